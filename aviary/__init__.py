@@ -30,10 +30,12 @@ from .core.enums import (
     Connectivity,
     DType,
     GeospatialFilterMode,
+    GridExporterMode,
     InterpolationMode,
     LogLevel,
     ObjectExporterMode,
     OSMType,
+    RasterExporterMode,
     SetFilterMode,
     SlopeUnit,
     WMSVersion,
@@ -89,6 +91,7 @@ __all__ = [
     'GeospatialFilterMode',
     'Grid',
     'GridConfig',
+    'GridExporterMode',
     'GroundSamplingDistance',
     'IDMixin',
     'InterpolationMode',
@@ -99,6 +102,7 @@ __all__ = [
     'ObjectExporterMode',
     'Objects',
     'RasterChannel',
+    'RasterExporterMode',
     'SetFilterMode',
     'SlopeUnit',
     'Tile',
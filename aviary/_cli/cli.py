@@ -575,6 +575,11 @@ def pipeline_run(
         envvar='AVIARY_LOG_SERIALIZE',
         help='Output logs in structured JSON format.',
     ),
+    resume_option: bool = typer.Option(
+        False,  # ruff: ignore[FBT003]
+        '--resume',
+        help='Resume the tile pipelines from their checkpoint journals.',
+    ),
 ) -> None:
     """Run the pipeline."""
     logger = Logger(
@@ -595,6 +600,18 @@ def pipeline_run(
         if quiet:
             config['show_progress'] = False
 
+        if resume_option:
+            num_tile_pipelines = set_resume(config=config)
+
+            if not num_tile_pipelines:
+                message = (
+                    'The config file must contain a tile pipeline with a checkpoint_path to resume a run.'
+                )
+                raise typer.BadParameter(
+                    message=message,
+                    param_hint="'--resume'",
+                )
+
         discover_packaged_plugins()
 
         plugins_dir_path = find_key(
@@ -732,6 +749,33 @@ def find_key(
     return None
 
 
+def set_resume(
+    config: dict | list,
+) -> int:
+    num_tile_pipelines = 0
+
+    if isinstance(config, dict):
+        sub_config = config.get('config')
+        conditions = [
+            config.get('package', 'aviary') == 'aviary',
+            config.get('name') == 'TilePipeline',
+            isinstance(sub_config, dict) and sub_config.get('checkpoint_path') is not None,
+        ]
+
+        if all(conditions):
+            sub_config['resume'] = True
+            num_tile_pipelines += 1
+
+        for value in config.values():
+            num_tile_pipelines += set_resume(config=value)
+
+    elif isinstance(config, list):
+        for item in config:
+            num_tile_pipelines += set_resume(config=item)
+
+    return num_tile_pipelines
+
+
 def parse_config(  # ruff: ignore[C901, PLR0912]
     config_path: Path,
     set_options: list[str] | None = None,
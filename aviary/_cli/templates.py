@@ -23,11 +23,33 @@ config:
     ...
 '''
 
+sharded_tile_pipeline_base_config = '''package: 'aviary'
+name: 'ShardedTilePipeline'
+config:
+  plugins_dir_path: null
+  work_queue_path: ...
+  num_units: ...
+  num_workers: 1
+  lease_duration: 600.
+  poll_interval: 10.
+
+  tile_pipeline_config:
+    ...
+'''
+
 tile_pipeline_base_config = '''package: 'aviary'
 name: 'TilePipeline'
 config:
   plugins_dir_path: null
   show_progress: true
+  executor_max_num_threads: null
+  executor_max_num_processes: null
+  staged: false
+  stage_num_workers: null
+  stage_max_queue_size: 1
+  checkpoint_path: null
+  checkpoint_interval: 10
+  resume: false
 
   grid_config:
     ...
@@ -39,6 +61,7 @@ config:
     batch_size: 1
     max_num_threads: null
     num_prefetched_tiles: 0
+    num_prefetching_threads: 1
 
   tiles_processor_config:
     ...
@@ -58,6 +81,7 @@ config:
 
 registry = {
     ('composite_pipeline', 'base'): composite_pipeline_base_config,
+    ('sharded_tile_pipeline', 'base'): sharded_tile_pipeline_base_config,
     ('tile_pipeline', 'base'): tile_pipeline_base_config,
     ('vector_pipeline', 'base'): vector_pipeline_base_config,
 }
@@ -15,23 +15,37 @@
 
 from __future__ import annotations
 
+import asyncio
 import random
 import time
 import warnings
-from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import (
+    datetime,
+    timezone,
+)
+from email.utils import parsedate_to_datetime
+from functools import partial
 from math import isclose
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
     from pathlib import Path
 
+    import httpx
+
 import geopandas as gpd
 import numpy as np
 import numpy.typing as npt
+import pyogrio
 import rasterio as rio
 import rasterio.windows
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from aviary._utils.concurrency import map_concurrently
 from aviary.core.bounding_box import BoundingBox
 from aviary.core.channel import VectorChannel
 from aviary.core.enums import (
@@ -43,6 +57,10 @@ from aviary.core.exceptions import AviaryUserError
 from aviary.core.tiles import Tile
 
 if TYPE_CHECKING:
+    from aviary._utils.cache import DiskCache
+    from aviary._utils.chunk_store import ChunkStore
+    from aviary._utils.concurrency import AsyncRateLimiter
+    from aviary._utils.resources import Pool
     from aviary.core.type_aliases import (
         BufferSize,
         Coordinates,
@@ -52,6 +70,186 @@ if TYPE_CHECKING:
     )
     from aviary.tile.tile_fetcher import TileFetcher
 
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_RETRY_AFTER_STATUS_CODES = frozenset({429, 503})
+
+
+def cached_fetcher(
+    coordinates: Coordinates,
+    tile_fetcher: TileFetcher,
+    cache: DiskCache,
+    cache_key: str,
+) -> Tile:
+    """Fetches a tile from the cache or, if the tile is not cached, from the source.
+
+    Parameters:
+        coordinates: Coordinates (x_min, y_min) of the tile in meters
+        tile_fetcher: Tile fetcher
+        cache: Cache
+        cache_key: Cache key of the tile fetcher
+
+    Returns:
+        Tile
+    """
+    key = _get_cache_key(
+        coordinates=coordinates,
+        cache_key=cache_key,
+    )
+    tile = cache.get(key=key)
+
+    if tile is None:
+        tile = tile_fetcher(coordinates=coordinates)
+        cache.put(
+            key=key,
+            value=tile,
+        )
+
+    return tile
+
+
+async def cached_fetcher_async(
+    coordinates: Coordinates,
+    tile_fetcher: TileFetcher,
+    cache: DiskCache,
+    cache_key: str,
+) -> Tile:
+    """Fetches a tile from the cache or, if the tile is not cached, from the source asynchronously.
+
+    Notes:
+        - The tile fetcher must fetch the tiles asynchronously
+        - The cache is read and written in the default thread pool of the event loop to not block it
+
+    Parameters:
+        coordinates: Coordinates (x_min, y_min) of the tile in meters
+        tile_fetcher: Tile fetcher
+        cache: Cache
+        cache_key: Cache key of the tile fetcher
+
+    Returns:
+        Tile
+    """
+    key = _get_cache_key(
+        coordinates=coordinates,
+        cache_key=cache_key,
+    )
+    tile = await asyncio.to_thread(cache.get, key=key)
+
+    if tile is None:
+        tile = await tile_fetcher.fetch_async(coordinates=coordinates)
+        await asyncio.to_thread(cache.put, key=key, value=tile)
+
+    return tile
+
+
+def cached_fetcher_many(
+    coordinates: list[Coordinates],
+    tile_fetcher: TileFetcher,
+    cache: DiskCache,
+    cache_key: str,
+    batched: bool = False,
+    max_num_threads: int | None = None,
+) -> list[Tile]:
+    """Fetches the tiles from the cache or, if the tiles are not cached, from the source.
+
+    Parameters:
+        coordinates: Coordinates (x_min, y_min) of the tiles in meters
+        tile_fetcher: Tile fetcher
+        cache: Cache
+        cache_key: Cache key of the tile fetcher
+        batched: If True, the tiles that are not cached are fetched by a single call of `fetch_many`
+            of the tile fetcher, otherwise they are fetched concurrently depending on the maximum number of threads
+        max_num_threads: Maximum number of threads
+
+    Returns:
+        Tiles
+    """
+    keys = [
+        _get_cache_key(
+            coordinates=coordinates_,
+            cache_key=cache_key,
+        )
+        for coordinates_ in coordinates
+    ]
+    tiles = [cache.get(key=key) for key in keys]
+    indices = [i for i, tile in enumerate(tiles) if tile is None]
+
+    if not indices:
+        return tiles
+
+    missing_coordinates = [coordinates[i] for i in indices]
+
+    if batched:
+        missing_tiles = tile_fetcher.fetch_many(
+            coordinates=missing_coordinates,
+            max_num_threads=max_num_threads,
+        )
+    elif len(missing_coordinates) == 1 or max_num_threads == 1:
+        missing_tiles = [
+            tile_fetcher(coordinates=coordinates_)
+            for coordinates_ in missing_coordinates
+        ]
+    else:
+        missing_tiles = map_concurrently(
+            tile_fetcher,
+            missing_coordinates,
+            scope='tile_loader',
+            max_num_threads=max_num_threads,
+        )
+
+    for i, tile in zip(indices, missing_tiles, strict=True):
+        cache.put(
+            key=keys[i],
+            value=tile,
+        )
+        tiles[i] = tile
+
+    return tiles
+
+
+def chunk_store_fetcher(
+    coordinates: Coordinates,
+    chunk_store: ChunkStore,
+    fill_value: int = 0,
+) -> Tile:
+    """Fetches a tile from the chunk store.
+
+    Notes:
+        - The tile size, the buffer size, and the channel names are read from the chunk store
+
+    Parameters:
+        coordinates: Coordinates (x_min, y_min) of the tile in meters
+        chunk_store: Chunk store
+        fill_value: Fill value of tiles that are not in the chunk store
+
+    Returns:
+        Tile
+
+    Raises:
+        AviaryUserError: Invalid `path` (the chunk store does not exist)
+    """
+    x_min, y_min = coordinates
+    data = chunk_store.read(
+        x_min=x_min,
+        y_min=y_min,
+    )
+    metadata = chunk_store.metadata
+
+    if data is None:
+        data = np.full(
+            shape=metadata['shape'],
+            fill_value=fill_value,
+            dtype=np.dtype(metadata['dtype']),
+        )
+
+    return Tile.from_composite_raster(
+        data=data,
+        channel_names=metadata['channel_names'],
+        coordinates=coordinates,
+        tile_size=metadata['tile_size'],
+        buffer_size=metadata['buffer_size'],
+        copy=False,
+    )
+
 
 def composite_fetcher(
     coordinates: Coordinates,
@@ -81,8 +279,12 @@ def composite_fetcher(
             copy=False,
         )
 
-    with ThreadPoolExecutor(max_workers=max_num_threads) as executor:
-        tiles = list(executor.map(lambda tile_fetcher: tile_fetcher(coordinates=coordinates), tile_fetchers))
+    tiles = map_concurrently(
+        lambda tile_fetcher: tile_fetcher(coordinates=coordinates),
+        tile_fetchers,
+        scope='tile_fetcher',
+        max_num_threads=max_num_threads,
+    )
 
     return Tile.from_tiles(
         tiles=tiles,
@@ -90,6 +292,88 @@ def composite_fetcher(
     )
 
 
+def create_async_client(
+    max_num_connections: int | None = None,
+) -> httpx.AsyncClient:
+    """Creates an asynchronous client to the web map service.
+
+    Notes:
+        - The client keeps the connections alive between requests
+
+    Parameters:
+        max_num_connections: Maximum number of connections (if None, the number is not limited)
+
+    Returns:
+        Asynchronous client
+
+    Raises:
+        ImportError: Missing dependencies (the async dependency group is not installed)
+    """
+    try:
+        import httpx  # ruff: ignore[PLC0415]
+    except ImportError as error:
+        message = (
+            'Missing dependencies! '
+            'To use the asynchronous mode of WMSFetcher, you need to install the '
+            'async dependency group (pip install geospaitial-lab-aviary[async]).'
+        )
+        raise ImportError(message) from error
+
+    from aviary import __version__  # ruff: ignore[PLC0415]
+
+    limits = httpx.Limits(
+        max_connections=max_num_connections,
+        max_keepalive_connections=max_num_connections,
+    )
+    return httpx.AsyncClient(
+        headers={'User-Agent': f'aviary/{__version__} (https://github.com/geospaitial-lab/aviary)'},
+        timeout=30,
+        limits=limits,
+    )
+
+
+def create_session(
+    max_num_retries: int = 0,
+    backoff_factor: float = 0.,
+) -> requests.Session:
+    """Creates a session to the web map service.
+
+    Notes:
+        - The session keeps the connection alive between requests
+        - Requests that fail with a connection error or a 429 or 5xx status code are retried
+            with exponential backoff, respecting the Retry-After header
+
+    Parameters:
+        max_num_retries: Maximum number of retries
+        backoff_factor: Backoff factor in seconds (the first retry is immediate,
+            the delay before the i-th retry is backoff_factor * 2 ** (i - 1))
+
+    Returns:
+        Session
+    """
+    from aviary import __version__  # ruff: ignore[PLC0415]
+
+    retry = Retry(
+        total=max_num_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=_RETRY_STATUS_CODES,
+        allowed_methods=frozenset({'GET'}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=1,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['User-Agent'] = f'aviary/{__version__} (https://github.com/geospaitial-lab/aviary)'
+    return session
+
+
 def gpkg_fetcher(
     coordinates: Coordinates,
     path: Path,
@@ -97,9 +381,17 @@ def gpkg_fetcher(
     channel_name: ChannelName | str | None,
     tile_size: TileSize,
     buffer_size: BufferSize = 0,
+    data: gpd.GeoDataFrame | None = None,
 ) -> Tile:
     """Fetches a tile from the geopackage.
 
+    Notes:
+        - If the data is None, only the features intersecting the bounding box of the tile are read
+            from the geopackage (using its spatial index)
+        - If the data is not None, the features intersecting the tile are queried from its spatial index
+            instead of reading the geopackage
+        - The features are ordered by their feature ids
+
     Parameters:
         coordinates: Coordinates (x_min, y_min) of the tile in meters
         path: Path to the geopackage (.gpkg file)
@@ -107,6 +399,7 @@ def gpkg_fetcher(
         channel_name: Channel name (if None, the channel is ignored)
         tile_size: Tile size in meters
         buffer_size: Buffer size in meters
+        data: Data of the geopackage in the coordinate reference system of the EPSG code (see `load_gpkg`)
 
     Returns:
         Tile
@@ -127,15 +420,25 @@ def gpkg_fetcher(
 
     mask_data = bounding_box.to_gdf(epsg_code=epsg_code)
 
-    data = gpd.read_file(path)
-    epsg_code = f'EPSG:{epsg_code}'
-    data = data.set_crs(crs=epsg_code) if data.crs is None else data.to_crs(crs=epsg_code)
+    if data is None:
+        data = _read_gpkg(
+            path=path,
+            epsg_code=epsg_code,
+            mask_data=mask_data,
+        )
+    else:
+        indices = data.sindex.query(
+            mask_data.geometry.iloc[0],
+            predicate='intersects',
+        )
+        data = data.iloc[np.sort(indices)]
 
     data = gpd.clip(
         gdf=data,
         mask=mask_data,
         keep_geom_type=True,
     )
+    data = data.sort_index()
     data = data.reset_index(drop=True)
 
     channel = VectorChannel.from_unnormalized_data(
@@ -155,6 +458,65 @@ def gpkg_fetcher(
     )
 
 
+def load_gpkg(
+    path: Path,
+    epsg_code: EPSGCode,
+) -> gpd.GeoDataFrame:
+    """Loads the geopackage.
+
+    Notes:
+        - The data is reprojected to the coordinate reference system of the EPSG code
+        - The data is indexed by the feature ids
+        - The spatial index of the data is built
+
+    Parameters:
+        path: Path to the geopackage (.gpkg file)
+        epsg_code: EPSG code
+
+    Returns:
+        Data
+    """
+    data = gpd.read_file(
+        path,
+        fid_as_index=True,
+    )
+    data = _set_crs(
+        data=data,
+        epsg_code=epsg_code,
+    )
+    _ = data.sindex
+    return data
+
+
+def open_vrt(
+    path: Path,
+    epsg_code: EPSGCode,
+) -> rio.io.DatasetReader:
+    """Opens the virtual raster.
+
+    Parameters:
+        path: Path to the virtual raster (.vrt file)
+        epsg_code: EPSG code
+
+    Returns:
+        Virtual raster
+
+    Raises:
+        AviaryUserError: Invalid `epsg_code` (the EPSG code does not match the virtual raster)
+    """
+    src = rio.open(path)
+
+    if src.crs is None or src.crs.to_epsg() != epsg_code:
+        src.close()
+        message = (
+            'Invalid epsg_code! '
+            'The EPSG code must match the virtual raster.'
+        )
+        raise AviaryUserError(message)
+
+    return src
+
+
 def stub_fetcher(
     coordinates: Coordinates,
     tile_size: TileSize,
@@ -195,9 +557,13 @@ def vrt_fetcher(
     interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR,
     buffer_size: BufferSize = 0,
     fill_value: int = 0,
+    dataset_pool: Pool[rio.io.DatasetReader] | None = None,
 ) -> Tile:
     """Fetches a tile from the virtual raster.
 
+    Notes:
+        - If the dataset pool is None, the virtual raster is opened for each tile
+
     Parameters:
         coordinates: Coordinates (x_min, y_min) of the tile in meters
         path: Path to the virtual raster (.vrt file)
@@ -208,6 +574,7 @@ def vrt_fetcher(
         interpolation_mode: Interpolation mode (`BILINEAR` or `NEAREST`)
         buffer_size: Buffer size in meters
         fill_value: Fill value of no-data pixels
+        dataset_pool: Pool of opened virtual rasters
 
     Returns:
         Tile
@@ -234,32 +601,23 @@ def vrt_fetcher(
         ground_sampling_distance=ground_sampling_distance,
     )
 
-    with rio.open(path) as src:
-        if src.crs is None or src.crs.to_epsg() != epsg_code:
-            message = (
-                'Invalid epsg_code! '
-                'The EPSG code must match the virtual raster.'
-            )
-            raise AviaryUserError(message)
-
-        window = rio.windows.from_bounds(
-            left=bounding_box.x_min,
-            bottom=bounding_box.y_min,
-            right=bounding_box.x_max,
-            top=bounding_box.y_max,
-            transform=src.transform,
+    if dataset_pool is not None:  # ruff: ignore[SIM108]
+        context = dataset_pool.acquire()
+    else:
+        context = open_vrt(
+            path=path,
+            epsg_code=epsg_code,
         )
-        data = src.read(
-            window=window,
-            out_shape=(src.count, tile_size_pixels, tile_size_pixels),
-            boundless=True,
-            resampling=interpolation_mode.to_rio(),
+
+    with context as src:
+        data = _read_vrt(
+            src=src,
+            bounding_box=bounding_box,
+            tile_size_pixels=tile_size_pixels,
+            interpolation_mode=interpolation_mode,
             fill_value=fill_value,
         )
 
-    data = _permute_data(
-        data=data,
-    )
     return Tile.from_composite_raster(
         data=data,
         channel_names=channel_names,
@@ -270,6 +628,130 @@ def vrt_fetcher(
     )
 
 
+def vrt_fetcher_many(
+    coordinates: list[Coordinates],
+    path: Path,
+    epsg_code: EPSGCode,
+    channel_names:
+        ChannelName | str |
+        list[ChannelName | str | None] |
+        None,
+    tile_size: TileSize,
+    ground_sampling_distance: GroundSamplingDistance,
+    interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR,
+    buffer_size: BufferSize = 0,
+    fill_value: int = 0,
+    dataset_pool: Pool[rio.io.DatasetReader] | None = None,
+    max_num_threads: int | None = None,
+) -> list[Tile]:
+    """Fetches the tiles from the virtual raster.
+
+    Notes:
+        - The union window of the tiles is read once and the tiles are sliced from it, i.e., source blocks
+            that are shared by adjacent tiles (e.g., in the buffer region) are read only once
+        - The union window is read only if the tiles are aligned to its pixels and it does not contain
+            more pixels than the tiles combined, otherwise the window of each tile is read concurrently
+            depending on the maximum number of threads
+        - The data of each tile is copied from the union window, i.e., the tiles do not share memory
+        - If the dataset pool is None, the virtual raster is opened once to read the union window,
+            otherwise it is opened for each tile
+
+    Parameters:
+        coordinates: Coordinates (x_min, y_min) of the tiles in meters
+        path: Path to the virtual raster (.vrt file)
+        epsg_code: EPSG code
+        channel_names: Channel name or channel names (if None, the channel is ignored)
+        tile_size: Tile size in meters
+        ground_sampling_distance: Ground sampling distance in meters per pixel
+        interpolation_mode: Interpolation mode (`BILINEAR` or `NEAREST`)
+        buffer_size: Buffer size in meters
+        fill_value: Fill value of no-data pixels
+        dataset_pool: Pool of opened virtual rasters
+        max_num_threads: Maximum number of threads to read the window of each tile
+
+    Returns:
+        Tiles
+
+    Raises:
+        AviaryUserError: Invalid `epsg_code` (the EPSG code does not match the virtual raster)
+    """
+    if not coordinates:
+        return []
+
+    tile_size_pixels = _compute_tile_size_pixels(
+        tile_size=tile_size,
+        buffer_size=buffer_size,
+        ground_sampling_distance=ground_sampling_distance,
+    )
+    union_window = _compute_union_window(
+        coordinates=coordinates,
+        tile_size=tile_size,
+        buffer_size=buffer_size,
+        ground_sampling_distance=ground_sampling_distance,
+    )
+
+    if union_window is None:
+        fetch = partial(
+            vrt_fetcher,
+            path=path,
+            epsg_code=epsg_code,
+            channel_names=channel_names,
+            tile_size=tile_size,
+            ground_sampling_distance=ground_sampling_distance,
+            interpolation_mode=interpolation_mode,
+            buffer_size=buffer_size,
+            fill_value=fill_value,
+            dataset_pool=dataset_pool,
+        )
+
+        if len(coordinates) == 1 or max_num_threads == 1:
+            return [
+                fetch(coordinates=coordinates_item)
+                for coordinates_item in coordinates
+            ]
+
+        return map_concurrently(
+            fetch,
+            coordinates,
+            scope='tile_loader',
+            max_num_threads=max_num_threads,
+        )
+
+    if dataset_pool is not None:  # ruff: ignore[SIM108]
+        context = dataset_pool.acquire()
+    else:
+        context = open_vrt(
+            path=path,
+            epsg_code=epsg_code,
+        )
+
+    with context as src:
+        bounding_box, shape, offsets = union_window
+        union_data = _read_vrt(
+            src=src,
+            bounding_box=bounding_box,
+            tile_size_pixels=shape,
+            interpolation_mode=interpolation_mode,
+            fill_value=fill_value,
+        )
+        data = [
+            union_data[row:row + tile_size_pixels, col:col + tile_size_pixels].copy()
+            for row, col in offsets
+        ]
+
+    return [
+        Tile.from_composite_raster(
+            data=data_item,
+            channel_names=channel_names,
+            coordinates=coordinates_item,
+            tile_size=tile_size,
+            buffer_size=buffer_size,
+            copy=False,
+        )
+        for data_item, coordinates_item in zip(data, coordinates, strict=True)
+    ]
+
+
 def wms_fetcher(
     coordinates: Coordinates,
     url: str,
@@ -287,9 +769,116 @@ def wms_fetcher(
     style: str | None = None,
     buffer_size: BufferSize = 0,
     fill_value: str = '0x000000',
+    session_pool: Pool[requests.Session] | None = None,
 ) -> Tile:
     """Fetches a tile from the web map service.
 
+    Notes:
+        - If the session pool is None, a new session is created for each tile
+
+    Parameters:
+        coordinates: Coordinates (x_min, y_min) of the tile in meters
+        url: URL of the web map service
+        version: Version of the web map service (`V1_1_1` or `V1_3_0`)
+        layer: Layer
+        epsg_code: EPSG code
+        response_format: Format of the response (MIME type, e.g., 'image/png')
+        channel_names: Channel name or channel names (if None, the channel is ignored)
+        tile_size: Tile size in meters
+        ground_sampling_distance: Ground sampling distance in meters per pixel
+        time: Time
+        style: Style
+        buffer_size: Buffer size in meters
+        fill_value: Fill value of no-data pixels
+        session_pool: Pool of sessions
+
+    Returns:
+        Tile
+    """
+    x_min, y_min = coordinates
+    x_max = x_min + tile_size
+    y_max = y_min + tile_size
+    bounding_box = BoundingBox(
+        x_min=x_min,
+        y_min=y_min,
+        x_max=x_max,
+        y_max=y_max,
+    )
+    bounding_box = bounding_box.buffer(
+        buffer_size=buffer_size,
+        inplace=False,
+    )
+    tile_size_pixels = _compute_tile_size_pixels(
+        tile_size=tile_size,
+        buffer_size=buffer_size,
+        ground_sampling_distance=ground_sampling_distance,
+    )
+
+    params = _get_wms_params(
+        version=version,
+        layer=layer,
+        epsg_code=epsg_code,
+        response_format=response_format,
+        tile_size_pixels=tile_size_pixels,
+        bounding_box=bounding_box,
+        time=time,
+        style=style,
+        fill_value=fill_value,
+    )
+
+    if session_pool is not None:  # ruff: ignore[SIM108]
+        context = session_pool.acquire()
+    else:
+        context = create_session()
+
+    with context as session:
+        data = _request_wms(
+            url=url,
+            params=params,
+            session=session,
+        )
+
+    return Tile.from_composite_raster(
+        data=data,
+        channel_names=channel_names,
+        coordinates=coordinates,
+        tile_size=tile_size,
+        buffer_size=buffer_size,
+        copy=False,
+    )
+
+
+async def wms_fetcher_async(
+    coordinates: Coordinates,
+    url: str,
+    version: WMSVersion,
+    layer: str,
+    epsg_code: EPSGCode,
+    response_format: str,
+    channel_names:
+        ChannelName | str |
+        list[ChannelName | str | None] |
+        None,
+    tile_size: TileSize,
+    ground_sampling_distance: GroundSamplingDistance,
+    client: httpx.AsyncClient,
+    time: int | str | None = None,
+    style: str | None = None,
+    buffer_size: BufferSize = 0,
+    fill_value: str = '0x000000',
+    max_num_retries: int = 0,
+    backoff_factor: float = 0.,
+    semaphore: asyncio.Semaphore | None = None,
+    rate_limiter: AsyncRateLimiter | None = None,
+    executor: Executor | None = None,
+) -> Tile:
+    """Fetches a tile from the web map service asynchronously.
+
+    Notes:
+        - Requests that fail with a connection error or a 429 or 5xx status code are retried
+            with exponential backoff, respecting the Retry-After header
+        - The response is decoded in the executor to not block the event loop
+
     Parameters:
         coordinates: Coordinates (x_min, y_min) of the tile in meters
         url: URL of the web map service
@@ -300,10 +889,17 @@ def wms_fetcher(
         channel_names: Channel name or channel names (if None, the channel is ignored)
         tile_size: Tile size in meters
         ground_sampling_distance: Ground sampling distance in meters per pixel
+        client: Asynchronous client
         time: Time
         style: Style
         buffer_size: Buffer size in meters
         fill_value: Fill value of no-data pixels
+        max_num_retries: Maximum number of retries
+        backoff_factor: Backoff factor in seconds (the first retry is immediate,
+            the delay before the i-th retry is backoff_factor * 2 ** (i - 1))
+        semaphore: Semaphore to limit the number of concurrent requests
+        rate_limiter: Rate limiter to limit the number of requests per second
+        executor: Executor to decode the response (if None, the default executor of the event loop is used)
 
     Returns:
         Tile
@@ -338,14 +934,18 @@ def wms_fetcher(
         style=style,
         fill_value=fill_value,
     )
-    data = _request_wms(
+
+    data = await _request_wms_async(
         url=url,
         params=params,
+        client=client,
+        max_num_retries=max_num_retries,
+        backoff_factor=backoff_factor,
+        semaphore=semaphore,
+        rate_limiter=rate_limiter,
+        executor=executor,
     )
 
-    data = _permute_data(
-        data=data,
-    )
     return Tile.from_composite_raster(
         data=data,
         channel_names=channel_names,
@@ -356,6 +956,41 @@ def wms_fetcher(
     )
 
 
+def _compute_retry_delay(
+    num_retries: int,
+    backoff_factor: float,
+    retry_after: str | None = None,
+) -> float:
+    """Computes the delay before the retry.
+
+    Parameters:
+        num_retries: Number of the retry (starting at 1)
+        backoff_factor: Backoff factor in seconds (the first retry is immediate,
+            the delay before the i-th retry is backoff_factor * 2 ** (i - 1))
+        retry_after: Value of the Retry-After header (in seconds or as an HTTP date)
+
+    Returns:
+        Delay in seconds
+    """
+    if retry_after is not None:
+        try:
+            return max(float(retry_after), 0.)
+        except ValueError:
+            pass
+
+        try:
+            retry_after_datetime = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            pass
+        else:
+            return max((retry_after_datetime - datetime.now(tz=timezone.utc)).total_seconds(), 0.)
+
+    if num_retries <= 1:
+        return 0.
+
+    return backoff_factor * 2 ** (num_retries - 1)
+
+
 def _compute_tile_size_pixels(
     tile_size: TileSize,
     buffer_size: BufferSize,
@@ -387,6 +1022,140 @@ def _compute_tile_size_pixels(
     return int(tile_size_pixels)
 
 
+def _compute_union_window(
+    coordinates: list[Coordinates],
+    tile_size: TileSize,
+    buffer_size: BufferSize,
+    ground_sampling_distance: GroundSamplingDistance,
+) -> tuple[BoundingBox, tuple[int, int], list[tuple[int, int]]] | None:
+    """Computes the union window of the tiles.
+
+    Notes:
+        - The union window is None if the tiles are not aligned to its pixels or if it contains
+            more pixels than the tiles combined
+
+    Parameters:
+        coordinates: Coordinates (x_min, y_min) of the tiles in meters
+        tile_size: Tile size in meters
+        buffer_size: Buffer size in meters
+        ground_sampling_distance: Ground sampling distance in meters per pixel
+
+    Returns:
+        Bounding box, shape (height, width) in pixels and offsets (row, col) in pixels of the tiles
+            or None
+    """
+    coordinates = np.array(coordinates, dtype=np.float64)
+    x_min, y_min = coordinates.min(axis=0).tolist()
+    x_max, y_max = (coordinates.max(axis=0) + tile_size).tolist()
+    bounding_box = BoundingBox(
+        x_min=x_min,
+        y_min=y_min,
+        x_max=x_max,
+        y_max=y_max,
+    )
+    bounding_box = bounding_box.buffer(
+        buffer_size=buffer_size,
+        inplace=False,
+    )
+    values = np.array([
+        (y_max - coordinates[:, 1] - tile_size) / ground_sampling_distance,
+        (coordinates[:, 0] - x_min) / ground_sampling_distance,
+    ]).T
+    shape = np.array([
+        (bounding_box.y_max - bounding_box.y_min) / ground_sampling_distance,
+        (bounding_box.x_max - bounding_box.x_min) / ground_sampling_distance,
+    ])
+
+    if not np.allclose(values, np.round(values), rtol=1e-9, atol=1e-9):
+        return None
+
+    if not np.allclose(shape, np.round(shape), rtol=1e-9, atol=1e-9):
+        return None
+
+    shape = np.round(shape).astype(np.int64)
+    tile_size_pixels = (tile_size + 2 * buffer_size) / ground_sampling_distance
+
+    if shape[0] * shape[1] > len(coordinates) * tile_size_pixels ** 2:
+        return None
+
+    offsets = np.round(values).astype(np.int64)
+    return (
+        bounding_box,
+        (int(shape[0]), int(shape[1])),
+        [(int(row), int(col)) for row, col in offsets],
+    )
+
+
+def _decode_wms_response(
+    content_type: str,
+    content: bytes,
+) -> npt.NDArray:
+    """Decodes the response of the web map service.
+
+    Parameters:
+        content_type: Content type of the response
+        content: Content of the response
+
+    Returns:
+        Data
+
+    Raises:
+        AviaryUserError: Invalid request (the response is not an image)
+        AviaryUserError: Invalid request (the response is not in shape (n, n, 3) and data type uint8)
+    """
+    if not content_type.startswith('image/'):
+        message = (
+            'Invalid request! '
+            'The response must be an image.'
+        )
+        raise AviaryUserError(message)
+
+    with rio.io.MemoryFile(content) as file, warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=rio.errors.NotGeoreferencedWarning)
+
+        with file.open() as src:
+            conditions = [
+                src.count != 3,  # ruff: ignore[PLR2004]
+                src.dtypes[0] != 'uint8',
+            ]
+
+            if any(conditions):
+                message = (
+                    'Invalid request! '
+                    'The response must be in shape (n, n, 3) and data type uint8.'
+                )
+                raise AviaryUserError(message)
+
+            data = _read_data(
+                src=src,
+            )
+
+    return data
+
+
+def _get_cache_key(
+    coordinates: Coordinates,
+    cache_key: str,
+) -> str:
+    """Returns the key of the tile in the cache.
+
+    Notes:
+        - The key contains the version of aviary, since the tiles are pickled, i.e., the tiles cached
+            by a different version are not read
+
+    Parameters:
+        coordinates: Coordinates (x_min, y_min) of the tile in meters
+        cache_key: Cache key of the tile fetcher
+
+    Returns:
+        Key
+    """
+    from aviary import __version__  # ruff: ignore[PLC0415]
+
+    x_min, y_min = coordinates
+    return f'{__version__}/{cache_key}/{x_min}/{y_min}'
+
+
 def _get_wms_params(
     version: WMSVersion,
     layer: str,
@@ -448,29 +1217,132 @@ def _get_wms_params(
     return params
 
 
-def _permute_data(
-    data: npt.NDArray,
+def _read_data(
+    src: rio.io.DatasetReader,
+    tile_size_pixels: int | tuple[int, int] | None = None,
+    window: rio.windows.Window | None = None,
+    boundless: bool = False,
+    resampling: rio.enums.Resampling = rio.enums.Resampling.nearest,
+    fill_value: int | None = None,
 ) -> npt.NDArray:
-    """Permutes the data from channels-first to channels-last.
+    """Reads the data into a channels-last array.
+
+    Notes:
+        - The data is read into a channels-first view of the array, i.e., the pixels are written interleaved
+            by GDAL without permuting the data afterward
+        - The channels of the tile are views of the array, i.e., the array is shared by all channels and
+            the composite raster data of the tile is a view of it
 
     Parameters:
-        data: Data
+        src: Dataset
+        tile_size_pixels: Tile size in pixels or shape (height, width) in pixels
+            (if None, the size of the dataset is used)
+        window: Window
+        boundless: If True, the window may extend beyond the dataset
+        resampling: Resampling method
+        fill_value: Fill value of no-data pixels
 
     Returns:
-        Data
+        Data in shape (n, n, c) or (height, width, c)
+    """
+    if tile_size_pixels is None:
+        shape = (src.height, src.width, src.count)
+    elif isinstance(tile_size_pixels, tuple):
+        shape = (*tile_size_pixels, src.count)
+    else:
+        shape = (tile_size_pixels, tile_size_pixels, src.count)
+
+    data = np.empty(
+        shape=shape,
+        dtype=src.dtypes[0],
+    )
+    src.read(
+        out=np.transpose(data, (2, 0, 1)),
+        window=window,
+        boundless=boundless,
+        resampling=resampling,
+        fill_value=fill_value,
+    )
+    return data
+
+
+def _read_vrt(
+    src: rio.io.DatasetReader,
+    bounding_box: BoundingBox,
+    tile_size_pixels: int | tuple[int, int],
+    interpolation_mode: InterpolationMode,
+    fill_value: int,
+) -> npt.NDArray:
+    """Reads the data of the bounding box from the virtual raster.
+
+    Parameters:
+        src: Virtual raster
+        bounding_box: Bounding box
+        tile_size_pixels: Tile size in pixels or shape (height, width) in pixels
+        interpolation_mode: Interpolation mode (`BILINEAR` or `NEAREST`)
+        fill_value: Fill value of no-data pixels
+
+    Returns:
+        Data in shape (n, n, c) or (height, width, c)
     """
-    return np.transpose(data, (1, 2, 0))
+    window = rio.windows.from_bounds(
+        left=bounding_box.x_min,
+        bottom=bounding_box.y_min,
+        right=bounding_box.x_max,
+        top=bounding_box.y_max,
+        transform=src.transform,
+    )
+    return _read_data(
+        src=src,
+        tile_size_pixels=tile_size_pixels,
+        window=window,
+        boundless=True,
+        resampling=interpolation_mode.to_rio(),
+        fill_value=fill_value,
+    )
+
+
+def _read_gpkg(
+    path: Path,
+    epsg_code: EPSGCode,
+    mask_data: gpd.GeoDataFrame,
+) -> gpd.GeoDataFrame:
+    """Reads the features intersecting the bounding box of the mask from the geopackage.
+
+    Parameters:
+        path: Path to the geopackage (.gpkg file)
+        epsg_code: EPSG code
+        mask_data: Mask in the coordinate reference system of the EPSG code
+
+    Returns:
+        Data in the coordinate reference system of the EPSG code (indexed by the feature ids)
+    """
+    crs = pyogrio.read_info(path).get('crs')
+    bbox = mask_data.to_crs(crs=crs) if crs is not None else mask_data
+    bbox = tuple(bbox.total_bounds)
+
+    data = gpd.read_file(
+        path,
+        bbox=bbox,
+        fid_as_index=True,
+    )
+    return _set_crs(
+        data=data,
+        epsg_code=epsg_code,
+    )
 
 
 def _request_wms(
     url: str,
     params: dict[str, str],
+    session: requests.Session,
 ) -> npt.NDArray:
     """Requests the web map service.
 
     Parameters:
         url: URL of the web map service
         params: Parameters of the request
+        session: Session
 
     Returns:
         Data
@@ -479,50 +1351,114 @@ def _request_wms(
         AviaryUserError: Invalid request (the response is not an image)
         AviaryUserError: Invalid request (the response is not in shape (n, n, 3) and data type uint8)
     """
-    from aviary import __version__  # ruff: ignore[PLC0415]
-
-    headers = {
-        'User-Agent': f'aviary/{__version__} (https://github.com/geospaitial-lab/aviary)',
-    }
-
-    response = requests.get(
+    response = session.get(
         url=url,
         params=params,
-        headers=headers,
         timeout=30,
     )
     response.raise_for_status()
 
-    if not response.headers['Content-Type'].startswith('image/'):
-        message = (
-            'Invalid request! '
-            'The response must be an image.'
-        )
-        raise AviaryUserError(message)
+    return _decode_wms_response(
+        content_type=response.headers['Content-Type'],
+        content=response.content,
+    )
 
-    with rio.io.MemoryFile(response.content) as file, warnings.catch_warnings():
-        warnings.filterwarnings('ignore', category=rio.errors.NotGeoreferencedWarning)
 
-        with file.open() as src:
-            data = src.read()
+async def _request_wms_async(
+    url: str,
+    params: dict[str, str],
+    client: httpx.AsyncClient,
+    max_num_retries: int = 0,
+    backoff_factor: float = 0.,
+    semaphore: asyncio.Semaphore | None = None,
+    rate_limiter: AsyncRateLimiter | None = None,
+    executor: Executor | None = None,
+) -> npt.NDArray:
+    """Requests the web map service asynchronously.
 
-            if data.ndim != 3:  # ruff: ignore[PLR2004]
-                message = (
-                    'Invalid request! '
-                    'The response must be in shape (n, n, 3) and data type uint8.'
-                )
-                raise AviaryUserError(message)
+    Parameters:
+        url: URL of the web map service
+        params: Parameters of the request
+        client: Asynchronous client
+        max_num_retries: Maximum number of retries
+        backoff_factor: Backoff factor in seconds (the first retry is immediate,
+            the delay before the i-th retry is backoff_factor * 2 ** (i - 1))
+        semaphore: Semaphore to limit the number of concurrent requests
+        rate_limiter: Rate limiter to limit the number of requests per second
+        executor: Executor to decode the response (if None, the default executor of the event loop is used)
 
-            conditions = [
-                data.shape[0] != 3,  # ruff: ignore[PLR2004]
-                data.dtype != np.uint8,
-            ]
+    Returns:
+        Data
 
-            if any(conditions):
-                message = (
-                    'Invalid request! '
-                    'The response must be in shape (n, n, 3) and data type uint8.'
+    Raises:
+        AviaryUserError: Invalid request (the response is not an image)
+        AviaryUserError: Invalid request (the response is not in shape (n, n, 3) and data type uint8)
+    """
+    import httpx  # ruff: ignore[PLC0415]
+
+    if semaphore is None:
+        semaphore = nullcontext()
+
+    num_retries = 0
+
+    while True:
+        if rate_limiter is not None:
+            await rate_limiter.wait()
+
+        try:
+            async with semaphore:
+                response = await client.get(
+                    url=url,
+                    params=params,
                 )
-                raise AviaryUserError(message)
+        except httpx.TransportError:
+            if num_retries >= max_num_retries:
+                raise
+
+            retry_after = None
+        else:
+            if response.status_code not in _RETRY_STATUS_CODES or num_retries >= max_num_retries:
+                break
+
+            retry_after = (
+                response.headers.get('Retry-After')
+                if response.status_code in _RETRY_AFTER_STATUS_CODES
+                else None
+            )
 
-    return data
+        num_retries += 1
+        delay = _compute_retry_delay(
+            num_retries=num_retries,
+            backoff_factor=backoff_factor,
+            retry_after=retry_after,
+        )
+        await asyncio.sleep(delay)
+
+    response.raise_for_status()
+
+    event_loop = asyncio.get_running_loop()
+    return await event_loop.run_in_executor(
+        executor,
+        partial(
+            _decode_wms_response,
+            content_type=response.headers['Content-Type'],
+            content=response.content,
+        ),
+    )
+
+
+def _set_crs(
+    data: gpd.GeoDataFrame,
+    epsg_code: EPSGCode,
+) -> gpd.GeoDataFrame:
+    """Sets the coordinate reference system of the data or reprojects the data.
+
+    Parameters:
+        data: Data
+        epsg_code: EPSG code
+
+    Returns:
+        Data in the coordinate reference system of the EPSG code
+    """
+    epsg_code = f'EPSG:{epsg_code}'
+    return data.set_crs(crs=epsg_code) if data.crs is None else data.to_crs(crs=epsg_code)
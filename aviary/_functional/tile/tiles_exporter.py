@@ -15,7 +15,6 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -31,7 +30,10 @@ from shapely.geometry import (
     box,
 )
 
+from aviary._utils.concurrency import map_concurrently
+from aviary._utils.journal import CoordinatesJournal
 from aviary.core.enums import (
+    GridExporterMode,
     ObjectExporterMode,
     _coerce_channel_name,
 )
@@ -39,24 +41,116 @@ from aviary.core.exceptions import AviaryUserError
 from aviary.core.grid import Grid
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from aviary._utils.chunk_store import ChunkStore
+    from aviary._utils.concurrency import BackgroundWorker
+    from aviary._utils.gpkg_writer import GPKGWriter
+    from aviary._utils.mosaic_writer import MosaicWriter
     from aviary.core.channel import (
         ObjectChannel,
         VectorChannel,
     )
     from aviary.core.enums import ChannelName
     from aviary.core.tiles import Tiles
-    from aviary.core.type_aliases import EPSGCode
+    from aviary.core.type_aliases import (
+        Coordinate,
+        EPSGCode,
+        GroundSamplingDistance,
+        TileSize,
+    )
+
+
+def chunk_store_exporter(
+    tiles: Tiles,
+    channel_names:
+        ChannelName | str |
+        list[ChannelName | str],
+    chunk_store: ChunkStore,
+    remove_channels: bool = True,
+    max_num_threads: int | None = None,
+) -> Tiles:
+    """Exports the raster channels to the chunk store.
+
+    Parameters:
+        tiles: Tiles
+        channel_names: Channel name or channel names
+        chunk_store: Chunk store
+        remove_channels: If True, the channels are removed
+        max_num_threads: Maximum number of threads
+
+    Returns:
+        Tiles
+
+    Raises:
+        AviaryUserError: Invalid `path` (the metadata does not match the chunk store)
+    """
+    data = tiles.to_composite_raster(
+        channel_names=channel_names,
+    )
+
+    if not isinstance(channel_names, list):
+        channel_names = [channel_names]
+
+    channel_names = [
+        _coerce_channel_name(channel_name=channel_name)
+        for channel_name in channel_names
+    ]
+    coordinates = tiles.coordinates
+    tile_size = tiles.tile_size
+    first_channel = tiles[channel_names[0]]
+
+    chunk_store.initialize(
+        tile_size=tile_size,
+        buffer_size=round(first_channel.buffer_size * tile_size),
+        shape=data.shape[1:],
+        dtype=data.dtype,
+        channel_names=[str(channel_name) for channel_name in channel_names],
+    )
+
+    def _export_data_item(index: int) -> None:
+        x_min, y_min = coordinates[index]
+        chunk_store.write(
+            x_min=x_min,
+            y_min=y_min,
+            data=data[index],
+        )
+
+    if tiles.batch_size == 1 or max_num_threads == 1:
+        for index in range(tiles.batch_size):
+            _export_data_item(index)
+    else:
+        map_concurrently(
+            _export_data_item,
+            range(tiles.batch_size),
+            scope='tiles_exporter',
+            max_num_threads=max_num_threads,
+        )
+
+    if remove_channels:
+        tiles = tiles.remove(
+            channel_names=channel_names,
+            inplace=True,
+        )
+
+    return tiles
 
 
 def grid_exporter(
     tiles: Tiles,
     path: Path,
+    mode: GridExporterMode = GridExporterMode.JSON,
 ) -> Tiles:
     """Exports the grid of the tiles.
 
+    Notes:
+        - In JSON mode, the JSON file is read and rewritten for each batch, i.e., exporting is O(n) per batch
+        - In journal mode, the coordinates are appended to the journal, i.e., exporting is O(batch) per batch
+
     Parameters:
         tiles: Tiles
-        path: Path to the JSON file (.json file)
+        path: Path to the JSON file (.json file) or the journal
+        mode: Grid exporter mode (`JOURNAL` or `JSON`)
 
     Returns:
         Tiles
@@ -64,6 +158,14 @@ def grid_exporter(
     coordinates = tiles.coordinates
     tile_size = tiles.tile_size
 
+    if mode == GridExporterMode.JOURNAL:
+        coordinates_journal = CoordinatesJournal(
+            path=path,
+            tile_size=tile_size,
+        )
+        coordinates_journal.append(coordinates=coordinates)
+        return tiles
+
     try:
         with path.open() as file:
             json_string = file.read()
@@ -84,6 +186,26 @@ def grid_exporter(
     return tiles
 
 
+def grid_journal_to_json(
+    path: Path,
+    json_path: Path,
+) -> None:
+    """Converts the journal of the grid to a JSON file.
+
+    Parameters:
+        path: Path to the journal
+        json_path: Path to the JSON file (.json file)
+
+    Raises:
+        AviaryUserError: Invalid `path` (the file is not a journal)
+    """
+    grid = Grid.from_journal(path=path)
+    json_string = grid.to_json()
+
+    with json_path.open('w') as file:
+        file.write(json_string)
+
+
 def object_exporter(
     tiles: Tiles,
     channel_name: ChannelName | str,
@@ -91,6 +213,7 @@ def object_exporter(
     path: Path,
     mode: ObjectExporterMode = ObjectExporterMode.BOX,
     remove_channel: bool = True,
+    gpkg_writer: GPKGWriter | None = None,
 ) -> Tiles:
     """Exports the object channel.
 
@@ -101,6 +224,7 @@ def object_exporter(
         path: Path to the geopackage (.gpkg file)
         mode: Object exporter mode (`BOX` or `POINT`)
         remove_channel: If True, the channel is removed
+        gpkg_writer: Geopackage writer (if None, the object data is appended to the geopackage immediately)
 
     Returns:
         Tiles
@@ -176,10 +300,10 @@ def object_exporter(
             inplace=True,
         )
 
-        gdf.to_file(
-            path,
-            driver='GPKG',
-            mode='a',
+        _write_gdf(
+            gdf=gdf,
+            path=path,
+            gpkg_writer=gpkg_writer,
         )
 
     if remove_channel:
@@ -201,9 +325,18 @@ def raster_exporter(
     mapping: dict[int, list[int]] | None = None,
     remove_channels: bool = True,
     max_num_threads: int | None = None,
+    background_worker: BackgroundWorker | None = None,
+    mosaic_writer: MosaicWriter | None = None,
 ) -> Tiles:
     """Exports the raster channels.
 
+    Notes:
+        - If a background worker is specified, the geotiffs are written by its worker threads,
+            i.e., the function returns before the geotiffs are written (`max_num_threads` is ignored)
+        - If a background worker is specified, the data is copied if it is a view of the channels,
+            i.e., modifying the channels afterward does not modify the written geotiffs
+        - If a mosaic writer is specified, the tiles are written into its mosaics instead of one geotiff per tile
+
     Parameters:
         tiles: Tiles
         channel_names: Channel name or channel names
@@ -212,6 +345,8 @@ def raster_exporter(
         mapping: Mapping of the values
         remove_channels: If True, the channels are removed
         max_num_threads: Maximum number of threads
+        background_worker: Background worker
+        mosaic_writer: Mosaic writer
 
     Returns:
         Tiles
@@ -220,11 +355,15 @@ def raster_exporter(
         channel_names=channel_names,
     )
 
+    if background_worker is not None and data.base is not None:
+        data = data.copy()
+
     path.mkdir(
         parents=True,
         exist_ok=True,
     )
 
+    coordinates = tiles.coordinates
     tile_size = tiles.tile_size
     batch_size = tiles.batch_size
     epsg_code = f'EPSG:{epsg_code}'
@@ -239,56 +378,45 @@ def raster_exporter(
     def _export_data_item(index: int) -> None:
         data_item = data[index]
 
-        x_min, y_min = tiles.coordinates[index]
-        tile_size_pixels = data_item.shape[0]
-
-        transform = rio.transform.from_origin(
-            west=x_min - buffer_size,
-            north=y_min + tile_size + buffer_size,
-            xsize=ground_sampling_distance,
-            ysize=ground_sampling_distance,
+        x_min, y_min = coordinates[index]
+
+        if mosaic_writer is not None:
+            mosaic_writer.write(
+                data_item=data_item,
+                x_min=x_min,
+                y_min=y_min,
+                tile_size=tile_size,
+                buffer_size=buffer_size,
+                ground_sampling_distance=ground_sampling_distance,
+            )
+            return
+
+        _write_geotiff(
+            data_item=data_item,
+            x_min=x_min,
+            y_min=y_min,
+            tile_size=tile_size,
+            buffer_size=buffer_size,
+            ground_sampling_distance=ground_sampling_distance,
+            epsg_code=epsg_code,
+            channel_names=channel_names,
+            path=path,
+            mapping=mapping,
         )
 
-        block_size = min(tile_size_pixels, max(16, 2 ** int(np.log2(min(256, tile_size_pixels)))))
-        predictor = 3 if np.issubdtype(data_item.dtype, np.floating) else 2
-
-        profile = {
-            'driver': 'GTiff',
-            'height': tile_size_pixels,
-            'width': tile_size_pixels,
-            'count': data_item.shape[-1],
-            'dtype': data_item.dtype,
-            'crs': epsg_code,
-            'transform': transform,
-            'tiled': True,
-            'blockxsize': block_size,
-            'blockysize': block_size,
-            'compress': 'deflate',
-            'predictor': predictor,
-            'bigtiff': 'if_safer',
-        }
-
-        path_ = path / f'{x_min}_{y_min}.tiff'
-
-        with rio.open(path_, mode='w', **profile) as dst:
-            data_item = np.transpose(data_item, (2, 0, 1))
-            dst.write(data_item)
-
-            for i, channel_name in enumerate(channel_names):
-                dst.set_band_description(i + 1, channel_name)
-
-            if mapping is not None:
-                dst.write_colormap(1, mapping)
-
-    if batch_size == 1:
-        max_num_threads = 1
-
-    if max_num_threads == 1:
+    if background_worker is not None:
+        for index in range(batch_size):
+            background_worker.submit(_export_data_item, index)
+    elif batch_size == 1 or max_num_threads == 1:
         for index in range(batch_size):
             _export_data_item(index)
     else:
-        with ThreadPoolExecutor(max_workers=max_num_threads) as executor:
-            list(executor.map(_export_data_item, range(batch_size)))
+        map_concurrently(
+            _export_data_item,
+            range(batch_size),
+            scope='tiles_exporter',
+            max_num_threads=max_num_threads,
+        )
 
     if remove_channels:
         tiles = tiles.remove(
@@ -305,6 +433,7 @@ def vector_exporter(
     epsg_code: EPSGCode,
     path: Path,
     remove_channel: bool = True,
+    gpkg_writer: GPKGWriter | None = None,
 ) -> Tiles:
     """Exports the vector channel.
 
@@ -314,6 +443,7 @@ def vector_exporter(
         epsg_code: EPSG code
         path: Path to the geopackage (.gpkg file)
         remove_channel: If True, the channel is removed
+        gpkg_writer: Geopackage writer (if None, the vector data is appended to the geopackage immediately)
 
     Returns:
         Tiles
@@ -340,10 +470,10 @@ def vector_exporter(
             inplace=True,
         )
 
-        gdf.to_file(
-            path,
-            driver='GPKG',
-            mode='a',
+        _write_gdf(
+            gdf=gdf,
+            path=path,
+            gpkg_writer=gpkg_writer,
         )
 
     if remove_channel:
@@ -353,3 +483,93 @@ def vector_exporter(
         )
 
     return tiles
+
+
+def _write_gdf(
+    gdf: gpd.GeoDataFrame,
+    path: Path,
+    gpkg_writer: GPKGWriter | None = None,
+) -> None:
+    """Appends the geodataframe to the geopackage.
+
+    Parameters:
+        gdf: Geodataframe
+        path: Path to the geopackage (.gpkg file)
+        gpkg_writer: Geopackage writer (if None, the geodataframe is appended immediately)
+    """
+    if gpkg_writer is not None:
+        gpkg_writer.write(gdf=gdf)
+        return
+
+    gdf.to_file(
+        path,
+        driver='GPKG',
+        mode='a',
+    )
+
+
+def _write_geotiff(
+    data_item: npt.NDArray,
+    x_min: Coordinate,
+    y_min: Coordinate,
+    tile_size: TileSize,
+    buffer_size: float,
+    ground_sampling_distance: GroundSamplingDistance,
+    epsg_code: str,
+    channel_names: list[ChannelName | str],
+    path: Path,
+    mapping: dict[int, list[int]] | None = None,
+) -> None:
+    """Writes the data item to a geotiff.
+
+    Parameters:
+        data_item: Data item (height, width, channels)
+        x_min: Minimum x coordinate of the tile in meters
+        y_min: Minimum y coordinate of the tile in meters
+        tile_size: Tile size in meters
+        buffer_size: Buffer size in meters
+        ground_sampling_distance: Ground sampling distance in meters
+        epsg_code: EPSG code (e.g., 'EPSG:25832')
+        channel_names: Channel names
+        path: Path to the directory
+        mapping: Mapping of the values
+    """
+    tile_size_pixels = data_item.shape[0]
+
+    transform = rio.transform.from_origin(
+        west=x_min - buffer_size,
+        north=y_min + tile_size + buffer_size,
+        xsize=ground_sampling_distance,
+        ysize=ground_sampling_distance,
+    )
+
+    block_size = min(tile_size_pixels, max(16, 2 ** int(np.log2(min(256, tile_size_pixels)))))
+    predictor = 3 if np.issubdtype(data_item.dtype, np.floating) else 2
+
+    profile = {
+        'driver': 'GTiff',
+        'height': tile_size_pixels,
+        'width': tile_size_pixels,
+        'count': data_item.shape[-1],
+        'dtype': data_item.dtype,
+        'crs': epsg_code,
+        'transform': transform,
+        'tiled': True,
+        'blockxsize': block_size,
+        'blockysize': block_size,
+        'compress': 'deflate',
+        'predictor': predictor,
+        'bigtiff': 'if_safer',
+    }
+
+    path_ = path / f'{x_min}_{y_min}.tiff'
+
+    with rio.open(path_, mode='w', **profile) as dst:
+        data_item = np.transpose(data_item, (2, 0, 1))
+        dst.write(data_item)
+
+        for i, channel_name in enumerate(channel_names):
+            dst.set_band_description(i + 1, str(channel_name))
+
+        if mapping is not None:
+            dst.write_colormap(1, mapping)
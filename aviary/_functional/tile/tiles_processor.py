@@ -18,9 +18,10 @@ from __future__ import annotations
 
 import random
 import time
-from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from itertools import repeat
 from math import isclose
+from multiprocessing.shared_memory import SharedMemory
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -32,6 +33,10 @@ import numpy.typing as npt
 import rasterio as rio
 import rasterio.features
 
+from aviary._utils.concurrency import (
+    map_concurrently,
+    map_in_processes,
+)
 from aviary.core.channel import (
     RasterChannel,
     VectorChannel,
@@ -60,15 +65,23 @@ def _process_data(
     process_data_item: Callable,
     new_channel_name: ChannelName | str | None = None,
     max_num_threads: int | None = None,
+    use_processes: bool = False,
 ) -> Tiles:
     """Processes the data of the channel.
 
+    Notes:
+        - If `use_processes` is True, the data items are processed in worker processes,
+            i.e., the function to process each data item must be picklable (e.g., a partial of a module-level
+            function instead of a lambda)
+        - Raster data items are passed to the worker processes via shared memory instead of being pickled
+
     Parameters:
         tiles: Tiles
         channel_name: Channel name
         process_data_item: Function to process each data item
         new_channel_name: New channel name
-        max_num_threads: Maximum number of threads
+        max_num_threads: Maximum number of threads (or processes if `use_processes` is True)
+        use_processes: If True, process the data items in worker processes instead of threads
 
     Returns:
         Tiles
@@ -90,9 +103,19 @@ def _process_data(
             process_data_item(data_item=data_item)
             for data_item in data
         ]
+    elif use_processes:
+        data = _process_data_in_processes(
+            data=data,
+            process_data_item=process_data_item,
+            max_num_processes=max_num_threads,
+        )
     else:
-        with ThreadPoolExecutor(max_workers=max_num_threads) as executor:
-            data = list(executor.map(process_data_item, data))
+        data = map_concurrently(
+            process_data_item,
+            data,
+            scope='tiles_processor',
+            max_num_threads=max_num_threads,
+        )
 
     channel._data = data  # ruff: ignore[SLF001]
 
@@ -106,6 +129,110 @@ def _process_data(
     return tiles
 
 
+def _process_data_in_processes(
+    data: list,
+    process_data_item: Callable,
+    max_num_processes: int | None = None,
+) -> list:
+    """Processes the data items in worker processes.
+
+    Notes:
+        - If the data items are arrays, they are copied into a single shared memory block once and the worker
+            processes create views of it, otherwise the data items are pickled
+
+    Parameters:
+        data: Data
+        process_data_item: Function to process each data item
+        max_num_processes: Maximum number of processes
+
+    Returns:
+        Data
+    """
+    conditions = [
+        isinstance(data_item, np.ndarray) and not data_item.dtype.hasobject
+        for data_item in data
+    ]
+
+    if not all(conditions) or sum(data_item.nbytes for data_item in data) == 0:
+        return map_in_processes(
+            process_data_item,
+            data,
+            max_num_processes=max_num_processes,
+        )
+
+    shared_memory = SharedMemory(
+        create=True,
+        size=sum(data_item.nbytes for data_item in data),
+    )
+
+    try:
+        descriptors = []
+        offset = 0
+
+        for data_item in data:
+            shared_data_item = np.ndarray(
+                shape=data_item.shape,
+                dtype=data_item.dtype,
+                buffer=shared_memory.buf,
+                offset=offset,
+            )
+            shared_data_item[...] = data_item
+            del shared_data_item
+
+            descriptors.append((offset, data_item.shape, data_item.dtype.str))
+            offset += data_item.nbytes
+
+        return map_in_processes(
+            partial(
+                _process_shared_data_item,
+                process_data_item=process_data_item,
+                shared_memory_name=shared_memory.name,
+            ),
+            descriptors,
+            max_num_processes=max_num_processes,
+        )
+    finally:
+        shared_memory.close()
+        shared_memory.unlink()
+
+
+def _process_shared_data_item(
+    descriptor: tuple[int, tuple[int, ...], str],
+    process_data_item: Callable,
+    shared_memory_name: str,
+) -> object:
+    """Processes the data item that is stored in the shared memory block.
+
+    Parameters:
+        descriptor: Offset in bytes, shape and data type of the data item
+        process_data_item: Function to process the data item
+        shared_memory_name: Name of the shared memory block
+
+    Returns:
+        Data item
+    """
+    offset, shape, dtype = descriptor
+    shared_memory = SharedMemory(name=shared_memory_name)
+
+    try:
+        data_item = np.ndarray(
+            shape=shape,
+            dtype=dtype,
+            buffer=shared_memory.buf,
+            offset=offset,
+        )
+        processed_data_item = process_data_item(data_item=data_item)
+
+        if isinstance(processed_data_item, np.ndarray) and np.shares_memory(processed_data_item, data_item):
+            processed_data_item = processed_data_item.copy()
+
+        del data_item
+    finally:
+        shared_memory.close()
+
+    return processed_data_item
+
+
 def _compute_dem_gradients(
     digital_elevation_model: npt.NDArray,
     ground_sampling_distance: GroundSamplingDistance,
@@ -356,8 +483,12 @@ def expression_processor(
             for index in range(batch_size)
         ]
     else:
-        with ThreadPoolExecutor(max_workers=max_num_threads) as executor:
-            data = list(executor.map(_compute_data_item, range(batch_size)))
+        data = map_concurrently(
+            _compute_data_item,
+            range(batch_size),
+            scope='tiles_processor',
+            max_num_threads=max_num_threads,
+        )
 
     first_channel = tiles[_coerce_channel_name(channel_name=channel_names[0])]
     buffer_size = first_channel.buffer_size
@@ -440,14 +571,15 @@ def hillshade_processor(
                 for slope_data_item, aspect_data_item in zip(slope_data, aspect_data, strict=False)
             ]
         else:
-            with ThreadPoolExecutor(max_workers=max_num_threads) as executor:
-                data = list(executor.map(
-                    _hillshade_slope_aspect_data_item,
-                    slope_data,
-                    aspect_data,
-                    repeat(azimuth),
-                    repeat(altitude),
-                ))
+            data = map_concurrently(
+                _hillshade_slope_aspect_data_item,
+                slope_data,
+                aspect_data,
+                repeat(azimuth),
+                repeat(altitude),
+                scope='tiles_processor',
+                max_num_threads=max_num_threads,
+            )
 
         channel._data = data  # ruff: ignore[SLF001]
         channel.name = new_channel_name
@@ -621,6 +753,7 @@ def rasterize_processor(
     dtype: DType | None = DType.UINT8,
     new_channel_name: ChannelName | str | None = None,
     max_num_threads: int | None = None,
+    use_processes: bool = False,
 ) -> Tiles:
     """Rasterizes the channel.
 
@@ -634,7 +767,8 @@ def rasterize_processor(
         background_value: Background value
         dtype: Data type
         new_channel_name: New channel name
-        max_num_threads: Maximum number of threads
+        max_num_threads: Maximum number of threads (or processes if `use_processes` is True)
+        use_processes: If True, process the data items in worker processes instead of threads
 
     Returns:
         Tiles
@@ -661,8 +795,8 @@ def rasterize_processor(
     tiles = _process_data(
         tiles=tiles,
         channel_name=channel_name,
-        process_data_item=lambda data_item: _rasterize_data_item(
-            data_item=data_item,
+        process_data_item=partial(
+            _rasterize_data_item,
             tile_size_pixels=tile_size_pixels,
             field=field,
             mapping=mapping,
@@ -672,6 +806,7 @@ def rasterize_processor(
         ),
         new_channel_name=new_channel_name,
         max_num_threads=max_num_threads,
+        use_processes=use_processes,
     )
 
     if new_channel_name is not None:  # ruff: ignore[SIM108]
@@ -874,6 +1009,7 @@ def sieve_processor(
     connectivity: Connectivity = Connectivity.FOUR,
     new_channel_name: ChannelName | str | None = None,
     max_num_threads: int | None = None,
+    use_processes: bool = False,
 ) -> Tiles:
     """Sieves the channel.
 
@@ -883,7 +1019,8 @@ def sieve_processor(
         threshold: Threshold (the minimum area of the polygon to retain) in pixels
         connectivity: Connectivity (`FOUR` or `EIGHT`)
         new_channel_name: New channel name
-        max_num_threads: Maximum number of threads
+        max_num_threads: Maximum number of threads (or processes if `use_processes` is True)
+        use_processes: If True, process the data items in worker processes instead of threads
 
     Returns:
         Tiles
@@ -891,13 +1028,14 @@ def sieve_processor(
     return _process_data(
         tiles=tiles,
         channel_name=channel_name,
-        process_data_item=lambda data_item: _sieve_data_item(
-            data_item=data_item,
+        process_data_item=partial(
+            _sieve_data_item,
             threshold=threshold,
             connectivity=connectivity,
         ),
         new_channel_name=new_channel_name,
         max_num_threads=max_num_threads,
+        use_processes=use_processes,
     )
 
 
@@ -1079,6 +1217,7 @@ def vectorize_processor(
     background_value: int | None = None,
     new_channel_name: ChannelName | str | None = None,
     max_num_threads: int | None = None,
+    use_processes: bool = False,
 ) -> Tiles:
     """Vectorizes the channel.
 
@@ -1088,7 +1227,8 @@ def vectorize_processor(
         field: Field
         background_value: Background value
         new_channel_name: New channel name
-        max_num_threads: Maximum number of threads
+        max_num_threads: Maximum number of threads (or processes if `use_processes` is True)
+        use_processes: If True, process the data items in worker processes instead of threads
 
     Returns:
         Tiles
@@ -1096,13 +1236,14 @@ def vectorize_processor(
     tiles = _process_data(
         tiles=tiles,
         channel_name=channel_name,
-        process_data_item=lambda data_item: _vectorize_data_item(
-            data_item=data_item,
+        process_data_item=partial(
+            _vectorize_data_item,
             field=field,
             background_value=background_value,
         ),
         new_channel_name=new_channel_name,
         max_num_threads=max_num_threads,
+        use_processes=use_processes,
     )
 
     if new_channel_name is not None:  # ruff: ignore[SIM108]
@@ -19,6 +19,7 @@ from typing import TYPE_CHECKING
 
 import geopandas as gpd
 import numpy as np
+import shapely
 from numpy import typing as npt
 
 from aviary.core.enums import (
@@ -65,9 +66,9 @@ def duplicates_filter(
     Returns:
         Coordinates (x_min, y_min) of each tile in meters
     """
+    keys = _pack_coordinates(coordinates=coordinates)
     _, indices = np.unique(
-        coordinates,
-        axis=0,
+        keys,
         return_index=True,
     )
     return coordinates[np.sort(indices)]
@@ -93,14 +94,17 @@ def geospatial_filter(
     Raises:
         AviaryUserError: Invalid `mode`
     """
-    from aviary.core.grid import Grid  # ruff: ignore[PLC0415]
-
-    grid = Grid(
-        coordinates=coordinates,
-        tile_size=tile_size,
+    coordinates_ = coordinates.astype(np.float64)
+    geometry = shapely.box(
+        xmin=coordinates_[:, 0],
+        ymin=coordinates_[:, 1],
+        xmax=coordinates_[:, 0] + tile_size,
+        ymax=coordinates_[:, 1] + tile_size,
+    )
+    grid = gpd.GeoDataFrame(
+        geometry=geometry,
+        crs=gdf.crs,
     )
-    epsg_code = gdf.crs.to_epsg() if gdf.crs is not None else None
-    grid = grid.to_gdf(epsg_code=epsg_code)
 
     if mode == GeospatialFilterMode.DIFFERENCE:
         return _geospatial_filter_difference(
@@ -221,6 +225,25 @@ def mask_filter(
     return coordinates[mask]
 
 
+def _pack_coordinates(
+    coordinates: CoordinatesSet,
+) -> npt.NDArray[np.int64]:
+    """Packs the coordinates into keys.
+
+    Notes:
+        - The x coordinate is packed into the upper 32 bits and the y coordinate into the lower 32 bits,
+            i.e., the coordinates are equal if and only if their keys are equal
+
+    Parameters:
+        coordinates: Coordinates (x_min, y_min) of each tile in meters
+
+    Returns:
+        Keys in shape (n,)
+    """
+    coordinates = coordinates.astype(np.int64)
+    return (coordinates[:, 0] << 32) | (coordinates[:, 1] & 0xFFFFFFFF)
+
+
 def set_filter(
     coordinates: CoordinatesSet,
     other: CoordinatesSet,
@@ -276,8 +299,11 @@ def _set_filter_difference(
     Returns:
         Coordinates (x_min, y_min) of each tile in meters
     """
-    # noinspection PyUnresolvedReferences
-    mask = ~(coordinates[:, np.newaxis] == other).all(axis=-1).any(axis=-1)
+    mask = np.isin(
+        _pack_coordinates(coordinates=coordinates),
+        _pack_coordinates(coordinates=other),
+        invert=True,
+    )
     return coordinates[mask]
 
 
@@ -296,8 +322,10 @@ def _set_filter_intersection(
     Returns:
         Coordinates (x_min, y_min) of each tile in meters
     """
-    # noinspection PyUnresolvedReferences
-    mask = (coordinates[:, np.newaxis] == other).all(axis=-1).any(axis=-1)
+    mask = np.isin(
+        _pack_coordinates(coordinates=coordinates),
+        _pack_coordinates(coordinates=other),
+    )
     return coordinates[mask]
 
 
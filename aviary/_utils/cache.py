@@ -0,0 +1,211 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import uuid
+import zlib
+from collections import OrderedDict
+from contextlib import suppress
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class DiskCache:
+    """Thread-safe on-disk cache with least recently used eviction
+
+    Notes:
+        - The values are pickled and compressed, each value is stored in a file named after the hash of its key
+        - The files are written atomically, i.e., a value is either stored completely or not at all
+        - The least recently used order is persisted via the modification times of the files
+        - If the size of the cache exceeds the maximum size, the least recently used values are evicted
+        - A corrupted or incompatible file (e.g., a value that cannot be unpickled by this version of aviary)
+            is treated as a miss and removed
+    """
+    _COMPRESSION_LEVEL = 1
+    _SUFFIX = '.cache'
+
+    def __init__(
+        self,
+        path: Path,
+        max_size: int | None = None,
+    ) -> None:
+        """
+        Parameters:
+            path: Path to the cache directory
+            max_size: Maximum size in bytes (if None, the size is not limited)
+        """
+        self._path = path
+        self._max_size = max_size
+
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        self._num_hits = 0
+        self._num_misses = 0
+        self._index, self._size = self._load_index()
+
+    def _load_index(self) -> tuple[OrderedDict[str, int], int]:
+        """Loads the index from the cache directory in least recently used order.
+
+        Returns:
+            Index (file names and sizes) and size in bytes
+        """
+        stats = []
+
+        for path in self._path.glob(f'*{self._SUFFIX}'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+
+            stats.append((stat.st_mtime_ns, path.name, stat.st_size))
+
+        stats.sort()
+        index = OrderedDict((name, size) for _, name, size in stats)
+        size = sum(index.values())
+        return index, size
+
+    @property
+    def num_hits(self) -> int:
+        """
+        Returns:
+            Number of hits
+        """
+        return self._num_hits
+
+    @property
+    def num_misses(self) -> int:
+        """
+        Returns:
+            Number of misses
+        """
+        return self._num_misses
+
+    @property
+    def size(self) -> int:
+        """
+        Returns:
+            Size in bytes
+        """
+        return self._size
+
+    def __len__(self) -> int:
+        """Computes the number of values.
+
+        Returns:
+            Number of values
+        """
+        with self._lock:
+            return len(self._index)
+
+    def _get_name(
+        self,
+        key: str,
+    ) -> str:
+        """Returns the file name of the key.
+
+        Parameters:
+            key: Key
+
+        Returns:
+            File name
+        """
+        return hashlib.sha256(key.encode()).hexdigest() + self._SUFFIX
+
+    def get(
+        self,
+        key: str,
+    ) -> object | None:
+        """Returns the value.
+
+        Parameters:
+            key: Key
+
+        Returns:
+            Value (if None, the key is not cached)
+        """
+        name = self._get_name(key=key)
+        path = self._path / name
+
+        try:
+            content = path.read_bytes()
+            value = pickle.loads(zlib.decompress(content))  # ruff: ignore[S301]
+        except FileNotFoundError:
+            value = None
+        except Exception:  # ruff: ignore[BLE001]
+            path.unlink(missing_ok=True)
+            value = None
+
+        with self._lock:
+            if value is None:
+                self._num_misses += 1
+                size = self._index.pop(name, None)
+
+                if size is not None:
+                    self._size -= size
+
+                return None
+
+            self._num_hits += 1
+
+            if name in self._index:
+                self._index.move_to_end(name)
+
+        with suppress(FileNotFoundError):
+            os.utime(path)
+
+        return value
+
+    def put(
+        self,
+        key: str,
+        value: object,
+    ) -> None:
+        """Puts the value.
+
+        Parameters:
+            key: Key
+            value: Value
+        """
+        name = self._get_name(key=key)
+        path = self._path / name
+        content = zlib.compress(
+            pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+            level=self._COMPRESSION_LEVEL,
+        )
+
+        temp_path = self._path / f'{name}.{uuid.uuid4().hex}.tmp'
+        temp_path.write_bytes(content)
+        temp_path.replace(path)
+
+        with self._lock:
+            self._size -= self._index.pop(name, 0)
+            self._index[name] = len(content)
+            self._size += len(content)
+            evicted = []
+
+            while self._max_size is not None and self._size > self._max_size and self._index:
+                name_, size = self._index.popitem(last=False)
+                self._size -= size
+                evicted.append(name_)
+
+        for name_ in evicted:
+            (self._path / name_).unlink(missing_ok=True)
@@ -0,0 +1,228 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import json
+import uuid
+import zlib
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from aviary.core.exceptions import AviaryUserError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import numpy.typing as npt
+
+    from aviary.core.type_aliases import Coordinate
+
+
+class ChunkStore:
+    """Chunked array store that stores the raster data of each tile in a compressed chunk
+
+    Notes:
+        - The metadata (tile size, buffer size, shape, data type, and channel names of the chunks)
+            is stored in a JSON file
+        - Each chunk is the raster data (height, width, channels) of a tile in C order compressed with zlib,
+            stored in a file named `{x_min}/{y_min}`, i.e., a chunk is located by the coordinates
+            of its tile without an index
+        - The metadata and the chunks are written atomically, i.e., a chunk is either stored completely
+            or not at all
+        - The store can be written by several threads and processes concurrently
+    """
+    _COMPRESSION_LEVEL = 1
+    _FORMAT = 1
+    _METADATA_NAME = 'metadata.json'
+
+    def __init__(
+        self,
+        path: Path,
+    ) -> None:
+        """
+        Parameters:
+            path: Path to the chunk store (directory)
+        """
+        self._path = path
+
+        self._metadata: dict[str, object] | None = None
+
+    @property
+    def metadata(self) -> dict[str, object] | None:
+        """
+        Returns:
+            Metadata (if None, the chunk store does not exist)
+        """
+        if self._metadata is None:
+            try:
+                metadata_string = (self._path / self._METADATA_NAME).read_text()
+            except FileNotFoundError:
+                return None
+
+            self._metadata = json.loads(metadata_string)
+
+        return self._metadata
+
+    def initialize(
+        self,
+        tile_size: int,
+        buffer_size: int,
+        shape: tuple[int, int, int],
+        dtype: np.dtype,
+        channel_names: list[str],
+    ) -> None:
+        """Creates the chunk store if it does not exist yet.
+
+        Parameters:
+            tile_size: Tile size in meters
+            buffer_size: Buffer size in meters
+            shape: Shape of each chunk (height, width, channels)
+            dtype: Data type
+            channel_names: Channel names
+
+        Raises:
+            AviaryUserError: Invalid `path` (the metadata does not match the chunk store)
+        """
+        metadata = {
+            'format': self._FORMAT,
+            'tile_size': int(tile_size),
+            'buffer_size': int(buffer_size),
+            'shape': [int(size) for size in shape],
+            'dtype': np.dtype(dtype).str,
+            'channel_names': channel_names,
+            'compressor': {
+                'id': 'zlib',
+                'level': self._COMPRESSION_LEVEL,
+            },
+        }
+
+        if self.metadata is None:
+            self._path.mkdir(parents=True, exist_ok=True)
+            self._write(
+                path=self._path / self._METADATA_NAME,
+                content=json.dumps(metadata).encode(),
+            )
+            self._metadata = metadata
+            return
+
+        if self.metadata != metadata:
+            message = (
+                'Invalid path! '
+                'The tile size, buffer size, shape, data type, and channel names must match '
+                'the chunk store.'
+            )
+            raise AviaryUserError(message)
+
+    def _get_chunk_path(
+        self,
+        x_min: Coordinate,
+        y_min: Coordinate,
+    ) -> Path:
+        """Returns the path to the chunk.
+
+        Parameters:
+            x_min: Minimum x coordinate of the tile in meters
+            y_min: Minimum y coordinate of the tile in meters
+
+        Returns:
+            Path to the chunk
+        """
+        return self._path / str(int(x_min)) / str(int(y_min))
+
+    def _write(
+        self,
+        path: Path,
+        content: bytes,
+    ) -> None:
+        """Writes the content to the file atomically.
+
+        Parameters:
+            path: Path to the file
+            content: Content
+        """
+        temp_path = path.parent / f'.{path.name}.{uuid.uuid4().hex}.tmp'
+        temp_path.write_bytes(content)
+        temp_path.replace(path)
+
+    def write(
+        self,
+        x_min: Coordinate,
+        y_min: Coordinate,
+        data: npt.NDArray,
+    ) -> None:
+        """Writes the chunk.
+
+        Parameters:
+            x_min: Minimum x coordinate of the tile in meters
+            y_min: Minimum y coordinate of the tile in meters
+            data: Data (height, width, channels)
+        """
+        path = self._get_chunk_path(
+            x_min=x_min,
+            y_min=y_min,
+        )
+        path.parent.mkdir(exist_ok=True)
+        content = zlib.compress(
+            np.ascontiguousarray(data).data,
+            level=self._COMPRESSION_LEVEL,
+        )
+        self._write(
+            path=path,
+            content=content,
+        )
+
+    def read(
+        self,
+        x_min: Coordinate,
+        y_min: Coordinate,
+    ) -> npt.NDArray | None:
+        """Reads the chunk.
+
+        Parameters:
+            x_min: Minimum x coordinate of the tile in meters
+            y_min: Minimum y coordinate of the tile in meters
+
+        Returns:
+            Data (height, width, channels) (if None, the chunk does not exist)
+
+        Raises:
+            AviaryUserError: Invalid `path` (the chunk store does not exist)
+        """
+        metadata = self.metadata
+
+        if metadata is None:
+            message = (
+                'Invalid path! '
+                'The chunk store must exist.'
+            )
+            raise AviaryUserError(message)
+
+        path = self._get_chunk_path(
+            x_min=x_min,
+            y_min=y_min,
+        )
+
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        data = np.frombuffer(
+            bytearray(zlib.decompress(content)),
+            dtype=np.dtype(metadata['dtype']),
+        )
+        return data.reshape(metadata['shape'])
@@ -0,0 +1,801 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import (
+    contextmanager,
+    suppress,
+)
+from queue import (
+    Empty,
+    Full,
+    Queue,
+)
+from threading import (
+    Event,
+    Lock,
+    Thread,
+    local,
+)
+from typing import (
+    TYPE_CHECKING,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Callable,
+        Coroutine,
+        Iterable,
+        Iterator,
+    )
+
+T = TypeVar('T')
+
+_event_loop: asyncio.AbstractEventLoop | None = None
+_event_loop_lock = Lock()
+_executor_registry: ExecutorRegistry | None = None
+_executor_registry_lock = Lock()
+_thread_local = local()
+_STAGE_END = object()
+_STAGE_POLL_INTERVAL = .1
+
+
+class AsyncRateLimiter:
+    """Rate limiter for coroutines
+
+    Notes:
+        - The calls to `wait` are spaced evenly, i.e., by the inverse of the maximum number of calls per second
+    """
+
+    def __init__(
+        self,
+        max_num_calls_per_second: float,
+    ) -> None:
+        """
+        Parameters:
+            max_num_calls_per_second: Maximum number of calls per second
+        """
+        self._max_num_calls_per_second = max_num_calls_per_second
+
+        self._interval = 1. / self._max_num_calls_per_second
+        self._next_time = 0.
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        """Waits until the next call is allowed."""
+        async with self._lock:
+            delay = self._next_time - time.monotonic()
+
+            if delay > 0.:
+                await asyncio.sleep(delay)
+
+            self._next_time = max(time.monotonic(), self._next_time) + self._interval
+
+
+class BackgroundWorker:
+    """Dedicated worker threads that call the submitted functions in the background
+
+    Notes:
+        - The submitted calls are put into a bounded queue, i.e., `submit` blocks if the queue is full (backpressure)
+        - The worker threads are started on first submit and stopped when the background worker is closed
+        - If a call raises an exception, the queued calls are discarded and the exception is raised
+            in the calling thread by the next call to `submit`, `join`, or `close`, afterward the background worker
+            accepts calls again
+        - The calls are not guaranteed to be called in the order of submission if there are several worker threads
+    """
+
+    def __init__(
+        self,
+        num_threads: int = 1,
+        max_queue_size: int = 1,
+        name: str = 'background',
+    ) -> None:
+        """
+        Parameters:
+            num_threads: Number of worker threads
+            max_queue_size: Maximum number of queued calls
+            name: Name of the worker threads
+        """
+        self._num_threads = num_threads
+        self._max_queue_size = max_queue_size
+        self._name = name
+
+        self._queue: Queue = Queue(maxsize=self._max_queue_size)
+        self._threads: list[Thread] = []
+        self._stop_event = Event()
+        self._exceptions: list[BaseException] = []
+        self._lock = Lock()
+
+    def _start(self) -> None:
+        """Starts the worker threads if they are not started yet."""
+        with self._lock:
+            if self._threads:
+                return
+
+            self._threads = [
+                Thread(
+                    target=self._work,
+                    name=f'aviary-{self._name}-{i}',
+                    daemon=True,
+                )
+                for i in range(self._num_threads)
+            ]
+
+            for thread in self._threads:
+                thread.start()
+
+    def _work(self) -> None:
+        """Calls the queued functions until the end marker is received."""
+        while True:
+            item = self._queue.get()
+
+            try:
+                if item is _STAGE_END:
+                    return
+
+                if self._stop_event.is_set():
+                    continue
+
+                fn, args, kwargs = item
+
+                try:
+                    fn(*args, **kwargs)
+                except BaseException as exception:  # ruff: ignore[BLE001]
+                    with self._lock:
+                        self._exceptions.append(exception)
+
+                    self._stop_event.set()
+            finally:
+                self._queue.task_done()
+
+    def _raise(self) -> None:
+        """Raises the first exception of the worker threads after the queued calls are discarded.
+
+        Raises:
+            BaseException: Exception of a worker thread
+        """
+        with self._lock:
+            if not self._exceptions:
+                return
+
+            exception = self._exceptions[0]
+
+        self._queue.join()
+
+        with self._lock:
+            self._exceptions.clear()
+            self._stop_event.clear()
+
+        raise exception
+
+    def submit(
+        self,
+        fn: Callable,
+        *args: object,
+        **kwargs: object,
+    ) -> None:
+        """Queues the call of the function, waiting until there is space in the queue.
+
+        Parameters:
+            fn: Function
+            args: Positional arguments of the function
+            kwargs: Keyword arguments of the function
+
+        Raises:
+            BaseException: Exception of a previous call
+        """
+        self._raise()
+        self._start()
+        self._queue.put((fn, args, kwargs))
+
+    def join(self) -> None:
+        """Waits until all queued calls are done.
+
+        Raises:
+            BaseException: Exception of a queued call
+        """
+        self._queue.join()
+        self._raise()
+
+    def close(self) -> None:
+        """Waits until all queued calls are done and stops the worker threads.
+
+        Raises:
+            BaseException: Exception of a queued call
+        """
+        with self._lock:
+            threads = self._threads
+            self._threads = []
+
+        for _ in threads:
+            self._queue.put(_STAGE_END)
+
+        for thread in threads:
+            thread.join()
+
+        self._raise()
+
+
+class ExecutorRegistry:
+    """Registry of long-lived thread pools and a process pool that are shared by the components of a pipeline
+
+    Notes:
+        - Each scope (e.g., 'tile_loader' or 'tiles_processor') has its own thread pool, which is created
+            on first use and reused until the registry is closed
+        - A task that waits for the tasks of another scope cannot exhaust the thread pool of that scope
+        - If a task maps a function in its own scope (e.g., nested composite components), the function is called
+            in the calling thread to avoid deadlocks
+        - The process pool is created on first use and reused until the registry is closed,
+            i.e., the worker processes are started once per run instead of once per batch
+    """
+
+    def __init__(
+        self,
+        max_num_threads: int | None = None,
+        max_num_processes: int | None = None,
+    ) -> None:
+        """
+        Parameters:
+            max_num_threads: Maximum number of threads of each thread pool
+            max_num_processes: Maximum number of processes of the process pool
+        """
+        self._max_num_threads = max_num_threads
+        self._max_num_processes = max_num_processes
+
+        self._executors: dict[str, ThreadPoolExecutor] = {}
+        self._process_executor: ProcessPoolExecutor | None = None
+        self._lock = Lock()
+
+    def _get_executor(
+        self,
+        scope: str,
+    ) -> ThreadPoolExecutor:
+        """Returns the thread pool of the scope.
+
+        Parameters:
+            scope: Scope
+
+        Returns:
+            Thread pool
+        """
+        with self._lock:
+            executor = self._executors.get(scope)
+
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=self._max_num_threads,
+                    thread_name_prefix=f'aviary-{scope}',
+                    initializer=_set_scope,
+                    initargs=(scope,),
+                )
+                self._executors[scope] = executor
+
+            return executor
+
+    def map(
+        self,
+        fn: Callable[..., T],
+        *iterables: Iterable,
+        scope: str,
+        max_num_threads: int | None = None,
+    ) -> list[T]:
+        """Maps the function over the iterables in the thread pool of the scope.
+
+        Parameters:
+            fn: Function
+            iterables: Iterables
+            scope: Scope
+            max_num_threads: Maximum number of concurrently running calls (if None, the number is limited
+                by the thread pool only)
+
+        Returns:
+            Results in the order of the iterables
+        """
+        args = list(zip(*iterables, strict=False))
+
+        if getattr(_thread_local, 'scope', None) == scope or max_num_threads == 1:
+            return [fn(*args_) for args_ in args]
+
+        executor = self._get_executor(scope=scope)
+        return _map_executor(
+            executor=executor,
+            fn=fn,
+            args=args,
+            max_num_workers=max_num_threads,
+        )
+
+    def _get_process_executor(self) -> ProcessPoolExecutor:
+        """Returns the process pool.
+
+        Returns:
+            Process pool
+        """
+        with self._lock:
+            if self._process_executor is None:
+                self._process_executor = _create_process_executor(max_num_processes=self._max_num_processes)
+
+            return self._process_executor
+
+    def map_in_processes(
+        self,
+        fn: Callable[..., T],
+        *iterables: Iterable,
+        max_num_processes: int | None = None,
+    ) -> list[T]:
+        """Maps the function over the iterables in the process pool.
+
+        Parameters:
+            fn: Function (must be picklable)
+            iterables: Iterables (the items must be picklable)
+            max_num_processes: Maximum number of concurrently running calls (if None, the number is limited
+                by the process pool only)
+
+        Returns:
+            Results in the order of the iterables
+        """
+        args = list(zip(*iterables, strict=False))
+        executor = self._get_process_executor()
+        return _map_executor(
+            executor=executor,
+            fn=fn,
+            args=args,
+            max_num_workers=max_num_processes,
+        )
+
+    def close(self) -> None:
+        """Shuts down the thread pools and the process pool."""
+        with self._lock:
+            executors: list[Executor] = list(self._executors.values())
+            self._executors.clear()
+
+            if self._process_executor is not None:
+                executors.append(self._process_executor)
+                self._process_executor = None
+
+        for executor in executors:
+            executor.shutdown()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Returns the background event loop.
+
+    Notes:
+        - The event loop runs in a daemon thread that is started on the first call
+
+    Returns:
+        Event loop
+    """
+    global _event_loop  # ruff: ignore[PLW0603]
+
+    with _event_loop_lock:
+        if _event_loop is None:
+            event_loop = asyncio.new_event_loop()
+            thread = Thread(
+                target=event_loop.run_forever,
+                name='aviary-event-loop',
+                daemon=True,
+            )
+            thread.start()
+            _event_loop = event_loop
+
+    return _event_loop
+
+
+def run_coroutine(
+    coroutine: Coroutine[object, object, T],
+) -> T:
+    """Runs the coroutine in the background event loop and waits for the result.
+
+    Parameters:
+        coroutine: Coroutine
+
+    Returns:
+        Result
+    """
+    event_loop = get_event_loop()
+    future = asyncio.run_coroutine_threadsafe(coroutine, event_loop)
+    return future.result()
+
+
+def get_executor_registry() -> ExecutorRegistry | None:
+    """Returns the executor registry that is in use.
+
+    Returns:
+        Executor registry (if None, no executor registry is in use)
+    """
+    return _executor_registry
+
+
+def map_concurrently(
+    fn: Callable[..., T],
+    *iterables: Iterable,
+    scope: str,
+    max_num_threads: int | None = None,
+) -> list[T]:
+    """Maps the function over the iterables concurrently.
+
+    Notes:
+        - If an executor registry is in use (see `use_executor_registry`), the thread pool of the scope is reused,
+            otherwise a thread pool is created for this call
+
+    Parameters:
+        fn: Function
+        iterables: Iterables
+        scope: Scope
+        max_num_threads: Maximum number of threads
+
+    Returns:
+        Results in the order of the iterables
+    """
+    executor_registry = get_executor_registry()
+
+    if executor_registry is not None:
+        return executor_registry.map(
+            fn,
+            *iterables,
+            scope=scope,
+            max_num_threads=max_num_threads,
+        )
+
+    with ThreadPoolExecutor(max_workers=max_num_threads) as executor:
+        return list(executor.map(fn, *iterables))
+
+
+def map_in_processes(
+    fn: Callable[..., T],
+    *iterables: Iterable,
+    max_num_processes: int | None = None,
+) -> list[T]:
+    """Maps the function over the iterables in worker processes.
+
+    Notes:
+        - If an executor registry is in use (see `use_executor_registry`), the process pool is reused,
+            otherwise a process pool is created for this call
+        - The worker processes are spawned, i.e., they do not inherit the threads or the state of the calling process
+
+    Parameters:
+        fn: Function (must be picklable)
+        iterables: Iterables (the items must be picklable)
+        max_num_processes: Maximum number of processes
+
+    Returns:
+        Results in the order of the iterables
+    """
+    executor_registry = get_executor_registry()
+
+    if executor_registry is not None:
+        return executor_registry.map_in_processes(
+            fn,
+            *iterables,
+            max_num_processes=max_num_processes,
+        )
+
+    with _create_process_executor(max_num_processes=max_num_processes) as executor:
+        return list(executor.map(fn, *iterables))
+
+
+def run_stages(
+    items: Iterable[T],
+    stages: list[tuple[Callable[[T], T], int]],
+    max_queue_size: int = 1,
+) -> Iterator[T]:
+    """Runs the stages concurrently, each stage consumes the items of the previous stage.
+
+    Notes:
+        - The items are produced by a feeding thread, each stage is run by its number of worker threads
+        - The stages are connected by bounded queues, i.e., a slow stage blocks the previous stages (backpressure)
+        - The items are yielded in the order of completion, which is the order of the items
+            only if each stage has one worker thread
+        - If an exception is raised in the feeding thread or in a stage, the remaining items are discarded
+            and the exception is raised in the calling thread
+
+    Parameters:
+        items: Items
+        stages: Stages (function and number of worker threads)
+        max_queue_size: Maximum number of items in each queue
+
+    Yields:
+        Items processed by all stages
+    """
+    stage_runner = _StageRunner(
+        items=items,
+        stages=stages,
+        max_queue_size=max_queue_size,
+    )
+    yield from stage_runner.run()
+
+
+class _StageRunner:
+    """Runner of concurrent stages that are connected by bounded queues (see `run_stages`)"""
+
+    def __init__(
+        self,
+        items: Iterable,
+        stages: list[tuple[Callable, int]],
+        max_queue_size: int = 1,
+    ) -> None:
+        """
+        Parameters:
+            items: Items
+            stages: Stages (function and number of worker threads)
+            max_queue_size: Maximum number of items in each queue
+        """
+        self._items = items
+        self._stages = stages
+        self._max_queue_size = max_queue_size
+
+        self._queues: list[Queue] = [Queue(maxsize=self._max_queue_size) for _ in range(len(self._stages) + 1)]
+        self._stop_event = Event()
+        self._exceptions: list[BaseException] = []
+        self._lock = Lock()
+        self._num_running_workers = [num_workers for _, num_workers in self._stages]
+
+    def _put(
+        self,
+        index: int,
+        item: object,
+    ) -> bool:
+        """Puts the item into the queue, waiting until there is space or the runner is stopped.
+
+        Parameters:
+            index: Index of the queue
+            item: Item
+
+        Returns:
+            True if the item was put, False if the runner is stopped
+        """
+        while not self._stop_event.is_set():
+            with suppress(Full):
+                self._queues[index].put(item, timeout=_STAGE_POLL_INTERVAL)
+                return True
+
+        return False
+
+    def _get(
+        self,
+        index: int,
+    ) -> object:
+        """Gets the next item from the queue, waiting until there is an item or the runner is stopped.
+
+        Parameters:
+            index: Index of the queue
+
+        Returns:
+            Item (the end marker if the runner is stopped)
+        """
+        while not self._stop_event.is_set():
+            with suppress(Empty):
+                return self._queues[index].get(timeout=_STAGE_POLL_INTERVAL)
+
+        return _STAGE_END
+
+    def _fail(
+        self,
+        exception: BaseException,
+    ) -> None:
+        """Records the exception and stops the runner.
+
+        Parameters:
+            exception: Exception
+        """
+        with self._lock:
+            self._exceptions.append(exception)
+
+        self._stop_event.set()
+
+    def _feed(self) -> None:
+        """Puts the items into the queue of the first stage."""
+        try:
+            for item in self._items:
+                if not self._put(index=0, item=item):
+                    return
+        except BaseException as exception:  # ruff: ignore[BLE001]
+            self._fail(exception=exception)
+            return
+
+        self._put(index=0, item=_STAGE_END)
+
+    def _work(
+        self,
+        index: int,
+    ) -> None:
+        """Processes the items of the stage until the end marker is received.
+
+        Notes:
+            - The last worker of the stage passes the end marker on to the next stage,
+                the other workers pass it on to their sibling workers
+
+        Parameters:
+            index: Index of the stage
+        """
+        fn, _ = self._stages[index]
+
+        while True:
+            item = self._get(index=index)
+
+            if item is _STAGE_END:
+                with self._lock:
+                    self._num_running_workers[index] -= 1
+                    is_last_worker = self._num_running_workers[index] == 0
+
+                self._put(
+                    index=index + 1 if is_last_worker else index,
+                    item=_STAGE_END,
+                )
+                return
+
+            try:
+                item = fn(item)
+            except BaseException as exception:  # ruff: ignore[BLE001]
+                self._fail(exception=exception)
+                return
+
+            if not self._put(index=index + 1, item=item):
+                return
+
+    def run(self) -> Iterator:
+        """Runs the stages.
+
+        Yields:
+            Items processed by all stages
+        """
+        threads = [
+            Thread(
+                target=self._feed,
+                name='aviary-stage-feed',
+                daemon=True,
+            ),
+        ]
+        threads.extend(
+            Thread(
+                target=self._work,
+                kwargs={'index': index},
+                name=f'aviary-stage-{index}-{i}',
+                daemon=True,
+            )
+            for index, (_, num_workers) in enumerate(self._stages)
+            for i in range(num_workers)
+        )
+
+        try:
+            for thread in threads:
+                thread.start()
+
+            while True:
+                item = self._get(index=len(self._stages))
+
+                if item is _STAGE_END:
+                    break
+
+                yield item
+        finally:
+            self._stop_event.set()
+
+            for thread in threads:
+                if thread.is_alive():
+                    thread.join()
+
+        if self._exceptions:
+            raise self._exceptions[0]
+
+
+@contextmanager
+def use_executor_registry(
+    executor_registry: ExecutorRegistry,
+) -> Iterator[ExecutorRegistry]:
+    """Uses the executor registry within the context.
+
+    Parameters:
+        executor_registry: Executor registry
+
+    Yields:
+        Executor registry
+    """
+    global _executor_registry  # ruff: ignore[PLW0603]
+
+    with _executor_registry_lock:
+        previous_executor_registry = _executor_registry
+        _executor_registry = executor_registry
+
+    try:
+        yield executor_registry
+    finally:
+        with _executor_registry_lock:
+            _executor_registry = previous_executor_registry
+
+
+def _create_process_executor(
+    max_num_processes: int | None = None,
+) -> ProcessPoolExecutor:
+    """Creates a process pool with spawned worker processes.
+
+    Parameters:
+        max_num_processes: Maximum number of processes
+
+    Returns:
+        Process pool
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_num_processes,
+        mp_context=multiprocessing.get_context('spawn'),
+    )
+
+
+def _map_executor(
+    executor: Executor,
+    fn: Callable[..., T],
+    args: list[tuple],
+    max_num_workers: int | None = None,
+) -> list[T]:
+    """Maps the function over the arguments in the executor with a bounded number of pending calls.
+
+    Parameters:
+        executor: Executor
+        fn: Function
+        args: Arguments of each call
+        max_num_workers: Maximum number of concurrently running calls (if None, the number is limited
+            by the executor only)
+
+    Returns:
+        Results in the order of the arguments
+    """
+    max_num_workers = max_num_workers if max_num_workers is not None else len(args)
+    results: list = [None] * len(args)
+    pending: dict[Future[T], int] = {}
+
+    try:
+        for index, args_ in enumerate(args):
+            if len(pending) >= max_num_workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    results[pending.pop(future)] = future.result()
+
+            future = executor.submit(fn, *args_)
+            pending[future] = index
+
+        for future in list(pending):
+            results[pending.pop(future)] = future.result()
+    except BaseException:
+        for future in pending:
+            future.cancel()
+
+        raise
+
+    return results
+
+
+def _set_scope(
+    scope: str,
+) -> None:
+    """Sets the scope of the current thread.
+
+    Parameters:
+        scope: Scope
+    """
+    _thread_local.scope = scope
@@ -0,0 +1,152 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import pandas as pd
+import shapely
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import geopandas as gpd
+
+
+class GPKGWriter:
+    """Buffered writer that appends geodataframes to a geopackage
+
+    Notes:
+        - The geodataframes are buffered in memory and appended when the buffer reaches the maximum number of rows
+            or bytes, i.e., the geopackage is opened, its schema is checked, and a transaction is committed
+            once per flush instead of once per batch
+        - If neither the maximum number of rows nor the maximum number of bytes is specified,
+            each geodataframe is appended immediately
+        - The number of bytes is estimated from the attribute columns and the coordinates of the geometries
+        - The buffered geodataframes are appended when the writer is flushed or closed
+        - The writer is thread-safe
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_num_rows: int | None = None,
+        max_num_bytes: int | None = None,
+        use_arrow: bool = False,
+    ) -> None:
+        """
+        Parameters:
+            path: Path to the geopackage (.gpkg file)
+            max_num_rows: Maximum number of buffered rows
+            max_num_bytes: Maximum number of buffered bytes
+            use_arrow: If True, the geodataframes are appended with Arrow I/O (requires pyarrow)
+
+        Raises:
+            ImportError: Missing dependencies (use_arrow is True and pyarrow is not installed)
+        """
+        self._path = path
+        self._max_num_rows = max_num_rows
+        self._max_num_bytes = max_num_bytes
+        self._use_arrow = use_arrow
+
+        if self._use_arrow:
+            try:
+                import pyarrow as pa  # ruff: ignore[F401, PLC0415]
+            except ImportError as error:
+                message = (
+                    'Missing dependencies! '
+                    'To use Arrow I/O, you need to install pyarrow (pip install pyarrow).'
+                )
+                raise ImportError(message) from error
+
+        self._lock = threading.Lock()
+        self._gdfs: list[gpd.GeoDataFrame] = []
+        self._num_rows = 0
+        self._num_bytes = 0
+
+    def write(
+        self,
+        gdf: gpd.GeoDataFrame,
+    ) -> None:
+        """Buffers the geodataframe and appends the buffered geodataframes if the buffer is full.
+
+        Parameters:
+            gdf: Geodataframe
+        """
+        if gdf.empty:
+            return
+
+        with self._lock:
+            self._gdfs.append(gdf)
+            self._num_rows += len(gdf)
+            self._num_bytes += _estimate_num_bytes(gdf=gdf)
+
+            conditions = [
+                self._max_num_rows is None and self._max_num_bytes is None,
+                self._max_num_rows is not None and self._num_rows >= self._max_num_rows,
+                self._max_num_bytes is not None and self._num_bytes >= self._max_num_bytes,
+            ]
+
+            if any(conditions):
+                self._flush()
+
+    def _flush(self) -> None:
+        """Appends the buffered geodataframes in a single transaction."""
+        if not self._gdfs:
+            return
+
+        gdf = pd.concat(
+            self._gdfs,
+            ignore_index=True,
+        )
+
+        self._gdfs = []
+        self._num_rows = 0
+        self._num_bytes = 0
+
+        gdf.to_file(
+            self._path,
+            driver='GPKG',
+            mode='a',
+            engine='pyogrio',
+            use_arrow=self._use_arrow,
+        )
+
+    def flush(self) -> None:
+        """Appends the buffered geodataframes."""
+        with self._lock:
+            self._flush()
+
+    def close(self) -> None:
+        """Appends the buffered geodataframes."""
+        self.flush()
+
+
+def _estimate_num_bytes(
+    gdf: gpd.GeoDataFrame,
+) -> int:
+    """Estimates the number of bytes of the geodataframe.
+
+    Parameters:
+        gdf: Geodataframe
+
+    Returns:
+        Number of bytes
+    """
+    num_bytes = gdf.memory_usage(index=False, deep=True).sum()
+    num_coordinates = shapely.get_num_coordinates(gdf.geometry.array).sum()
+    return int(num_bytes) + 16 * int(num_coordinates)
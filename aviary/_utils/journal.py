@@ -0,0 +1,201 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from aviary.core.exceptions import AviaryUserError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from aviary.core.type_aliases import (
+        CoordinatesSet,
+        TileSize,
+    )
+
+
+_MAGIC = b'AVIARYJ1'
+_DTYPE = np.dtype('<i4')
+_HEADER_SIZE = len(_MAGIC) + _DTYPE.itemsize
+_RECORD_SIZE = 2 * _DTYPE.itemsize
+
+
+class CoordinatesJournal:
+    """Append-only journal of coordinates
+
+    Notes:
+        - The journal is a binary file with a header (magic number and tile size) followed by the coordinates
+            (x_min, y_min) of each tile as little-endian 32-bit integers
+        - Appending is O(batch), i.e., the journal is never rewritten
+        - Each append is flushed and synced to disk, i.e., the journal survives a crash of the process
+        - An incomplete record at the end of the journal (e.g., from a crash while appending) is ignored
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        tile_size: TileSize,
+    ) -> None:
+        """
+        Parameters:
+            path: Path to the journal
+            tile_size: Tile size in meters
+        """
+        self._path = path
+        self._tile_size = tile_size
+
+    def _get_header(self) -> bytes:
+        """Returns the header.
+
+        Returns:
+            Header
+        """
+        return _MAGIC + np.array([self._tile_size], dtype=_DTYPE).tobytes()
+
+    def _validate_tile_size(
+        self,
+        tile_size: TileSize,
+    ) -> None:
+        """Validates the tile size of the journal.
+
+        Parameters:
+            tile_size: Tile size of the journal in meters
+
+        Raises:
+            AviaryUserError: Invalid `tile_size` (the tile size does not match the tile size of the journal)
+        """
+        if tile_size != self._tile_size:
+            message = (
+                'Invalid tile_size! '
+                f'The tile size must match the tile size of the journal ({tile_size}).'
+            )
+            raise AviaryUserError(message)
+
+    def reset(self) -> None:
+        """Creates an empty journal, an existing journal is overwritten."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._path.open('wb') as file:
+            file.write(self._get_header())
+            file.flush()
+            os.fsync(file.fileno())
+
+    def read(self) -> CoordinatesSet:
+        """Reads the coordinates.
+
+        Returns:
+            Coordinates (x_min, y_min) of each tile in meters (empty if the journal does not exist)
+
+        Raises:
+            AviaryUserError: Invalid `path` (the file is not a journal)
+            AviaryUserError: Invalid `tile_size` (the tile size does not match the tile size of the journal)
+        """
+        if not self._path.exists():
+            return np.empty(shape=(0, 2), dtype=np.int32)
+
+        coordinates, tile_size = read_journal(path=self._path)
+        self._validate_tile_size(tile_size=tile_size)
+        return coordinates
+
+    def append(
+        self,
+        coordinates: CoordinatesSet,
+    ) -> None:
+        """Appends the coordinates.
+
+        Notes:
+            - If the journal does not exist, it is created
+
+        Parameters:
+            coordinates: Coordinates (x_min, y_min) of each tile in meters
+
+        Raises:
+            AviaryUserError: Invalid `path` (the file is not a journal)
+            AviaryUserError: Invalid `tile_size` (the tile size does not match the tile size of the journal)
+        """
+        if not self._path.exists():
+            self.reset()
+
+        with self._path.open('r+b') as file:
+            header = file.read(_HEADER_SIZE)
+            self._validate_tile_size(tile_size=_parse_header(header=header))
+            size = file.seek(0, os.SEEK_END)
+            num_excess_bytes = (size - _HEADER_SIZE) % _RECORD_SIZE
+
+            if num_excess_bytes:
+                file.truncate(size - num_excess_bytes)
+                file.seek(0, os.SEEK_END)
+
+            file.write(np.ascontiguousarray(coordinates, dtype=_DTYPE).tobytes())
+            file.flush()
+            os.fsync(file.fileno())
+
+
+def read_journal(
+    path: Path,
+) -> tuple[CoordinatesSet, TileSize]:
+    """Reads the coordinates and the tile size from the journal.
+
+    Notes:
+        - An incomplete record at the end of the journal is ignored
+
+    Parameters:
+        path: Path to the journal
+
+    Returns:
+        Coordinates (x_min, y_min) of each tile in meters and tile size in meters
+
+    Raises:
+        AviaryUserError: Invalid `path` (the file is not a journal)
+    """
+    content = path.read_bytes()
+    tile_size = _parse_header(header=content[:_HEADER_SIZE])
+    num_records = (len(content) - _HEADER_SIZE) // _RECORD_SIZE
+    coordinates = np.frombuffer(
+        content,
+        dtype=_DTYPE,
+        count=2 * num_records,
+        offset=_HEADER_SIZE,
+    )
+    return coordinates.reshape(-1, 2).astype(np.int32), tile_size
+
+
+def _parse_header(
+    header: bytes,
+) -> TileSize:
+    """Parses the header of the journal.
+
+    Parameters:
+        header: Header
+
+    Returns:
+        Tile size in meters
+
+    Raises:
+        AviaryUserError: Invalid `path` (the file is not a journal)
+    """
+    if len(header) < _HEADER_SIZE or header[:len(_MAGIC)] != _MAGIC:
+        message = (
+            'Invalid path! '
+            'The file must be a journal.'
+        )
+        raise AviaryUserError(message)
+
+    return int(np.frombuffer(header, dtype=_DTYPE, count=1, offset=len(_MAGIC))[0])
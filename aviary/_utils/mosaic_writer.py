@@ -0,0 +1,441 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from threading import Lock
+from typing import TYPE_CHECKING
+
+import numpy as np
+import rasterio as rio
+import rasterio.shutil
+from rasterio.windows import Window
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import numpy.typing as npt
+    from rasterio.io import DatasetWriter
+
+    from aviary.core.enums import ChannelName
+    from aviary.core.type_aliases import (
+        Coordinate,
+        Coordinates,
+        EPSGCode,
+        GroundSamplingDistance,
+        TileSize,
+    )
+
+
+class MosaicWriter:
+    """Writer that writes the tiles into large tiled geotiffs (mosaics) instead of one geotiff per tile
+
+    Notes:
+        - The mosaics partition the plane into squares of `mosaic_size` tiles, i.e., the mosaic of a tile is
+            determined by its coordinates and each mosaic is named by the coordinates of its bottom left corner
+        - Each mosaic is created on first use as a sparse geotiff, i.e., blocks without tiles take no space
+            on disk, and is kept open until the writer is flushed or closed
+        - The mosaics are closed when the writer is flushed, i.e., the written tiles are on disk,
+            and reopened when the next tile is written into them
+        - The block size divides the tile size in pixels if possible, i.e., the tiles of a snapped grid
+            cover whole blocks and each block is compressed and written exactly once
+        - Each mosaic is written by one thread at a time, different mosaics are written concurrently,
+            and the blocks of a mosaic are compressed by the worker threads of GDAL
+        - The buffer of each tile is removed before writing
+        - The overviews are built when the writer is closed
+        - If `cog` is True, the tiles are written into intermediate geotiffs (.partial.tiff files) that are
+            converted to cloud optimized geotiffs when the writer is closed, i.e., a cloud optimized geotiff
+            is never updated in place
+        - Existing mosaics are updated, i.e., a resumed run writes into the mosaics of the previous run
+            (if `cog` is True, into the intermediate geotiffs of an interrupted run or into intermediate geotiffs
+            that are converted back from the cloud optimized geotiffs of a completed run)
+    """
+    _MAX_BLOCK_SIZE = 512
+    _MIN_BLOCK_SIZE = 16
+    _MIN_OVERVIEW_SIZE = 256
+
+    def __init__(
+        self,
+        path: Path,
+        epsg_code: EPSGCode,
+        mosaic_size: int = 64,
+        channel_names: list[ChannelName | str] | None = None,
+        mapping: dict[int, list[int]] | None = None,
+        cog: bool = False,
+    ) -> None:
+        """
+        Parameters:
+            path: Path to the directory
+            epsg_code: EPSG code
+            mosaic_size: Size of each mosaic in tiles
+            channel_names: Channel names (used as band descriptions)
+            mapping: Mapping of the values
+            cog: If True, the mosaics are written into intermediate geotiffs that are converted
+                to cloud optimized geotiffs when the writer is closed
+        """
+        self._path = path
+        self._epsg_code = epsg_code
+        self._mosaic_size = mosaic_size
+        self._channel_names = channel_names
+        self._mapping = mapping
+        self._cog = cog
+
+        self._datasets: dict[Coordinates, tuple[DatasetWriter, Lock]] = {}
+        self._keys: set[Coordinates] = set()
+        self._lock = Lock()
+
+    def _get_path(
+        self,
+        x_min: Coordinate,
+        y_min: Coordinate,
+    ) -> Path:
+        """Returns the path of the geotiff that the tiles of the mosaic are written into.
+
+        Parameters:
+            x_min: Minimum x coordinate of the mosaic in meters
+            y_min: Minimum y coordinate of the mosaic in meters
+
+        Returns:
+            Path to the geotiff (the intermediate geotiff if `cog` is True)
+        """
+        if self._cog:
+            return self._path / f'{x_min}_{y_min}.partial.tiff'
+
+        return self._path / f'{x_min}_{y_min}.tiff'
+
+    def _get_dataset(
+        self,
+        x_min: Coordinate,
+        y_min: Coordinate,
+        size: int,
+        ground_sampling_distance: GroundSamplingDistance,
+        block_size: int,
+        count: int,
+        dtype: np.dtype,
+    ) -> tuple[DatasetWriter, Lock]:
+        """Returns the opened mosaic, it is created if it does not exist yet.
+
+        Parameters:
+            x_min: Minimum x coordinate of the mosaic in meters
+            y_min: Minimum y coordinate of the mosaic in meters
+            size: Size of the mosaic in meters
+            ground_sampling_distance: Ground sampling distance in meters
+            block_size: Block size in pixels
+            count: Number of bands
+            dtype: Data type
+
+        Returns:
+            Mosaic and its lock
+        """
+        key = (x_min, y_min)
+
+        with self._lock:
+            if key in self._datasets:
+                return self._datasets[key]
+
+            path = self._get_path(
+                x_min=x_min,
+                y_min=y_min,
+            )
+            cog_path = self._path / f'{x_min}_{y_min}.tiff'
+
+            if self._cog and not path.exists() and cog_path.exists():
+                _convert_to_geotiff(
+                    src_path=cog_path,
+                    dst_path=path,
+                )
+
+            if path.exists():
+                dataset = rio.open(path, mode='r+', num_threads='all_cpus')
+            else:
+                size_pixels = round(size / ground_sampling_distance)
+                transform = rio.transform.from_origin(
+                    west=x_min,
+                    north=y_min + size,
+                    xsize=ground_sampling_distance,
+                    ysize=ground_sampling_distance,
+                )
+                profile = {
+                    'driver': 'GTiff',
+                    'height': size_pixels,
+                    'width': size_pixels,
+                    'count': count,
+                    'dtype': dtype,
+                    'crs': f'EPSG:{self._epsg_code}',
+                    'transform': transform,
+                    'tiled': True,
+                    'blockxsize': block_size,
+                    'blockysize': block_size,
+                    'compress': 'deflate',
+                    'predictor': _get_predictor(dtype=dtype),
+                    'bigtiff': 'if_safer',
+                    'sparse_ok': True,
+                    'num_threads': 'all_cpus',
+                }
+                dataset = rio.open(path, mode='w', **profile)
+
+                if self._channel_names is not None:
+                    for i, channel_name in enumerate(self._channel_names):
+                        dataset.set_band_description(i + 1, str(channel_name))
+
+                if self._mapping is not None:
+                    dataset.write_colormap(1, self._mapping)
+
+            self._datasets[key] = (dataset, Lock())
+            self._keys.add(key)
+            return self._datasets[key]
+
+    def _get_block_size(
+        self,
+        tile_size_pixels: int,
+    ) -> int:
+        """Computes the block size, i.e., the largest power of two that divides the tile size in pixels.
+
+        Parameters:
+            tile_size_pixels: Tile size in pixels
+
+        Returns:
+            Block size in pixels
+        """
+        block_size = tile_size_pixels & -tile_size_pixels
+        return min(self._MAX_BLOCK_SIZE, max(self._MIN_BLOCK_SIZE, block_size))
+
+    def write(
+        self,
+        data_item: npt.NDArray,
+        x_min: Coordinate,
+        y_min: Coordinate,
+        tile_size: TileSize,
+        buffer_size: float,
+        ground_sampling_distance: GroundSamplingDistance,
+    ) -> None:
+        """Writes the tile into the mosaics it intersects.
+
+        Parameters:
+            data_item: Data item (height, width, channels)
+            x_min: Minimum x coordinate of the tile in meters
+            y_min: Minimum y coordinate of the tile in meters
+            tile_size: Tile size in meters
+            buffer_size: Buffer size in meters
+            ground_sampling_distance: Ground sampling distance in meters
+        """
+        buffer_size_pixels = round(buffer_size / ground_sampling_distance)
+
+        if buffer_size_pixels:
+            data_item = data_item[
+                buffer_size_pixels:-buffer_size_pixels,
+                buffer_size_pixels:-buffer_size_pixels,
+            ]
+
+        x_min, y_min = int(x_min), int(y_min)
+        tile_size_pixels = data_item.shape[0]
+        block_size = self._get_block_size(tile_size_pixels=tile_size_pixels)
+        size = self._mosaic_size * tile_size
+        size_pixels = round(size / ground_sampling_distance)
+        data_item = np.transpose(data_item, (2, 0, 1))
+
+        for mosaic_x_min in range(
+            (x_min // size) * size,
+            x_min + tile_size,
+            size,
+        ):
+            for mosaic_y_min in range(
+                (y_min // size) * size,
+                y_min + tile_size,
+                size,
+            ):
+                col_off = round((x_min - mosaic_x_min) / ground_sampling_distance)
+                row_off = round((mosaic_y_min + size - y_min - tile_size) / ground_sampling_distance)
+                col_min, row_min = max(0, col_off), max(0, row_off)
+                col_max = min(size_pixels, col_off + tile_size_pixels)
+                row_max = min(size_pixels, row_off + tile_size_pixels)
+
+                if col_min >= col_max or row_min >= row_max:
+                    continue
+
+                window = Window(
+                    col_off=col_min,
+                    row_off=row_min,
+                    width=col_max - col_min,
+                    height=row_max - row_min,
+                )
+
+                while True:
+                    dataset, lock = self._get_dataset(
+                        x_min=mosaic_x_min,
+                        y_min=mosaic_y_min,
+                        size=size,
+                        ground_sampling_distance=ground_sampling_distance,
+                        block_size=block_size,
+                        count=data_item.shape[0],
+                        dtype=data_item.dtype,
+                    )
+
+                    with lock:
+                        if dataset.closed:
+                            continue
+
+                        dataset.write(
+                            data_item[
+                                :,
+                                row_min - row_off:row_max - row_off,
+                                col_min - col_off:col_max - col_off,
+                            ],
+                            window=window,
+                        )
+                        break
+
+    def flush(self) -> None:
+        """Closes the mosaics, i.e., the written tiles are on disk."""
+        with self._lock:
+            datasets = list(self._datasets.values())
+            self._datasets.clear()
+
+        for dataset, lock in datasets:
+            with lock:
+                dataset.close()
+
+    def close(self) -> None:
+        """Closes the mosaics and builds the overviews."""
+        self.flush()
+
+        with self._lock:
+            keys = sorted(self._keys)
+            self._keys.clear()
+
+        for x_min, y_min in keys:
+            path = self._get_path(
+                x_min=x_min,
+                y_min=y_min,
+            )
+
+            with rio.open(path, mode='r+', num_threads='all_cpus') as dataset:
+                factors = _get_overview_factors(
+                    size_pixels=dataset.width,
+                    min_size_pixels=self._MIN_OVERVIEW_SIZE,
+                )
+
+                if factors:
+                    dataset.build_overviews(factors, rio.enums.Resampling.nearest)
+                    dataset.update_tags(ns='rio_overview', resampling='nearest')
+
+                block_size, _ = dataset.block_shapes[0]
+                predictor = _get_predictor(dtype=np.dtype(dataset.dtypes[0]))
+
+            if self._cog:
+                _convert_to_cog(
+                    src_path=path,
+                    dst_path=self._path / f'{x_min}_{y_min}.tiff',
+                    block_size=block_size,
+                    predictor=predictor,
+                )
+
+
+def _convert_to_geotiff(
+    src_path: Path,
+    dst_path: Path,
+) -> None:
+    """Converts the cloud optimized geotiff to a sparse tiled geotiff that can be updated.
+
+    Parameters:
+        src_path: Path to the cloud optimized geotiff
+        dst_path: Path to the geotiff
+    """
+    with rio.open(src_path) as src:
+        block_size, _ = src.block_shapes[0]
+        predictor = _get_predictor(dtype=np.dtype(src.dtypes[0]))
+
+    temp_path = dst_path.with_suffix('.tmp')
+    rasterio.shutil.copy(
+        src_path,
+        temp_path,
+        driver='GTiff',
+        tiled=True,
+        blockxsize=block_size,
+        blockysize=block_size,
+        compress='deflate',
+        predictor=predictor,
+        bigtiff='if_safer',
+        sparse_ok=True,
+        num_threads='all_cpus',
+    )
+    temp_path.replace(dst_path)
+
+
+def _convert_to_cog(
+    src_path: Path,
+    dst_path: Path,
+    block_size: int,
+    predictor: int,
+) -> None:
+    """Converts the geotiff to a cloud optimized geotiff and removes the geotiff.
+
+    Parameters:
+        src_path: Path to the geotiff
+        dst_path: Path to the cloud optimized geotiff
+        block_size: Block size in pixels
+        predictor: Predictor
+    """
+    temp_path = dst_path.with_suffix('.tmp')
+    rasterio.shutil.copy(
+        src_path,
+        temp_path,
+        driver='COG',
+        blocksize=block_size,
+        compress='deflate',
+        predictor=predictor,
+        bigtiff='if_safer',
+        overviews='force_use_existing',
+        num_threads='all_cpus',
+    )
+    temp_path.replace(dst_path)
+    src_path.unlink()
+
+
+def _get_overview_factors(
+    size_pixels: int,
+    min_size_pixels: int,
+) -> list[int]:
+    """Computes the overview factors, i.e., the powers of two until the overview is smaller than the minimum size.
+
+    Parameters:
+        size_pixels: Size in pixels
+        min_size_pixels: Minimum size of an overview in pixels
+
+    Returns:
+        Overview factors
+    """
+    factors = []
+    factor = 2
+
+    while size_pixels // factor >= min_size_pixels:
+        factors.append(factor)
+        factor *= 2
+
+    return factors
+
+
+def _get_predictor(
+    dtype: np.dtype,
+) -> int:
+    """Returns the predictor for deflate compression.
+
+    Parameters:
+        dtype: Data type
+
+    Returns:
+        Predictor (3 for floating point data, 2 otherwise)
+    """
+    return 3 if np.issubdtype(dtype, np.floating) else 2
@@ -0,0 +1,162 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+from threading import Lock
+from typing import (
+    TYPE_CHECKING,
+    Generic,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Callable,
+        Iterator,
+    )
+
+T = TypeVar('T')
+
+
+class Pool(Generic[T]):
+    """Thread-safe pool of reusable resources
+
+    Notes:
+        - A resource is acquired exclusively by one thread at a time
+        - Idle resources are reused in most recently used order, i.e., the most recently released resource
+            is acquired first
+        - If the number of idle resources exceeds the maximum number of idle resources,
+            the least recently used resource is closed
+        - The maximum number of idle resources does not limit the number of acquired resources,
+            i.e., each concurrently acquiring thread gets its own resource
+        - If an exception is raised while a resource is acquired, the resource is closed instead of released
+        - If the pool is closed while a resource is acquired, the resource is closed when it is released,
+            i.e., no resource is left open after the pool is closed
+        - The pool is reopened by the next acquisition, i.e., the pool can be reused after it is closed
+    """
+
+    def __init__(
+        self,
+        create: Callable[[], T],
+        close: Callable[[T], None],
+        max_num_idle: int | None = None,
+    ) -> None:
+        """
+        Parameters:
+            create: Function to create a resource
+            close: Function to close a resource
+            max_num_idle: Maximum number of idle resources (if None, the number is not limited)
+        """
+        self._create = create
+        self._close = close
+        self._max_num_idle = max_num_idle
+
+        self._idle: deque[T] = deque()
+        self._closed = False
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """Computes the number of idle resources.
+
+        Returns:
+            Number of idle resources
+        """
+        with self._lock:
+            return len(self._idle)
+
+    @contextmanager
+    def acquire(self) -> Iterator[T]:
+        """Acquires a resource.
+
+        Yields:
+            Resource
+        """
+        with self._lock:
+            self._closed = False
+            resource = self._idle.pop() if self._idle else None
+
+        if resource is None:
+            resource = self._create()
+
+        try:
+            yield resource
+        except BaseException:
+            self._close(resource)
+            raise
+
+        self._release(resource=resource)
+
+    def _release(
+        self,
+        resource: T,
+    ) -> None:
+        """Releases the resource, it is closed if the pool is closed.
+
+        Parameters:
+            resource: Resource
+        """
+        with self._lock:
+            if self._closed:
+                evicted = [resource]
+            else:
+                self._idle.append(resource)
+                evicted = []
+
+            while self._max_num_idle is not None and len(self._idle) > self._max_num_idle:
+                evicted.append(self._idle.popleft())
+
+        for resource_ in evicted:
+            self._close(resource_)
+
+    def close(self) -> None:
+        """Closes the idle resources and the acquired resources when they are released."""
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+
+        for resource in idle:
+            self._close(resource)
+
+
+def close(
+    obj: object,
+) -> None:
+    """Closes the object if it implements a `close` method.
+
+    Parameters:
+        obj: Object
+    """
+    close_ = getattr(obj, 'close', None)
+
+    if callable(close_):
+        close_()
+
+
+def flush(
+    obj: object,
+) -> None:
+    """Flushes the object if it implements a `flush` method.
+
+    Parameters:
+        obj: Object
+    """
+    flush_ = getattr(obj, 'flush', None)
+
+    if callable(flush_):
+        flush_()
@@ -0,0 +1,285 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from contextlib import (
+    closing,
+    contextmanager,
+)
+from typing import TYPE_CHECKING
+
+from aviary.core.exceptions import AviaryUserError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+class WorkQueue:
+    """SQLite-backed queue of work units that are claimed by workers with a lease
+
+    Notes:
+        - The queue can be shared by the worker processes of one or several machines via a shared filesystem
+            (the filesystem must support file locking)
+        - A claimed unit is reclaimed by another worker if its lease expires, i.e., if the worker crashed
+            or did not renew the lease in time
+        - The leases are based on the wall clock, i.e., the clocks of the machines must be synchronized
+        - Each connection is opened per operation, i.e., the queue can be used from several threads and processes
+    """
+    _PENDING = 'pending'
+    _CLAIMED = 'claimed'
+    _DONE = 'done'
+    _TIMEOUT = 60.
+
+    def __init__(
+        self,
+        path: Path,
+    ) -> None:
+        """
+        Parameters:
+            path: Path to the SQLite database (.db file)
+        """
+        self._path = path
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Opens a connection in autocommit mode.
+
+        Yields:
+            Connection
+        """
+        connection = sqlite3.connect(
+            self._path,
+            timeout=self._TIMEOUT,
+            isolation_level=None,
+        )
+
+        with closing(connection):
+            yield connection
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Opens a connection with an immediate transaction, i.e., the database is locked for writing.
+
+        Yields:
+            Connection
+        """
+        with self._connect() as connection:
+            connection.execute('BEGIN IMMEDIATE')
+
+            try:
+                yield connection
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+
+            connection.execute('COMMIT')
+
+    def initialize(
+        self,
+        num_units: int,
+        fingerprint: str,
+    ) -> None:
+        """Creates the units if they do not exist yet.
+
+        Parameters:
+            num_units: Number of units
+            fingerprint: Fingerprint of the work that is split into the units (e.g., of the grid and the tile size)
+
+        Raises:
+            AviaryUserError: Invalid `num_units` (the number of units does not match the existing work queue)
+            AviaryUserError: Invalid `fingerprint` (the fingerprint does not match the existing work queue)
+        """
+        with self._transaction() as connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS metadata ('
+                'key TEXT PRIMARY KEY, '
+                'value TEXT NOT NULL'
+                ')',
+            )
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS units ('
+                'unit INTEGER PRIMARY KEY, '
+                'status TEXT NOT NULL, '
+                'worker_id TEXT, '
+                'lease_expiration REAL, '
+                'num_attempts INTEGER NOT NULL DEFAULT 0'
+                ')',
+            )
+            metadata = dict(connection.execute('SELECT key, value FROM metadata').fetchall())
+
+            if metadata:
+                existing_num_units = int(metadata['num_units'])
+
+                if existing_num_units != num_units:
+                    message = (
+                        'Invalid num_units! '
+                        'The number of units must match the number of units of the work queue '
+                        f'({existing_num_units}).'
+                    )
+                    raise AviaryUserError(message)
+
+                if metadata.get('fingerprint') != fingerprint:
+                    message = (
+                        'Invalid fingerprint! '
+                        'The fingerprint must match the fingerprint of the work queue, '
+                        'i.e., the work queue must not be reused for a different grid or tile size.'
+                    )
+                    raise AviaryUserError(message)
+
+                return
+
+            connection.executemany(
+                'INSERT INTO metadata (key, value) VALUES (?, ?)',
+                [
+                    ('num_units', str(num_units)),
+                    ('fingerprint', fingerprint),
+                ],
+            )
+            connection.executemany(
+                'INSERT INTO units (unit, status) VALUES (?, ?)',
+                ((unit, self._PENDING) for unit in range(num_units)),
+            )
+
+    def claim(
+        self,
+        worker_id: str,
+        lease_duration: float,
+    ) -> int | None:
+        """Claims the next pending unit or a unit whose lease has expired.
+
+        Parameters:
+            worker_id: Worker ID
+            lease_duration: Lease duration in seconds
+
+        Returns:
+            Unit (if None, no unit can be claimed)
+        """
+        now = time.time()
+
+        with self._transaction() as connection:
+            row = connection.execute(
+                'SELECT unit FROM units '
+                'WHERE status = ? OR (status = ? AND lease_expiration < ?) '
+                'ORDER BY unit LIMIT 1',
+                (self._PENDING, self._CLAIMED, now),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            unit = row[0]
+            connection.execute(
+                'UPDATE units '
+                'SET status = ?, worker_id = ?, lease_expiration = ?, num_attempts = num_attempts + 1 '
+                'WHERE unit = ?',
+                (self._CLAIMED, worker_id, now + lease_duration, unit),
+            )
+
+        return unit
+
+    def renew(
+        self,
+        unit: int,
+        worker_id: str,
+        lease_duration: float,
+    ) -> bool:
+        """Renews the lease of the unit.
+
+        Parameters:
+            unit: Unit
+            worker_id: Worker ID
+            lease_duration: Lease duration in seconds
+
+        Returns:
+            True if the lease was renewed, False if the unit is no longer claimed by the worker
+        """
+        with self._connect() as connection:
+            cursor = connection.execute(
+                'UPDATE units SET lease_expiration = ? '
+                'WHERE unit = ? AND worker_id = ? AND status = ?',
+                (time.time() + lease_duration, unit, worker_id, self._CLAIMED),
+            )
+            return cursor.rowcount == 1
+
+    def complete(
+        self,
+        unit: int,
+        worker_id: str,
+    ) -> bool:
+        """Marks the unit as done if it is still claimed by the worker.
+
+        Parameters:
+            unit: Unit
+            worker_id: Worker ID
+
+        Returns:
+            True if the unit was marked as done, False if the unit is no longer claimed by the worker
+        """
+        with self._connect() as connection:
+            cursor = connection.execute(
+                'UPDATE units SET status = ?, lease_expiration = NULL '
+                'WHERE unit = ? AND worker_id = ? AND status = ?',
+                (self._DONE, unit, worker_id, self._CLAIMED),
+            )
+            return cursor.rowcount == 1
+
+    def release(
+        self,
+        unit: int,
+        worker_id: str,
+    ) -> None:
+        """Releases the unit, i.e., marks it as pending if it is still claimed by the worker.
+
+        Parameters:
+            unit: Unit
+            worker_id: Worker ID
+        """
+        with self._connect() as connection:
+            connection.execute(
+                'UPDATE units SET status = ?, worker_id = NULL, lease_expiration = NULL '
+                'WHERE unit = ? AND worker_id = ? AND status = ?',
+                (self._PENDING, unit, worker_id, self._CLAIMED),
+            )
+
+    def count(self) -> dict[str, int]:
+        """Counts the units by status.
+
+        Returns:
+            Number of pending, claimed, and done units
+        """
+        counts = dict.fromkeys((self._PENDING, self._CLAIMED, self._DONE), 0)
+
+        with self._connect() as connection:
+            rows = connection.execute('SELECT status, COUNT(*) FROM units GROUP BY status').fetchall()
+
+        for status, num_units in rows:
+            counts[status] = num_units
+
+        return counts
+
+    def is_done(self) -> bool:
+        """Checks if all units are done.
+
+        Returns:
+            True if all units are done, False otherwise
+        """
+        counts = self.count()
+        return counts[self._PENDING] == 0 and counts[self._CLAIMED] == 0
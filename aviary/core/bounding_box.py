@@ -25,7 +25,7 @@ from math import (
 )
 
 import geopandas as gpd
-from shapely.geometry import box
+import shapely
 
 from aviary.core.exceptions import AviaryUserError
 from aviary.core.mixins import IDMixin
@@ -464,9 +464,12 @@ class BoundingBox(
         Returns:
             Geodataframe
         """
-        geometry = [
-            box(self._x_min, self._y_min, self._x_max, self._y_max),
-        ]
+        geometry = shapely.box(
+            xmin=[self._x_min],
+            ymin=[self._y_min],
+            xmax=[self._x_max],
+            ymax=[self._y_max],
+        )
         epsg_code = f'EPSG:{epsg_code}' if epsg_code is not None else None
         return gpd.GeoDataFrame(
             geometry=geometry,
@@ -1239,11 +1239,18 @@ class RasterChannel(
 
     Notes:
         - The data items are assumed to be in shape (n, n), where n is the spatial extent in x and y direction
+        - The data is backed by an array in shape (batch, n, n) and the data items are views of it,
+            i.e., the `array` property returns the batched data without copying it
+        - If the data is passed as an array in shape (batch, n, n), it is used as the backing array
+            without copying it, if the data is passed as a list of data items, the data items are stacked
+            into the backing array when it is accessed for the first time
         - The `data` property returns a reference to the data
         - The `metadata` property returns a reference to the metadata
         - The dunder methods `__getitem__` and `__iter__` return or yield a reference to a data item
     """
+    _array: npt.NDArray | None
     _data: list[npt.NDArray]
+    _views: list[npt.NDArray] | None
 
     __hash__ = None
 
@@ -1257,12 +1264,15 @@ class RasterChannel(
     ) -> None:
         """
         Parameters:
-            data: Data
+            data: Data (a data item in shape (n, n), a list of data items, or an array in shape (batch, n, n))
             name: Name
             buffer_size: Buffer size as a fraction of the spatial extent of the data
             metadata: Metadata
             copy: If True, the data and metadata are copied during initialization
         """
+        self._array = None
+        self._views = None
+
         super().__init__(
             data=data,
             name=name,
@@ -1274,6 +1284,44 @@ class RasterChannel(
         self._buffer_size_pixels = self._compute_buffer_size_pixels()
         self._tile_size_pixels = self._compute_tile_size_pixels()
 
+    def _coerce_data(self) -> None:
+        """Coerces `data`."""
+        if isinstance(self._data, np.ndarray) and self._data.ndim == 3:  # ruff: ignore[PLR2004]
+            self._set_array(array=self._data)
+            return
+
+        super()._coerce_data()
+
+    def _set_array(
+        self,
+        array: npt.NDArray,
+    ) -> None:
+        """Sets the backing array and the data items as views of it.
+
+        Parameters:
+            array: Data in shape (batch, n, n)
+        """
+        self._array = array
+        self._views = list(array)
+        self._data = list(self._views)
+
+    def _has_array(self) -> bool:
+        """Checks if the data items are the views of the backing array.
+
+        Returns:
+            True if the data items are the views of the backing array, False otherwise
+        """
+        if self._array is None:
+            return False
+
+        if len(self._data) != len(self._views):
+            return False
+
+        return all(
+            data_item is view
+            for data_item, view in zip(self._data, self._views, strict=True)
+        )
+
     def _validate_data(self) -> None:
         """Validates `data`.
 
@@ -1287,9 +1335,34 @@ class RasterChannel(
             )
             raise AviaryUserError(message)
 
+        if self._has_array():
+            self._validate_array()
+            return
+
         for data_item in self:
             self._validate_data_item(data_item=data_item)
 
+    def _validate_array(self) -> None:
+        """Validates the backing array, i.e., all data items at once.
+
+        Raises:
+            AviaryUserError: Invalid `data` (the data items are not in shape (n, n))
+            AviaryUserError: Invalid `data` (the dtype of the data items is not supported)
+        """
+        if self._array.shape[1] != self._array.shape[2]:
+            message = (
+                'Invalid data! '
+                'The data item must be in shape (n, n).'
+            )
+            raise AviaryUserError(message)
+
+        if self._array.dtype.name not in _supported_dtypes:
+            message = (
+                'Invalid data! '
+                'The dtype of the data item must be supported.'
+            )
+            raise AviaryUserError(message)
+
     def _validate_data_item(
         self,
         data_item: npt.NDArray,
@@ -1343,8 +1416,12 @@ class RasterChannel(
             raise AviaryUserError(message)
 
     def _copy_data(self) -> None:
-        """Copies `data`."""
-        self._data = [data_item.copy() for data_item in self]
+        """Copies `data` into a new backing array."""
+        if self._has_array():
+            self._set_array(array=self._array.copy())
+            return
+
+        self._set_array(array=np.stack(self._data))
 
     def _compute_buffer_size_pixels(self) -> int:
         """Computes the buffer size in pixels.
@@ -1384,6 +1461,21 @@ class RasterChannel(
         """
         return self._data
 
+    @property
+    def array(self) -> npt.NDArray:
+        """
+        Notes:
+            - If the data items are not the views of the backing array (e.g., after they were replaced),
+                they are stacked into a new backing array
+
+        Returns:
+            Data in shape (batch, n, n)
+        """
+        if not self._has_array():
+            self._set_array(array=np.stack(self._data))
+
+        return self._array
+
     @property
     def dtype(self) -> DType:
         """
@@ -1426,10 +1518,16 @@ class RasterChannel(
         Returns:
             Raster channel
         """
-        return super().from_channels(
+        raster_channel = super().from_channels(
             channels=channels,
-            copy=copy,
+            copy=False,
         )
+        raster_channel._copy_data()  # ruff: ignore[SLF001]
+
+        if copy:
+            raster_channel._mark_as_copied()  # ruff: ignore[SLF001]
+
+        return raster_channel
 
     def __repr__(self) -> str:
         """Returns the string representation.
@@ -1454,7 +1552,15 @@ class RasterChannel(
         Returns:
             State
         """
-        return super().__getstate__()
+        state = super().__getstate__()
+
+        if self._has_array():
+            state['_data'] = None
+        else:
+            state['_array'] = None
+
+        state['_views'] = None
+        return state
 
     def __setstate__(
         self,
@@ -1467,6 +1573,9 @@ class RasterChannel(
         """
         super().__setstate__(state=state)
 
+        if self._data is None:
+            self._set_array(array=self._array)
+
     def __eq__(
         self,
         other: object,
@@ -1558,6 +1667,9 @@ class RasterChannel(
         Returns:
             Raster channel
         """
+        if isinstance(data, np.ndarray) and data.ndim == 3:  # ruff: ignore[PLR2004]
+            data = list(data)
+
         return super().append(
             data=data,
             inplace=inplace,
@@ -1592,11 +1704,11 @@ class RasterChannel(
             Raster channel
         """
         if inplace:
-            self._data = [data_item.astype(dtype.to_numpy()) for data_item in self]
+            self._set_array(array=self.array.astype(dtype.to_numpy()))
             self._validate()
             return self
 
-        data = [data_item.astype(dtype.to_numpy()) for data_item in self]
+        data = self.array.astype(dtype.to_numpy())
         metadata = self._metadata.copy()
 
         raster_channel = RasterChannel(
@@ -1628,20 +1740,14 @@ class RasterChannel(
             return self.copy()
 
         if inplace:
-            self._data = [
-                self._remove_buffer_item(data_item=data_item)
-                for data_item in self
-            ]
+            self._set_array(array=self._remove_buffer_array(array=self.array))
             self._buffer_size = 0.
             self._validate()
             self._buffer_size_pixels = self._compute_buffer_size_pixels()
             self._tile_size_pixels = self._compute_tile_size_pixels()
             return self
 
-        data = [
-            self._remove_buffer_item(data_item=data_item)
-            for data_item in self
-        ]
+        data = self._remove_buffer_array(array=self.array)
         buffer_size = 0.
         return RasterChannel(
             data=data,
@@ -1651,19 +1757,20 @@ class RasterChannel(
             copy=True,
         )
 
-    def _remove_buffer_item(
+    def _remove_buffer_array(
         self,
-        data_item: npt.NDArray,
+        array: npt.NDArray,
     ) -> npt.NDArray:
-        """Removes the buffer from the data item.
+        """Removes the buffer from all data items at once.
 
         Parameters:
-            data_item: Data item
+            array: Data in shape (batch, n, n)
 
         Returns:
-            Data item
+            Data in shape (batch, n, n)
         """
-        return data_item[
+        return array[
+            :,
             self._buffer_size_pixels:-self._buffer_size_pixels,
             self._buffer_size_pixels:-self._buffer_size_pixels,
         ]
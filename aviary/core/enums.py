@@ -228,6 +228,16 @@ class GeospatialFilterMode(Enum):
     INTERSECTION = 'intersection'
 
 
+class GridExporterMode(Enum):
+    """
+    Attributes:
+        JOURNAL: Journal mode
+        JSON: JSON mode
+    """
+    JOURNAL = 'journal'
+    JSON = 'json'
+
+
 class InterpolationMode(Enum):
     """
     Attributes:
@@ -300,6 +310,18 @@ class OSMType(Enum):
     RELATION = 'relation'
 
 
+class RasterExporterMode(Enum):
+    """
+    Attributes:
+        COG: Cloud optimized geotiff mode
+        MOSAIC: Mosaic mode
+        TILES: Tiles mode
+    """
+    COG = 'cog'
+    MOSAIC = 'mosaic'
+    TILES = 'tiles'
+
+
 class SetFilterMode(Enum):
     """
     Attributes:
@@ -15,6 +15,7 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 from collections.abc import (
     Iterable,
@@ -30,13 +31,14 @@ import geopandas as gpd
 import numpy as np
 import pydantic
 import requests
-from shapely.geometry import box
+import shapely
 
 from aviary._functional.utils.coordinates_filter import (
     duplicates_filter,
     geospatial_filter,
     set_filter,
 )
+from aviary._utils.journal import read_journal
 from aviary._utils.lifecycle import experimental
 from aviary.core.bounding_box import BoundingBox
 from aviary.core.enums import (
@@ -55,6 +57,8 @@ from aviary.core.type_aliases import (
 )
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
+
     from aviary.utils.coordinates_filter import CoordinatesFilter
 
 
@@ -68,8 +72,11 @@ class Grid(
     Notes:
         - The coordinates are assumed to be in shape (n, 2) and data type int32, where n is the number of coordinates
         - The coordinates are sorted
+        - A grid created from a bounding box or a geodataframe is lazy, i.e., the coordinates are computed on demand
+            by `__len__`, `__getitem__`, `__iter__` and `chunk` and materialized only if the coordinates
+            are required as a whole (e.g., by the set operations)
     """
-    _coordinates: CoordinatesSet
+    _BLOCK_SIZE = 65_536
 
     __hash__ = None
 
@@ -90,6 +97,82 @@ class Grid(
 
         super().__init__()
 
+    @classmethod
+    def _from_lattice(
+        cls,
+        lattice: _Lattice,
+        tile_size: TileSize,
+    ) -> Grid:
+        """Creates a lazy grid from a lattice.
+
+        Parameters:
+            lattice: Lattice
+            tile_size: Tile size in meters
+
+        Returns:
+            Grid
+        """
+        grid = cls.__new__(cls)
+        grid._coordinates_array = None  # ruff: ignore[SLF001]
+        grid._lattice = lattice  # ruff: ignore[SLF001]
+        grid._tile_size = tile_size  # ruff: ignore[SLF001]
+        grid._validate_tile_size()  # ruff: ignore[SLF001]
+        super(Grid, grid).__init__()
+        return grid
+
+    @classmethod
+    def _from_coordinates(
+        cls,
+        coordinates: CoordinatesSet,
+        tile_size: TileSize,
+    ) -> Grid:
+        """Creates a grid from coordinates that are known to be valid without validating them.
+
+        Notes:
+            - The coordinates must be in shape (n, 2) and data type int32, unique, evenly distributed and sorted,
+                e.g., a subset of the coordinates of a grid in the same order
+            - The tile size must be positive
+
+        Parameters:
+            coordinates: Coordinates (x_min, y_min) of each tile in meters
+            tile_size: Tile size in meters
+
+        Returns:
+            Grid
+        """
+        grid = cls.__new__(cls)
+        grid._coordinates = coordinates  # ruff: ignore[SLF001]
+        grid._tile_size = tile_size  # ruff: ignore[SLF001]
+        super(Grid, grid).__init__()
+        return grid
+
+    @property
+    def _coordinates(self) -> CoordinatesSet:
+        """
+        Notes:
+            - The coordinates of a lazy grid are materialized
+
+        Returns:
+            Coordinates (x_min, y_min) of each tile in meters
+        """
+        if self._lattice is not None:
+            self._coordinates_array = self._lattice.compute_coordinates()
+            self._lattice = None
+
+        return self._coordinates_array
+
+    @_coordinates.setter
+    def _coordinates(
+        self,
+        value: CoordinatesSet | None,
+    ) -> None:
+        """
+        Parameters:
+            value: Coordinates (x_min, y_min) of each tile in meters
+        """
+        self._coordinates_array = value
+        self._lattice = None
+
     def _validate(self) -> None:
         """Validates the grid."""
         self._validate_tile_size()  # valid tile_size is necessary for _validate_coordinates
@@ -132,13 +215,9 @@ class Grid(
 
         self._coordinates = duplicates_filter(coordinates=self._coordinates)
 
-        coordinates_x_remainders = self._coordinates[:, 0] % self._tile_size
-        coordinates_y_remainders = self._coordinates[:, 1] % self._tile_size
-        unique_coordinates_x_remainders = np.unique(coordinates_x_remainders)
-        unique_coordinates_y_remainders = np.unique(coordinates_y_remainders)
+        coordinates_remainders = self._coordinates % self._tile_size
         conditions = [
-            len(unique_coordinates_x_remainders) > 1,
-            len(unique_coordinates_y_remainders) > 1,
+            np.any(coordinates_remainders != coordinates_remainders[:1]),
         ]
 
         if any(conditions):
@@ -170,6 +249,9 @@ class Grid(
         Returns:
             Coordinates (x_min, y_min) of each tile in meters
         """
+        if self._lattice is not None:
+            return self._lattice.compute_coordinates()
+
         return self._coordinates.copy()
 
     @property
@@ -215,13 +297,18 @@ class Grid(
             )
             raise AviaryUserError(message)
 
-        coordinates = cls._compute_coordinates(
+        if snap:
+            bounding_box = bounding_box.snap(
+                value=tile_size,
+                inplace=False,
+            )
+
+        lattice = _Lattice.from_bounding_box(
             bounding_box=bounding_box,
             tile_size=tile_size,
-            snap=snap,
         )
-        return cls(
-            coordinates=coordinates,
+        return cls._from_lattice(
+            lattice=lattice,
             tile_size=tile_size,
         )
 
@@ -269,51 +356,56 @@ class Grid(
             raise AviaryUserError(message)
 
         bounding_box = BoundingBox.from_gdf(gdf=gdf)
-        coordinates = cls._compute_coordinates(
+
+        if snap:
+            bounding_box = bounding_box.snap(
+                value=tile_size,
+                inplace=False,
+            )
+
+        lattice = _Lattice.from_bounding_box(
             bounding_box=bounding_box,
             tile_size=tile_size,
-            snap=snap,
         )
         coordinates = geospatial_filter(
-            coordinates=coordinates,
+            coordinates=lattice.compute_coordinates(),
             tile_size=tile_size,
             gdf=gdf,
             mode=GeospatialFilterMode.INTERSECTION,
         )
-        return cls(
-            coordinates=coordinates,
+        lattice = lattice.mask(coordinates=coordinates)
+        return cls._from_lattice(
+            lattice=lattice,
             tile_size=tile_size,
         )
 
-    @staticmethod
-    def _compute_coordinates(
-        bounding_box: BoundingBox,
-        tile_size: TileSize,
-        snap: bool = True,
-    ) -> CoordinatesSet:
-        """Computes the coordinates of the bottom left corner of each tile.
+    @classmethod
+    def from_journal(
+        cls,
+        path: Path,
+    ) -> Grid:
+        """Creates a grid from a journal.
+
+        Notes:
+            - The journal is the append-only binary file that is exported by the `GridExporter`
+                in journal mode
+            - The coordinates are read into memory in one pass, i.e., the journal is not parsed record by record
 
         Parameters:
-            bounding_box: Bounding box
-            tile_size: Tile size in meters
-            snap: If True, the bounding box is snapped to `tile_size`
+            path: Path to the journal
 
         Returns:
-            Coordinates (x_min, y_min) of each tile in meters
-        """
-        if snap:
-            bounding_box = bounding_box.snap(
-                value=tile_size,
-                inplace=False,
-            )
-
-        coordinates_range_x = np.arange(bounding_box.x_min, bounding_box.x_max, tile_size)
-        coordinates_range_y = np.arange(bounding_box.y_min, bounding_box.y_max, tile_size)
-        coordinates_x, coordinates_y = np.meshgrid(coordinates_range_x, coordinates_range_y)
+            Grid
 
-        coordinates_x = coordinates_x.reshape(-1)[..., np.newaxis]
-        coordinates_y = coordinates_y.reshape(-1)[..., np.newaxis]
-        return np.concatenate((coordinates_x, coordinates_y), axis=-1).astype(np.int32)
+        Raises:
+            AviaryUserError: Invalid `path` (the file is not a journal)
+        """
+        coordinates, tile_size = read_journal(path=path)
+        coordinates = coordinates if len(coordinates) else None
+        return cls(
+            coordinates=coordinates,
+            tile_size=tile_size,
+        )
 
     @classmethod
     def from_json(
@@ -619,6 +711,9 @@ class Grid(
         Returns:
             Number of coordinates
         """
+        if self._lattice is not None:
+            return len(self._lattice)
+
         return len(self._coordinates)
 
     def __bool__(self) -> bool:
@@ -696,8 +791,18 @@ class Grid(
         Returns:
             Coordinates (x_min, y_min) of the tile in meters or grid
         """
+        if self._lattice is not None:
+            return self._getitem_lattice(index=index)
+
         if isinstance(index, slice):
-            coordinates = self._coordinates[index]
+            coordinates = self._coordinates[index].copy()
+
+            if index.step is None or index.step > 0:
+                return Grid._from_coordinates(
+                    coordinates=coordinates,
+                    tile_size=self._tile_size,
+                )
+
             return Grid(
                 coordinates=coordinates,
                 tile_size=self._tile_size,
@@ -706,14 +811,88 @@ class Grid(
         x_min, y_min = self._coordinates[index]
         return int(x_min), int(y_min)
 
+    def _getitem_lattice(
+        self,
+        index: int | slice,
+    ) -> Coordinates | Grid:
+        """Returns the coordinates or the sliced grid of a lazy grid.
+
+        Notes:
+            - A slice with a step of 1 returns a lazy grid
+
+        Parameters:
+            index: Index or slice of the coordinates
+
+        Returns:
+            Coordinates (x_min, y_min) of the tile in meters or grid
+
+        Raises:
+            IndexError: Invalid `index` (the index is not in the range [-n, n))
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+
+            if step == 1:
+                lattice = self._lattice.slice(
+                    start=start,
+                    stop=max(start, stop),
+                )
+                return Grid._from_lattice(
+                    lattice=lattice,
+                    tile_size=self._tile_size,
+                )
+
+            positions = np.arange(start, stop, step)
+            coordinates = self._lattice.compute_coordinates(positions=positions)
+
+            if step > 0:
+                return Grid._from_coordinates(
+                    coordinates=coordinates,
+                    tile_size=self._tile_size,
+                )
+
+            return Grid(
+                coordinates=coordinates,
+                tile_size=self._tile_size,
+            )
+
+        num_coordinates = len(self)
+        position = index + num_coordinates if index < 0 else index
+
+        if position < 0 or position >= num_coordinates:
+            message = (
+                'Invalid index! '
+                'The index must be in the range [-n, n).'
+            )
+            raise IndexError(message)
+
+        x_min, y_min = self._lattice.compute_coordinates(positions=np.array([position]))[0]
+        return int(x_min), int(y_min)
+
     def __iter__(self) -> Iterator[Coordinates]:
         """Iterates over the coordinates.
 
+        Notes:
+            - The coordinates of a lazy grid are computed in blocks
+
         Yields:
             Coordinates (x_min, y_min) of the tile in meters
         """
-        for x_min, y_min in self._coordinates:
-            yield int(x_min), int(y_min)
+        if self._lattice is None:
+            for x_min, y_min in self._coordinates:
+                yield int(x_min), int(y_min)
+
+            return
+
+        lattice = self._lattice
+        num_coordinates = len(lattice)
+
+        for start in range(0, num_coordinates, self._BLOCK_SIZE):
+            stop = min(start + self._BLOCK_SIZE, num_coordinates)
+            coordinates = lattice.compute_coordinates(positions=np.arange(start, stop))
+
+            for x_min, y_min in coordinates.tolist():
+                yield x_min, y_min
 
     def __add__(
         self,
@@ -774,7 +953,7 @@ class Grid(
             other=other.coordinates,
             mode=SetFilterMode.DIFFERENCE,
         )
-        return Grid(
+        return Grid._from_coordinates(
             coordinates=coordinates,
             tile_size=self._tile_size,
         )
@@ -806,7 +985,7 @@ class Grid(
             other=other.coordinates,
             mode=SetFilterMode.INTERSECTION,
         )
-        return Grid(
+        return Grid._from_coordinates(
             coordinates=coordinates,
             tile_size=self._tile_size,
         )
@@ -898,7 +1077,7 @@ class Grid(
             tile_size=self._tile_size,
         )
 
-    def buffer(  # ruff: ignore[C901, PLR0912]
+    def buffer(
         self,
         buffer_size: int,
         inplace: bool = False,
@@ -908,6 +1087,8 @@ class Grid(
         Notes:
             - A positive buffer size expands the grid
             - A negative buffer size shrinks the grid
+            - The grid is rasterized into a boolean lattice that spans its bounding box, which is dilated
+                (positive buffer size) or eroded (negative buffer size) by a square of `2 * |buffer_size| + 1` tiles
 
         Parameters:
             buffer_size: Buffer size in tiles
@@ -920,66 +1101,103 @@ class Grid(
             if inplace:
                 return self
 
-            return Grid(
+            return Grid._from_coordinates(
                 coordinates=self._coordinates.copy(),
                 tile_size=self._tile_size,
             )
 
-        step = self._tile_size
-        offsets = [
-            (+step, 0), (-step, 0), (0, +step), (0, -step),
-            (+step, +step), (+step, -step), (-step, +step), (-step, -step),
-        ]
+        coordinates = self._buffer_coordinates(
+            coordinates=self._coordinates,
+            tile_size=self._tile_size,
+            buffer_size=buffer_size,
+        )
+
+        if inplace:
+            self._coordinates = coordinates
+            return self
 
-        iterations = abs(buffer_size)
-        coordinates = self._coordinates.copy()
+        return Grid._from_coordinates(
+            coordinates=coordinates,
+            tile_size=self._tile_size,
+        )
 
-        if buffer_size > 0:
-            for _ in range(iterations):
-                coordinates_ = {
-                    (int(x_min), int(y_min))
-                    for x_min, y_min in coordinates
-                }
+    @staticmethod
+    def _buffer_coordinates(
+        coordinates: CoordinatesSet,
+        tile_size: TileSize,
+        buffer_size: int,
+    ) -> CoordinatesSet:
+        """Buffers the coordinates.
 
-                for x_min, y_min in coordinates:
-                    for dx_min, dy_min in offsets:
-                        coordinates_.add((int(x_min + dx_min), int(y_min + dy_min)))
+        Parameters:
+            coordinates: Coordinates (x_min, y_min) of each tile in meters
+            tile_size: Tile size in meters
+            buffer_size: Buffer size in tiles
 
-                if coordinates_:  # ruff: ignore[SIM108]
-                    coordinates = np.array(list(coordinates_), dtype=np.int32)
-                else:
-                    coordinates = coordinates[:0]
+        Returns:
+            Coordinates (x_min, y_min) of each tile in meters
+        """
+        radius = abs(buffer_size)
+        padding = radius if buffer_size > 0 else 0
+        origin = coordinates.min(axis=0).astype(np.int64)
+        indices = (coordinates.astype(np.int64) - origin) // tile_size + padding
+        num_tiles_x, num_tiles_y = indices.max(axis=0) + 1 + padding
+
+        lattice = np.zeros(
+            shape=(num_tiles_y, num_tiles_x),
+            dtype=np.bool_,
+        )
+        lattice[indices[:, 1], indices[:, 0]] = True
+
+        for axis in (0, 1):
+            lattice = Grid._filter_lattice(
+                lattice=lattice,
+                radius=radius,
+                axis=axis,
+                dilate=buffer_size > 0,
+            )
 
-        else:
-            for _ in range(iterations):
-                coordinates_ = {
-                    (int(x_min), int(y_min))
-                    for x_min, y_min in coordinates
-                }
+        indices_y, indices_x = np.nonzero(lattice)
+        coordinates_x = (indices_x - padding) * tile_size + origin[0]
+        coordinates_y = (indices_y - padding) * tile_size + origin[1]
+        return np.stack((coordinates_x, coordinates_y), axis=-1).astype(np.int32)
 
-                kept_coordinates: list[tuple[int, int]] = []
+    @staticmethod
+    def _filter_lattice(
+        lattice: npt.NDArray[np.bool_],
+        radius: int,
+        axis: int,
+        dilate: bool,
+    ) -> npt.NDArray[np.bool_]:
+        """Dilates or erodes the lattice along the axis.
 
-                for x_min, y_min in coordinates:
-                    if all(((int(x_min + dx_min), int(y_min + dy_min)) in coordinates_) for dx_min, dy_min in offsets):
-                        kept_coordinates.append((int(x_min), int(y_min)))
+        Notes:
+            - A cell is set if any (dilation) or all (erosion) cells within the radius along the axis are set,
+                cells outside the lattice are not set
+            - The cells within the radius are counted by the difference of the cumulative sum, i.e., the runtime
+                does not depend on the radius
 
-                if kept_coordinates:  # ruff: ignore[SIM108]
-                    coordinates = np.array(kept_coordinates, dtype=np.int32)
-                else:
-                    coordinates = coordinates[:0]
+        Parameters:
+            lattice: Lattice
+            radius: Radius in cells
+            axis: Axis
+            dilate: If True, the lattice is dilated, otherwise it is eroded
 
-                if coordinates.size == 0:
-                    break
+        Returns:
+            Lattice
+        """
+        num_cells = lattice.shape[axis]
+        cumsum = np.cumsum(lattice, axis=axis, dtype=np.int32)
+        cumsum = np.insert(cumsum, 0, 0, axis=axis)
+        cell_indices = np.arange(num_cells)
+        upper_indices = np.minimum(cell_indices + radius + 1, num_cells)
+        lower_indices = np.maximum(cell_indices - radius, 0)
+        counts = np.take(cumsum, upper_indices, axis=axis) - np.take(cumsum, lower_indices, axis=axis)
 
-        if inplace:
-            self._coordinates = coordinates
-            self._validate()
-            return self
+        if dilate:
+            return counts > 0
 
-        return Grid(
-            coordinates=coordinates,
-            tile_size=self._tile_size,
-        )
+        return counts == 2 * radius + 1
 
     def chunk(
         self,
@@ -1003,9 +1221,26 @@ class Grid(
             )
             raise AviaryUserError(message)
 
+        if self._lattice is not None:
+            chunk_size, remainder = divmod(len(self), num_chunks)
+            indices = [
+                i * chunk_size + min(i, remainder)
+                for i in range(num_chunks + 1)
+            ]
+            return [
+                Grid._from_lattice(
+                    lattice=self._lattice.slice(
+                        start=start,
+                        stop=stop,
+                    ),
+                    tile_size=self._tile_size,
+                )
+                for start, stop in itertools.pairwise(indices)
+            ]
+
         return [
-            Grid(
-                coordinates=coordinates,
+            Grid._from_coordinates(
+                coordinates=coordinates.copy(),
                 tile_size=self._tile_size,
             )
             for coordinates
@@ -1085,10 +1320,9 @@ class Grid(
 
         if inplace:
             self._coordinates = coordinates
-            self._validate()
             return self
 
-        return Grid(
+        return Grid._from_coordinates(
             coordinates=coordinates,
             tile_size=self._tile_size,
         )
@@ -1099,26 +1333,59 @@ class Grid(
     ) -> Grid:
         """Snaps the coordinates to the tile size.
 
+        Notes:
+            - Each tile is replaced by the tiles of the snapped grid that it overlaps
+
         Parameters:
             inplace: If True, the coordinates are snapped inplace
 
         Returns:
             Grid
         """
-        gdf = self.to_gdf(epsg_code=None)
-
-        grid = self.from_gdf(
-            gdf=gdf,
+        coordinates = self._snap_coordinates(
+            coordinates=self._coordinates,
             tile_size=self._tile_size,
-            snap=True,
         )
 
         if inplace:
-            self._coordinates = grid.coordinates
+            self._coordinates = coordinates
             self._validate()
             return self
 
-        return grid
+        return Grid(
+            coordinates=coordinates,
+            tile_size=self._tile_size,
+        )
+
+    @staticmethod
+    def _snap_coordinates(
+        coordinates: CoordinatesSet,
+        tile_size: TileSize,
+    ) -> CoordinatesSet:
+        """Snaps the coordinates to the tile size.
+
+        Notes:
+            - A tile overlaps the tiles of the snapped grid with the coordinates rounded down and rounded up
+                to the tile size, i.e., one tile per axis if the coordinate is divisible by the tile size
+                and two tiles otherwise
+            - The coordinates may contain duplicates
+
+        Parameters:
+            coordinates: Coordinates (x_min, y_min) of each tile in meters
+            tile_size: Tile size in meters
+
+        Returns:
+            Coordinates (x_min, y_min) of each tile in meters
+        """
+        coordinates = coordinates.astype(np.int64)
+        lower_coordinates = coordinates // tile_size * tile_size
+        upper_coordinates = -(-coordinates // tile_size) * tile_size
+        snapped_coordinates = [
+            np.stack((coordinates_x[:, 0], coordinates_y[:, 1]), axis=-1)
+            for coordinates_x in (lower_coordinates, upper_coordinates)
+            for coordinates_y in (lower_coordinates, upper_coordinates)
+        ]
+        return np.concatenate(snapped_coordinates, axis=0).astype(np.int32)
 
     def to_gdf(
         self,
@@ -1132,10 +1399,13 @@ class Grid(
         Returns:
             Geodataframe
         """
-        geometry = [
-            box(x_min, y_min, x_min + self._tile_size, y_min + self._tile_size)
-            for x_min, y_min in self
-        ]
+        coordinates = self.coordinates.astype(np.float64)
+        geometry = shapely.box(
+            xmin=coordinates[:, 0],
+            ymin=coordinates[:, 1],
+            xmax=coordinates[:, 0] + self._tile_size,
+            ymax=coordinates[:, 1] + self._tile_size,
+        )
         epsg_code = f'EPSG:{epsg_code}' if epsg_code is not None else None
         return gpd.GeoDataFrame(
             geometry=geometry,
@@ -1158,6 +1428,189 @@ class Grid(
         return json.dumps(json_dict)
 
 
+class _Lattice:
+    """Lattice of tiles that computes the coordinates on demand
+
+    Notes:
+        - The cells of the lattice are ordered by y_min and then by x_min, i.e., in the order of the coordinates
+            of a grid
+        - If the mask is not None, only the cells of the mask are tiles
+        - The tiles of the lattice are the tiles in the range [start, stop)
+    """
+
+    def __init__(
+        self,
+        x_min: Coordinate,
+        y_min: Coordinate,
+        num_tiles_x: int,
+        num_tiles_y: int,
+        tile_size: TileSize,
+        mask: npt.NDArray[np.bool_] | None = None,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> None:
+        """
+        Parameters:
+            x_min: Minimum x coordinate of the lattice in meters
+            y_min: Minimum y coordinate of the lattice in meters
+            num_tiles_x: Number of tiles in x direction
+            num_tiles_y: Number of tiles in y direction
+            tile_size: Tile size in meters
+            mask: Boolean mask in shape (num_tiles_y * num_tiles_x,) (if None, each cell is a tile)
+            start: Start of the range of tiles
+            stop: Stop of the range of tiles (if None, the number of tiles is used)
+        """
+        self._x_min = x_min
+        self._y_min = y_min
+        self._num_tiles_x = num_tiles_x
+        self._num_tiles_y = num_tiles_y
+        self._tile_size = tile_size
+        self._mask = mask
+        self._start = start
+        self._mask_indices: npt.NDArray[np.int64] | None = None
+
+        if stop is None:
+            stop = (
+                num_tiles_x * num_tiles_y
+                if mask is None else
+                int(np.count_nonzero(mask))
+            )
+
+        self._stop = stop
+
+    @classmethod
+    def from_bounding_box(
+        cls,
+        bounding_box: BoundingBox,
+        tile_size: TileSize,
+    ) -> _Lattice:
+        """Creates a lattice from a bounding box.
+
+        Parameters:
+            bounding_box: Bounding box
+            tile_size: Tile size in meters
+
+        Returns:
+            Lattice
+        """
+        num_tiles_x = int(np.ceil((bounding_box.x_max - bounding_box.x_min) / tile_size))
+        num_tiles_y = int(np.ceil((bounding_box.y_max - bounding_box.y_min) / tile_size))
+        return cls(
+            x_min=bounding_box.x_min,
+            y_min=bounding_box.y_min,
+            num_tiles_x=num_tiles_x,
+            num_tiles_y=num_tiles_y,
+            tile_size=tile_size,
+        )
+
+    def __len__(self) -> int:
+        """Computes the number of tiles.
+
+        Returns:
+            Number of tiles
+        """
+        return self._stop - self._start
+
+    def _compute_cell_indices(
+        self,
+        positions: npt.NDArray[np.int64],
+    ) -> npt.NDArray[np.int64]:
+        """Computes the indices of the cells of the tiles.
+
+        Parameters:
+            positions: Positions of the tiles in the range of tiles
+
+        Returns:
+            Indices of the cells
+        """
+        indices = positions + self._start
+
+        if self._mask is None:
+            return indices
+
+        if self._mask_indices is None:
+            self._mask_indices = np.flatnonzero(self._mask)
+
+        return self._mask_indices[indices]
+
+    def compute_coordinates(
+        self,
+        positions: npt.NDArray[np.int64] | None = None,
+    ) -> CoordinatesSet:
+        """Computes the coordinates of the tiles.
+
+        Parameters:
+            positions: Positions of the tiles in the range of tiles (if None, all tiles are used)
+
+        Returns:
+            Coordinates (x_min, y_min) of each tile in meters
+        """
+        if positions is None:
+            positions = np.arange(len(self), dtype=np.int64)
+
+        cell_indices = self._compute_cell_indices(positions=positions)
+        indices_y, indices_x = np.divmod(cell_indices, self._num_tiles_x)
+        coordinates_x = self._x_min + indices_x * self._tile_size
+        coordinates_y = self._y_min + indices_y * self._tile_size
+        return np.stack((coordinates_x, coordinates_y), axis=-1).astype(np.int32).reshape(-1, 2)
+
+    def mask(
+        self,
+        coordinates: CoordinatesSet,
+    ) -> _Lattice:
+        """Masks the lattice with the coordinates.
+
+        Parameters:
+            coordinates: Coordinates (x_min, y_min) of each tile in meters (the coordinates must be
+                coordinates of the lattice)
+
+        Returns:
+            Lattice
+        """
+        indices_x = (coordinates[:, 0].astype(np.int64) - int(self._x_min)) // self._tile_size
+        indices_y = (coordinates[:, 1].astype(np.int64) - int(self._y_min)) // self._tile_size
+        mask = np.zeros(
+            shape=self._num_tiles_x * self._num_tiles_y,
+            dtype=np.bool_,
+        )
+        mask[indices_y * self._num_tiles_x + indices_x] = True
+        return _Lattice(
+            x_min=self._x_min,
+            y_min=self._y_min,
+            num_tiles_x=self._num_tiles_x,
+            num_tiles_y=self._num_tiles_y,
+            tile_size=self._tile_size,
+            mask=mask,
+        )
+
+    def slice(
+        self,
+        start: int,
+        stop: int,
+    ) -> _Lattice:
+        """Slices the lattice.
+
+        Parameters:
+            start: Start of the range of tiles relative to the range of tiles
+            stop: Stop of the range of tiles relative to the range of tiles
+
+        Returns:
+            Lattice
+        """
+        lattice = _Lattice(
+            x_min=self._x_min,
+            y_min=self._y_min,
+            num_tiles_x=self._num_tiles_x,
+            num_tiles_y=self._num_tiles_y,
+            tile_size=self._tile_size,
+            mask=self._mask,
+            start=self._start + start,
+            stop=self._start + stop,
+        )
+        lattice._mask_indices = self._mask_indices
+        return lattice
+
+
 class GridConfig(pydantic.BaseModel):
     """Configuration for the `from_config` class method of `Grid`
 
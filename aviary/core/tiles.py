@@ -394,7 +394,7 @@ class Tiles(
                 continue
 
             channels_dict[channel_name] = RasterChannel(
-                data=data[..., i],
+                data=data[np.newaxis, ..., i],
                 name=channel_name,
                 buffer_size=buffer_size,
                 copy=False,
@@ -923,11 +923,18 @@ class Tiles(
     ) -> npt.NDArray:
         """Converts the tiles to composite raster data.
 
+        Notes:
+            - If only one channel name is given or the data of the channels are equally spaced channels
+                of one array (e.g., the channels of a fetched tile), the composite raster data is a view
+                of the data without copying it
+            - The view aliases the data of the channels, so it is read-only, i.e., modifying it in place
+                raises an exception instead of modifying the channels (copy it with `np.array` to modify it)
+
         Parameters:
             channel_names: Channel name or channel names
 
         Returns:
-            Composite raster data
+            Composite raster data in shape (batch, n, n, c)
 
         Raises:
             AviaryUserError: Invalid `channel_names` (the channel names do not refer to raster channels)
@@ -950,8 +957,65 @@ class Tiles(
                 )
                 raise AviaryUserError(message)
 
-        data = [channel.data for channel in channels]
+        data = [channel.array for channel in channels]
+        composite_data = _get_composite_view(data=data)
+
+        if composite_data is not None:
+            return composite_data
+
         return np.stack(data, axis=-1)
 
 
+def _get_composite_view(
+    data: list[npt.NDArray],
+) -> npt.NDArray | None:
+    """Returns the composite raster data as a view of the data of the channels.
+
+    Notes:
+        - A view exists if the data of the channels share the same base array, shape, strides, and dtype,
+            and are equally spaced in memory, i.e., they are the channels of a channels-last array
+        - The view is read-only, since it aliases the data of the channels
+
+    Parameters:
+        data: Data of the channels in shape (batch, n, n)
+
+    Returns:
+        Composite raster data in shape (batch, n, n, c) (if None, the data of the channels must be stacked)
+    """
+    first_data = data[0]
+
+    if len(data) == 1:
+        composite_data = first_data[..., np.newaxis]
+        composite_data.flags.writeable = False
+        return composite_data
+
+    addresses = [channel_data.__array_interface__['data'][0] for channel_data in data]
+    stride = addresses[1] - addresses[0]
+    conditions = [
+        stride != 0,
+        all(
+            channel_data.base is not None and
+            channel_data.base is first_data.base and
+            channel_data.shape == first_data.shape and
+            channel_data.strides == first_data.strides and
+            channel_data.dtype == first_data.dtype
+            for channel_data in data
+        ),
+        all(
+            address - addresses[0] == i * stride
+            for i, address in enumerate(addresses)
+        ),
+    ]
+
+    if not all(conditions):
+        return None
+
+    return np.lib.stride_tricks.as_strided(
+        first_data,
+        shape=(*first_data.shape, len(data)),
+        strides=(*first_data.strides, stride),
+        writeable=False,
+    )
+
+
 Tile: TypeAlias = Tiles
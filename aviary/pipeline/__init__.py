@@ -18,6 +18,8 @@ from .pipeline import (
     CompositePipelineConfig,
     Pipeline,
     PipelineConfig,
+    ShardedTilePipeline,
+    ShardedTilePipelineConfig,
     TileLoaderConfig,
     TilePipeline,
     TilePipelineConfig,
@@ -31,6 +33,8 @@ __all__ = [
     'CompositePipelineConfig',
     'Pipeline',
     'PipelineConfig',
+    'ShardedTilePipeline',
+    'ShardedTilePipelineConfig',
     'TileLoaderConfig',
     'TilePipeline',
     'TilePipelineConfig',
@@ -15,8 +15,19 @@
 
 from __future__ import annotations
 
+import hashlib
+import multiprocessing
+import os
+import socket
 import time
+import uuid
+from contextlib import closing
+from functools import partial
 from pathlib import Path
+from threading import (
+    Event,
+    Thread,
+)
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -25,8 +36,14 @@ from typing import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import (
+        Callable,
+        Iterator,
+    )
+
+    from aviary.core.type_aliases import CoordinatesSet
 
+import numpy as np
 import pydantic
 import rich
 import rich.theme
@@ -44,6 +61,24 @@ from rich.progress import (
 if TYPE_CHECKING:
     from pydantic_core.core_schema import ValidationInfo
 
+    from aviary.core.tiles import Tiles
+
+from aviary._utils.concurrency import (
+    ExecutorRegistry,
+    run_stages,
+    use_executor_registry,
+)
+from aviary._utils.journal import CoordinatesJournal
+from aviary._utils.lifecycle import experimental
+from aviary._utils.plugins import (
+    discover_local_plugins,
+    discover_packaged_plugins,
+)
+from aviary._utils.resources import (
+    close,
+    flush,
+)
+from aviary._utils.work_queue import WorkQueue
 from aviary.core.exceptions import AviaryUserError
 from aviary.core.grid import (
     Grid,
@@ -59,6 +94,7 @@ from aviary.tile.tile_fetcher import (
 from aviary.tile.tile_loader import TileLoader
 from aviary.tile.tile_set import TileSet
 from aviary.tile.tiles_processor import (
+    SequentialCompositeProcessor,
     TilesProcessor,
     TilesProcessorConfig,
     _TilesProcessorFactory,
@@ -84,6 +120,7 @@ class Pipeline(Protocol):
 
     Implemented pipelines:
         - `CompositePipeline`: Composes multiple pipelines
+        - `ShardedTilePipeline`: Runs a tile pipeline in work units that are claimed dynamically by worker processes
         - `TilePipeline`: Fetches and processes tiles
         - `VectorPipeline`: Loads and processes vectors
     """
@@ -387,6 +424,24 @@ _PipelineFactory.register(
 class TilePipeline(IDMixin):
     """Pipeline that fetches and processes tiles
 
+    Notes:
+        - The tile loader, the tile fetchers, the tiles processors and the tiles exporters share long-lived
+            thread pools for the duration of a run instead of creating a thread pool per batch
+        - The tiles processors that process the data items in worker processes share a long-lived process pool
+        - If `staged` is True, fetching and each stage of the tiles processor (each tiles processor
+            of a sequential composite processor, including the tiles exporters) run concurrently and are connected
+            by bounded queues, i.e., exporting a batch does not stall processing the next batch
+        - A stage with more than one worker processes several batches concurrently, so only use more than one
+            worker for stages that are thread-safe (e.g., not for tiles exporters that append to the same file)
+        - If `checkpoint_path` is specified, the coordinates of the processed batches are appended to a checkpoint
+            journal every `checkpoint_interval` batches and at the end of the run after the tiles processor
+            is flushed (e.g., the tiles exporters wait until the data written in the background is written);
+            if `resume` is True, the tiles in the checkpoint journal are removed from the grid, i.e., an interrupted
+            run continues where it stopped
+        - Flushing waits until the background writes are done and appending to the checkpoint journal syncs
+            the file, so a larger checkpoint interval keeps the tiles exporters busy at the cost of reprocessing
+            up to `checkpoint_interval` batches after an interruption
+
     Implements the `Pipeline` protocol.
     """
 
@@ -398,6 +453,15 @@ class TilePipeline(IDMixin):
         tile_loader_batch_size: int = 1,
         tile_loader_max_num_threads: int | None = None,
         tile_loader_num_prefetched_tiles: int = 0,
+        tile_loader_num_prefetching_threads: int = 1,
+        executor_max_num_threads: int | None = None,
+        executor_max_num_processes: int | None = None,
+        staged: bool = False,
+        stage_num_workers: list[int] | None = None,
+        stage_max_queue_size: int = 1,
+        checkpoint_path: Path | None = None,
+        checkpoint_interval: int = 10,
+        resume: bool = False,
         show_progress: bool = True,
     ) -> None:
         """
@@ -408,7 +472,25 @@ class TilePipeline(IDMixin):
             tile_loader_batch_size: Batch size
             tile_loader_max_num_threads: Maximum number of threads
             tile_loader_num_prefetched_tiles: Number of prefetched tiles
+            tile_loader_num_prefetching_threads: Number of prefetching threads
+            executor_max_num_threads: Maximum number of threads of each shared thread pool
+            executor_max_num_processes: Maximum number of processes of the shared process pool
+            staged: If True, run fetching and the stages of the tiles processor concurrently
+            stage_num_workers: Number of workers of each stage of the tiles processor (if None, each stage
+                has one worker)
+            stage_max_queue_size: Maximum number of batches in the queue of each stage
+            checkpoint_path: Path to the checkpoint journal (if None, no checkpoints are written)
+            checkpoint_interval: Number of batches between two checkpoints
+            resume: If True, skip the tiles in the checkpoint journal, otherwise the checkpoint journal
+                is overwritten
             show_progress: If True, show the progress with a progress bar
+
+        Raises:
+            AviaryUserError: Invalid `stage_num_workers` (the number of workers is not specified for each stage
+                of the tiles processor or is less than 1)
+            AviaryUserError: Invalid `stage_max_queue_size` (the maximum queue size is less than 1)
+            AviaryUserError: Invalid `checkpoint_interval` (the checkpoint interval is less than 1)
+            AviaryUserError: Invalid `resume` (resume is True and the checkpoint path is not specified)
         """
         self._grid = grid
         self._tile_fetcher = tile_fetcher
@@ -416,10 +498,81 @@ class TilePipeline(IDMixin):
         self._tile_loader_batch_size = tile_loader_batch_size
         self._tile_loader_max_num_threads = tile_loader_max_num_threads
         self._tile_loader_num_prefetched_tiles = tile_loader_num_prefetched_tiles
+        self._tile_loader_num_prefetching_threads = tile_loader_num_prefetching_threads
+        self._executor_max_num_threads = executor_max_num_threads
+        self._executor_max_num_processes = executor_max_num_processes
+        self._staged = staged
+        self._stage_num_workers = stage_num_workers
+        self._stage_max_queue_size = stage_max_queue_size
+        self._checkpoint_path = checkpoint_path
+        self._checkpoint_interval = checkpoint_interval
+        self._resume = resume
         self._show_progress = show_progress
 
+        self._validate()
+
         super().__init__()
 
+    def _validate(self) -> None:
+        """Validates the tile pipeline.
+
+        Raises:
+            AviaryUserError: Invalid `stage_num_workers` (the number of workers is not specified for each stage
+                of the tiles processor or is less than 1)
+            AviaryUserError: Invalid `stage_max_queue_size` (the maximum queue size is less than 1)
+            AviaryUserError: Invalid `checkpoint_interval` (the checkpoint interval is less than 1)
+            AviaryUserError: Invalid `resume` (resume is True and the checkpoint path is not specified)
+        """
+        if self._stage_num_workers is not None:
+            num_stages = len(self._get_stages())
+
+            if len(self._stage_num_workers) != num_stages:
+                message = (
+                    'Invalid stage_num_workers! '
+                    'The number of workers must match the number of stages of the tiles processor '
+                    f'({num_stages}).'
+                )
+                raise AviaryUserError(message)
+
+            if any(num_workers < 1 for num_workers in self._stage_num_workers):
+                message = (
+                    'Invalid stage_num_workers! '
+                    'The number of workers of each stage must be positive.'
+                )
+                raise AviaryUserError(message)
+
+        if self._stage_max_queue_size < 1:
+            message = (
+                'Invalid stage_max_queue_size! '
+                'The maximum queue size must be positive.'
+            )
+            raise AviaryUserError(message)
+
+        if self._checkpoint_interval < 1:
+            message = (
+                'Invalid checkpoint_interval! '
+                'The checkpoint interval must be positive.'
+            )
+            raise AviaryUserError(message)
+
+        if self._resume and self._checkpoint_path is None:
+            message = (
+                'Invalid resume! '
+                'The checkpoint path must be specified to resume a run.'
+            )
+            raise AviaryUserError(message)
+
+    def _get_stages(self) -> list[TilesProcessor]:
+        """Returns the stages of the tiles processor.
+
+        Returns:
+            Tiles processors (the tiles processors of a sequential composite processor or the tiles processor)
+        """
+        if isinstance(self._tiles_processor, SequentialCompositeProcessor):
+            return self._tiles_processor.tiles_processors
+
+        return [self._tiles_processor]
+
     @classmethod
     def from_config(
         cls,
@@ -436,6 +589,33 @@ class TilePipeline(IDMixin):
         grid = _GridFactory.create(config=config.grid_config)
         tile_fetcher = _TileFetcherFactory.create(config=config.tile_fetcher_config)
         tiles_processor = _TilesProcessorFactory.create(config=config.tiles_processor_config)
+        return cls._from_config_with_components(
+            config=config,
+            grid=grid,
+            tile_fetcher=tile_fetcher,
+            tiles_processor=tiles_processor,
+        )
+
+    @classmethod
+    def _from_config_with_components(
+        cls,
+        config: TilePipelineConfig,
+        grid: Grid,
+        tile_fetcher: TileFetcher,
+        tiles_processor: TilesProcessor,
+    ) -> TilePipeline:
+        """Creates a tile pipeline from the configuration with a grid, a tile fetcher, and a tiles processor
+        that are already created.
+
+        Parameters:
+            config: Configuration
+            grid: Grid
+            tile_fetcher: Tile fetcher
+            tiles_processor: Tiles processor
+
+        Returns:
+            Tile pipeline
+        """
         return cls(
             grid=grid,
             tile_fetcher=tile_fetcher,
@@ -443,13 +623,44 @@ class TilePipeline(IDMixin):
             tile_loader_batch_size=config.tile_loader_config.batch_size,
             tile_loader_max_num_threads=config.tile_loader_config.max_num_threads,
             tile_loader_num_prefetched_tiles=config.tile_loader_config.num_prefetched_tiles,
+            tile_loader_num_prefetching_threads=config.tile_loader_config.num_prefetching_threads,
+            executor_max_num_threads=config.executor_max_num_threads,
+            executor_max_num_processes=config.executor_max_num_processes,
+            staged=config.staged,
+            stage_num_workers=config.stage_num_workers,
+            stage_max_queue_size=config.stage_max_queue_size,
+            checkpoint_path=config.checkpoint_path,
+            checkpoint_interval=config.checkpoint_interval,
+            resume=config.resume,
             show_progress=config.show_progress,
         )
 
     def __call__(self) -> None:
         """Runs the tile pipeline."""
+        try:
+            self._run()
+        finally:
+            close(self._tile_fetcher)
+            close(self._tiles_processor)
+
+    def _run(self) -> None:
+        """Runs the tile pipeline without closing the tile fetcher and the tiles processor."""
+        grid = self._grid
+        checkpoint_journal = None
+        pending_coordinates = []
+
+        if self._checkpoint_path is not None:
+            checkpoint_journal = CoordinatesJournal(
+                path=self._checkpoint_path,
+                tile_size=grid.tile_size,
+            )
+            grid = self._prepare_checkpoint_journal(
+                checkpoint_journal=checkpoint_journal,
+                grid=grid,
+            )
+
         tile_set = TileSet(
-            grid=self._grid,
+            grid=grid,
             tile_fetcher=self._tile_fetcher,
         )
         tile_loader = TileLoader(
@@ -457,6 +668,7 @@ class TilePipeline(IDMixin):
             batch_size=self._tile_loader_batch_size,
             max_num_threads=self._tile_loader_max_num_threads,
             num_prefetched_tiles=self._tile_loader_num_prefetched_tiles,
+            num_prefetching_threads=self._tile_loader_num_prefetching_threads,
         )
 
         num_tiles = len(tile_set)
@@ -480,44 +692,88 @@ class TilePipeline(IDMixin):
             'progress.remaining': 'white',
         })
 
-        with console.use_theme(theme), Progress(
-            SpinnerColumn(
-                spinner_name='dots3',
-                style='bold green',
-            ),
-            TextColumn('[progress.description]{task.description}'),
-            BarColumn(),
-            TaskProgressColumn(),
-            TimeElapsedColumn(),
-            TimeRemainingColumn(),
-            disable=(not self._show_progress) or (not interactive),
-            console=console,
-        ) as progress:
-            task_id = progress.add_task('Processing tiles', total=num_batches)
-
-            for i, tiles in enumerate(tile_loader, start=1):
-                batch_size = tiles.batch_size
-                logger.info(
-                    'Processing {} tiles {:>{}} / {}...',
-                    batch_size,
-                    i,
-                    i_len,
-                    num_batches,
-                )
-                start_time = time.perf_counter()
-
-                _ = self._tiles_processor(tiles=tiles)
-
-                duration = time.perf_counter() - start_time
-                logger.success(
-                    'Processed  {} tiles {:>{}} / {} in {:.3f} s.',
-                    batch_size,
-                    i,
-                    i_len,
-                    num_batches,
-                    duration,
-                )
-                progress.advance(task_id)
+        executor_registry = ExecutorRegistry(
+            max_num_threads=self._executor_max_num_threads,
+            max_num_processes=self._executor_max_num_processes,
+        )
+
+        try:
+            with use_executor_registry(executor_registry), console.use_theme(theme), Progress(
+                SpinnerColumn(
+                    spinner_name='dots3',
+                    style='bold green',
+                ),
+                TextColumn('[progress.description]{task.description}'),
+                BarColumn(),
+                TaskProgressColumn(),
+                TimeElapsedColumn(),
+                TimeRemainingColumn(),
+                disable=(not self._show_progress) or (not interactive),
+                console=console,
+            ) as progress:
+                task_id = progress.add_task('Processing tiles', total=num_batches)
+
+                if self._staged:
+                    with closing(self._run_stages(tile_loader=tile_loader)) as batches:
+                        for i, (tiles, start_time) in enumerate(batches, start=1):
+                            if checkpoint_journal is not None:
+                                self._checkpoint(
+                                    checkpoint_journal=checkpoint_journal,
+                                    pending_coordinates=pending_coordinates,
+                                    coordinates=tiles.coordinates,
+                                )
+
+                            duration = time.perf_counter() - start_time
+                            logger.success(
+                                'Processed  {} tiles {:>{}} / {} in {:.3f} s.',
+                                tiles.batch_size,
+                                i,
+                                i_len,
+                                num_batches,
+                                duration,
+                            )
+                            progress.advance(task_id)
+                else:
+                    for i, tiles in enumerate(tile_loader, start=1):
+                        batch_size = tiles.batch_size
+                        logger.info(
+                            'Processing {} tiles {:>{}} / {}...',
+                            batch_size,
+                            i,
+                            i_len,
+                            num_batches,
+                        )
+                        start_time = time.perf_counter()
+
+                        coordinates = tiles.coordinates
+                        _ = self._tiles_processor(tiles=tiles)
+
+                        if checkpoint_journal is not None:
+                            self._checkpoint(
+                                checkpoint_journal=checkpoint_journal,
+                                pending_coordinates=pending_coordinates,
+                                coordinates=coordinates,
+                            )
+
+                        duration = time.perf_counter() - start_time
+                        logger.success(
+                            'Processed  {} tiles {:>{}} / {} in {:.3f} s.',
+                            batch_size,
+                            i,
+                            i_len,
+                            num_batches,
+                            duration,
+                        )
+                        progress.advance(task_id)
+
+                if checkpoint_journal is not None and pending_coordinates:
+                    self._checkpoint(
+                        checkpoint_journal=checkpoint_journal,
+                        pending_coordinates=pending_coordinates,
+                    )
+        finally:
+            tile_loader.close()
+            executor_registry.close()
 
         tile_pipeline_duration = time.perf_counter() - tile_pipeline_start_time
         tile_pipeline_average_time = tile_pipeline_duration / num_tiles if num_tiles else 0.
@@ -528,6 +784,112 @@ class TilePipeline(IDMixin):
             tile_pipeline_average_time,
         )
 
+    def _checkpoint(
+        self,
+        checkpoint_journal: CoordinatesJournal,
+        pending_coordinates: list[CoordinatesSet],
+        coordinates: CoordinatesSet | None = None,
+    ) -> None:
+        """Flushes the tiles processor and appends the coordinates of the pending batches to the checkpoint journal.
+
+        Parameters:
+            checkpoint_journal: Checkpoint journal
+            pending_coordinates: Coordinates (x_min, y_min) of each tile of each pending batch in meters
+                (the list is cleared after the checkpoint is written)
+            coordinates: Coordinates (x_min, y_min) of each tile of the processed batch in meters
+                (if None, the checkpoint is written, otherwise the coordinates are added to the pending batches
+                and the checkpoint is written if the checkpoint interval is reached)
+        """
+        if coordinates is not None:
+            pending_coordinates.append(coordinates)
+
+            if len(pending_coordinates) < self._checkpoint_interval:
+                return
+
+        flush(self._tiles_processor)
+        checkpoint_journal.append(coordinates=np.concatenate(pending_coordinates))
+        pending_coordinates.clear()
+
+    def _prepare_checkpoint_journal(
+        self,
+        checkpoint_journal: CoordinatesJournal,
+        grid: Grid,
+    ) -> Grid:
+        """Prepares the checkpoint journal and removes the processed tiles from the grid if the run is resumed.
+
+        Parameters:
+            checkpoint_journal: Checkpoint journal
+            grid: Grid
+
+        Returns:
+            Grid
+        """
+        if not self._resume:
+            checkpoint_journal.reset()
+            return grid
+
+        coordinates = checkpoint_journal.read()
+
+        if not len(coordinates):
+            return grid
+
+        num_tiles = len(grid)
+        grid -= Grid(
+            coordinates=coordinates,
+            tile_size=grid.tile_size,
+        )
+        logger.info(
+            'Resuming tile pipeline, skipping {} of {} tiles...',
+            num_tiles - len(grid),
+            num_tiles,
+        )
+        return grid
+
+    def _run_stages(
+        self,
+        tile_loader: TileLoader,
+    ) -> Iterator[tuple[Tiles, float]]:
+        """Runs the stages of the tiles processor concurrently.
+
+        Parameters:
+            tile_loader: Tile loader
+
+        Returns:
+            Iterator over the processed tiles and the time at which they were fetched
+        """
+        stages = self._get_stages()
+        stage_num_workers = self._stage_num_workers or [1] * len(stages)
+        batches = (
+            (tiles, time.perf_counter())
+            for tiles in tile_loader
+        )
+        return run_stages(
+            items=batches,
+            stages=[
+                (partial(_process_stage, tiles_processor=tiles_processor), num_workers)
+                for tiles_processor, num_workers in zip(stages, stage_num_workers, strict=True)
+            ],
+            max_queue_size=self._stage_max_queue_size,
+        )
+
+
+def _process_stage(
+    batch: tuple[Tiles, float],
+    tiles_processor: TilesProcessor,
+) -> tuple[Tiles, float]:
+    """Processes the tiles of the batch with the tiles processor of the stage.
+
+    Parameters:
+        batch: Tiles and the time at which they were fetched
+        tiles_processor: Tiles processor
+
+    Returns:
+        Processed tiles and the time at which they were fetched
+    """
+    tiles, start_time = batch
+    tiles = tiles_processor(tiles=tiles)
+    return tiles, start_time
+
 
 class TileLoaderConfig(pydantic.BaseModel):
     """Configuration for the tile loader in the tile pipeline
@@ -542,6 +904,7 @@ class TileLoaderConfig(pydantic.BaseModel):
         batch_size: 1
         max_num_threads: null
         num_prefetched_tiles: 0
+        num_prefetching_threads: 1
         ```
 
     Attributes:
@@ -551,10 +914,13 @@ class TileLoaderConfig(pydantic.BaseModel):
             defaults to None
         num_prefetched_tiles: Number of prefetched tiles -
             defaults to 0
+        num_prefetching_threads: Number of prefetching threads -
+            defaults to 1
     """
     batch_size: int = 1
     max_num_threads: int | None = None
     num_prefetched_tiles: int = 0
+    num_prefetching_threads: int = 1
 
 
 class TilePipelineConfig(pydantic.BaseModel):
@@ -573,6 +939,14 @@ class TilePipelineConfig(pydantic.BaseModel):
         config:
           plugins_dir_path: null
           show_progress: true
+          executor_max_num_threads: null
+          executor_max_num_processes: null
+          staged: false
+          stage_num_workers: null
+          stage_max_queue_size: 1
+          checkpoint_path: null
+          checkpoint_interval: 10
+          resume: false
 
           grid_config:
             ...
@@ -584,6 +958,7 @@ class TilePipelineConfig(pydantic.BaseModel):
             batch_size: 1
             max_num_threads: null
             num_prefetched_tiles: 0
+            num_prefetching_threads: 1
 
           tiles_processor_config:
             ...
@@ -594,6 +969,24 @@ class TilePipelineConfig(pydantic.BaseModel):
             defaults to None
         show_progress: If True, show the progress with a progress bar -
             defaults to True
+        executor_max_num_threads: Maximum number of threads of each shared thread pool -
+            defaults to None
+        executor_max_num_processes: Maximum number of processes of the shared process pool -
+            defaults to None
+        staged: If True, run fetching and the stages of the tiles processor concurrently -
+            defaults to False
+        stage_num_workers: Number of workers of each stage of the tiles processor (if None, each stage
+            has one worker) -
+            defaults to None
+        stage_max_queue_size: Maximum number of batches in the queue of each stage -
+            defaults to 1
+        checkpoint_path: Path to the checkpoint journal (if None, no checkpoints are written) -
+            defaults to None
+        checkpoint_interval: Number of batches between two checkpoints -
+            defaults to 10
+        resume: If True, skip the tiles in the checkpoint journal, otherwise the checkpoint journal
+            is overwritten -
+            defaults to False
         grid_config: Configuration for the grid
         tile_fetcher_config: Configuration for the tile fetcher
         tile_loader_config: Configuration for the tile loader -
@@ -602,6 +995,14 @@ class TilePipelineConfig(pydantic.BaseModel):
     """
     plugins_dir_path: Path | None = None
     show_progress: bool = True
+    executor_max_num_threads: int | None = None
+    executor_max_num_processes: int | None = None
+    staged: bool = False
+    stage_num_workers: list[int] | None = None
+    stage_max_queue_size: int = 1
+    checkpoint_path: Path | None = None
+    checkpoint_interval: int = 10
+    resume: bool = False
     grid_config: GridConfig
     tile_fetcher_config: TileFetcherConfig
     tile_loader_config: TileLoaderConfig = pydantic.Field(default=TileLoaderConfig())
@@ -615,6 +1016,472 @@ _PipelineFactory.register(
 )
 
 
+@experimental(
+    since='1.10.0',
+)
+class ShardedTilePipeline(IDMixin):
+    """Pipeline that runs a tile pipeline in work units that are claimed dynamically by worker processes
+
+    Experimental:
+        `ShardedTilePipeline` is experimental since `1.10.0` and may change without notice.
+
+    Notes:
+        - The grid is split into the number of units, which are stored in a work queue (SQLite database)
+        - Each worker process claims the next unit, runs the tile pipeline on it, and marks it as done,
+            i.e., fast workers process more units than slow workers
+        - Run the sharded tile pipeline on several machines that share the work queue (and the output directories)
+            to distribute the units across the machines
+        - While a unit is processed, its lease is renewed periodically; if a worker crashes, its unit is reclaimed
+            by another worker after the lease duration
+        - If the sharded tile pipeline is run again with the same work queue, only the units that are not done
+            are processed (the work queue stores a fingerprint of the grid and rejects a different grid)
+        - A unit is only marked as done by the worker that holds its lease, i.e., a worker that lost its lease
+            does not mark a unit as done that was reclaimed by another worker
+        - The tile fetcher and the tiles processor are created once per worker process and run on each unit
+            it claims, they are closed when the worker process exits (e.g., the tiles exporters are finalized
+            once per worker process)
+        - The tiles processor is flushed before a unit is marked as done, i.e., the tiles of a unit that is done
+            are exported
+        - The tile pipeline must not contain a checkpoint path, since the work queue keeps track of the units
+            that are done
+        - The tiles exporters of concurrent workers must not write to the same file (e.g., use tiles exporters
+            that write one file per tile)
+        - At most one worker process is started per unit that is not done
+        - The worker processes do not show the progress with a progress bar
+
+    Implements the `Pipeline` protocol.
+    """
+
+    def __init__(
+        self,
+        tile_pipeline_config: TilePipelineConfig,
+        work_queue_path: Path,
+        num_units: int,
+        num_workers: int = 1,
+        lease_duration: float = 600.,
+        poll_interval: float = 10.,
+        plugins_dir_path: Path | None = None,
+    ) -> None:
+        """
+        Parameters:
+            tile_pipeline_config: Configuration for the tile pipeline
+            work_queue_path: Path to the work queue (.db file)
+            num_units: Number of units
+            num_workers: Number of worker processes
+            lease_duration: Lease duration in seconds
+            poll_interval: Interval in seconds to poll for units whose lease has expired
+            plugins_dir_path: Path to the plugins directory
+
+        Raises:
+            AviaryUserError: Invalid `tile_pipeline_config` (the tile pipeline contains a checkpoint path
+                or resume is True)
+            AviaryUserError: Invalid `num_units` (the number of units is less than 1)
+            AviaryUserError: Invalid `num_workers` (the number of workers is less than 1)
+        """
+        self._tile_pipeline_config = tile_pipeline_config
+        self._work_queue_path = work_queue_path
+        self._num_units = num_units
+        self._num_workers = num_workers
+        self._lease_duration = lease_duration
+        self._poll_interval = poll_interval
+        self._plugins_dir_path = plugins_dir_path
+
+        self._validate()
+
+        super().__init__()
+
+    def _validate(self) -> None:
+        """Validates the sharded tile pipeline.
+
+        Raises:
+            AviaryUserError: Invalid `tile_pipeline_config` (the tile pipeline contains a checkpoint path
+                or resume is True)
+            AviaryUserError: Invalid `num_units` (the number of units is less than 1)
+            AviaryUserError: Invalid `num_workers` (the number of workers is less than 1)
+        """
+        if self._tile_pipeline_config.checkpoint_path is not None or self._tile_pipeline_config.resume:
+            message = (
+                'Invalid tile_pipeline_config! '
+                'The tile pipeline must not contain checkpoint_path or resume, '
+                'since the work queue keeps track of the units that are done.'
+            )
+            raise AviaryUserError(message)
+
+        if self._num_units < 1:
+            message = (
+                'Invalid num_units! '
+                'The number of units must be positive.'
+            )
+            raise AviaryUserError(message)
+
+        if self._num_workers < 1:
+            message = (
+                'Invalid num_workers! '
+                'The number of workers must be positive.'
+            )
+            raise AviaryUserError(message)
+
+    @classmethod
+    def from_config(
+        cls,
+        config: ShardedTilePipelineConfig,
+    ) -> ShardedTilePipeline:
+        """Creates a sharded tile pipeline from the configuration.
+
+        Parameters:
+            config: Configuration
+
+        Returns:
+            Sharded tile pipeline
+        """
+        return cls(
+            tile_pipeline_config=config.tile_pipeline_config,
+            work_queue_path=config.work_queue_path,
+            num_units=config.num_units,
+            num_workers=config.num_workers,
+            lease_duration=config.lease_duration,
+            poll_interval=config.poll_interval,
+            plugins_dir_path=config.plugins_dir_path,
+        )
+
+    def __call__(self) -> None:
+        """Runs the sharded tile pipeline.
+
+        Raises:
+            AviaryUserError: Invalid `work_queue_path` (the work queue was created for a different grid
+                or number of units)
+            RuntimeError: A worker process exited with an error
+        """
+        grid = _GridFactory.create(config=self._tile_pipeline_config.grid_config)
+        work_queue = WorkQueue(path=self._work_queue_path)
+        work_queue.initialize(
+            num_units=self._num_units,
+            fingerprint=_compute_fingerprint(grid=grid),
+        )
+
+        logger.info(
+            'Starting sharded tile pipeline with {} units and {} workers...',
+            self._num_units,
+            self._num_workers,
+        )
+        sharded_tile_pipeline_start_time = time.perf_counter()
+
+        kwargs = {
+            'work_queue_path': self._work_queue_path,
+            'num_units': self._num_units,
+            'lease_duration': self._lease_duration,
+            'poll_interval': self._poll_interval,
+        }
+
+        counts = work_queue.count()
+        num_workers = min(self._num_workers, counts['pending'] + counts['claimed'])
+
+        if num_workers == 1:
+            _run_sharded_worker(
+                tile_pipeline_config=self._tile_pipeline_config,
+                **kwargs,
+            )
+        elif num_workers > 1:
+            tile_pipeline_config = self._tile_pipeline_config.model_copy(update={'show_progress': False})
+            context = multiprocessing.get_context('spawn')
+            processes = [
+                context.Process(
+                    target=_run_sharded_worker_process,
+                    kwargs={
+                        'tile_pipeline_config': tile_pipeline_config.model_dump(serialize_as_any=True),
+                        'plugins_dir_path': self._plugins_dir_path,
+                        **kwargs,
+                    },
+                    name=f'aviary-sharded-worker-{i}',
+                )
+                for i in range(num_workers)
+            ]
+
+            for process in processes:
+                process.start()
+
+            for process in processes:
+                process.join()
+
+            num_failed_workers = sum(process.exitcode != 0 for process in processes)
+
+            if num_failed_workers:
+                message = (
+                    'The sharded tile pipeline failed! '
+                    f'{num_failed_workers} of {num_workers} workers exited with an error.'
+                )
+                raise RuntimeError(message)
+
+        counts = work_queue.count()
+        sharded_tile_pipeline_duration = time.perf_counter() - sharded_tile_pipeline_start_time
+        logger.success(
+            'Done with {} of {} units in {:.3f} s.',
+            counts['done'],
+            self._num_units,
+            sharded_tile_pipeline_duration,
+        )
+
+
+class ShardedTilePipelineConfig(pydantic.BaseModel):
+    """Configuration for the `from_config` class method of `ShardedTilePipeline`
+
+    Notes:
+        - Use the top level plugins_dir_path and omit the plugins_dir_path from the tile pipeline configuration
+        - Omit the checkpoint_path and resume from the tile pipeline configuration, since the work queue
+            keeps track of the units that are done
+
+    Create the configuration from a config file:
+        - Use null instead of None
+
+    Usage:
+        You can create the configuration from a config file.
+
+        ``` yaml title="config.yaml"
+        package: 'aviary'
+        name: 'ShardedTilePipeline'
+        config:
+          plugins_dir_path: null
+          work_queue_path: '/path/to/work_queue.db'
+          num_units: 1000
+          num_workers: 1
+          lease_duration: 600.
+          poll_interval: 10.
+
+          tile_pipeline_config:
+            ...
+        ```
+
+    Attributes:
+        plugins_dir_path: Path to the plugins directory -
+            defaults to None
+        work_queue_path: Path to the work queue (.db file)
+        num_units: Number of units
+        num_workers: Number of worker processes -
+            defaults to 1
+        lease_duration: Lease duration in seconds -
+            defaults to 600.
+        poll_interval: Interval in seconds to poll for units whose lease has expired -
+            defaults to 10.
+        tile_pipeline_config: Configuration for the tile pipeline
+    """
+    plugins_dir_path: Path | None = None
+    work_queue_path: Path
+    num_units: int
+    num_workers: int = 1
+    lease_duration: float = 600.
+    poll_interval: float = 10.
+    tile_pipeline_config: TilePipelineConfig
+
+    @pydantic.model_validator(mode='after')
+    def _validate_config(self) -> ShardedTilePipelineConfig:
+        if self.tile_pipeline_config.plugins_dir_path is not None:
+            message = (
+                'Invalid config! '
+                'The tile pipeline must not contain plugins_dir_path.'
+            )
+            raise ValueError(message)
+
+        if self.tile_pipeline_config.checkpoint_path is not None or self.tile_pipeline_config.resume:
+            message = (
+                'Invalid config! '
+                'The tile pipeline must not contain checkpoint_path or resume.'
+            )
+            raise ValueError(message)
+
+        return self
+
+
+_PipelineFactory.register(
+    pipeline_class=ShardedTilePipeline,
+    config_class=ShardedTilePipelineConfig,
+    package=_PACKAGE,
+)
+
+
+def _run_sharded_worker_process(
+    tile_pipeline_config: dict[str, object],
+    plugins_dir_path: Path | None,
+    work_queue_path: Path,
+    num_units: int,
+    lease_duration: float,
+    poll_interval: float,
+) -> None:
+    """Runs a sharded worker in a spawned worker process.
+
+    Notes:
+        - The plugins are discovered before the configuration is validated, since the worker process
+            does not inherit the registered components
+
+    Parameters:
+        tile_pipeline_config: Configuration for the tile pipeline
+        plugins_dir_path: Path to the plugins directory
+        work_queue_path: Path to the work queue (.db file)
+        num_units: Number of units
+        lease_duration: Lease duration in seconds
+        poll_interval: Interval in seconds to poll for units whose lease has expired
+    """
+    discover_packaged_plugins()
+
+    if plugins_dir_path is not None:
+        discover_local_plugins(plugins_dir_path=plugins_dir_path)
+
+    _run_sharded_worker(
+        tile_pipeline_config=TilePipelineConfig(**tile_pipeline_config),
+        work_queue_path=work_queue_path,
+        num_units=num_units,
+        lease_duration=lease_duration,
+        poll_interval=poll_interval,
+    )
+
+
+def _run_sharded_worker(
+    tile_pipeline_config: TilePipelineConfig,
+    work_queue_path: Path,
+    num_units: int,
+    lease_duration: float,
+    poll_interval: float,
+) -> None:
+    """Claims units and runs the tile pipeline on them until all units are done.
+
+    Notes:
+        - The grid, the tile fetcher, and the tiles processor are created once per worker,
+            the tile fetcher and the tiles processor are closed when the worker exits
+        - The tiles processor is flushed before a unit is marked as done
+        - If the tile pipeline raises an exception, the unit is released and the exception is raised
+
+    Parameters:
+        tile_pipeline_config: Configuration for the tile pipeline
+        work_queue_path: Path to the work queue (.db file)
+        num_units: Number of units
+        lease_duration: Lease duration in seconds
+        poll_interval: Interval in seconds to poll for units whose lease has expired
+    """
+    work_queue = WorkQueue(path=work_queue_path)
+    worker_id = f'{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}'
+    grid = _GridFactory.create(config=tile_pipeline_config.grid_config)
+    grids = grid.chunk(num_chunks=num_units)
+    tile_fetcher = _TileFetcherFactory.create(config=tile_pipeline_config.tile_fetcher_config)
+    tiles_processor = _TilesProcessorFactory.create(config=tile_pipeline_config.tiles_processor_config)
+
+    try:
+        while True:
+            unit = work_queue.claim(
+                worker_id=worker_id,
+                lease_duration=lease_duration,
+            )
+
+            if unit is None:
+                if work_queue.is_done():
+                    return
+
+                time.sleep(poll_interval)
+                continue
+
+            logger.info(
+                'Worker {} claimed unit {} / {}.',
+                worker_id,
+                unit,
+                num_units,
+            )
+            tile_pipeline = TilePipeline._from_config_with_components(  # ruff: ignore[SLF001]
+                config=tile_pipeline_config,
+                grid=grids[unit],
+                tile_fetcher=tile_fetcher,
+                tiles_processor=tiles_processor,
+            )
+            stop_event = Event()
+            heartbeat = Thread(
+                target=_renew_lease,
+                kwargs={
+                    'work_queue': work_queue,
+                    'unit': unit,
+                    'worker_id': worker_id,
+                    'lease_duration': lease_duration,
+                    'stop_event': stop_event,
+                },
+                name='aviary-sharded-worker-heartbeat',
+                daemon=True,
+            )
+            heartbeat.start()
+
+            try:
+                tile_pipeline._run()  # ruff: ignore[SLF001]
+                flush(tiles_processor)
+            except BaseException:
+                work_queue.release(
+                    unit=unit,
+                    worker_id=worker_id,
+                )
+                raise
+            finally:
+                stop_event.set()
+                heartbeat.join()
+
+            completed = work_queue.complete(
+                unit=unit,
+                worker_id=worker_id,
+            )
+
+            if not completed:
+                logger.warning(
+                    'Worker {} lost the lease of unit {}, the unit is not marked as done.',
+                    worker_id,
+                    unit,
+                )
+    finally:
+        close(tile_fetcher)
+        close(tiles_processor)
+
+
+def _compute_fingerprint(
+    grid: Grid,
+) -> str:
+    """Computes the fingerprint of the grid.
+
+    Parameters:
+        grid: Grid
+
+    Returns:
+        Fingerprint (SHA-256 hash of the tile size and the coordinates)
+    """
+    hash_ = hashlib.sha256()
+    hash_.update(np.array([grid.tile_size], dtype='<i8').tobytes())
+    hash_.update(np.ascontiguousarray(grid.coordinates, dtype='<i4').tobytes())
+    return hash_.hexdigest()
+
+
+def _renew_lease(
+    work_queue: WorkQueue,
+    unit: int,
+    worker_id: str,
+    lease_duration: float,
+    stop_event: Event,
+) -> None:
+    """Renews the lease of the unit periodically until the stop event is set.
+
+    Parameters:
+        work_queue: Work queue
+        unit: Unit
+        worker_id: Worker ID
+        lease_duration: Lease duration in seconds
+        stop_event: Stop event
+    """
+    while not stop_event.wait(timeout=lease_duration / 3):
+        renewed = work_queue.renew(
+            unit=unit,
+            worker_id=worker_id,
+            lease_duration=lease_duration,
+        )
+
+        if not renewed:
+            logger.warning(
+                'Worker {} lost the lease of unit {}.',
+                worker_id,
+                unit,
+            )
+            return
+
+
 class VectorPipeline(IDMixin):
     """Pipeline that loads and processes vectors
 
@@ -15,6 +15,10 @@
 #  If not, see <https://www.gnu.org/licenses/>.
 
 from .tile_fetcher import (
+    CachedFetcher,
+    CachedFetcherConfig,
+    ChunkStoreFetcher,
+    ChunkStoreFetcherConfig,
     CompositeFetcher,
     CompositeFetcherConfig,
     GPKGFetcher,
@@ -32,6 +36,8 @@ from .tile_fetcher import (
 from .tile_loader import TileLoader
 from .tile_set import TileSet
 from .tiles_exporter import (
+    ChunkStoreExporter,
+    ChunkStoreExporterConfig,
     GridExporter,
     GridExporterConfig,
     ObjectExporter,
@@ -84,8 +90,14 @@ from .tiles_processor import (
 __all__ = [
     'AspectProcessor',
     'AspectProcessorConfig',
+    'CachedFetcher',
+    'CachedFetcherConfig',
     'CastProcessor',
     'CastProcessorConfig',
+    'ChunkStoreExporter',
+    'ChunkStoreExporterConfig',
+    'ChunkStoreFetcher',
+    'ChunkStoreFetcherConfig',
     'CompositeFetcher',
     'CompositeFetcherConfig',
     'CopyProcessor',
@@ -15,7 +15,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from threading import Lock
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -26,20 +30,42 @@ from typing import (
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    import httpx
+
 import pydantic
 
 if TYPE_CHECKING:
     from pydantic_core.core_schema import ValidationInfo
 
 from aviary._functional.tile.tile_fetcher import (
+    cached_fetcher,
+    cached_fetcher_async,
+    cached_fetcher_many,
+    chunk_store_fetcher,
     composite_fetcher,
+    create_async_client,
+    create_session,
     gpkg_fetcher,
+    load_gpkg,
+    open_vrt,
     stub_fetcher,
     vrt_fetcher,
+    vrt_fetcher_many,
     wms_fetcher,
+    wms_fetcher_async,
+)
+from aviary._utils.cache import DiskCache
+from aviary._utils.chunk_store import ChunkStore
+from aviary._utils.concurrency import (
+    AsyncRateLimiter,
+    run_coroutine,
 )
 from aviary._utils.lifecycle import experimental
 from aviary._utils.logging import log
+from aviary._utils.resources import (
+    Pool,
+    close,
+)
 from aviary.core.enums import (
     ChannelName,
     InterpolationMode,
@@ -68,11 +94,19 @@ class TileFetcher(Protocol):
     These coordinates correspond to the bottom left corner of a tile.
 
     Implemented tile fetchers:
+        - `CachedFetcher`: Caches the tiles of a tile fetcher on disk
         - `CompositeFetcher`: Composes multiple tile fetchers
         - `GPKGFetcher`: Fetches a tile from a geopackage
         - `StubFetcher`: Fetches a tile with no channels
         - `VRTFetcher`: Fetches a tile from a virtual raster
         - `WMSFetcher`: Fetches a tile from a web map service
+
+    Notes:
+        - Tile fetchers may implement a `fetch_many` method that fetches multiple tiles at once,
+            the tile loader uses it to fetch the tiles of a batch (e.g., `VRTFetcher`) and passes its maximum number
+            of threads to fetch the tiles that cannot be fetched at once
+        - Tile fetchers that wrap a tile fetcher may implement a `batched` property that overrides
+            whether the tile loader uses `fetch_many` (e.g., `CachedFetcher`)
     """
 
     def __call__(
@@ -239,6 +273,331 @@ def register_tile_fetcher(
     return decorator
 
 
+@experimental(
+    since='1.10.0',
+)
+@log
+class CachedFetcher(IDMixin):
+    """Tile fetcher that caches the tiles of a tile fetcher on disk
+
+    Experimental:
+        `CachedFetcher` is experimental since `1.10.0` and may change without notice.
+
+    Notes:
+        - The tiles are keyed by the version of aviary, the cache key, and the coordinates, i.e., the cache key
+            must change if the tile fetcher changes (e.g., its source, tile size or buffer size)
+        - If the cached fetcher is created from the configuration, the cache key is the hash of the configuration
+            of the tile fetcher
+        - The tiles are pickled and compressed, each tile is stored in a file named after the hash of its key
+        - If the size of the cache exceeds the maximum size, the least recently used tiles are evicted
+        - The numbers of hits and misses are available via `num_hits` and `num_misses`
+        - If the tile fetcher fetches multiple tiles at once (e.g., `VRTFetcher`) or fetches the tiles
+            asynchronously (e.g., `WMSFetcher`), the cached fetcher does as well, i.e., the tiles that are not cached
+            are fetched by a single call or asynchronously
+
+    Implements the `TileFetcher` protocol.
+    """
+
+    def __init__(
+        self,
+        tile_fetcher: TileFetcher,
+        path: Path,
+        cache_key: str,
+        max_size: int | None = None,
+    ) -> None:
+        """
+        Parameters:
+            tile_fetcher: Tile fetcher
+            path: Path to the cache directory
+            cache_key: Cache key of the tile fetcher
+            max_size: Maximum size of the cache in bytes (if None, the size is not limited)
+        """
+        self._tile_fetcher = tile_fetcher
+        self._path = path
+        self._cache_key = cache_key
+        self._max_size = max_size
+
+        self._cache = DiskCache(
+            path=self._path,
+            max_size=self._max_size,
+        )
+
+        super().__init__()
+
+    @property
+    def num_hits(self) -> int:
+        """
+        Returns:
+            Number of hits
+        """
+        return self._cache.num_hits
+
+    @property
+    def num_misses(self) -> int:
+        """
+        Returns:
+            Number of misses
+        """
+        return self._cache.num_misses
+
+    @property
+    def asynchronous(self) -> bool:
+        """
+        Returns:
+            If True, the tiles are fetched asynchronously
+        """
+        return getattr(self._tile_fetcher, 'asynchronous', False)
+
+    @property
+    def batched(self) -> bool:
+        """
+        Returns:
+            If True, the tiles that are not cached are fetched by a single call
+        """
+        return getattr(self._tile_fetcher, 'batched', callable(getattr(self._tile_fetcher, 'fetch_many', None)))
+
+    @classmethod
+    def from_config(
+        cls,
+        config: CachedFetcherConfig,
+    ) -> CachedFetcher:
+        """Creates a cached fetcher from the configuration.
+
+        Parameters:
+            config: Configuration
+
+        Returns:
+            Cached fetcher
+        """
+        tile_fetcher = _TileFetcherFactory.create(config=config.tile_fetcher_config)
+        cache_key = config.tile_fetcher_config.model_dump_json(serialize_as_any=True)
+        cache_key = hashlib.sha256(cache_key.encode()).hexdigest()
+        return cls(
+            tile_fetcher=tile_fetcher,
+            path=config.path,
+            cache_key=cache_key,
+            max_size=config.max_size,
+        )
+
+    def __call__(
+        self,
+        coordinates: Coordinates,
+    ) -> Tile:
+        """Fetches a tile from the cache or, if the tile is not cached, from the source.
+
+        Parameters:
+            coordinates: Coordinates (x_min, y_min) of the tile in meters
+
+        Returns:
+            Tile
+        """
+        return cached_fetcher(
+            coordinates=coordinates,
+            tile_fetcher=self._tile_fetcher,
+            cache=self._cache,
+            cache_key=self._cache_key,
+        )
+
+    async def fetch_async(
+        self,
+        coordinates: Coordinates,
+    ) -> Tile:
+        """Fetches a tile from the cache or, if the tile is not cached, from the source asynchronously.
+
+        Notes:
+            - The coroutine must be awaited in the background event loop
+                (see `aviary._utils.concurrency.run_coroutine`)
+
+        Parameters:
+            coordinates: Coordinates (x_min, y_min) of the tile in meters
+
+        Returns:
+            Tile
+
+        Raises:
+            AviaryUserError: Invalid call (the tile fetcher does not fetch the tiles asynchronously)
+        """
+        if not self.asynchronous:
+            message = (
+                'Invalid call! '
+                'The tile fetcher must fetch the tiles asynchronously to fetch a tile asynchronously.'
+            )
+            raise AviaryUserError(message)
+
+        return await cached_fetcher_async(
+            coordinates=coordinates,
+            tile_fetcher=self._tile_fetcher,
+            cache=self._cache,
+            cache_key=self._cache_key,
+        )
+
+    def fetch_many(
+        self,
+        coordinates: list[Coordinates],
+        max_num_threads: int | None = None,
+    ) -> list[Tile]:
+        """Fetches the tiles from the cache or, if the tiles are not cached, from the source.
+
+        Parameters:
+            coordinates: Coordinates (x_min, y_min) of the tiles in meters
+            max_num_threads: Maximum number of threads
+
+        Returns:
+            Tiles
+        """
+        return cached_fetcher_many(
+            coordinates=coordinates,
+            tile_fetcher=self._tile_fetcher,
+            cache=self._cache,
+            cache_key=self._cache_key,
+            batched=self.batched,
+            max_num_threads=max_num_threads,
+        )
+
+    def close(self) -> None:
+        """Closes the tile fetcher."""
+        close(self._tile_fetcher)
+
+
+class CachedFetcherConfig(pydantic.BaseModel):
+    """Configuration for the `from_config` class method of `CachedFetcher`
+
+    Create the configuration from a config file:
+        - Use null instead of None
+
+    Usage:
+        You can create the configuration from a config file.
+
+        ``` yaml title="config.yaml"
+        package: 'aviary'
+        name: 'CachedFetcher'
+        config:
+          tile_fetcher_config:
+            ...
+          path: 'path/to/my_cache_directory'
+          max_size: null
+        ```
+
+    Attributes:
+        tile_fetcher_config: Configuration of the tile fetcher
+        path: Path to the cache directory
+        max_size: Maximum size of the cache in bytes (if None, the size is not limited) -
+            defaults to None
+    """
+    tile_fetcher_config: TileFetcherConfig
+    path: Path
+    max_size: int | None = None
+
+
+_TileFetcherFactory.register(
+    tile_fetcher_class=CachedFetcher,
+    config_class=CachedFetcherConfig,
+    package=_PACKAGE,
+)
+
+
+@experimental(
+    since='1.10.0',
+)
+@log
+class ChunkStoreFetcher(IDMixin):
+    """Tile fetcher for chunk stores
+
+    The chunk store is exported by the `ChunkStoreExporter`.
+
+    Experimental:
+        `ChunkStoreFetcher` is experimental since `1.10.0` and may change without notice.
+
+    Notes:
+        - The tile size, the buffer size, and the channel names are read from the chunk store
+        - Each tile is read from a single chunk in O(1), i.e., without an index and without GDAL
+        - Tiles that are not in the chunk store are filled with the fill value
+
+    Implements the `TileFetcher` protocol.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        fill_value: int = 0,
+    ) -> None:
+        """
+        Parameters:
+            path: Path to the chunk store (directory)
+            fill_value: Fill value of tiles that are not in the chunk store
+        """
+        self._path = path
+        self._fill_value = fill_value
+
+        self._chunk_store = ChunkStore(path=self._path)
+
+        super().__init__()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: ChunkStoreFetcherConfig,
+    ) -> ChunkStoreFetcher:
+        """Creates a chunk store fetcher from the configuration.
+
+        Parameters:
+            config: Configuration
+
+        Returns:
+            Chunk store fetcher
+        """
+        config = config.model_dump()
+        return cls(**config)
+
+    def __call__(
+        self,
+        coordinates: Coordinates,
+    ) -> Tile:
+        """Fetches a tile from the chunk store.
+
+        Parameters:
+            coordinates: Coordinates (x_min, y_min) of the tile in meters
+
+        Returns:
+            Tile
+        """
+        return chunk_store_fetcher(
+            coordinates=coordinates,
+            chunk_store=self._chunk_store,
+            fill_value=self._fill_value,
+        )
+
+
+class ChunkStoreFetcherConfig(pydantic.BaseModel):
+    """Configuration for the `from_config` class method of `ChunkStoreFetcher`
+
+    Usage:
+        You can create the configuration from a config file.
+
+        ``` yaml title="config.yaml"
+        package: 'aviary'
+        name: 'ChunkStoreFetcher'
+        config:
+          path: 'path/to/my_chunk_store'
+          fill_value: 0
+        ```
+
+    Attributes:
+        path: Path to the chunk store (directory)
+        fill_value: Fill value of tiles that are not in the chunk store -
+            defaults to 0
+    """
+    path: Path
+    fill_value: int = 0
+
+
+_TileFetcherFactory.register(
+    tile_fetcher_class=ChunkStoreFetcher,
+    config_class=ChunkStoreFetcherConfig,
+    package=_PACKAGE,
+)
+
+
 @log
 class CompositeFetcher(IDMixin):
     """Tile fetcher that composes multiple tile fetchers
@@ -307,6 +666,11 @@ class CompositeFetcher(IDMixin):
             max_num_threads=self._max_num_threads,
         )
 
+    def close(self) -> None:
+        """Closes the tile fetchers."""
+        for tile_fetcher in self._tile_fetchers:
+            close(tile_fetcher)
+
 
 class CompositeFetcherConfig(pydantic.BaseModel):
     """Configuration for the `from_config` class method of `CompositeFetcher`
@@ -353,6 +717,13 @@ class GPKGFetcher(IDMixin):
     Experimental:
         `GPKGFetcher` is experimental since `1.4.0` and may change without notice.
 
+    Notes:
+        - If in_memory is True, the geopackage is loaded and reprojected once, and the features intersecting
+            a tile are queried from the spatial index (STRtree) of the data
+        - If in_memory is False, only the features intersecting the bounding box of a tile are read
+            from the geopackage (using its spatial index), i.e., the memory usage does not depend on the size
+            of the geopackage
+
     Implements the `TileFetcher` protocol.
     """
 
@@ -363,6 +734,7 @@ class GPKGFetcher(IDMixin):
         channel_name: ChannelName | str | None,
         tile_size: TileSize,
         buffer_size: BufferSize = 0,
+        in_memory: bool = True,
     ) -> None:
         """
         Parameters:
@@ -371,12 +743,23 @@ class GPKGFetcher(IDMixin):
             channel_name: Channel name (if None, the channel is ignored)
             tile_size: Tile size in meters
             buffer_size: Buffer size in meters
+            in_memory: If True, the geopackage is loaded into memory
         """
         self._path = path
         self._epsg_code = epsg_code
         self._channel_name = channel_name
         self._tile_size = tile_size
         self._buffer_size = buffer_size
+        self._in_memory = in_memory
+
+        self._data = (
+            load_gpkg(
+                path=self._path,
+                epsg_code=self._epsg_code,
+            )
+            if self._in_memory
+            else None
+        )
 
         super().__init__()
 
@@ -415,6 +798,7 @@ class GPKGFetcher(IDMixin):
             channel_name=self._channel_name,
             tile_size=self._tile_size,
             buffer_size=self._buffer_size,
+            data=self._data,
         )
 
 
@@ -436,6 +820,7 @@ class GPKGFetcherConfig(pydantic.BaseModel):
           channel_name: 'my_channel'
           tile_size: 128
           buffer_size: 0
+          in_memory: true
         ```
 
     Attributes:
@@ -445,12 +830,15 @@ class GPKGFetcherConfig(pydantic.BaseModel):
         tile_size: Tile size in meters
         buffer_size: Buffer size in meters -
             defaults to 0
+        in_memory: If True, the geopackage is loaded into memory -
+            defaults to True
     """
     path: Path
     epsg_code: EPSGCode
     channel_name: str
     tile_size: TileSize
     buffer_size: BufferSize = 0
+    in_memory: bool = True
 
 
 _TileFetcherFactory.register(
@@ -565,6 +953,14 @@ _TileFetcherFactory.register(
 class VRTFetcher(IDMixin):
     """Tile fetcher for virtual rasters
 
+    Notes:
+        - The virtual raster is opened once per concurrently fetching thread and reused for subsequent tiles
+        - The EPSG code is validated once when the virtual raster is opened
+        - Call `close` to close the opened virtual rasters (the tile pipeline closes them automatically)
+        - `fetch_many` reads the union window of the tiles once instead of the window of each tile,
+            the tile loader uses it to fetch the tiles of a batch (if the tiles are too sparse to read
+            the union window, the window of each tile is read concurrently)
+
     Implements the `TileFetcher` protocol.
     """
     _FILL_VALUE = 0
@@ -581,6 +977,7 @@ class VRTFetcher(IDMixin):
         ground_sampling_distance: GroundSamplingDistance,
         interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR,
         buffer_size: BufferSize = 0,
+        max_num_datasets: int | None = None,
     ) -> None:
         """
         Parameters:
@@ -591,6 +988,11 @@ class VRTFetcher(IDMixin):
             ground_sampling_distance: Ground sampling distance in meters per pixel
             interpolation_mode: Interpolation mode (`BILINEAR` or `NEAREST`)
             buffer_size: Buffer size in meters
+            max_num_datasets: Maximum number of idle opened virtual rasters (if None, the number is not limited),
+                each concurrently fetching thread opens its own virtual raster regardless of the maximum number
+
+        Raises:
+            AviaryUserError: Invalid `max_num_datasets` (the maximum number of datasets is less than 1)
         """
         self._path = path
         self._epsg_code = epsg_code
@@ -599,9 +1001,34 @@ class VRTFetcher(IDMixin):
         self._ground_sampling_distance = ground_sampling_distance
         self._interpolation_mode = interpolation_mode
         self._buffer_size = buffer_size
+        self._max_num_datasets = max_num_datasets
+
+        self._dataset_pool = Pool(
+            create=lambda: open_vrt(
+                path=self._path,
+                epsg_code=self._epsg_code,
+            ),
+            close=lambda src: src.close(),
+            max_num_idle=self._max_num_datasets,
+        )
+
+        self._validate()
 
         super().__init__()
 
+    def _validate(self) -> None:
+        """Validates the VRT fetcher.
+
+        Raises:
+            AviaryUserError: Invalid `max_num_datasets` (the maximum number of datasets is less than 1)
+        """
+        if self._max_num_datasets is not None and self._max_num_datasets < 1:
+            message = (
+                'Invalid max_num_datasets! '
+                'The maximum number of datasets must be positive.'
+            )
+            raise AviaryUserError(message)
+
     @classmethod
     def from_config(
         cls,
@@ -640,8 +1067,41 @@ class VRTFetcher(IDMixin):
             interpolation_mode=self._interpolation_mode,
             buffer_size=self._buffer_size,
             fill_value=self._FILL_VALUE,
+            dataset_pool=self._dataset_pool,
         )
 
+    def fetch_many(
+        self,
+        coordinates: list[Coordinates],
+        max_num_threads: int | None = None,
+    ) -> list[Tile]:
+        """Fetches the tiles from the virtual raster.
+
+        Parameters:
+            coordinates: Coordinates (x_min, y_min) of the tiles in meters
+            max_num_threads: Maximum number of threads to read the window of each tile
+
+        Returns:
+            Tiles
+        """
+        return vrt_fetcher_many(
+            coordinates=coordinates,
+            path=self._path,
+            epsg_code=self._epsg_code,
+            channel_names=self._channel_names,
+            tile_size=self._tile_size,
+            ground_sampling_distance=self._ground_sampling_distance,
+            interpolation_mode=self._interpolation_mode,
+            buffer_size=self._buffer_size,
+            fill_value=self._FILL_VALUE,
+            dataset_pool=self._dataset_pool,
+            max_num_threads=max_num_threads,
+        )
+
+    def close(self) -> None:
+        """Closes the opened virtual rasters."""
+        self._dataset_pool.close()
+
 
 class VRTFetcherConfig(pydantic.BaseModel):
     """Configuration for the `from_config` class method of `VRTFetcher`
@@ -667,6 +1127,7 @@ class VRTFetcherConfig(pydantic.BaseModel):
           ground_sampling_distance: .2
           interpolation_mode: 'bilinear'
           buffer_size: 0
+          max_num_datasets: null
         ```
 
     Attributes:
@@ -679,6 +1140,9 @@ class VRTFetcherConfig(pydantic.BaseModel):
             defaults to `BILINEAR`
         buffer_size: Buffer size in meters (specifies the area around the tile that is additionally fetched) -
             defaults to 0
+        max_num_datasets: Maximum number of idle opened virtual rasters (if None, the number is not limited),
+            each concurrently fetching thread opens its own virtual raster regardless of the maximum number -
+            defaults to None
     """
     path: Path
     epsg_code: EPSGCode
@@ -691,6 +1155,7 @@ class VRTFetcherConfig(pydantic.BaseModel):
     ground_sampling_distance: GroundSamplingDistance
     interpolation_mode: InterpolationMode = InterpolationMode.BILINEAR
     buffer_size: BufferSize = 0
+    max_num_datasets: int | None = None
 
 
 _TileFetcherFactory.register(
@@ -704,6 +1169,18 @@ _TileFetcherFactory.register(
 class WMSFetcher(IDMixin):
     """Tile fetcher for web map services
 
+    Notes:
+        - A session is created once per concurrently fetching thread and reused for subsequent tiles,
+            i.e., the connection to the web map service is kept alive
+        - Requests that fail with a connection error or a 429 or 5xx status code are retried
+            with exponential backoff, respecting the Retry-After header
+        - Call `close` to close the sessions (the tile pipeline closes them automatically),
+            the WMS fetcher can be used again after it is closed
+        - If asynchronous is True, the tiles are fetched by an asynchronous client in a background event loop,
+            i.e., the tile loader fetches the tiles of a batch concurrently with up to the maximum number of
+            concurrent requests instead of one thread per tile (requires the async dependency group)
+        - In asynchronous mode, the responses are decoded in a thread pool to not block the event loop
+
     Implements the `TileFetcher` protocol.
     """
     _FILL_VALUE = '0x000000'
@@ -724,6 +1201,13 @@ class WMSFetcher(IDMixin):
         time: int | str | None = None,
         style: str | None = None,
         buffer_size: BufferSize = 0,
+        max_num_retries: int = 3,
+        backoff_factor: float = .5,
+        max_num_sessions: int | None = None,
+        asynchronous: bool = False,
+        max_num_concurrent_requests: int = 64,
+        max_num_requests_per_second: float | None = None,
+        max_num_decoding_threads: int | None = None,
     ) -> None:
         """
         Parameters:
@@ -738,6 +1222,25 @@ class WMSFetcher(IDMixin):
             time: Time
             style: Style
             buffer_size: Buffer size in meters
+            max_num_retries: Maximum number of retries
+            backoff_factor: Backoff factor in seconds (the first retry is immediate,
+                the delay before the i-th retry is backoff_factor * 2 ** (i - 1))
+            max_num_sessions: Maximum number of idle sessions (if None, the number is not limited)
+            asynchronous: If True, the tiles are fetched asynchronously
+            max_num_concurrent_requests: Maximum number of concurrent requests in asynchronous mode
+            max_num_requests_per_second: Maximum number of requests per second in asynchronous mode
+                (if None, the number is not limited)
+            max_num_decoding_threads: Maximum number of threads to decode the responses in asynchronous mode
+
+        Raises:
+            AviaryUserError: Invalid `max_num_sessions` (the maximum number of sessions is less than 1)
+            AviaryUserError: Invalid `max_num_concurrent_requests` (the maximum number of concurrent requests
+                is less than 1)
+            AviaryUserError: Invalid `max_num_requests_per_second` (the maximum number of requests per second
+                is not positive)
+            AviaryUserError: Invalid `max_num_decoding_threads` (the maximum number of decoding threads
+                is less than 1)
+            ImportError: Missing dependencies (asynchronous is True and the async dependency group is not installed)
         """
         self._url = url
         self._version = version
@@ -750,9 +1253,94 @@ class WMSFetcher(IDMixin):
         self._time = time
         self._style = style
         self._buffer_size = buffer_size
+        self._max_num_retries = max_num_retries
+        self._backoff_factor = backoff_factor
+        self._max_num_sessions = max_num_sessions
+        self._asynchronous = asynchronous
+        self._max_num_concurrent_requests = max_num_concurrent_requests
+        self._max_num_requests_per_second = max_num_requests_per_second
+        self._max_num_decoding_threads = max_num_decoding_threads
+
+        self._validate()
+
+        self._session_pool = Pool(
+            create=lambda: create_session(
+                max_num_retries=self._max_num_retries,
+                backoff_factor=self._backoff_factor,
+            ),
+            close=lambda session: session.close(),
+            max_num_idle=self._max_num_sessions,
+        )
+
+        if self._asynchronous:
+            self._client = create_async_client(
+                max_num_connections=self._max_num_concurrent_requests,
+            )
+            self._semaphore = asyncio.Semaphore(self._max_num_concurrent_requests)
+            self._rate_limiter = (
+                AsyncRateLimiter(max_num_calls_per_second=self._max_num_requests_per_second)
+                if self._max_num_requests_per_second is not None
+                else None
+            )
+            self._executor = ThreadPoolExecutor(max_workers=self._max_num_decoding_threads)
+        else:
+            self._client = None
+            self._semaphore = None
+            self._rate_limiter = None
+            self._executor = None
+
+        self._lock = Lock()
 
         super().__init__()
 
+    def _validate(self) -> None:
+        """Validates the WMS fetcher.
+
+        Raises:
+            AviaryUserError: Invalid `max_num_sessions` (the maximum number of sessions is less than 1)
+            AviaryUserError: Invalid `max_num_concurrent_requests` (the maximum number of concurrent requests
+                is less than 1)
+            AviaryUserError: Invalid `max_num_requests_per_second` (the maximum number of requests per second
+                is not positive)
+            AviaryUserError: Invalid `max_num_decoding_threads` (the maximum number of decoding threads
+                is less than 1)
+        """
+        if self._max_num_sessions is not None and self._max_num_sessions < 1:
+            message = (
+                'Invalid max_num_sessions! '
+                'The maximum number of sessions must be positive.'
+            )
+            raise AviaryUserError(message)
+
+        if self._max_num_concurrent_requests < 1:
+            message = (
+                'Invalid max_num_concurrent_requests! '
+                'The maximum number of concurrent requests must be positive.'
+            )
+            raise AviaryUserError(message)
+
+        if self._max_num_requests_per_second is not None and self._max_num_requests_per_second <= 0:
+            message = (
+                'Invalid max_num_requests_per_second! '
+                'The maximum number of requests per second must be positive.'
+            )
+            raise AviaryUserError(message)
+
+        if self._max_num_decoding_threads is not None and self._max_num_decoding_threads < 1:
+            message = (
+                'Invalid max_num_decoding_threads! '
+                'The maximum number of decoding threads must be positive.'
+            )
+            raise AviaryUserError(message)
+
+    @property
+    def asynchronous(self) -> bool:
+        """
+        Returns:
+            If True, the tiles are fetched asynchronously
+        """
+        return self._asynchronous
+
     @classmethod
     def from_config(
         cls,
@@ -781,6 +1369,9 @@ class WMSFetcher(IDMixin):
         Returns:
             Tile
         """
+        if self._asynchronous:
+            return run_coroutine(self.fetch_async(coordinates=coordinates))
+
         return wms_fetcher(
             coordinates=coordinates,
             url=self._url,
@@ -795,8 +1386,91 @@ class WMSFetcher(IDMixin):
             style=self._style,
             buffer_size=self._buffer_size,
             fill_value=self._FILL_VALUE,
+            session_pool=self._session_pool,
         )
 
+    async def fetch_async(
+        self,
+        coordinates: Coordinates,
+    ) -> Tile:
+        """Fetches a tile from the web map service asynchronously.
+
+        Notes:
+            - The coroutine must be awaited in the background event loop
+                (see `aviary._utils.concurrency.run_coroutine`)
+
+        Parameters:
+            coordinates: Coordinates (x_min, y_min) of the tile in meters
+
+        Returns:
+            Tile
+
+        Raises:
+            AviaryUserError: Invalid call (asynchronous is False)
+        """
+        if not self._asynchronous:
+            message = (
+                'Invalid call! '
+                'asynchronous must be True to fetch a tile asynchronously.'
+            )
+            raise AviaryUserError(message)
+
+        client, executor = self._open()
+        return await wms_fetcher_async(
+            coordinates=coordinates,
+            url=self._url,
+            version=self._version,
+            layer=self._layer,
+            epsg_code=self._epsg_code,
+            response_format=self._response_format,
+            channel_names=self._channel_names,
+            tile_size=self._tile_size,
+            ground_sampling_distance=self._ground_sampling_distance,
+            client=client,
+            time=self._time,
+            style=self._style,
+            buffer_size=self._buffer_size,
+            fill_value=self._FILL_VALUE,
+            max_num_retries=self._max_num_retries,
+            backoff_factor=self._backoff_factor,
+            semaphore=self._semaphore,
+            rate_limiter=self._rate_limiter,
+            executor=executor,
+        )
+
+    def _open(self) -> tuple[httpx.AsyncClient, ThreadPoolExecutor]:
+        """Returns the client and the thread pool, they are recreated if the WMS fetcher was closed.
+
+        Returns:
+            Asynchronous client and thread pool to decode the responses
+        """
+        with self._lock:
+            if self._client is None:
+                self._client = create_async_client(
+                    max_num_connections=self._max_num_concurrent_requests,
+                )
+                self._executor = ThreadPoolExecutor(max_workers=self._max_num_decoding_threads)
+
+            return self._client, self._executor
+
+    def close(self) -> None:
+        """Closes the sessions and, in asynchronous mode, the client and the thread pool.
+
+        Notes:
+            - The client and the thread pool are recreated on the next asynchronous fetch
+        """
+        self._session_pool.close()
+
+        with self._lock:
+            client = self._client
+            executor = self._executor
+            self._client = None
+            self._executor = None
+
+        if client is not None:
+            run_coroutine(client.aclose())
+            executor.shutdown()
+
 
 class WMSFetcherConfig(pydantic.BaseModel):
     """Configuration for the `from_config` class method of `WMSFetcher`
@@ -826,6 +1500,13 @@ class WMSFetcherConfig(pydantic.BaseModel):
           time: null
           style: null
           buffer_size: 0
+          max_num_retries: 3
+          backoff_factor: .5
+          max_num_sessions: null
+          asynchronous: false
+          max_num_concurrent_requests: 64
+          max_num_requests_per_second: null
+          max_num_decoding_threads: null
         ```
 
     Attributes:
@@ -843,6 +1524,22 @@ class WMSFetcherConfig(pydantic.BaseModel):
             defaults to None
         buffer_size: Buffer size in meters -
             defaults to 0
+        max_num_retries: Maximum number of retries -
+            defaults to 3
+        backoff_factor: Backoff factor in seconds (the first retry is immediate,
+            the delay before the i-th retry is backoff_factor * 2 ** (i - 1)) -
+            defaults to .5
+        max_num_sessions: Maximum number of idle sessions (if None, the number is not limited) -
+            defaults to None
+        asynchronous: If True, the tiles are fetched asynchronously -
+            defaults to False
+        max_num_concurrent_requests: Maximum number of concurrent requests in asynchronous mode -
+            defaults to 64
+        max_num_requests_per_second: Maximum number of requests per second in asynchronous mode
+            (if None, the number is not limited) -
+            defaults to None
+        max_num_decoding_threads: Maximum number of threads to decode the responses in asynchronous mode -
+            defaults to None
     """
     url: str
     version: WMSVersion
@@ -859,6 +1556,13 @@ class WMSFetcherConfig(pydantic.BaseModel):
     time: int | str | None = None
     style: str | None = None
     buffer_size: BufferSize = 0
+    max_num_retries: int = 3
+    backoff_factor: float = .5
+    max_num_sessions: int | None = None
+    asynchronous: bool = False
+    max_num_concurrent_requests: int = 64
+    max_num_requests_per_second: float | None = None
+    max_num_decoding_threads: int | None = None
 
 
 _TileFetcherFactory.register(
@@ -13,17 +13,27 @@
 #  You should have received a copy of the GNU General Public License along with aviary.
 #  If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
+from collections import deque
 from collections.abc import (
     Iterable,
     Iterator,
 )
-from concurrent.futures import ThreadPoolExecutor
-from queue import Queue
-from threading import Thread
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
 
+from aviary._utils.concurrency import (
+    map_concurrently,
+    run_coroutine,
+)
 from aviary._utils.logging import log
 from aviary.core.mixins import IDMixin
-from aviary.core.tiles import Tiles
+from aviary.core.tiles import (
+    Tile,
+    Tiles,
+)
 from aviary.tile.tile_set import TileSet
 
 
@@ -45,11 +55,25 @@ class TileLoader(
             batch_size=1,
             max_num_threads=None,
             num_prefetched_tiles=0,
+            num_prefetching_threads=1,
         )
 
         for tiles in tile_loader:
             ...
         ```
+
+    Notes:
+        - If the number of prefetched tiles is greater than 0, the next batches are fetched in the background
+            while the current batch is processed, i.e., up to the number of prefetched tiles batches are buffered
+        - The batches are prefetched concurrently depending on the number of prefetching threads,
+            but they are yielded in order
+        - If an exception is raised while prefetching a batch, it is raised when the batch is yielded
+        - Call `close` to cancel the prefetching (the tile pipeline closes the tile loader automatically)
+        - If the tile fetcher fetches the tiles asynchronously, the tiles of a batch are fetched concurrently
+            in the background event loop instead of in a thread pool, i.e., the maximum number of threads is ignored
+        - If the tile fetcher fetches multiple tiles at once (e.g., `VRTFetcher`), the tiles of a batch are fetched
+            by a single call instead of in a thread pool, i.e., the maximum number of threads is only used
+            for the tiles that the tile fetcher cannot fetch at once
     """
 
     def __init__(
@@ -58,6 +82,7 @@ class TileLoader(
         batch_size: int = 1,
         max_num_threads: int | None = None,
         num_prefetched_tiles: int = 0,
+        num_prefetching_threads: int = 1,
     ) -> None:
         """
         Parameters:
@@ -65,37 +90,33 @@ class TileLoader(
             batch_size: Batch size
             max_num_threads: Maximum number of threads
             num_prefetched_tiles: Number of prefetched tiles
+            num_prefetching_threads: Number of prefetching threads
         """
         self._tile_set = tile_set
         self._batch_size = batch_size
         self._max_num_threads = max_num_threads if self._batch_size > 1 else 1
         self._num_prefetched_tiles = num_prefetched_tiles
+        self._num_prefetching_threads = num_prefetching_threads
 
         self._index = 0
-
-        if self._num_prefetched_tiles > 0:
-            self._prefetch_queue = Queue(self._num_prefetched_tiles)
-            self._prefetch_thread = Thread(
-                target=self._prefetch_tiles,
-                daemon=True,
-            )
-            self._prefetch_thread.start()
-        else:
-            self._prefetch_queue = None
+        self._prefetch_index = 0
+        self._prefetch_executor: ThreadPoolExecutor | None = None
+        self._prefetch_futures: deque[Future[Tiles]] = deque()
 
         super().__init__()
 
     def _prefetch_tiles(self) -> None:
-        """Prefetches the tiles and puts them into the queue."""
-        index = 0
+        """Submits the next batches to the prefetching threads until the number of prefetched tiles is reached."""
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=self._num_prefetching_threads)
 
-        while index < len(self._tile_set):
-            if self._prefetch_queue.full():
-                continue
+        while len(self._prefetch_futures) < self._num_prefetched_tiles:
+            if self._prefetch_index >= len(self._tile_set):
+                break
 
-            tiles = self._fetch_tiles(index=index)
-            self._prefetch_queue.put(tiles)
-            index += self._batch_size
+            future = self._prefetch_executor.submit(self._fetch_tiles, index=self._prefetch_index)
+            self._prefetch_futures.append(future)
+            self._prefetch_index += self._batch_size
 
     def _fetch_tiles(
         self,
@@ -112,20 +133,48 @@ class TileLoader(
         end_index = min(index + self._batch_size, len(self._tile_set))
         indices = range(index, end_index)
 
-        if self._max_num_threads == 1:
+        if self._tile_set.asynchronous:
+            tiles = run_coroutine(self._fetch_tiles_async(indices=indices))
+        elif self._tile_set.batched:
+            tiles = self._tile_set.get_many(
+                indices=indices,
+                max_num_threads=self._max_num_threads,
+            )
+        elif self._max_num_threads == 1:
             tiles = [
                 self._tile_set[index]
                 for index in indices
             ]
         else:
-            with ThreadPoolExecutor(max_workers=self._max_num_threads) as executor:
-                tiles = list(executor.map(self._tile_set.__getitem__, indices))
+            tiles = map_concurrently(
+                self._tile_set.__getitem__,
+                indices,
+                scope='tile_loader',
+                max_num_threads=self._max_num_threads,
+            )
 
         return Tiles.from_tiles(
             tiles=tiles,
             copy=False,
         )
 
+    async def _fetch_tiles_async(
+        self,
+        indices: range,
+    ) -> list[Tile]:
+        """Fetches the tiles asynchronously.
+
+        Parameters:
+            indices: Indices
+
+        Returns:
+            Tiles
+        """
+        return await asyncio.gather(*(
+            self._tile_set.get_async(index=index)
+            for index in indices
+        ))
+
     def __len__(self) -> int:
         """Computes the number of batches.
 
@@ -148,7 +197,9 @@ class TileLoader(
         Yields:
             Tiles
         """
+        self.close()
         self._index = 0
+        self._prefetch_index = 0
         return self
 
     def __next__(self) -> Tiles:
@@ -160,10 +211,33 @@ class TileLoader(
         if self._index >= len(self._tile_set):
             raise StopIteration
 
-        if self._prefetch_queue is not None:  # ruff: ignore[SIM108]
-            tiles = self._prefetch_queue.get()
+        if self._num_prefetched_tiles > 0:
+            self._prefetch_tiles()
+            future = self._prefetch_futures.popleft()
+
+            try:
+                tiles = future.result()
+            except BaseException:
+                self.close()
+                raise
+
+            self._prefetch_tiles()
         else:
             tiles = self._fetch_tiles(index=self._index)
 
         self._index += self._batch_size
         return tiles
+
+    def close(self) -> None:
+        """Cancels the prefetching."""
+        for future in self._prefetch_futures:
+            future.cancel()
+
+        self._prefetch_futures.clear()
+
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(
+                wait=False,
+                cancel_futures=True,
+            )
+            self._prefetch_executor = None
@@ -63,6 +63,22 @@ class TileSet(
 
         super().__init__()
 
+    @property
+    def asynchronous(self) -> bool:
+        """
+        Returns:
+            If True, the tile fetcher fetches the tiles asynchronously
+        """
+        return getattr(self._tile_fetcher, 'asynchronous', False)
+
+    @property
+    def batched(self) -> bool:
+        """
+        Returns:
+            If True, the tile fetcher fetches multiple tiles at once
+        """
+        return getattr(self._tile_fetcher, 'batched', callable(getattr(self._tile_fetcher, 'fetch_many', None)))
+
     def __len__(self) -> int:
         """Computes the number of tiles.
 
@@ -94,6 +110,58 @@ class TileSet(
         coordinates = self._grid[index]
         return self._tile_fetcher(coordinates=coordinates)
 
+    async def get_async(
+        self,
+        index: int,
+    ) -> Tile:
+        """Returns the tile asynchronously.
+
+        Notes:
+            - The tile fetcher must fetch the tiles asynchronously (see `asynchronous`)
+
+        Parameters:
+            index: Index of the tile
+
+        Returns:
+            Tile
+        """
+        coordinates = self._grid[index]
+        return await self._tile_fetcher.fetch_async(coordinates=coordinates)
+
+    def get_many(
+        self,
+        indices: Iterable[int],
+        max_num_threads: int | None = None,
+    ) -> list[Tile]:
+        """Returns the tiles.
+
+        Notes:
+            - If the tile fetcher fetches multiple tiles at once (see `batched`), the tiles are fetched
+                by a single call, otherwise the tiles are fetched one by one
+
+        Parameters:
+            indices: Indices of the tiles
+            max_num_threads: Maximum number of threads of the tile fetcher to fetch the tiles
+                that cannot be fetched at once
+
+        Returns:
+            Tiles
+        """
+        if not self.batched:
+            return [
+                self[index]
+                for index in indices
+            ]
+
+        coordinates = [
+            self._grid[index]
+            for index in indices
+        ]
+        return self._tile_fetcher.fetch_many(
+            coordinates=coordinates,
+            max_num_threads=max_num_threads,
+        )
+
     def __iter__(self) -> Iterator[Tile]:
         """Iterates over the tiles.
 
@@ -21,16 +21,24 @@ from typing import TYPE_CHECKING
 import pydantic
 
 from aviary._functional.tile.tiles_exporter import (
+    chunk_store_exporter,
     grid_exporter,
+    grid_journal_to_json,
     object_exporter,
     raster_exporter,
     vector_exporter,
 )
+from aviary._utils.chunk_store import ChunkStore
+from aviary._utils.concurrency import BackgroundWorker
+from aviary._utils.gpkg_writer import GPKGWriter
 from aviary._utils.lifecycle import experimental
 from aviary._utils.logging import log
+from aviary._utils.mosaic_writer import MosaicWriter
 from aviary.core.enums import (
     ChannelName,
+    GridExporterMode,
     ObjectExporterMode,
+    RasterExporterMode,
 )
 from aviary.core.mixins import IDMixin
 from aviary.core.type_aliases import EPSGCode
@@ -42,25 +50,171 @@ if TYPE_CHECKING:
 _PACKAGE = 'aviary'
 
 
+@experimental(
+    since='1.10.0',
+)
+@log
+class ChunkStoreExporter(IDMixin):
+    """Tiles processor that exports raster channels to a chunk store
+
+    The raster data of each tile is exported to a compressed chunk that is located by the coordinates of the tile.
+    Use the `ChunkStoreFetcher` to fetch the tiles from the chunk store.
+
+    Experimental:
+        `ChunkStoreExporter` is experimental since `1.10.0` and may change without notice.
+
+    Notes:
+        - Requires raster channels
+        - The raster data is exported with its buffer
+        - The tile size, buffer size, shape, data type, and channel names must match an existing chunk store,
+            i.e., a chunk store can be extended by subsequent runs
+        - Existing chunks are overwritten
+
+    Implements the `TilesProcessor` protocol.
+    """
+
+    def __init__(
+        self,
+        channel_names:
+            ChannelName | str |
+            list[ChannelName | str],
+        path: Path,
+        remove_channels: bool = True,
+        max_num_threads: int | None = None,
+    ) -> None:
+        """
+        Parameters:
+            channel_names: Channel name or channel names
+            path: Path to the chunk store (directory)
+            remove_channels: If True, the channels are removed
+            max_num_threads: Maximum number of threads
+        """
+        self._channel_names = channel_names
+        self._path = path
+        self._remove_channels = remove_channels
+        self._max_num_threads = max_num_threads
+
+        self._chunk_store = ChunkStore(path=self._path)
+
+        super().__init__()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: ChunkStoreExporterConfig,
+    ) -> ChunkStoreExporter:
+        """Creates a chunk store exporter from the configuration.
+
+        Parameters:
+            config: Configuration
+
+        Returns:
+            Chunk store exporter
+        """
+        config = config.model_dump()
+        return cls(**config)
+
+    def __call__(
+        self,
+        tiles: Tiles,
+    ) -> Tiles:
+        """Exports the raster channels to the chunk store.
+
+        Parameters:
+            tiles: Tiles
+
+        Returns:
+            Tiles
+        """
+        return chunk_store_exporter(
+            tiles=tiles,
+            channel_names=self._channel_names,
+            chunk_store=self._chunk_store,
+            remove_channels=self._remove_channels,
+            max_num_threads=self._max_num_threads,
+        )
+
+
+class ChunkStoreExporterConfig(pydantic.BaseModel):
+    """Configuration for the `from_config` class method of `ChunkStoreExporter`
+
+    Create the configuration from a config file:
+        - Use null instead of None
+        - Use false or true instead of False or True
+
+    Usage:
+        You can create the configuration from a config file.
+
+        ``` yaml title="config.yaml"
+        package: 'aviary'
+        name: 'ChunkStoreExporter'
+        config:
+          channel_names:
+            - 'r'
+            - 'g'
+            - 'b'
+          path: 'path/to/my_chunk_store'
+          remove_channels: true
+          max_num_threads: null
+        ```
+
+    Attributes:
+        channel_names: Channel name or channel names
+        path: Path to the chunk store (directory)
+        remove_channels: If True, the channels are removed -
+            defaults to True
+        max_num_threads: Maximum number of threads -
+            defaults to None
+    """
+    channel_names: (
+        ChannelName | str |
+        list[ChannelName | str]
+    )
+    path: Path
+    remove_channels: bool = True
+    max_num_threads: int | None = None
+
+
+_TilesProcessorFactory.register(
+    tiles_processor_class=ChunkStoreExporter,
+    config_class=ChunkStoreExporterConfig,
+    package=_PACKAGE,
+)
+
+
 @log
 class GridExporter(IDMixin):
     """Tiles processor that exports the grid of the tiles
 
-    The grid is exported to a JSON file. The JSON string contains a list of coordinates (x_min, y_min)
+    The grid is exported to a JSON file or a journal. The JSON string contains a list of coordinates (x_min, y_min)
     of each tile and the tile size.
 
+    Notes:
+        - In JSON mode, the JSON file is rewritten for each batch, i.e., exporting slows down as the grid grows
+        - In journal mode, the coordinates are appended to an append-only binary file, i.e., exporting is O(batch)
+            per batch (use `Grid.from_journal` to read the journal)
+        - In journal mode, the journal is converted to a JSON file when the grid exporter is closed
+            if `json_path` is specified
+
     Implements the `TilesProcessor` protocol.
     """
 
     def __init__(
         self,
         path: Path,
+        mode: GridExporterMode = GridExporterMode.JSON,
+        json_path: Path | None = None,
     ) -> None:
         """
         Parameters:
-            path: Path to the JSON file (.json file)
+            path: Path to the JSON file (.json file) or the journal
+            mode: Grid exporter mode (`JOURNAL` or `JSON`)
+            json_path: Path to the JSON file (.json file) the journal is converted to when the grid exporter
+                is closed (only used in journal mode)
         """
         self._path = path
+        self._mode = mode
+        self._json_path = json_path
 
         super().__init__()
 
@@ -95,12 +249,31 @@ class GridExporter(IDMixin):
         return grid_exporter(
             tiles=tiles,
             path=self._path,
+            mode=self._mode,
         )
 
+    def close(self) -> None:
+        """Converts the journal to a JSON file if `json_path` is specified (only in journal mode)."""
+        conditions = [
+            self._mode == GridExporterMode.JOURNAL,
+            self._json_path is not None,
+            self._path.exists(),
+        ]
+
+        if all(conditions):
+            grid_journal_to_json(
+                path=self._path,
+                json_path=self._json_path,
+            )
+
 
 class GridExporterConfig(pydantic.BaseModel):
     """Configuration for the `from_config` class method of `GridExporter`
 
+    Create the configuration from a config file:
+        - Use 'journal' or 'json' instead of `GridExporterMode.JOURNAL` or `GridExporterMode.JSON`
+        - Use null instead of None
+
     Usage:
         You can create the configuration from a config file.
 
@@ -109,12 +282,21 @@ class GridExporterConfig(pydantic.BaseModel):
         name: 'GridExporter'
         config:
           path: 'path/to/my_processed_grid.json'
+          mode: 'json'
+          json_path: null
         ```
 
     Attributes:
-        path: Path to the JSON file (.json file)
+        path: Path to the JSON file (.json file) or the journal
+        mode: Grid exporter mode (`JOURNAL` or `JSON`) -
+            defaults to `JSON`
+        json_path: Path to the JSON file (.json file) the journal is converted to when the grid exporter
+            is closed (only used in journal mode) -
+            defaults to None
     """
     path: Path
+    mode: GridExporterMode = GridExporterMode.JSON
+    json_path: Path | None = None
 
 
 _TilesProcessorFactory.register(
@@ -138,6 +320,9 @@ class ObjectExporter(IDMixin):
 
     Notes:
         - Requires an object channel
+        - The object data is buffered if `max_num_buffered_rows` or `max_num_buffered_bytes` is specified,
+            i.e., it is appended to the geopackage in large transactions instead of once per batch
+        - The buffered object data is appended when the object exporter is flushed or closed
 
     Implements the `TilesProcessor` protocol.
     """
@@ -149,6 +334,9 @@ class ObjectExporter(IDMixin):
         path: Path,
         mode: ObjectExporterMode = ObjectExporterMode.BOX,
         remove_channel: bool = True,
+        max_num_buffered_rows: int | None = None,
+        max_num_buffered_bytes: int | None = None,
+        use_arrow: bool = False,
     ) -> None:
         """
         Parameters:
@@ -157,12 +345,28 @@ class ObjectExporter(IDMixin):
             path: Path to the geopackage (.gpkg file)
             mode: Object exporter mode (`BOX` or `POINT`)
             remove_channel: If True, the channel is removed
+            max_num_buffered_rows: Maximum number of buffered rows
+            max_num_buffered_bytes: Maximum number of buffered bytes
+            use_arrow: If True, the data is appended with Arrow I/O (requires pyarrow)
+
+        Raises:
+            ImportError: Missing dependencies (use_arrow is True and pyarrow is not installed)
         """
         self._channel_name = channel_name
         self._epsg_code = epsg_code
         self._path = path
         self._mode = mode
         self._remove_channel = remove_channel
+        self._max_num_buffered_rows = max_num_buffered_rows
+        self._max_num_buffered_bytes = max_num_buffered_bytes
+        self._use_arrow = use_arrow
+
+        self._gpkg_writer = GPKGWriter(
+            path=self._path,
+            max_num_rows=self._max_num_buffered_rows,
+            max_num_bytes=self._max_num_buffered_bytes,
+            use_arrow=self._use_arrow,
+        )
 
         super().__init__()
 
@@ -201,14 +405,24 @@ class ObjectExporter(IDMixin):
             path=self._path,
             mode=self._mode,
             remove_channel=self._remove_channel,
+            gpkg_writer=self._gpkg_writer,
         )
 
+    def flush(self) -> None:
+        """Appends the buffered data to the geopackage."""
+        self._gpkg_writer.flush()
+
+    def close(self) -> None:
+        """Appends the buffered data to the geopackage."""
+        self._gpkg_writer.close()
+
 
 class ObjectExporterConfig(pydantic.BaseModel):
     """Configuration for the `from_config` class method of `ObjectExporter`
 
     Create the configuration from a config file:
         - Use 'box' or 'point' instead of `ObjectExporterMode.BOX` or `ObjectExporterMode.POINT`
+        - Use null instead of None
         - Use false or true instead of False or True
 
     Usage:
@@ -223,6 +437,9 @@ class ObjectExporterConfig(pydantic.BaseModel):
           path: 'path/to/my_channel.gpkg'
           mode: 'box'
           remove_channel: true
+          max_num_buffered_rows: null
+          max_num_buffered_bytes: null
+          use_arrow: false
         ```
 
     Attributes:
@@ -233,12 +450,21 @@ class ObjectExporterConfig(pydantic.BaseModel):
             defaults to `BOX`
         remove_channel: If True, the channel is removed -
             defaults to True
+        max_num_buffered_rows: Maximum number of buffered rows -
+            defaults to None
+        max_num_buffered_bytes: Maximum number of buffered bytes -
+            defaults to None
+        use_arrow: If True, the data is appended with Arrow I/O (requires pyarrow) -
+            defaults to False
     """
     channel_name: ChannelName | str
     epsg_code: EPSGCode
     path: Path
     mode: ObjectExporterMode = ObjectExporterMode.BOX
     remove_channel: bool = True
+    max_num_buffered_rows: int | None = None
+    max_num_buffered_bytes: int | None = None
+    use_arrow: bool = False
 
 
 _TilesProcessorFactory.register(
@@ -255,13 +481,27 @@ _TilesProcessorFactory.register(
 class RasterExporter(IDMixin):
     """Tiles processor that exports raster channels
 
-    The raster data is exported to a geotiff for each tile.
+    The raster data is exported to a geotiff for each tile (tiles mode) or into large tiled geotiffs
+    that contain `mosaic_size` x `mosaic_size` tiles (mosaic mode or cloud optimized geotiff mode).
 
     Experimental:
         `RasterExporter` is experimental since `1.3.0` and may change without notice.
 
     Notes:
         - Requires raster channels
+        - If `write_in_background` is True, the geotiffs are compressed and written by dedicated writing threads,
+            i.e., writing overlaps with fetching and processing the next tiles (`max_num_threads` is ignored)
+        - The queue of the writing threads is bounded, i.e., processing waits if writing falls behind
+        - The remaining geotiffs are written when the raster exporter is flushed or closed, an exception
+            of a writing thread is raised by the next call or when the raster exporter is flushed or closed
+        - In mosaic mode, the buffer of each tile is removed and the tile is written into the mosaic
+            that contains it, the mosaics are named by the coordinates of their bottom left corner
+        - In mosaic mode, the mosaics are closed when the raster exporter is flushed, i.e., the written tiles
+            are on disk, and the overviews are built when the raster exporter is closed
+        - In cloud optimized geotiff mode, the tiles are written into intermediate geotiffs that are converted
+            to cloud optimized geotiffs when the raster exporter is closed
+        - The mosaics are aligned to multiples of `mosaic_size` tiles, i.e., the tiles of a snapped grid
+            are block-aligned and each block is written exactly once
 
     Implements the `TilesProcessor` protocol.
     """
@@ -276,6 +516,11 @@ class RasterExporter(IDMixin):
         mapping: dict[int, list[int]] | None = None,
         remove_channels: bool = True,
         max_num_threads: int | None = None,
+        write_in_background: bool = False,
+        num_writing_threads: int = 1,
+        max_write_queue_size: int = 16,
+        mode: RasterExporterMode = RasterExporterMode.TILES,
+        mosaic_size: int = 64,
     ) -> None:
         """
         Parameters:
@@ -285,6 +530,12 @@ class RasterExporter(IDMixin):
             mapping: Mapping of the values
             remove_channels: If True, the channels are removed
             max_num_threads: Maximum number of threads
+            write_in_background: If True, the geotiffs are written by dedicated writing threads
+            num_writing_threads: Number of writing threads
+            max_write_queue_size: Maximum number of queued tiles
+            mode: Raster exporter mode (`COG`, `MOSAIC`, or `TILES`)
+            mosaic_size: Size of each mosaic in tiles (only used in mosaic mode
+                and cloud optimized geotiff mode)
         """
         self._channel_names = channel_names
         self._epsg_code = epsg_code
@@ -292,6 +543,37 @@ class RasterExporter(IDMixin):
         self._mapping = mapping
         self._remove_channels = remove_channels
         self._max_num_threads = max_num_threads
+        self._write_in_background = write_in_background
+        self._num_writing_threads = num_writing_threads
+        self._max_write_queue_size = max_write_queue_size
+        self._mode = mode
+        self._mosaic_size = mosaic_size
+
+        self._background_worker = None
+
+        if self._write_in_background:
+            self._background_worker = BackgroundWorker(
+                num_threads=self._num_writing_threads,
+                max_queue_size=self._max_write_queue_size,
+                name='raster-exporter',
+            )
+
+        self._mosaic_writer = None
+
+        if self._mode in (RasterExporterMode.COG, RasterExporterMode.MOSAIC):
+            channel_names = self._channel_names
+
+            if not isinstance(channel_names, list):
+                channel_names = [channel_names]
+
+            self._mosaic_writer = MosaicWriter(
+                path=self._path,
+                epsg_code=self._epsg_code,
+                mosaic_size=self._mosaic_size,
+                channel_names=channel_names,
+                mapping=self._mapping,
+                cog=self._mode == RasterExporterMode.COG,
+            )
 
         super().__init__()
 
@@ -331,13 +613,34 @@ class RasterExporter(IDMixin):
             mapping=self._mapping,
             remove_channels=self._remove_channels,
             max_num_threads=self._max_num_threads,
+            background_worker=self._background_worker,
+            mosaic_writer=self._mosaic_writer,
         )
 
+    def flush(self) -> None:
+        """Waits until the queued geotiffs are written and flushes the mosaics."""
+        if self._background_worker is not None:
+            self._background_worker.join()
+
+        if self._mosaic_writer is not None:
+            self._mosaic_writer.flush()
+
+    def close(self) -> None:
+        """Waits until the queued geotiffs are written, stops the writing threads, and finalizes the mosaics."""
+        try:
+            if self._background_worker is not None:
+                self._background_worker.close()
+        finally:
+            if self._mosaic_writer is not None:
+                self._mosaic_writer.close()
+
 
 class RasterExporterConfig(pydantic.BaseModel):
     """Configuration for the `from_config` class method of `RasterExporter`
 
     Create the configuration from a config file:
+        - Use 'cog', 'mosaic', or 'tiles' instead of `RasterExporterMode.COG`, `RasterExporterMode.MOSAIC`,
+            or `RasterExporterMode.TILES`
         - Use null instead of None
         - Use false or true instead of False or True
 
@@ -357,6 +660,11 @@ class RasterExporterConfig(pydantic.BaseModel):
           mapping: null
           remove_channels: true
           max_num_threads: null
+          write_in_background: false
+          num_writing_threads: 1
+          max_write_queue_size: 16
+          mode: 'tiles'
+          mosaic_size: 64
         ```
 
     Attributes:
@@ -369,6 +677,17 @@ class RasterExporterConfig(pydantic.BaseModel):
             defaults to True
         max_num_threads: Maximum number of threads -
             defaults to None
+        write_in_background: If True, the geotiffs are written by dedicated writing threads -
+            defaults to False
+        num_writing_threads: Number of writing threads -
+            defaults to 1
+        max_write_queue_size: Maximum number of queued tiles -
+            defaults to 16
+        mode: Raster exporter mode (`COG`, `MOSAIC`, or `TILES`) -
+            defaults to `TILES`
+        mosaic_size: Size of each mosaic in tiles (only used in mosaic mode
+            and cloud optimized geotiff mode) -
+            defaults to 64
     """
     channel_names: (
         ChannelName | str |
@@ -379,6 +698,11 @@ class RasterExporterConfig(pydantic.BaseModel):
     mapping: dict[int, list[int]] | None = None
     remove_channels: bool = True
     max_num_threads: int | None = None
+    write_in_background: bool = False
+    num_writing_threads: int = 1
+    max_write_queue_size: int = 16
+    mode: RasterExporterMode = RasterExporterMode.TILES
+    mosaic_size: int = 64
 
 
 _TilesProcessorFactory.register(
@@ -396,6 +720,9 @@ class VectorExporter(IDMixin):
 
     Notes:
         - Requires a vector channel
+        - The vector data is buffered if `max_num_buffered_rows` or `max_num_buffered_bytes` is specified,
+            i.e., it is appended to the geopackage in large transactions instead of once per batch
+        - The buffered vector data is appended when the vector exporter is flushed or closed
 
     Implements the `TilesProcessor` protocol.
     """
@@ -406,6 +733,9 @@ class VectorExporter(IDMixin):
         epsg_code: EPSGCode,
         path: Path,
         remove_channel: bool = True,
+        max_num_buffered_rows: int | None = None,
+        max_num_buffered_bytes: int | None = None,
+        use_arrow: bool = False,
     ) -> None:
         """
         Parameters:
@@ -413,11 +743,27 @@ class VectorExporter(IDMixin):
             epsg_code: EPSG code
             path: Path to the geopackage (.gpkg file)
             remove_channel: If True, the channel is removed
+            max_num_buffered_rows: Maximum number of buffered rows
+            max_num_buffered_bytes: Maximum number of buffered bytes
+            use_arrow: If True, the data is appended with Arrow I/O (requires pyarrow)
+
+        Raises:
+            ImportError: Missing dependencies (use_arrow is True and pyarrow is not installed)
         """
         self._channel_name = channel_name
         self._epsg_code = epsg_code
         self._path = path
         self._remove_channel = remove_channel
+        self._max_num_buffered_rows = max_num_buffered_rows
+        self._max_num_buffered_bytes = max_num_buffered_bytes
+        self._use_arrow = use_arrow
+
+        self._gpkg_writer = GPKGWriter(
+            path=self._path,
+            max_num_rows=self._max_num_buffered_rows,
+            max_num_bytes=self._max_num_buffered_bytes,
+            use_arrow=self._use_arrow,
+        )
 
         super().__init__()
 
@@ -455,13 +801,23 @@ class VectorExporter(IDMixin):
             epsg_code=self._epsg_code,
             path=self._path,
             remove_channel=self._remove_channel,
+            gpkg_writer=self._gpkg_writer,
         )
 
+    def flush(self) -> None:
+        """Appends the buffered data to the geopackage."""
+        self._gpkg_writer.flush()
+
+    def close(self) -> None:
+        """Appends the buffered data to the geopackage."""
+        self._gpkg_writer.close()
+
 
 class VectorExporterConfig(pydantic.BaseModel):
     """Configuration for the `from_config` class method of `VectorExporter`
 
     Create the configuration from a config file:
+        - Use null instead of None
         - Use false or true instead of False or True
 
     Usage:
@@ -475,6 +831,9 @@ class VectorExporterConfig(pydantic.BaseModel):
           epsg_code: 25832
           path: 'path/to/my_channel.gpkg'
           remove_channel: true
+          max_num_buffered_rows: null
+          max_num_buffered_bytes: null
+          use_arrow: false
         ```
 
     Attributes:
@@ -483,11 +842,20 @@ class VectorExporterConfig(pydantic.BaseModel):
         path: Path to the geopackage (.gpkg file)
         remove_channel: If True, the channel is removed -
             defaults to True
+        max_num_buffered_rows: Maximum number of buffered rows -
+            defaults to None
+        max_num_buffered_bytes: Maximum number of buffered bytes -
+            defaults to None
+        use_arrow: If True, the data is appended with Arrow I/O (requires pyarrow) -
+            defaults to False
     """
     channel_name: ChannelName | str
     epsg_code: EPSGCode
     path: Path
     remove_channel: bool = True
+    max_num_buffered_rows: int | None = None
+    max_num_buffered_bytes: int | None = None
+    use_arrow: bool = False
 
 
 _TilesProcessorFactory.register(
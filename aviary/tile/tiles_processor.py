@@ -52,6 +52,10 @@ from aviary._functional.tile.tiles_processor import (
 )
 from aviary._utils.lifecycle import experimental
 from aviary._utils.logging import log
+from aviary._utils.resources import (
+    close,
+    flush,
+)
 from aviary.core.enums import (
     ChannelName,
     Connectivity,
@@ -1011,6 +1015,16 @@ class ParallelCompositeProcessor(IDMixin):
             tiles_processors=self._tiles_processors,
         )
 
+    def flush(self) -> None:
+        """Flushes the tiles processors."""
+        for tiles_processor in self._tiles_processors:
+            flush(tiles_processor)
+
+    def close(self) -> None:
+        """Closes the tiles processors."""
+        for tiles_processor in self._tiles_processors:
+            close(tiles_processor)
+
 
 class ParallelCompositeProcessorConfig(pydantic.BaseModel):
     """Configuration for the `from_config` class method of `ParallelCompositeProcessor`
@@ -1052,6 +1066,8 @@ class RasterizeProcessor(IDMixin):
 
     Notes:
         - Requires a vector channel
+        - If `use_processes` is True, the data items are processed in worker processes, which scales across
+            all cores for large batches
 
     Implements the `TilesProcessor` protocol.
     """
@@ -1067,6 +1083,7 @@ class RasterizeProcessor(IDMixin):
         dtype: DType | None = DType.UINT8,
         new_channel_name: ChannelName | str | None = None,
         max_num_threads: int | None = None,
+        use_processes: bool = False,
     ) -> None:
         """
         Parameters:
@@ -1078,7 +1095,8 @@ class RasterizeProcessor(IDMixin):
             background_value: Background value
             dtype: Data type
             new_channel_name: New channel name
-            max_num_threads: Maximum number of threads
+            max_num_threads: Maximum number of threads (or processes if `use_processes` is True)
+            use_processes: If True, process the data items in worker processes instead of threads
         """
         self._channel_name = channel_name
         self._ground_sampling_distance = ground_sampling_distance
@@ -1089,6 +1107,7 @@ class RasterizeProcessor(IDMixin):
         self._dtype = dtype
         self._new_channel_name = new_channel_name
         self._max_num_threads = max_num_threads
+        self._use_processes = use_processes
 
         super().__init__()
 
@@ -1131,6 +1150,7 @@ class RasterizeProcessor(IDMixin):
             dtype=self._dtype,
             new_channel_name=self._new_channel_name,
             max_num_threads=self._max_num_threads,
+            use_processes=self._use_processes,
         )
 
 
@@ -1157,6 +1177,7 @@ class RasterizeProcessorConfig(pydantic.BaseModel):
           dtype: 'uint8'
           new_channel_name: null
           max_num_threads: null
+          use_processes: false
         ```
 
     Attributes:
@@ -1174,8 +1195,10 @@ class RasterizeProcessorConfig(pydantic.BaseModel):
             defaults to `UINT8`
         new_channel_name: New channel name -
             defaults to None
-        max_num_threads: Maximum number of threads -
+        max_num_threads: Maximum number of threads (or processes if `use_processes` is True) -
             defaults to None
+        use_processes: If True, process the data items in worker processes instead of threads -
+            defaults to False
     """
     channel_name: ChannelName | str
     ground_sampling_distance: GroundSamplingDistance
@@ -1186,6 +1209,7 @@ class RasterizeProcessorConfig(pydantic.BaseModel):
     dtype: DType | None = DType.UINT8
     new_channel_name: ChannelName | str | None = None
     max_num_threads: int | None = None
+    use_processes: bool = False
 
 
 _TilesProcessorFactory.register(
@@ -1496,6 +1520,14 @@ class SequentialCompositeProcessor(IDMixin):
 
         super().__init__()
 
+    @property
+    def tiles_processors(self) -> list[TilesProcessor]:
+        """
+        Returns:
+            Tiles processors
+        """
+        return self._tiles_processors
+
     @classmethod
     def from_config(
         cls,
@@ -1534,6 +1566,16 @@ class SequentialCompositeProcessor(IDMixin):
             tiles_processors=self._tiles_processors,
         )
 
+    def flush(self) -> None:
+        """Flushes the tiles processors."""
+        for tiles_processor in self._tiles_processors:
+            flush(tiles_processor)
+
+    def close(self) -> None:
+        """Closes the tiles processors."""
+        for tiles_processor in self._tiles_processors:
+            close(tiles_processor)
+
 
 class SequentialCompositeProcessorConfig(pydantic.BaseModel):
     """Configuration for the `from_config` class method of `SequentialCompositeProcessor`
@@ -1569,6 +1611,8 @@ class SieveProcessor(IDMixin):
 
     Notes:
         - Requires a raster channel
+        - If `use_processes` is True, the data items are processed in worker processes, which scales across
+            all cores for large batches (raster data items are passed via shared memory)
 
     Implements the `TilesProcessor` protocol.
     """
@@ -1580,6 +1624,7 @@ class SieveProcessor(IDMixin):
         connectivity: Connectivity = Connectivity.FOUR,
         new_channel_name: ChannelName | str | None = None,
         max_num_threads: int | None = None,
+        use_processes: bool = False,
     ) -> None:
         """
         Parameters:
@@ -1587,13 +1632,15 @@ class SieveProcessor(IDMixin):
             threshold: Threshold (the minimum area of the polygon to retain) in pixels
             connectivity: Connectivity (`FOUR` or `EIGHT`)
             new_channel_name: New channel name
-            max_num_threads: Maximum number of threads
+            max_num_threads: Maximum number of threads (or processes if `use_processes` is True)
+            use_processes: If True, process the data items in worker processes instead of threads
         """
         self._channel_name = channel_name
         self._threshold = threshold
         self._connectivity = connectivity
         self._new_channel_name = new_channel_name
         self._max_num_threads = max_num_threads
+        self._use_processes = use_processes
 
         super().__init__()
 
@@ -1632,6 +1679,7 @@ class SieveProcessor(IDMixin):
             connectivity=self._connectivity,
             new_channel_name=self._new_channel_name,
             max_num_threads=self._max_num_threads,
+            use_processes=self._use_processes,
         )
 
 
@@ -1654,6 +1702,7 @@ class SieveProcessorConfig(pydantic.BaseModel):
           connectivity: 4
           new_channel_name: null
           max_num_threads: null
+          use_processes: false
         ```
 
     Attributes:
@@ -1663,14 +1712,17 @@ class SieveProcessorConfig(pydantic.BaseModel):
             defaults to `FOUR`
         new_channel_name: New channel name -
             defaults to None
-        max_num_threads: Maximum number of threads -
+        max_num_threads: Maximum number of threads (or processes if `use_processes` is True) -
             defaults to None
+        use_processes: If True, process the data items in worker processes instead of threads -
+            defaults to False
     """
     channel_name: ChannelName | str
     threshold: int
     connectivity: Connectivity = Connectivity.FOUR
     new_channel_name: ChannelName | str | None = None
     max_num_threads: int | None = None
+    use_processes: bool = False
 
 
 _TilesProcessorFactory.register(
@@ -2019,6 +2071,8 @@ class VectorizeProcessor(IDMixin):
 
     Notes:
         - Requires a raster channel
+        - If `use_processes` is True, the data items are processed in worker processes, which scales across
+            all cores for large batches (raster data items are passed via shared memory)
 
     Implements the `TilesProcessor` protocol.
     """
@@ -2030,6 +2084,7 @@ class VectorizeProcessor(IDMixin):
         background_value: int | None = None,
         new_channel_name: ChannelName | str | None = None,
         max_num_threads: int | None = None,
+        use_processes: bool = False,
     ) -> None:
         """
         Parameters:
@@ -2037,13 +2092,15 @@ class VectorizeProcessor(IDMixin):
             field: Field
             background_value: Background value
             new_channel_name: New channel name
-            max_num_threads: Maximum number of threads
+            max_num_threads: Maximum number of threads (or processes if `use_processes` is True)
+            use_processes: If True, process the data items in worker processes instead of threads
         """
         self._channel_name = channel_name
         self._field = field
         self._background_value = background_value
         self._new_channel_name = new_channel_name
         self._max_num_threads = max_num_threads
+        self._use_processes = use_processes
 
         super().__init__()
 
@@ -2082,6 +2139,7 @@ class VectorizeProcessor(IDMixin):
             background_value=self._background_value,
             new_channel_name=self._new_channel_name,
             max_num_threads=self._max_num_threads,
+            use_processes=self._use_processes,
         )
 
 
@@ -2103,6 +2161,7 @@ class VectorizeProcessorConfig(pydantic.BaseModel):
           background_value: null
           new_channel_name: null
           max_num_threads: null
+          use_processes: false
         ```
 
     Attributes:
@@ -2112,14 +2171,17 @@ class VectorizeProcessorConfig(pydantic.BaseModel):
             defaults to None
         new_channel_name: New channel name -
             defaults to None
-        max_num_threads: Maximum number of threads -
+        max_num_threads: Maximum number of threads (or processes if `use_processes` is True) -
             defaults to None
+        use_processes: If True, process the data items in worker processes instead of threads -
+            defaults to False
     """
     channel_name: ChannelName | str
     field: str
     background_value: int | None = None
     new_channel_name: ChannelName | str | None = None
     max_num_threads: int | None = None
+    use_processes: bool = False
 
 
 _TilesProcessorFactory.register(
@@ -0,0 +1,136 @@
+import argparse
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from aviary.core.bounding_box import BoundingBox
+from aviary.core.grid import Grid
+
+
+def create_grid(
+    num_coordinates: int,
+    tile_size: int = 128,
+    lazy: bool = False,
+) -> Grid:
+    """Creates a square grid.
+
+    Parameters:
+        num_coordinates: minimum number of coordinates
+        tile_size: tile size in meters
+        lazy: if True, the grid is created from a bounding box, otherwise from its coordinates
+
+    Returns:
+        grid
+    """
+    num_tiles = int(np.ceil(np.sqrt(num_coordinates)))
+    bounding_box = BoundingBox(
+        x_min=0,
+        y_min=0,
+        x_max=num_tiles * tile_size,
+        y_max=num_tiles * tile_size,
+    )
+    grid = Grid.from_bounding_box(
+        bounding_box=bounding_box,
+        tile_size=tile_size,
+    )
+
+    if lazy:
+        return grid
+
+    return Grid(
+        coordinates=grid.coordinates,
+        tile_size=tile_size,
+    )
+
+
+def measure(
+    function: Callable[[], object],
+    num_repetitions: int,
+) -> float:
+    """Measures the minimum duration of the function.
+
+    Parameters:
+        function: function
+        num_repetitions: number of repetitions
+
+    Returns:
+        minimum duration in seconds
+    """
+    durations = []
+
+    for _ in range(num_repetitions):
+        start = time.perf_counter()
+        _ = function()
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+def benchmark_grid(
+    num_coordinates: int,
+    num_chunks: int,
+    num_repetitions: int,
+) -> dict[str, float]:
+    """Benchmarks chunking and slicing the grid.
+
+    Parameters:
+        num_coordinates: minimum number of coordinates
+        num_chunks: number of chunks
+        num_repetitions: number of repetitions
+
+    Returns:
+        minimum duration in seconds of each operation
+    """
+    durations = {}
+
+    for lazy in [False, True]:
+        grid = create_grid(
+            num_coordinates=num_coordinates,
+            lazy=lazy,
+        )
+        name = 'lazy' if lazy else 'eager'
+        durations[f'{name} chunk'] = measure(
+            function=lambda grid=grid: grid.chunk(num_chunks=num_chunks),
+            num_repetitions=num_repetitions,
+        )
+        durations[f'{name} slice'] = measure(
+            function=lambda grid=grid: grid[len(grid) // 4:len(grid) // 4 * 3],
+            num_repetitions=num_repetitions,
+        )
+
+    return durations
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--num-coordinates',
+        type=int,
+        nargs='+',
+        default=[100_000, 1_000_000, 10_000_000],
+        help='Minimum numbers of coordinates.',
+    )
+    parser.add_argument(
+        '--num-chunks',
+        type=int,
+        default=16,
+        help='Number of chunks.',
+    )
+    parser.add_argument(
+        '--num-repetitions',
+        type=int,
+        default=3,
+        help='Number of repetitions.',
+    )
+    args = parser.parse_args()
+
+    for num_coordinates in args.num_coordinates:
+        durations = benchmark_grid(
+            num_coordinates=num_coordinates,
+            num_chunks=args.num_chunks,
+            num_repetitions=args.num_repetitions,
+        )
+
+        for name, duration in durations.items():
+            print(f'{name:>12} | {num_coordinates:>10} coordinates | {duration:.3f} s')
@@ -0,0 +1,97 @@
+import argparse
+import time
+
+import numpy as np
+
+from aviary._functional.utils.coordinates_filter import (
+    _set_filter_difference,
+    _set_filter_intersection,
+    _set_filter_union,
+)
+
+
+def create_coordinates(
+    num_coordinates: int,
+    tile_size: int = 128,
+) -> np.ndarray:
+    """Creates the coordinates of a square grid.
+
+    Parameters:
+        num_coordinates: number of coordinates
+        tile_size: tile size in meters
+
+    Returns:
+        coordinates in shape (n, 2)
+    """
+    num_tiles = int(np.ceil(np.sqrt(num_coordinates)))
+    coordinates = np.arange(num_tiles, dtype=np.int32) * tile_size
+    x, y = np.meshgrid(coordinates, coordinates)
+    coordinates = np.stack([x.ravel(), y.ravel()], axis=-1)
+    return coordinates[:num_coordinates]
+
+
+def benchmark_set_filter(
+    num_coordinates: int,
+    num_repetitions: int,
+) -> dict[str, float]:
+    """Benchmarks the set filters.
+
+    The other coordinates are every other coordinate of the coordinates in reverse order.
+
+    Parameters:
+        num_coordinates: number of coordinates
+        num_repetitions: number of repetitions
+
+    Returns:
+        minimum duration in seconds of each set filter
+    """
+    coordinates = create_coordinates(num_coordinates=num_coordinates)
+    other = coordinates[::-2].copy()
+    set_filters = {
+        'difference': _set_filter_difference,
+        'intersection': _set_filter_intersection,
+        'union': _set_filter_union,
+    }
+    durations = {}
+
+    for name, set_filter in set_filters.items():
+        durations_ = []
+
+        for _ in range(num_repetitions):
+            start = time.perf_counter()
+            _ = set_filter(
+                coordinates=coordinates,
+                other=other,
+            )
+            durations_.append(time.perf_counter() - start)
+
+        durations[name] = min(durations_)
+
+    return durations
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--num-coordinates',
+        type=int,
+        nargs='+',
+        default=[100_000, 1_000_000, 10_000_000],
+        help='Numbers of coordinates.',
+    )
+    parser.add_argument(
+        '--num-repetitions',
+        type=int,
+        default=3,
+        help='Number of repetitions.',
+    )
+    args = parser.parse_args()
+
+    for num_coordinates in args.num_coordinates:
+        durations = benchmark_set_filter(
+            num_coordinates=num_coordinates,
+            num_repetitions=args.num_repetitions,
+        )
+
+        for name, duration in durations.items():
+            print(f'{name:>12} | {num_coordinates:>10} coordinates | {duration:.3f} s')
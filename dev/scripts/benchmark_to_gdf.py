@@ -0,0 +1,65 @@
+import argparse
+import time
+
+from aviary.core.bounding_box import BoundingBox
+from aviary.core.grid import Grid
+
+
+def benchmark_to_gdf(
+    num_tiles: int,
+    num_repetitions: int,
+    tile_size: int = 128,
+) -> float:
+    """Benchmarks converting a square grid to a geodataframe.
+
+    Parameters:
+        num_tiles: number of tiles per axis
+        num_repetitions: number of repetitions
+        tile_size: tile size in meters
+
+    Returns:
+        minimum duration in seconds
+    """
+    bounding_box = BoundingBox(
+        x_min=0,
+        y_min=0,
+        x_max=num_tiles * tile_size,
+        y_max=num_tiles * tile_size,
+    )
+    grid = Grid.from_bounding_box(
+        bounding_box=bounding_box,
+        tile_size=tile_size,
+    )
+    durations = []
+
+    for _ in range(num_repetitions):
+        start = time.perf_counter()
+        _ = grid.to_gdf(epsg_code=25832)
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--num-tiles',
+        type=int,
+        nargs='+',
+        default=[100, 316, 1000],
+        help='Numbers of tiles per axis.',
+    )
+    parser.add_argument(
+        '--num-repetitions',
+        type=int,
+        default=3,
+        help='Number of repetitions.',
+    )
+    args = parser.parse_args()
+
+    for num_tiles in args.num_tiles:
+        duration = benchmark_to_gdf(
+            num_tiles=num_tiles,
+            num_repetitions=args.num_repetitions,
+        )
+        print(f'to_gdf | {num_tiles ** 2:>10} tiles | {duration:.3f} s')
@@ -20,7 +20,10 @@ from typer.testing import CliRunner
 if TYPE_CHECKING:
     from click.testing import Result
 
-from aviary._cli.cli import app
+from aviary._cli.cli import (
+    app,
+    set_resume,
+)
 
 
 def test_help(
@@ -43,3 +46,38 @@ def test_version(
     )
 
     assert result.exit_code == 0
+
+
+def test_set_resume() -> None:
+    config = {
+        'package': 'aviary',
+        'name': 'CompositePipeline',
+        'config': {
+            'pipeline_configs': [
+                {
+                    'name': 'TilePipeline',
+                    'config': {
+                        'checkpoint_path': 'test/checkpoint.bin',
+                    },
+                },
+                {
+                    'name': 'TilePipeline',
+                    'config': {},
+                },
+                {
+                    'name': 'VectorPipeline',
+                    'config': {
+                        'checkpoint_path': 'test/checkpoint.bin',
+                    },
+                },
+            ],
+        },
+    }
+
+    num_tile_pipelines = set_resume(config=config)
+    pipeline_configs = config['config']['pipeline_configs']
+
+    assert num_tile_pipelines == 1
+    assert pipeline_configs[0]['config']['resume'] is True
+    assert 'resume' not in pipeline_configs[1]['config']
+    assert 'resume' not in pipeline_configs[2]['config']
@@ -0,0 +1,133 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+import warnings
+from collections.abc import Iterator
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer,
+)
+from pathlib import Path
+from threading import Thread
+
+import geopandas as gpd
+import numpy as np
+import pytest
+import rasterio as rio
+import rasterio.transform
+import shapely
+
+
+@pytest.fixture(scope='function')
+def gpkg_path(
+    tmp_path: Path,
+) -> Path:
+    path = tmp_path / 'test.gpkg'
+    x_min = np.repeat(np.arange(500000.25, 500010.), 10)
+    y_min = np.tile(np.arange(5700000.25, 5700010.), 10)
+    data = gpd.GeoDataFrame(
+        data={'value': np.arange(100)},
+        geometry=shapely.box(x_min, y_min, x_min + .5, y_min + .5),
+        crs='EPSG:25832',
+    )
+    data = data.to_crs('EPSG:4326')
+    data.to_file(path)
+    return path
+
+
+@pytest.fixture(scope='function')
+def raster_path(
+    tmp_path: Path,
+) -> Path:
+    path = tmp_path / 'test.tiff'
+    profile = {
+        'driver': 'GTiff',
+        'height': 4,
+        'width': 4,
+        'count': 1,
+        'dtype': np.uint8,
+        'crs': 'EPSG:25832',
+        'transform': rio.transform.from_origin(west=0., north=4., xsize=1., ysize=1.),
+    }
+
+    with rio.open(path, mode='w', **profile) as dst:
+        dst.write(np.zeros(shape=(1, 4, 4), dtype=np.uint8))
+
+    return path
+
+
+def get_png() -> bytes:
+    profile = {
+        'driver': 'PNG',
+        'height': 4,
+        'width': 4,
+        'count': 3,
+        'dtype': np.uint8,
+    }
+
+    with rio.io.MemoryFile() as file, warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=rio.errors.NotGeoreferencedWarning)
+
+        with file.open(**profile) as dst:
+            dst.write(np.ones(shape=(3, 4, 4), dtype=np.uint8))
+
+        return file.read()
+
+
+class WMSServer:
+    """Local stand-in for a web map service that replies with the queued responses."""
+
+    def __init__(self) -> None:
+        self.responses: list[tuple[int, dict[str, str], bytes]] = []
+        self.num_requests = 0
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self) -> None:
+                server.num_requests += 1
+                status_code, headers, body = server.responses.pop(0)
+
+                self.send_response(status_code)
+
+                for key, value in headers.items():
+                    self.send_header(key, value)
+
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        self._http_server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self._http_server.server_port}'
+        self._thread = Thread(
+            target=self._http_server.serve_forever,
+            daemon=True,
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        self._http_server.shutdown()
+        self._http_server.server_close()
+
+
+@pytest.fixture(scope='function')
+def wms_server() -> Iterator[WMSServer]:
+    server = WMSServer()
+    yield server
+    server.close()
@@ -15,11 +15,79 @@
 
 import re
 
-import numpy as np
-
 from aviary.core.bounding_box import BoundingBox
 from aviary.core.enums import WMSVersion
 
+data_test__compute_retry_delay = [
+    # test case 1: first retry is immediate
+    (1, .5, None, 0.),
+    # test case 2: second retry
+    (2, .5, None, 1.),
+    # test case 3: third retry
+    (3, .5, None, 2.),
+    # test case 4: retry_after is in seconds
+    (1, .5, '3', 3.),
+    # test case 5: retry_after is negative
+    (2, .5, '-1', 0.),
+    # test case 6: retry_after is an HTTP date in the past
+    (2, .5, 'Wed, 21 Oct 2015 07:28:00 GMT', 0.),
+    # test case 7: retry_after is invalid
+    (2, .5, 'invalid', 1.),
+]
+
+data_test__compute_union_window = [
+    # test case 1: tiles are adjacent and buffer_size is 0
+    (
+        [(0, 0), (2, 0)],
+        2,
+        0,
+        .5,
+        (
+            BoundingBox(
+                x_min=0,
+                y_min=0,
+                x_max=4,
+                y_max=2,
+            ),
+            (4, 8),
+            [(0, 0), (0, 4)],
+        ),
+    ),
+    # test case 2: tiles are adjacent and buffer_size is not 0
+    (
+        [(0, 0), (2, 0), (0, 2), (2, 2)],
+        2,
+        1,
+        .5,
+        (
+            BoundingBox(
+                x_min=-1,
+                y_min=-1,
+                x_max=5,
+                y_max=5,
+            ),
+            (12, 12),
+            [(4, 0), (4, 4), (0, 0), (0, 4)],
+        ),
+    ),
+    # test case 3: tiles are not adjacent
+    (
+        [(0, 0), (8, 8)],
+        2,
+        0,
+        .5,
+        None,
+    ),
+    # test case 4: tiles are not aligned to the pixels
+    (
+        [(0, 0), (2.25, 0)],
+        2,
+        0,
+        .5,
+        None,
+    ),
+]
+
 data_test__compute_tile_size_pixels = [
     # test case 1: buffer_size is 0
     (128, 0, .2, 640),
@@ -132,23 +200,3 @@ data_test__get_wms_params = [
         },
     ),
 ]
-
-data_test__permute_data = [
-    (
-        np.array(
-            [
-                [[0, 255], [127, 0]],
-                [[127, 0], [255, 127]],
-                [[255, 127], [0, 255]],
-            ],
-            dtype=np.uint8,
-        ),
-        np.array(
-            [
-                [[0, 127, 255], [255, 0, 127]],
-                [[127, 255, 0], [0, 127, 255]],
-            ],
-            dtype=np.uint8,
-        ),
-    ),
-]
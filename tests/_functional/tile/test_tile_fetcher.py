@@ -13,48 +13,481 @@
 #  You should have received a copy of the GNU General Public License along with aviary.
 #  If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
+import re
+from pathlib import Path
+from unittest.mock import (
+    AsyncMock,
+    MagicMock,
+    patch,
+)
+
+import httpx
 import numpy as np
 import numpy.typing as npt
 import pytest
+import rasterio as rio
+import rasterio.transform
+import requests
 
 # noinspection PyProtectedMember
 from aviary._functional.tile.tile_fetcher import (
+    _compute_retry_delay,
     _compute_tile_size_pixels,
+    _compute_union_window,
     _get_wms_params,
-    _permute_data,
+    _request_wms,
+    _request_wms_async,
+    cached_fetcher,
+    cached_fetcher_async,
+    cached_fetcher_many,
+    chunk_store_fetcher,
+    create_async_client,
+    create_session,
+    gpkg_fetcher,
+    load_gpkg,
+    open_vrt,
+    vrt_fetcher,
+    vrt_fetcher_many,
+    wms_fetcher_async,
+)
+from aviary._utils.cache import DiskCache
+from aviary._utils.chunk_store import ChunkStore
+from aviary._utils.concurrency import (
+    AsyncRateLimiter,
+    map_concurrently,
 )
 from aviary.core.bounding_box import BoundingBox
-from aviary.core.enums import WMSVersion
+from aviary.core.enums import (
+    ChannelName,
+    WMSVersion,
+)
 from aviary.core.exceptions import AviaryUserError
+from aviary.core.tiles import Tile
 from aviary.core.type_aliases import (
     BufferSize,
+    Coordinates,
     EPSGCode,
     GroundSamplingDistance,
     TileSize,
 )
+from tests._functional.tile.conftest import (
+    WMSServer,
+    get_png,
+)
 from tests._functional.tile.data.data_test_tile_fetcher import (
+    data_test__compute_retry_delay,
     data_test__compute_tile_size_pixels,
     data_test__compute_tile_size_pixels_exceptions,
+    data_test__compute_union_window,
     data_test__get_wms_params,
-    data_test__permute_data,
 )
 
 
+def test_cached_fetcher(
+    tmp_path: Path,
+) -> None:
+    tile_fetcher = MagicMock(side_effect=lambda coordinates: coordinates)
+    cache = DiskCache(path=tmp_path)
+
+    for _ in range(2):
+        tile = cached_fetcher(
+            coordinates=(0, 0),
+            tile_fetcher=tile_fetcher,
+            cache=cache,
+            cache_key='test',
+        )
+
+        assert tile == (0, 0)
+
+    tile_fetcher.assert_called_once_with(coordinates=(0, 0))
+    assert cache.num_hits == 1
+    assert cache.num_misses == 1
+
+
+def test_cached_fetcher_async(
+    tmp_path: Path,
+) -> None:
+    tile_fetcher = MagicMock()
+    tile_fetcher.fetch_async = AsyncMock(side_effect=lambda coordinates: coordinates)
+    cache = DiskCache(path=tmp_path)
+
+    for _ in range(2):
+        tile = asyncio.run(cached_fetcher_async(
+            coordinates=(0, 0),
+            tile_fetcher=tile_fetcher,
+            cache=cache,
+            cache_key='test',
+        ))
+
+        assert tile == (0, 0)
+
+    tile_fetcher.fetch_async.assert_awaited_once_with(coordinates=(0, 0))
+    assert cache.num_hits == 1
+    assert cache.num_misses == 1
+
+
+@pytest.mark.parametrize('batched', [False, True])
+def test_cached_fetcher_many(
+    tmp_path: Path,
+    batched: bool,
+) -> None:
+    tile_fetcher = MagicMock(side_effect=lambda coordinates: coordinates)
+    tile_fetcher.fetch_many.side_effect = lambda coordinates, max_num_threads: [*coordinates]  # ruff: ignore[ARG005]
+    cache = DiskCache(path=tmp_path)
+    _ = cached_fetcher(
+        coordinates=(128, 0),
+        tile_fetcher=tile_fetcher,
+        cache=cache,
+        cache_key='test',
+    )
+    tile_fetcher.reset_mock()
+
+    tiles = cached_fetcher_many(
+        coordinates=[(0, 0), (128, 0), (256, 0)],
+        tile_fetcher=tile_fetcher,
+        cache=cache,
+        cache_key='test',
+        batched=batched,
+    )
+
+    assert tiles == [(0, 0), (128, 0), (256, 0)]
+
+    if batched:
+        tile_fetcher.fetch_many.assert_called_once_with(
+            coordinates=[(0, 0), (256, 0)],
+            max_num_threads=None,
+        )
+        tile_fetcher.assert_not_called()
+    else:
+        assert tile_fetcher.call_count == 2
+        tile_fetcher.fetch_many.assert_not_called()
+
+    tiles = cached_fetcher_many(
+        coordinates=[(0, 0), (256, 0)],
+        tile_fetcher=tile_fetcher,
+        cache=cache,
+        cache_key='test',
+        batched=batched,
+    )
+
+    assert tiles == [(0, 0), (256, 0)]
+    assert cache.num_hits == 3
+
+
+def test_chunk_store_fetcher(
+    tmp_path: Path,
+) -> None:
+    chunk_store = ChunkStore(path=tmp_path)
+    chunk_store.initialize(
+        tile_size=128,
+        buffer_size=32,
+        shape=(96, 96, 2),
+        dtype=np.dtype(np.uint8),
+        channel_names=['r', 'test'],
+    )
+    data = np.arange(96 * 96 * 2, dtype=np.uint8).reshape(96, 96, 2)
+    chunk_store.write(
+        x_min=128,
+        y_min=-128,
+        data=data,
+    )
+
+    tile = chunk_store_fetcher(
+        coordinates=(128, -128),
+        chunk_store=chunk_store,
+    )
+
+    assert tile.channel_names == {ChannelName.R, 'test'}
+    assert tile.tile_size == 128
+    assert tile[ChannelName.R].buffer_size == .25
+    np.testing.assert_array_equal(tile.to_composite_raster(channel_names=[ChannelName.R, 'test'])[0], data)
+
+    tile = chunk_store_fetcher(
+        coordinates=(0, 0),
+        chunk_store=chunk_store,
+        fill_value=1,
+    )
+
+    np.testing.assert_array_equal(tile[ChannelName.R].data[0], np.ones((96, 96), dtype=np.uint8))
+
+
 @pytest.mark.skip(reason='Not implemented')
 def test_composite_fetcher() -> None:
     pass
 
 
+def test_gpkg_fetcher(
+    gpkg_path: Path,
+) -> None:
+    data = load_gpkg(
+        path=gpkg_path,
+        epsg_code=25832,
+    )
+
+    tiles = [
+        gpkg_fetcher(
+            coordinates=(500002, 5700002),
+            path=gpkg_path,
+            epsg_code=25832,
+            channel_name='test',
+            tile_size=4,
+            buffer_size=1,
+            data=data_,
+        )
+        for data_ in [None, data]
+    ]
+
+    assert len(data) == 100
+    assert data.crs == 'EPSG:25832'
+    assert len(tiles[0]['test'][0]) == 36
+    assert tiles[0] == tiles[1]
+
+
+def test_open_vrt(
+    raster_path: Path,
+) -> None:
+    epsg_code = 25832
+
+    with open_vrt(
+        path=raster_path,
+        epsg_code=epsg_code,
+    ) as src:
+        assert not src.closed
+        assert src.crs.to_epsg() == epsg_code
+
+
+def test_open_vrt_exceptions(
+    raster_path: Path,
+) -> None:
+    epsg_code = 4326
+    message = re.escape(
+        'Invalid epsg_code! '
+        'The EPSG code must match the virtual raster.',
+    )
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = open_vrt(
+            path=raster_path,
+            epsg_code=epsg_code,
+        )
+
+
 @pytest.mark.skip(reason='Not implemented')
 def test_vrt_fetcher() -> None:
     pass
 
 
+@pytest.mark.parametrize(
+    (
+        'coordinates',
+        'buffer_size',
+    ),
+    [
+        # test case 1: tiles are adjacent
+        ([(0, 0), (4, 0), (8, 0), (0, 4)], 1),
+        # test case 2: tiles are not adjacent
+        ([(0, 0), (12, 12)], 0),
+    ],
+)
+def test_vrt_fetcher_many(
+    tmp_path: Path,
+    coordinates: list[Coordinates],
+    buffer_size: BufferSize,
+) -> None:
+    path = tmp_path / 'test.tiff'
+    profile = {
+        'driver': 'GTiff',
+        'height': 16,
+        'width': 16,
+        'count': 2,
+        'dtype': np.uint16,
+        'crs': 'EPSG:25832',
+        'transform': rio.transform.from_origin(west=0., north=16., xsize=1., ysize=1.),
+    }
+
+    with rio.open(path, mode='w', **profile) as dst:
+        dst.write(np.arange(512, dtype=np.uint16).reshape(2, 16, 16))
+
+    kwargs = {
+        'path': path,
+        'epsg_code': 25832,
+        'channel_names': ['a', 'b'],
+        'tile_size': 4,
+        'ground_sampling_distance': 1.,
+        'buffer_size': buffer_size,
+    }
+    tiles = vrt_fetcher_many(
+        coordinates=coordinates,
+        **kwargs,
+    )
+    expected = [
+        vrt_fetcher(
+            coordinates=coordinates_item,
+            **kwargs,
+        )
+        for coordinates_item in coordinates
+    ]
+
+    assert tiles == expected
+    assert not np.shares_memory(tiles[0]['a'].array, tiles[1]['a'].array)
+
+
+@pytest.mark.parametrize('max_num_threads', [None, 1, 2])
+def test_vrt_fetcher_many_max_num_threads(
+    raster_path: Path,
+    max_num_threads: int | None,
+) -> None:
+    coordinates = [(0, 0), (2, 2)]
+    kwargs = {
+        'path': raster_path,
+        'epsg_code': 25832,
+        'channel_names': 'test',
+        'tile_size': 2,
+        'ground_sampling_distance': 1.,
+    }
+
+    with patch(
+        'aviary._functional.tile.tile_fetcher.map_concurrently',
+        wraps=map_concurrently,
+    ) as mocked_map_concurrently:
+        tiles = vrt_fetcher_many(
+            coordinates=coordinates,
+            max_num_threads=max_num_threads,
+            **kwargs,
+        )
+
+    expected = [
+        vrt_fetcher(
+            coordinates=coordinates_item,
+            **kwargs,
+        )
+        for coordinates_item in coordinates
+    ]
+
+    assert tiles == expected
+    assert mocked_map_concurrently.call_count == (max_num_threads != 1)
+
+
+def test_vrt_fetcher_many_empty(
+    raster_path: Path,
+) -> None:
+    tiles = vrt_fetcher_many(
+        coordinates=[],
+        path=raster_path,
+        epsg_code=25832,
+        channel_names='test',
+        tile_size=2,
+        ground_sampling_distance=1.,
+    )
+
+    assert tiles == []
+
+
 @pytest.mark.skip(reason='Not implemented')
 def test_wms_fetcher() -> None:
     pass
 
 
+def test_wms_fetcher_async() -> None:
+    requests_ = []
+
+    def _handle(
+        request: httpx.Request,
+    ) -> httpx.Response:
+        requests_.append(request)
+        return httpx.Response(
+            status_code=200,
+            headers={'Content-Type': 'image/png'},
+            content=get_png(),
+        )
+
+    async def _fetch() -> list[Tile]:
+        semaphore = asyncio.Semaphore(2)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handle)) as client:
+            return await asyncio.gather(*(
+                wms_fetcher_async(
+                    coordinates=coordinates,
+                    url='https://www.test.com',
+                    version=WMSVersion.V1_3_0,
+                    layer='test_layer',
+                    epsg_code=25832,
+                    response_format='image/png',
+                    channel_names=[ChannelName.R, ChannelName.G, ChannelName.B],
+                    tile_size=4,
+                    ground_sampling_distance=1.,
+                    client=client,
+                    semaphore=semaphore,
+                )
+                for coordinates in [(0, 0), (4, 0)]
+            ))
+
+    tiles = asyncio.run(_fetch())
+
+    expected = np.array([[0, 0], [4, 0]], dtype=np.int32)
+
+    np.testing.assert_array_equal(np.concatenate([tile.coordinates for tile in tiles]), expected)
+
+    for tile in tiles:
+        assert tile.channel_names == {ChannelName.R, ChannelName.G, ChannelName.B}
+        np.testing.assert_array_equal(tile[ChannelName.R].data[0], np.ones((4, 4), dtype=np.uint8))
+
+    assert sorted(request.url.params['bbox'] for request in requests_) == ['0,0,4,4', '4,0,8,4']
+    assert all(request.url.params['width'] == '4' for request in requests_)
+
+
+@pytest.mark.parametrize(
+    (
+        'num_retries',
+        'backoff_factor',
+        'retry_after',
+        'expected',
+    ),
+    data_test__compute_retry_delay,
+)
+def test__compute_retry_delay(
+    num_retries: int,
+    backoff_factor: float,
+    retry_after: str | None,
+    expected: float,
+) -> None:
+    delay = _compute_retry_delay(
+        num_retries=num_retries,
+        backoff_factor=backoff_factor,
+        retry_after=retry_after,
+    )
+
+    assert delay == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    (
+        'coordinates',
+        'tile_size',
+        'buffer_size',
+        'ground_sampling_distance',
+        'expected',
+    ),
+    data_test__compute_union_window,
+)
+def test__compute_union_window(
+    coordinates: list[Coordinates],
+    tile_size: TileSize,
+    buffer_size: BufferSize,
+    ground_sampling_distance: GroundSamplingDistance,
+    expected: tuple[BoundingBox, tuple[int, int], list[tuple[int, int]]] | None,
+) -> None:
+    union_window = _compute_union_window(
+        coordinates=coordinates,
+        tile_size=tile_size,
+        buffer_size=buffer_size,
+        ground_sampling_distance=ground_sampling_distance,
+    )
+
+    assert union_window == expected
+
+
 @pytest.mark.parametrize(
     (
         'tile_size',
@@ -141,16 +574,177 @@ def test__get_wms_params(
     assert params == expected
 
 
-@pytest.mark.parametrize(('data', 'expected'), data_test__permute_data)
-def test__permute_data(
-    data: npt.NDArray,
-    expected: npt.NDArray,
+def test__request_wms(
+    wms_server: WMSServer,
 ) -> None:
-    data = _permute_data(data=data)
+    wms_server.responses = [
+        (200, {'Content-Type': 'image/png'}, get_png()),
+        (200, {'Content-Type': 'image/png'}, get_png()),
+    ]
 
-    np.testing.assert_array_equal(data, expected)
+    with create_session() as session:
+        for _ in range(2):
+            data = _request_wms(
+                url=wms_server.url,
+                params={},
+                session=session,
+            )
 
+            assert data.shape == (4, 4, 3)
+            assert data.dtype == np.uint8
 
-@pytest.mark.skip(reason='Not implemented')
-def test__request_wms() -> None:
-    pass
+    assert wms_server.num_requests == 2
+
+
+def test__request_wms_retry(
+    wms_server: WMSServer,
+) -> None:
+    wms_server.responses = [
+        (503, {'Retry-After': '0'}, b''),
+        (429, {'Retry-After': '0'}, b''),
+        (200, {'Content-Type': 'image/png'}, get_png()),
+    ]
+
+    with create_session(
+        max_num_retries=2,
+        backoff_factor=0.,
+    ) as session:
+        data = _request_wms(
+            url=wms_server.url,
+            params={},
+            session=session,
+        )
+
+    assert data.shape == (4, 4, 3)
+    assert wms_server.num_requests == 3
+
+
+def test__request_wms_exceptions(
+    wms_server: WMSServer,
+) -> None:
+    wms_server.responses = [
+        (500, {}, b''),
+        (500, {}, b''),
+    ]
+
+    with create_session(
+        max_num_retries=1,
+        backoff_factor=0.,
+    ) as session, pytest.raises(requests.HTTPError):
+        _ = _request_wms(
+            url=wms_server.url,
+            params={},
+            session=session,
+        )
+
+    assert wms_server.num_requests == 2
+
+    wms_server.responses = [
+        (200, {'Content-Type': 'text/xml'}, b'<ServiceExceptionReport/>'),
+    ]
+    message = re.escape(
+        'Invalid request! '
+        'The response must be an image.',
+    )
+
+    with create_session() as session, pytest.raises(AviaryUserError, match=message):
+        _ = _request_wms(
+            url=wms_server.url,
+            params={},
+            session=session,
+        )
+
+
+def test__request_wms_async(
+    wms_server: WMSServer,
+) -> None:
+    wms_server.responses = [
+        (200, {'Content-Type': 'image/png'}, get_png())
+        for _ in range(4)
+    ]
+
+    async def _request() -> list[npt.NDArray]:
+        semaphore = asyncio.Semaphore(2)
+        rate_limiter = AsyncRateLimiter(max_num_calls_per_second=1000.)
+
+        async with create_async_client(max_num_connections=2) as client:
+            return await asyncio.gather(*(
+                _request_wms_async(
+                    url=wms_server.url,
+                    params={},
+                    client=client,
+                    semaphore=semaphore,
+                    rate_limiter=rate_limiter,
+                )
+                for _ in range(4)
+            ))
+
+    data = asyncio.run(_request())
+
+    for data_ in data:
+        assert data_.shape == (4, 4, 3)
+        assert data_.dtype == np.uint8
+
+    assert wms_server.num_requests == 4
+
+
+def test__request_wms_async_retry(
+    wms_server: WMSServer,
+) -> None:
+    wms_server.responses = [
+        (503, {'Retry-After': '0'}, b''),
+        (429, {'Retry-After': '0'}, b''),
+        (200, {'Content-Type': 'image/png'}, get_png()),
+    ]
+
+    async def _request() -> npt.NDArray:
+        async with create_async_client() as client:
+            return await _request_wms_async(
+                url=wms_server.url,
+                params={},
+                client=client,
+                max_num_retries=2,
+                backoff_factor=0.,
+            )
+
+    data = asyncio.run(_request())
+
+    assert data.shape == (4, 4, 3)
+    assert wms_server.num_requests == 3
+
+
+def test__request_wms_async_exceptions(
+    wms_server: WMSServer,
+) -> None:
+    async def _request(
+        max_num_retries: int = 0,
+    ) -> npt.NDArray:
+        async with create_async_client() as client:
+            return await _request_wms_async(
+                url=wms_server.url,
+                params={},
+                client=client,
+                max_num_retries=max_num_retries,
+                backoff_factor=0.,
+            )
+
+    wms_server.responses = [
+        (500, {}, b''),
+        (500, {}, b''),
+    ]
+
+    with pytest.raises(httpx.HTTPStatusError):
+        _ = asyncio.run(_request(max_num_retries=1))
+
+    assert wms_server.num_requests == 2
+
+    wms_server.responses = [
+        (200, {'Content-Type': 'text/xml'}, b'<ServiceExceptionReport/>'),
+    ]
+    message = re.escape(
+        'Invalid request! '
+        'The response must be an image.',
+    )
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = asyncio.run(_request())
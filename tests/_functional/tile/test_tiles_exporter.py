@@ -0,0 +1,58 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import rasterio as rio
+
+# noinspection PyProtectedMember
+from aviary._functional.tile.tiles_exporter import raster_exporter
+
+# noinspection PyProtectedMember
+from aviary._utils.concurrency import BackgroundWorker
+from aviary.core.tiles import Tiles
+
+
+def test_raster_exporter_background_worker(
+    tmp_path: Path,
+) -> None:
+    data = np.arange(32 * 32 * 3, dtype=np.uint8).reshape(32, 32, 3)
+    expected = data.copy()
+    tiles = Tiles.from_composite_raster(
+        data=data,
+        channel_names=['r', 'g', 'b'],
+        coordinates=(0, 0),
+        tile_size=32,
+    )
+    background_worker = MagicMock(spec=BackgroundWorker)
+
+    _ = raster_exporter(
+        tiles=tiles,
+        channel_names=['r', 'g', 'b'],
+        epsg_code=25832,
+        path=tmp_path,
+        remove_channels=False,
+        background_worker=background_worker,
+    )
+    data += 1
+
+    for call in background_worker.submit.call_args_list:
+        fn, *args = call.args
+        fn(*args)
+
+    with rio.open(tmp_path / '0_0.tiff') as src:
+        np.testing.assert_array_equal(src.read(), np.transpose(expected, (2, 0, 1)))
@@ -0,0 +1,109 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+from multiprocessing.shared_memory import SharedMemory
+from unittest.mock import patch
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+# noinspection PyProtectedMember
+from aviary._functional.tile.tiles_processor import (
+    _process_data,
+    sieve_processor,
+)
+from aviary.core.channel import RasterChannel
+from aviary.core.tiles import Tiles
+
+
+def _raise(
+    data_item: npt.NDArray,  # ruff: ignore[ARG001]
+) -> npt.NDArray:
+    message = 'test'
+    raise ValueError(message)
+
+
+@pytest.fixture
+def tiles() -> Tiles:
+    rng = np.random.default_rng(seed=0)
+    data = (rng.random(size=(4, 32, 32)) > .5).astype(np.uint8)
+    channel = RasterChannel(
+        data=data,
+        name='test',
+    )
+    return Tiles(
+        channels=[channel],
+        coordinates=np.array([[0, 0], [128, 0], [0, 128], [128, 128]], dtype=np.int32),
+        tile_size=128,
+    )
+
+
+@pytest.mark.parametrize('new_channel_name', [None, 'test_sieved'])
+def test_sieve_processor_use_processes(
+    tiles: Tiles,
+    new_channel_name: str | None,
+) -> None:
+    expected = sieve_processor(
+        tiles=tiles.copy(),
+        channel_name='test',
+        threshold=4,
+        new_channel_name=new_channel_name,
+        max_num_threads=2,
+    )
+    tiles = sieve_processor(
+        tiles=tiles.copy(),
+        channel_name='test',
+        threshold=4,
+        new_channel_name=new_channel_name,
+        max_num_threads=2,
+        use_processes=True,
+    )
+    channel_name = new_channel_name or 'test'
+
+    assert tiles.channel_names == expected.channel_names
+    np.testing.assert_array_equal(tiles[channel_name].array, expected[channel_name].array)
+    np.testing.assert_array_equal(tiles['test'].array, expected['test'].array)
+
+
+def test__process_data_use_processes_exception(
+    tiles: Tiles,
+) -> None:
+    shared_memories = []
+
+    def _create_shared_memory(
+        *args: object,
+        **kwargs: object,
+    ) -> SharedMemory:
+        shared_memory = SharedMemory(*args, **kwargs)
+        shared_memories.append(shared_memory)
+        return shared_memory
+
+    with (
+        patch('aviary._functional.tile.tiles_processor.SharedMemory', side_effect=_create_shared_memory),
+        pytest.raises(ValueError, match='test'),
+    ):
+        _ = _process_data(
+            tiles=tiles,
+            channel_name='test',
+            process_data_item=_raise,
+            max_num_threads=2,
+            use_processes=True,
+        )
+
+    assert len(shared_memories) == 1
+
+    with pytest.raises(FileNotFoundError):
+        _ = SharedMemory(name=shared_memories[0].name)
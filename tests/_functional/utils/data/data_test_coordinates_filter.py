@@ -289,6 +289,31 @@ data_test_mask_filter = [
     ),
 ]
 
+data_test__pack_coordinates = [
+    # test case 1: coordinates contains no coordinates
+    (
+        np.empty(
+            shape=(0, 2),
+            dtype=np.int32,
+        ),
+        np.empty(
+            shape=(0,),
+            dtype=np.int64,
+        ),
+    ),
+    # test case 2: coordinates contains coordinates
+    (
+        np.array(
+            [[0, 0], [0, 1], [1, 0], [-1, -1]],
+            dtype=np.int32,
+        ),
+        np.array(
+            [0, 1, 2 ** 32, -1],
+            dtype=np.int64,
+        ),
+    ),
+]
+
 data_test__set_filter_difference = [
     # test case 1: other contains no coordinates
     (
@@ -25,6 +25,7 @@ import pytest
 from aviary._functional.utils.coordinates_filter import (
     _geospatial_filter_difference,
     _geospatial_filter_intersection,
+    _pack_coordinates,
     _set_filter_difference,
     _set_filter_intersection,
     _set_filter_union,
@@ -38,6 +39,7 @@ from aviary.core.type_aliases import CoordinatesSet
 from tests._functional.utils.data.data_test_coordinates_filter import (
     data_test__geospatial_filter_difference,
     data_test__geospatial_filter_intersection,
+    data_test__pack_coordinates,
     data_test__set_filter_difference,
     data_test__set_filter_intersection,
     data_test__set_filter_union,
@@ -118,6 +120,17 @@ def test_mask_filter(
     assert id(coordinates_) != id(coordinates)
 
 
+@pytest.mark.parametrize(('coordinates', 'expected'), data_test__pack_coordinates)
+def test__pack_coordinates(
+    coordinates: CoordinatesSet,
+    expected: npt.NDArray[np.int64],
+) -> None:
+    keys = _pack_coordinates(coordinates=coordinates)
+
+    np.testing.assert_array_equal(keys, expected)
+    assert keys.dtype == np.int64
+
+
 @patch('aviary._functional.utils.coordinates_filter._set_filter_difference')
 def test_set_filter_difference(
     mocked_set_filter_difference: MagicMock,
@@ -272,3 +285,35 @@ def test__set_filter_union(
 
     np.testing.assert_array_equal(coordinates_, expected)
     assert id(coordinates_) != id(coordinates)
+
+
+def test__set_filter_difference_large() -> None:
+    x, y = np.meshgrid(
+        np.arange(1000, dtype=np.int32) * 128,
+        np.arange(1000, dtype=np.int32) * 128,
+    )
+    coordinates = np.stack([x.ravel(), y.ravel()], axis=-1)
+    other = coordinates[::2]
+
+    coordinates_ = _set_filter_difference(
+        coordinates=coordinates,
+        other=other,
+    )
+
+    np.testing.assert_array_equal(coordinates_, coordinates[1::2])
+
+
+def test__set_filter_intersection_large() -> None:
+    x, y = np.meshgrid(
+        np.arange(1000, dtype=np.int32) * 128,
+        np.arange(1000, dtype=np.int32) * 128,
+    )
+    coordinates = np.stack([x.ravel(), y.ravel()], axis=-1)
+    other = coordinates[::-2]
+
+    coordinates_ = _set_filter_intersection(
+        coordinates=coordinates,
+        other=other,
+    )
+
+    np.testing.assert_array_equal(coordinates_, coordinates[1::2])
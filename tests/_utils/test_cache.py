@@ -0,0 +1,124 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+# noinspection PyProtectedMember
+from aviary._utils.cache import DiskCache
+
+
+def test_disk_cache_get(
+    tmp_path: Path,
+) -> None:
+    cache = DiskCache(path=tmp_path)
+    value = np.arange(16).reshape(4, 4)
+
+    assert cache.get(key='test') is None
+
+    cache.put(
+        key='test',
+        value=value,
+    )
+
+    np.testing.assert_array_equal(cache.get(key='test'), value)
+    assert len(cache) == 1
+    assert cache.num_hits == 1
+    assert cache.num_misses == 1
+
+
+def test_disk_cache_get_persistence(
+    tmp_path: Path,
+) -> None:
+    cache = DiskCache(path=tmp_path)
+    cache.put(
+        key='test',
+        value='value',
+    )
+
+    cache_ = DiskCache(path=tmp_path)
+
+    assert len(cache_) == 1
+    assert cache_.size == cache.size
+    assert cache_.get(key='test') == 'value'
+
+
+def test_disk_cache_get_corrupted(
+    tmp_path: Path,
+) -> None:
+    cache = DiskCache(path=tmp_path)
+    cache.put(
+        key='test',
+        value='value',
+    )
+
+    for path in tmp_path.iterdir():
+        path.write_bytes(b'corrupted')
+
+    assert cache.get(key='test') is None
+    assert len(cache) == 0
+    assert cache.size == 0
+    assert not any(tmp_path.iterdir())
+
+
+def test_disk_cache_get_incompatible(
+    tmp_path: Path,
+) -> None:
+    cache = DiskCache(path=tmp_path)
+    cache.put(
+        key='test',
+        value='value',
+    )
+
+    for path in tmp_path.iterdir():
+        path.write_bytes(zlib.compress(b'cmissing_module\nMissingClass\n.'))
+
+    assert cache.get(key='test') is None
+    assert len(cache) == 0
+    assert not any(tmp_path.iterdir())
+
+
+def test_disk_cache_put_max_size(
+    tmp_path: Path,
+) -> None:
+    cache = DiskCache(path=tmp_path)
+    cache.put(
+        key='test_1',
+        value='value',
+    )
+    size = cache.size
+
+    cache = DiskCache(
+        path=tmp_path,
+        max_size=2 * size,
+    )
+    cache.put(
+        key='test_2',
+        value='value',
+    )
+    _ = cache.get(key='test_1')
+    cache.put(
+        key='test_3',
+        value='value',
+    )
+
+    assert len(cache) == 2
+    assert cache.size == 2 * size
+    assert cache.get(key='test_1') == 'value'
+    assert cache.get(key='test_2') is None
+    assert cache.get(key='test_3') == 'value'
+    assert len(list(tmp_path.iterdir())) == 2
@@ -0,0 +1,91 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+import re
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# noinspection PyProtectedMember
+from aviary._utils.chunk_store import ChunkStore
+from aviary.core.exceptions import AviaryUserError
+
+
+def test_chunk_store(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / 'chunk_store'
+    chunk_store = ChunkStore(path=path)
+
+    assert chunk_store.metadata is None
+
+    chunk_store.initialize(
+        tile_size=128,
+        buffer_size=0,
+        shape=(64, 64, 3),
+        dtype=np.dtype(np.float32),
+        channel_names=['r', 'g', 'b'],
+    )
+    data = np.random.default_rng(seed=0).random((64, 64, 3), dtype=np.float32)
+    chunk_store.write(
+        x_min=0,
+        y_min=128,
+        data=data,
+    )
+
+    chunk_store = ChunkStore(path=path)
+
+    assert chunk_store.metadata['tile_size'] == 128
+    assert chunk_store.read(x_min=0, y_min=0) is None
+
+    data_ = chunk_store.read(x_min=0, y_min=128)
+
+    np.testing.assert_array_equal(data_, data)
+    assert data_.flags.writeable
+
+
+def test_chunk_store_exceptions(
+    tmp_path: Path,
+) -> None:
+    chunk_store = ChunkStore(path=tmp_path)
+    message = re.escape(
+        'Invalid path! '
+        'The chunk store must exist.',
+    )
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = chunk_store.read(x_min=0, y_min=0)
+
+    chunk_store.initialize(
+        tile_size=128,
+        buffer_size=0,
+        shape=(64, 64, 3),
+        dtype=np.dtype(np.uint8),
+        channel_names=['r', 'g', 'b'],
+    )
+    message = re.escape(
+        'Invalid path! '
+        'The tile size, buffer size, shape, data type, and channel names must match the chunk store.',
+    )
+
+    with pytest.raises(AviaryUserError, match=message):
+        chunk_store.initialize(
+            tile_size=128,
+            buffer_size=0,
+            shape=(64, 64, 3),
+            dtype=np.dtype(np.float32),
+            channel_names=['r', 'g', 'b'],
+        )
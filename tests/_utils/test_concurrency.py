@@ -0,0 +1,356 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from itertools import repeat
+
+import pytest
+
+# noinspection PyProtectedMember
+from aviary._utils.concurrency import (
+    AsyncRateLimiter,
+    BackgroundWorker,
+    ExecutorRegistry,
+    get_event_loop,
+    get_executor_registry,
+    map_concurrently,
+    map_in_processes,
+    run_coroutine,
+    run_stages,
+    use_executor_registry,
+)
+
+
+def test_async_rate_limiter() -> None:
+    rate_limiter = AsyncRateLimiter(max_num_calls_per_second=20.)
+
+    async def _wait() -> None:
+        for _ in range(5):
+            await rate_limiter.wait()
+
+    start_time = time.monotonic()
+    asyncio.run(_wait())
+    duration = time.monotonic() - start_time
+
+    assert duration >= .2 - .01
+
+
+def test_background_worker() -> None:
+    background_worker = BackgroundWorker(
+        num_threads=2,
+        max_queue_size=2,
+    )
+    results = []
+    lock = threading.Lock()
+
+    def _append(
+        value: int,
+    ) -> None:
+        time.sleep(.01)
+
+        with lock:
+            results.append(value)
+
+    for value in range(10):
+        background_worker.submit(_append, value)
+
+    background_worker.join()
+
+    assert sorted(results) == list(range(10))
+
+    background_worker.submit(_append, 10)
+    background_worker.close()
+
+    assert sorted(results) == list(range(11))
+
+
+def test_background_worker_exception() -> None:
+    background_worker = BackgroundWorker()
+    results = []
+
+    def _raise(
+        value: int,
+    ) -> None:
+        if value == 1:
+            message = 'test'
+            raise ValueError(message)
+
+        results.append(value)
+
+    for value in range(2):
+        background_worker.submit(_raise, value)
+
+    with pytest.raises(ValueError, match='test'):
+        background_worker.join()
+
+    background_worker.submit(_raise, 2)
+    background_worker.close()
+
+    assert results == [0, 2]
+
+
+def test_executor_registry_map() -> None:
+    executor_registry = ExecutorRegistry(max_num_threads=2)
+
+    def _get_thread_name(
+        value: int,
+    ) -> tuple[int, str]:
+        time.sleep(.001 * (value % 3))
+        return value, threading.current_thread().name
+
+    results = executor_registry.map(
+        _get_thread_name,
+        range(10),
+        scope='test',
+        max_num_threads=2,
+    )
+    results_ = executor_registry.map(
+        _get_thread_name,
+        range(10),
+        scope='test',
+    )
+
+    assert [value for value, _ in results] == list(range(10))
+    assert all(thread_name.startswith('aviary-test') for _, thread_name in results + results_)
+    assert len(executor_registry._executors) == 1
+
+    executor_registry.close()
+
+    assert len(executor_registry._executors) == 0
+
+
+def test_executor_registry_map_nested() -> None:
+    executor_registry = ExecutorRegistry(max_num_threads=1)
+
+    def _map(
+        value: int,
+    ) -> list[int]:
+        return executor_registry.map(
+            lambda value_: value + value_,
+            range(2),
+            scope='test',
+        )
+
+    results = executor_registry.map(
+        _map,
+        range(3),
+        scope='test',
+    )
+
+    assert results == [[0, 1], [1, 2], [2, 3]]
+
+    executor_registry.close()
+
+
+def test_executor_registry_map_exception() -> None:
+    executor_registry = ExecutorRegistry()
+
+    def _raise(
+        value: int,
+    ) -> int:
+        if value == 1:
+            message = 'test'
+            raise ValueError(message)
+
+        return value
+
+    with pytest.raises(ValueError, match='test'):
+        executor_registry.map(
+            _raise,
+            range(3),
+            scope='test',
+        )
+
+    executor_registry.close()
+
+
+def test_get_event_loop() -> None:
+    event_loop = get_event_loop()
+    event_loop_ = get_event_loop()
+
+    assert event_loop is event_loop_
+    assert event_loop.is_running()
+
+
+def test_run_coroutine() -> None:
+    async def _get_thread_name() -> str:
+        await asyncio.sleep(0)
+        return threading.current_thread().name
+
+    thread_name = run_coroutine(_get_thread_name())
+
+    assert thread_name == 'aviary-event-loop'
+
+
+def test_run_coroutine_exception() -> None:
+    async def _raise() -> None:
+        message = 'test'
+        raise ValueError(message)
+
+    with pytest.raises(ValueError, match='test'):
+        run_coroutine(_raise())
+
+
+def test_map_concurrently() -> None:
+    results = map_concurrently(
+        lambda value, value_: value + value_,
+        range(3),
+        range(3),
+        scope='test',
+    )
+
+    assert results == [0, 2, 4]
+
+
+def test_map_in_processes() -> None:
+    results = map_in_processes(
+        pow,
+        range(3),
+        repeat(2),
+        max_num_processes=2,
+    )
+
+    assert results == [0, 1, 4]
+
+    executor_registry = ExecutorRegistry(max_num_processes=2)
+
+    with use_executor_registry(executor_registry):
+        results = map_in_processes(
+            pow,
+            range(4),
+            repeat(2),
+            max_num_processes=1,
+        )
+
+    assert results == [0, 1, 4, 9]
+    assert executor_registry._process_executor is not None
+
+    executor_registry.close()
+
+    assert executor_registry._process_executor is None
+
+
+def test_use_executor_registry() -> None:
+    executor_registry = ExecutorRegistry()
+
+    assert get_executor_registry() is None
+
+    with use_executor_registry(executor_registry):
+        assert get_executor_registry() is executor_registry
+
+        results = map_concurrently(
+            lambda _: threading.current_thread().name,
+            range(3),
+            scope='test',
+        )
+
+    assert get_executor_registry() is None
+    assert all(thread_name.startswith('aviary-test') for thread_name in results)
+
+    executor_registry.close()
+
+
+def test_run_stages() -> None:
+    results = list(run_stages(
+        items=range(10),
+        stages=[
+            (lambda value: value + 1, 1),
+            (lambda value: value * 2, 1),
+        ],
+    ))
+
+    assert results == [2 * (value + 1) for value in range(10)]
+
+    results = list(run_stages(
+        items=range(10),
+        stages=[
+            (lambda value: value + 1, 4),
+            (lambda value: value * 2, 2),
+        ],
+        max_queue_size=2,
+    ))
+
+    assert sorted(results) == [2 * (value + 1) for value in range(10)]
+
+    results = list(run_stages(
+        items=[],
+        stages=[
+            (lambda value: value, 2),
+        ],
+    ))
+
+    assert results == []
+
+
+def test_run_stages_backpressure() -> None:
+    num_fed_items = 0
+
+    def _feed() -> Iterator[int]:
+        nonlocal num_fed_items
+
+        for value in range(100):
+            num_fed_items += 1
+            yield value
+
+    iterator = run_stages(
+        items=_feed(),
+        stages=[
+            (lambda value: value, 1),
+            (lambda value: value, 1),
+        ],
+        max_queue_size=1,
+    )
+    _ = next(iterator)
+    time.sleep(.1)
+
+    assert num_fed_items <= 8
+
+    iterator.close()
+
+
+def test_run_stages_exceptions() -> None:
+    def _raise(
+        value: int,
+    ) -> int:
+        if value == 5:
+            message = 'test'
+            raise ValueError(message)
+
+        return value
+
+    with pytest.raises(ValueError, match='test'):
+        _ = list(run_stages(
+            items=range(100),
+            stages=[
+                (lambda value: value, 1),
+                (_raise, 2),
+            ],
+        ))
+
+    def _feed() -> Iterator[int]:
+        yield 0
+        message = 'test'
+        raise RuntimeError(message)
+
+    with pytest.raises(RuntimeError, match='test'):
+        _ = list(run_stages(
+            items=_feed(),
+            stages=[
+                (lambda value: value, 1),
+            ],
+        ))
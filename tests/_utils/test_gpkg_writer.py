@@ -0,0 +1,111 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+from pathlib import Path
+
+import geopandas as gpd
+from shapely.geometry import box
+
+# noinspection PyProtectedMember
+from aviary._utils.gpkg_writer import GPKGWriter
+
+
+def _get_gdf(
+    num_rows: int,
+) -> gpd.GeoDataFrame:
+    return gpd.GeoDataFrame(
+        data={'value': list(range(num_rows))},
+        geometry=[box(i, 0, i + 1, 1) for i in range(num_rows)],
+        crs='EPSG:25832',
+    )
+
+
+def test_gpkg_writer(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / 'test.gpkg'
+    gpkg_writer = GPKGWriter(
+        path=path,
+        max_num_rows=5,
+    )
+
+    gpkg_writer.write(gdf=_get_gdf(num_rows=3))
+
+    assert not path.exists()
+
+    gpkg_writer.write(gdf=_get_gdf(num_rows=3))
+
+    assert len(gpd.read_file(path)) == 6
+
+    gpkg_writer.write(gdf=_get_gdf(num_rows=2))
+    gpkg_writer.write(gdf=_get_gdf(num_rows=0))
+    gpkg_writer.close()
+
+    gdf = gpd.read_file(path)
+
+    assert len(gdf) == 8
+    assert gdf.crs == 'EPSG:25832'
+
+
+def test_gpkg_writer_flush(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / 'test.gpkg'
+    gpkg_writer = GPKGWriter(
+        path=path,
+        max_num_rows=5,
+    )
+
+    gpkg_writer.write(gdf=_get_gdf(num_rows=3))
+    gpkg_writer.flush()
+
+    assert len(gpd.read_file(path)) == 3
+
+    gpkg_writer.flush()
+    gpkg_writer.write(gdf=_get_gdf(num_rows=1))
+    gpkg_writer.close()
+
+    assert len(gpd.read_file(path)) == 4
+
+
+def test_gpkg_writer_max_num_bytes(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / 'test.gpkg'
+    gpkg_writer = GPKGWriter(
+        path=path,
+        max_num_bytes=1,
+    )
+
+    gpkg_writer.write(gdf=_get_gdf(num_rows=1))
+
+    assert len(gpd.read_file(path)) == 1
+
+
+def test_gpkg_writer_unbuffered(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / 'test.gpkg'
+    gpkg_writer = GPKGWriter(
+        path=path,
+    )
+
+    gpkg_writer.write(gdf=_get_gdf(num_rows=2))
+
+    assert len(gpd.read_file(path)) == 2
+
+    gpkg_writer.write(gdf=_get_gdf(num_rows=2))
+
+    assert len(gpd.read_file(path)) == 4
@@ -0,0 +1,113 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+import re
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# noinspection PyProtectedMember
+from aviary._utils.journal import (
+    CoordinatesJournal,
+    read_journal,
+)
+from aviary.core.exceptions import AviaryUserError
+
+
+def test_coordinates_journal(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / 'journal.bin'
+    coordinates_journal = CoordinatesJournal(
+        path=path,
+        tile_size=128,
+    )
+
+    assert coordinates_journal.read().shape == (0, 2)
+
+    coordinates_journal.append(coordinates=np.array([[0, 0], [128, 0]], dtype=np.int32))
+    coordinates_journal.append(coordinates=np.array([[0, 128]], dtype=np.int32))
+
+    expected = np.array([[0, 0], [128, 0], [0, 128]], dtype=np.int32)
+
+    np.testing.assert_array_equal(coordinates_journal.read(), expected)
+
+    with path.open('ab') as file:
+        file.write(b'\x00\x01\x02')
+
+    np.testing.assert_array_equal(coordinates_journal.read(), expected)
+
+    coordinates_journal.append(coordinates=np.array([[128, 128]], dtype=np.int32))
+
+    expected = np.array([[0, 0], [128, 0], [0, 128], [128, 128]], dtype=np.int32)
+
+    np.testing.assert_array_equal(coordinates_journal.read(), expected)
+
+    coordinates_journal.reset()
+
+    assert coordinates_journal.read().shape == (0, 2)
+
+
+def test_coordinates_journal_exceptions(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / 'journal.bin'
+    path.write_bytes(b'test')
+    coordinates_journal = CoordinatesJournal(
+        path=path,
+        tile_size=128,
+    )
+    message = re.escape(
+        'Invalid path! '
+        'The file must be a journal.',
+    )
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = coordinates_journal.read()
+
+    coordinates_journal.reset()
+    coordinates_journal = CoordinatesJournal(
+        path=path,
+        tile_size=64,
+    )
+    message = re.escape(
+        'Invalid tile_size! '
+        'The tile size must match the tile size of the journal (128).',
+    )
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = coordinates_journal.read()
+
+    with pytest.raises(AviaryUserError, match=message):
+        coordinates_journal.append(coordinates=np.array([[0, 0]], dtype=np.int32))
+
+
+def test_read_journal(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / 'journal.bin'
+    coordinates_journal = CoordinatesJournal(
+        path=path,
+        tile_size=128,
+    )
+    coordinates_journal.append(coordinates=np.array([[0, 0], [128, 0]], dtype=np.int32))
+
+    coordinates, tile_size = read_journal(path=path)
+    expected = np.array([[0, 0], [128, 0]], dtype=np.int32)
+
+    np.testing.assert_array_equal(coordinates, expected)
+    assert coordinates.dtype == np.int32
+    assert tile_size == 128
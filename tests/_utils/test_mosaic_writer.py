@@ -0,0 +1,290 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import rasterio as rio
+from rasterio.windows import from_bounds
+
+# noinspection PyProtectedMember
+from aviary._utils.mosaic_writer import MosaicWriter
+
+
+def _read(
+    path: Path,
+    x_min: int,
+    y_min: int,
+    tile_size: int,
+) -> np.ndarray:
+    with rio.open(path) as src:
+        window = from_bounds(
+            left=x_min,
+            bottom=y_min,
+            right=x_min + tile_size,
+            top=y_min + tile_size,
+            transform=src.transform,
+        )
+        return src.read(window=window)
+
+
+@pytest.mark.parametrize('cog', [False, True])
+def test_mosaic_writer(
+    tmp_path: Path,
+    cog: bool,
+) -> None:
+    mosaic_writer = MosaicWriter(
+        path=tmp_path,
+        epsg_code=25832,
+        mosaic_size=2,
+        channel_names=['r', 'g'],
+        cog=cog,
+    )
+    rng = np.random.default_rng(seed=0)
+    data_items = {}
+
+    for x_min in range(0, 192, 64):
+        for y_min in range(0, 192, 64):
+            data_item = rng.integers(0, 255, size=(80, 80, 2), dtype=np.uint8)
+            data_items[x_min, y_min] = data_item
+            mosaic_writer.write(
+                data_item=data_item,
+                x_min=x_min,
+                y_min=y_min,
+                tile_size=64,
+                buffer_size=8.,
+                ground_sampling_distance=1.,
+            )
+
+    mosaic_writer.close()
+
+    paths = sorted(path.name for path in tmp_path.iterdir())
+
+    assert paths == ['0_0.tiff', '0_128.tiff', '128_0.tiff', '128_128.tiff']
+
+    with rio.open(tmp_path / '0_0.tiff') as src:
+        assert src.width == src.height == 128
+        assert src.block_shapes[0] == (64, 64)
+        assert src.descriptions == ('r', 'g')
+
+    for (x_min, y_min), data_item in data_items.items():
+        path = tmp_path / f'{x_min // 128 * 128}_{y_min // 128 * 128}.tiff'
+        data = _read(
+            path=path,
+            x_min=x_min,
+            y_min=y_min,
+            tile_size=64,
+        )
+        expected = np.transpose(data_item[8:-8, 8:-8], (2, 0, 1))
+
+        np.testing.assert_array_equal(data, expected)
+
+
+def test_mosaic_writer_unaligned(
+    tmp_path: Path,
+) -> None:
+    mosaic_writer = MosaicWriter(
+        path=tmp_path,
+        epsg_code=25832,
+        mosaic_size=2,
+    )
+    data_item = np.arange(64 * 64, dtype=np.float32).reshape(64, 64, 1)
+    mosaic_writer.write(
+        data_item=data_item,
+        x_min=96,
+        y_min=96,
+        tile_size=64,
+        buffer_size=0.,
+        ground_sampling_distance=1.,
+    )
+    mosaic_writer.close()
+
+    paths = sorted(path.name for path in tmp_path.iterdir())
+
+    assert paths == ['0_0.tiff', '0_128.tiff', '128_0.tiff', '128_128.tiff']
+
+    data = _read(
+        path=tmp_path / '0_0.tiff',
+        x_min=96,
+        y_min=96,
+        tile_size=32,
+    )
+    expected = np.transpose(data_item[32:, :32], (2, 0, 1))
+
+    np.testing.assert_array_equal(data, expected)
+
+    data = _read(
+        path=tmp_path / '128_128.tiff',
+        x_min=128,
+        y_min=128,
+        tile_size=32,
+    )
+    expected = np.transpose(data_item[:32, 32:], (2, 0, 1))
+
+    np.testing.assert_array_equal(data, expected)
+
+
+@pytest.mark.parametrize('cog', [False, True])
+def test_mosaic_writer_flush(
+    tmp_path: Path,
+    cog: bool,
+) -> None:
+    mosaic_writer = MosaicWriter(
+        path=tmp_path,
+        epsg_code=25832,
+        mosaic_size=2,
+        cog=cog,
+    )
+    data_item = np.full((64, 64, 1), 1, dtype=np.uint8)
+    data_item_ = np.full((64, 64, 1), 2, dtype=np.uint8)
+    mosaic_writer.write(
+        data_item=data_item,
+        x_min=0,
+        y_min=0,
+        tile_size=64,
+        buffer_size=0.,
+        ground_sampling_distance=1.,
+    )
+    mosaic_writer.flush()
+
+    path = tmp_path / ('0_0.partial.tiff' if cog else '0_0.tiff')
+    data = _read(
+        path=path,
+        x_min=0,
+        y_min=0,
+        tile_size=64,
+    )
+
+    np.testing.assert_array_equal(data, np.transpose(data_item, (2, 0, 1)))
+
+    mosaic_writer.write(
+        data_item=data_item_,
+        x_min=64,
+        y_min=0,
+        tile_size=64,
+        buffer_size=0.,
+        ground_sampling_distance=1.,
+    )
+    mosaic_writer.close()
+
+    paths = sorted(path.name for path in tmp_path.iterdir())
+
+    assert paths == ['0_0.tiff']
+
+    for x_min, expected in [(0, data_item), (64, data_item_)]:
+        data = _read(
+            path=tmp_path / '0_0.tiff',
+            x_min=x_min,
+            y_min=0,
+            tile_size=64,
+        )
+
+        np.testing.assert_array_equal(data, np.transpose(expected, (2, 0, 1)))
+
+
+@pytest.mark.parametrize('cog', [False, True])
+def test_mosaic_writer_resume(
+    tmp_path: Path,
+    cog: bool,
+) -> None:
+    data_items = {
+        0: np.full((64, 64, 1), 1, dtype=np.uint8),
+        64: np.full((64, 64, 1), 2, dtype=np.uint8),
+    }
+
+    for x_min, data_item in data_items.items():
+        mosaic_writer = MosaicWriter(
+            path=tmp_path,
+            epsg_code=25832,
+            mosaic_size=2,
+            channel_names=['r'],
+            cog=cog,
+        )
+        mosaic_writer.write(
+            data_item=data_item,
+            x_min=x_min,
+            y_min=0,
+            tile_size=64,
+            buffer_size=0.,
+            ground_sampling_distance=1.,
+        )
+        mosaic_writer.close()
+
+    paths = sorted(path.name for path in tmp_path.iterdir())
+
+    assert paths == ['0_0.tiff']
+
+    with rio.open(tmp_path / '0_0.tiff') as src:
+        assert src.descriptions == ('r',)
+
+        if cog:
+            assert src.tags(ns='IMAGE_STRUCTURE')['LAYOUT'] == 'COG'
+
+    for x_min, data_item in data_items.items():
+        data = _read(
+            path=tmp_path / '0_0.tiff',
+            x_min=x_min,
+            y_min=0,
+            tile_size=64,
+        )
+
+        np.testing.assert_array_equal(data, np.transpose(data_item, (2, 0, 1)))
+
+
+@pytest.mark.parametrize('cog', [False, True])
+def test_mosaic_writer_resume_interrupted(
+    tmp_path: Path,
+    cog: bool,
+) -> None:
+    data_items = {
+        0: np.full((64, 64, 1), 1, dtype=np.uint8),
+        64: np.full((64, 64, 1), 2, dtype=np.uint8),
+    }
+    mosaic_writers = []
+
+    for x_min, data_item in data_items.items():
+        mosaic_writer = MosaicWriter(
+            path=tmp_path,
+            epsg_code=25832,
+            mosaic_size=2,
+            cog=cog,
+        )
+        mosaic_writer.write(
+            data_item=data_item,
+            x_min=x_min,
+            y_min=0,
+            tile_size=64,
+            buffer_size=0.,
+            ground_sampling_distance=1.,
+        )
+        mosaic_writer.flush()
+        mosaic_writers.append(mosaic_writer)
+
+    mosaic_writers[-1].close()
+
+    paths = sorted(path.name for path in tmp_path.iterdir())
+
+    assert paths == ['0_0.tiff']
+
+    for x_min, data_item in data_items.items():
+        data = _read(
+            path=tmp_path / '0_0.tiff',
+            x_min=x_min,
+            y_min=0,
+            tile_size=64,
+        )
+
+        np.testing.assert_array_equal(data, np.transpose(data_item, (2, 0, 1)))
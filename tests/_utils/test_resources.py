@@ -0,0 +1,187 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+from unittest.mock import MagicMock
+
+import pytest
+
+# noinspection PyProtectedMember
+from aviary._utils.resources import (
+    Pool,
+    close,
+    flush,
+)
+
+
+def test_pool_acquire() -> None:
+    create = MagicMock(side_effect=[object(), object()])
+    close_ = MagicMock()
+    pool = Pool(
+        create=create,
+        close=close_,
+    )
+
+    with pool.acquire() as resource:
+        pass
+
+    with pool.acquire() as resource_:
+        pass
+
+    assert resource is resource_
+    assert create.call_count == 1
+    close_.assert_not_called()
+
+
+def test_pool_acquire_most_recently_used() -> None:
+    resources = [object(), object()]
+    create = MagicMock(side_effect=resources)
+    close_ = MagicMock()
+    pool = Pool(
+        create=create,
+        close=close_,
+    )
+
+    with pool.acquire(), pool.acquire():
+        pass
+
+    with pool.acquire() as resource:
+        pass
+
+    assert resource is resources[0]
+
+
+def test_pool_acquire_concurrently() -> None:
+    create = MagicMock(side_effect=[object(), object()])
+    close_ = MagicMock()
+    pool = Pool(
+        create=create,
+        close=close_,
+    )
+
+    with pool.acquire() as resource, pool.acquire() as resource_:
+        pass
+
+    assert resource is not resource_
+    assert create.call_count == 2
+    assert len(pool) == 2
+
+
+def test_pool_acquire_max_num_idle() -> None:
+    resources = [object(), object(), object()]
+    create = MagicMock(side_effect=resources)
+    close_ = MagicMock()
+    pool = Pool(
+        create=create,
+        close=close_,
+        max_num_idle=1,
+    )
+
+    with pool.acquire(), pool.acquire(), pool.acquire():
+        pass
+
+    assert len(pool) == 1
+    assert close_.call_count == 2
+    close_.assert_any_call(resources[2])
+    close_.assert_any_call(resources[1])
+
+
+def test_pool_acquire_exception() -> None:
+    resource = object()
+    create = MagicMock(return_value=resource)
+    close_ = MagicMock()
+    pool = Pool(
+        create=create,
+        close=close_,
+    )
+
+    def _acquire() -> None:
+        with pool.acquire():
+            message = 'test'
+            raise ValueError(message)
+
+    with pytest.raises(ValueError, match='test'):
+        _acquire()
+
+    assert len(pool) == 0
+    close_.assert_called_once_with(resource)
+
+
+def test_pool_close() -> None:
+    resources = [object(), object()]
+    create = MagicMock(side_effect=resources)
+    close_ = MagicMock()
+    pool = Pool(
+        create=create,
+        close=close_,
+    )
+
+    with pool.acquire(), pool.acquire():
+        pass
+
+    pool.close()
+
+    assert len(pool) == 0
+    assert close_.call_count == 2
+
+
+def test_pool_close_acquired() -> None:
+    resource = object()
+    create = MagicMock(return_value=resource)
+    close_ = MagicMock()
+    pool = Pool(
+        create=create,
+        close=close_,
+    )
+
+    with pool.acquire():
+        pool.close()
+
+        close_.assert_not_called()
+
+    assert len(pool) == 0
+    close_.assert_called_once_with(resource)
+
+    with pool.acquire():
+        pass
+
+    assert len(pool) == 1
+
+
+def test_close() -> None:
+    obj = MagicMock()
+
+    close(obj)
+
+    obj.close.assert_called_once_with()
+
+
+def test_close_no_close() -> None:
+    obj = object()
+
+    close(obj)
+
+
+def test_flush() -> None:
+    obj = MagicMock()
+
+    flush(obj)
+
+    obj.flush.assert_called_once_with()
+
+
+def test_flush_no_flush() -> None:
+    obj = object()
+
+    flush(obj)
@@ -0,0 +1,106 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+import re
+from pathlib import Path
+
+import pytest
+
+# noinspection PyProtectedMember
+from aviary._utils.work_queue import WorkQueue
+from aviary.core.exceptions import AviaryUserError
+
+
+def test_work_queue(
+    tmp_path: Path,
+) -> None:
+    work_queue = WorkQueue(path=tmp_path / 'work_queue.db')
+    work_queue.initialize(num_units=3, fingerprint='test')
+    work_queue.initialize(num_units=3, fingerprint='test')
+
+    assert work_queue.count() == {'pending': 3, 'claimed': 0, 'done': 0}
+
+    units = [
+        work_queue.claim(
+            worker_id=worker_id,
+            lease_duration=60.,
+        )
+        for worker_id in ['a', 'b', 'c', 'd']
+    ]
+
+    assert units == [0, 1, 2, None]
+    assert work_queue.count() == {'pending': 0, 'claimed': 3, 'done': 0}
+    assert work_queue.renew(unit=0, worker_id='a', lease_duration=60.)
+    assert not work_queue.renew(unit=0, worker_id='b', lease_duration=60.)
+
+    assert work_queue.complete(unit=0, worker_id='a')
+    work_queue.release(unit=1, worker_id='b')
+    work_queue.release(unit=2, worker_id='a')
+
+    assert work_queue.count() == {'pending': 1, 'claimed': 1, 'done': 1}
+    assert work_queue.claim(worker_id='d', lease_duration=60.) == 1
+    assert not work_queue.is_done()
+
+    assert work_queue.complete(unit=1, worker_id='d')
+    assert work_queue.complete(unit=2, worker_id='c')
+
+    assert work_queue.is_done()
+
+
+def test_work_queue_reclaim(
+    tmp_path: Path,
+) -> None:
+    work_queue = WorkQueue(path=tmp_path / 'work_queue.db')
+    work_queue.initialize(num_units=1, fingerprint='test')
+
+    unit = work_queue.claim(
+        worker_id='a',
+        lease_duration=-1.,
+    )
+    unit_ = work_queue.claim(
+        worker_id='b',
+        lease_duration=60.,
+    )
+
+    assert unit == 0
+    assert unit_ == 0
+    assert not work_queue.renew(unit=0, worker_id='a', lease_duration=60.)
+    assert not work_queue.complete(unit=0, worker_id='a')
+    assert work_queue.count() == {'pending': 0, 'claimed': 1, 'done': 0}
+    assert work_queue.complete(unit=0, worker_id='b')
+    assert work_queue.is_done()
+
+
+def test_work_queue_exceptions(
+    tmp_path: Path,
+) -> None:
+    work_queue = WorkQueue(path=tmp_path / 'work_queue.db')
+    work_queue.initialize(num_units=3, fingerprint='test')
+    message = re.escape(
+        'Invalid num_units! '
+        'The number of units must match the number of units of the work queue (3).',
+    )
+
+    with pytest.raises(AviaryUserError, match=message):
+        work_queue.initialize(num_units=4, fingerprint='test')
+
+    message = re.escape(
+        'Invalid fingerprint! '
+        'The fingerprint must match the fingerprint of the work queue, '
+        'i.e., the work queue must not be reused for a different grid or tile size.',
+    )
+
+    with pytest.raises(AviaryUserError, match=message):
+        work_queue.initialize(num_units=3, fingerprint='other')
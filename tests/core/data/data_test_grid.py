@@ -25,6 +25,7 @@ from shapely.geometry import (
     box,
 )
 
+from aviary.core.bounding_box import BoundingBox
 from aviary.core.grid import Grid
 from tests.core.conftest import (
     get_bounding_box,
@@ -233,6 +234,94 @@ data_test_grid_bool = [
     ),
 ]
 
+data_test_grid_buffer = [
+    # test case 1: buffer_size is 0
+    (
+        get_grid(),
+        0,
+        get_grid(),
+    ),
+    # test case 2: buffer_size is positive
+    (
+        get_grid(),
+        1,
+        Grid.from_bounding_box(
+            bounding_box=BoundingBox(
+                x_min=-256,
+                y_min=-256,
+                x_max=256,
+                y_max=256,
+            ),
+            tile_size=128,
+        ),
+    ),
+    # test case 3: buffer_size is positive and coordinates is not divisible by tile_size
+    (
+        Grid(
+            coordinates=np.array(
+                [[64, 64]],
+                dtype=np.int32,
+            ),
+            tile_size=128,
+        ),
+        1,
+        Grid.from_bounding_box(
+            bounding_box=BoundingBox(
+                x_min=-64,
+                y_min=-64,
+                x_max=320,
+                y_max=320,
+            ),
+            tile_size=128,
+            snap=False,
+        ),
+    ),
+    # test case 4: buffer_size is negative
+    (
+        Grid.from_bounding_box(
+            bounding_box=BoundingBox(
+                x_min=-128,
+                y_min=-128,
+                x_max=256,
+                y_max=256,
+            ),
+            tile_size=128,
+        ),
+        -1,
+        Grid(
+            coordinates=np.array(
+                [[0, 0]],
+                dtype=np.int32,
+            ),
+            tile_size=128,
+        ),
+    ),
+    # test case 5: buffer_size is negative and the grid is removed
+    (
+        get_grid(),
+        -1,
+        Grid(
+            coordinates=None,
+            tile_size=128,
+        ),
+    ),
+    # test case 6: grid contains no coordinates
+    (
+        Grid(
+            coordinates=None,
+            tile_size=128,
+        ),
+        1,
+        Grid(
+            coordinates=None,
+            tile_size=128,
+        ),
+    ),
+]
+
+data_test_grid_buffer_inplace = copy.deepcopy(data_test_grid_buffer)
+data_test_grid_buffer_inplace_return = copy.deepcopy(data_test_grid_buffer)
+
 data_test_grid_chunk = [
     # test case 1: len(coordinates) is divisible by num_chunks
     (
@@ -1065,6 +1154,34 @@ data_test_grid_snap = [
         ),
         get_grid(),
     ),
+    # test case 3: coordinates contains adjacent coordinates that are not divisible by tile_size
+    (
+        Grid(
+            coordinates=np.array(
+                [[-64, -64], [64, -64]],
+                dtype=np.int32,
+            ),
+            tile_size=128,
+        ),
+        Grid(
+            coordinates=np.array(
+                [[-128, -128], [0, -128], [128, -128], [-128, 0], [0, 0], [128, 0]],
+                dtype=np.int32,
+            ),
+            tile_size=128,
+        ),
+    ),
+    # test case 4: coordinates contains no coordinates
+    (
+        Grid(
+            coordinates=None,
+            tile_size=128,
+        ),
+        Grid(
+            coordinates=None,
+            tile_size=128,
+        ),
+    ),
 ]
 
 data_test_grid_snap_inplace = copy.deepcopy(data_test_grid_snap)
@@ -228,6 +228,51 @@ def test_raster_channel_serializability(
     assert raster_channel.id == deserialized_raster_channel.id
 
 
+def test_raster_channel_serializability_array() -> None:
+    array = np.arange(2 * 4 * 4, dtype=np.float32).reshape(2, 4, 4)
+    raster_channel = RasterChannel(
+        data=array,
+        name=ChannelName.R,
+    )
+
+    serialized_raster_channel = pickle.dumps(raster_channel)
+    deserialized_raster_channel = pickle.loads(serialized_raster_channel)  # ruff: ignore[S301]
+    deserialized_raster_channel.array[0] = 0.
+
+    np.testing.assert_array_equal(deserialized_raster_channel[0], np.zeros(shape=(4, 4), dtype=np.float32))
+
+
+def test_raster_channel_array() -> None:
+    array = np.arange(2 * 4 * 4, dtype=np.float32).reshape(2, 4, 4)
+    raster_channel = RasterChannel(
+        data=array,
+        name=ChannelName.R,
+    )
+
+    assert raster_channel.array is array
+    assert len(raster_channel) == 2
+
+    for data_item in raster_channel:
+        assert np.shares_memory(data_item, array)
+
+
+def test_raster_channel_array_stacked(
+    raster_channel: RasterChannel,
+    raster_channel_data: list[npt.NDArray],
+) -> None:
+    array = raster_channel.array
+
+    assert array.shape == (2, 640, 640)
+    assert raster_channel.array is array
+
+    raster_channel.data[0] = np.zeros(shape=(640, 640), dtype=np.uint8)
+    array_ = raster_channel.array
+
+    assert array_ is not array
+    np.testing.assert_array_equal(array_[0], raster_channel_data[0] * 0)
+    np.testing.assert_array_equal(array_[1], raster_channel_data[1])
+
+
 def test_raster_channel_batch_size(
     raster_channel: RasterChannel,
 ) -> None:
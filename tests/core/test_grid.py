@@ -16,6 +16,7 @@
 import copy
 import inspect
 import pickle
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import geopandas as gpd
@@ -23,6 +24,8 @@ import geopandas.testing
 import numpy as np
 import pytest
 
+# noinspection PyProtectedMember
+from aviary._utils.journal import CoordinatesJournal
 from aviary.core.bounding_box import BoundingBox
 from aviary.core.exceptions import AviaryUserError
 from aviary.core.grid import Grid
@@ -44,6 +47,9 @@ from tests.core.data.data_test_grid import (
     data_test_grid_append_inplace_return,
     data_test_grid_area,
     data_test_grid_bool,
+    data_test_grid_buffer,
+    data_test_grid_buffer_inplace,
+    data_test_grid_buffer_inplace_return,
     data_test_grid_chunk,
     data_test_grid_chunk_exceptions,
     data_test_grid_contains,
@@ -117,6 +123,35 @@ def test_grid_init_exceptions(
         )
 
 
+def test_grid_from_coordinates(
+    grid_coordinates: CoordinatesSet,
+) -> None:
+    tile_size = 128
+
+    grid = Grid._from_coordinates(
+        coordinates=grid_coordinates,
+        tile_size=tile_size,
+    )
+
+    assert grid == Grid(
+        coordinates=grid_coordinates,
+        tile_size=tile_size,
+    )
+    assert id(grid._coordinates) == id(grid_coordinates)
+
+
+def test_grid_derived_mutability(
+    grid: Grid,
+) -> None:
+    grid_ = grid[1:]
+    grids = grid.chunk(num_chunks=2)
+
+    assert not np.shares_memory(grid_._coordinates, grid._coordinates)
+
+    for grid__ in grids:
+        assert not np.shares_memory(grid__._coordinates, grid._coordinates)
+
+
 def test_grid_mutability(
     grid_coordinates: CoordinatesSet,
 ) -> None:
@@ -210,6 +245,77 @@ def test_grid_from_bounding_box_defaults() -> None:
     assert snap is expected_snap
 
 
+def test_grid_from_bounding_box_lazy() -> None:
+    bounding_box = BoundingBox(
+        x_min=-128,
+        y_min=-128,
+        x_max=256,
+        y_max=128,
+    )
+    grid = Grid.from_bounding_box(
+        bounding_box=bounding_box,
+        tile_size=128,
+    )
+    expected_coordinates = np.array(
+        [[-128, -128], [0, -128], [128, -128], [-128, 0], [0, 0], [128, 0]],
+        dtype=np.int32,
+    )
+
+    assert len(grid) == 6
+    assert grid[1] == (0, -128)
+    assert grid[-1] == (128, 0)
+    assert list(grid) == [tuple(coordinates) for coordinates in expected_coordinates.tolist()]
+    np.testing.assert_array_equal(grid[2:5].coordinates, expected_coordinates[2:5])
+    np.testing.assert_array_equal(grid[::2].coordinates, expected_coordinates[::2])
+    np.testing.assert_array_equal(grid.chunk(num_chunks=4)[1].coordinates, expected_coordinates[2:4])
+    np.testing.assert_array_equal(grid.coordinates, expected_coordinates)
+    assert grid._lattice is not None
+    assert grid[2:5]._lattice is not None
+    assert grid.chunk(num_chunks=4)[1]._lattice is not None
+
+    with pytest.raises(IndexError):
+        _ = grid[6]
+
+    grid = grid - Grid(
+        coordinates=np.array([[0, 0]], dtype=np.int32),
+        tile_size=128,
+    )
+
+    np.testing.assert_array_equal(grid.coordinates, np.delete(expected_coordinates, 4, axis=0))
+
+
+def test_grid_from_bounding_box_lazy_materialization() -> None:
+    bounding_box = BoundingBox(
+        x_min=-128,
+        y_min=-128,
+        x_max=128,
+        y_max=128,
+    )
+    grid = Grid.from_bounding_box(
+        bounding_box=bounding_box,
+        tile_size=128,
+    )
+    serialized_grid = pickle.dumps(grid)
+    deserialized_grid = pickle.loads(serialized_grid)  # ruff: ignore[S301]
+
+    assert deserialized_grid._lattice is not None
+
+    grid.append(
+        coordinates=(128, 128),
+        inplace=True,
+    )
+
+    assert grid._lattice is None
+    assert len(grid) == 5
+    assert deserialized_grid == Grid(
+        coordinates=np.array(
+            [[-128, -128], [0, -128], [-128, 0], [0, 0]],
+            dtype=np.int32,
+        ),
+        tile_size=128,
+    )
+
+
 @pytest.mark.parametrize(('gdf', 'tile_size', 'snap', 'expected'), data_test_grid_from_gdf)
 def test_grid_from_gdf(
     gdf: gpd.GeoDataFrame,
@@ -251,6 +357,36 @@ def test_grid_from_gdf_defaults() -> None:
     assert snap is expected_snap
 
 
+def test_grid_from_journal(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / 'journal.bin'
+    coordinates_journal = CoordinatesJournal(
+        path=path,
+        tile_size=128,
+    )
+    coordinates_journal.reset()
+    grid = Grid.from_journal(path=path)
+
+    expected = Grid(
+        coordinates=None,
+        tile_size=128,
+    )
+
+    assert grid == expected
+
+    coordinates = np.array([[0, 0], [128, 0], [0, 128]], dtype=np.int32)
+    coordinates_journal.append(coordinates=coordinates)
+    grid = Grid.from_journal(path=path)
+
+    expected = Grid(
+        coordinates=coordinates,
+        tile_size=128,
+    )
+
+    assert grid == expected
+
+
 @pytest.mark.parametrize(('json_string', 'expected'), data_test_grid_from_json)
 def test_grid_from_json(
     json_string: str,
@@ -533,6 +669,84 @@ def test_grid_append_defaults() -> None:
     assert inplace is expected_inplace
 
 
+@pytest.mark.parametrize(('grid', 'buffer_size', 'expected'), data_test_grid_buffer)
+def test_grid_buffer(
+    grid: Grid,
+    buffer_size: int,
+    expected: Grid,
+) -> None:
+    copied_grid = copy.deepcopy(grid)
+
+    grid_ = grid.buffer(
+        buffer_size=buffer_size,
+        inplace=False,
+    )
+
+    assert grid == copied_grid
+    assert grid_ == expected
+    assert id(grid_) != id(grid)
+    assert id(grid_.coordinates) != id(grid.coordinates)
+
+
+@pytest.mark.parametrize(('grid', 'buffer_size', 'expected'), data_test_grid_buffer_inplace)
+def test_grid_buffer_inplace(
+    grid: Grid,
+    buffer_size: int,
+    expected: Grid,
+) -> None:
+    grid.buffer(
+        buffer_size=buffer_size,
+        inplace=True,
+    )
+
+    assert grid == expected
+
+
+@pytest.mark.parametrize(('grid', 'buffer_size', 'expected'), data_test_grid_buffer_inplace_return)
+def test_grid_buffer_inplace_return(
+    grid: Grid,
+    buffer_size: int,
+    expected: Grid,
+) -> None:
+    grid_ = grid.buffer(
+        buffer_size=buffer_size,
+        inplace=True,
+    )
+
+    assert grid == expected
+    assert grid_ == expected
+    assert id(grid_) == id(grid)
+
+
+def test_grid_buffer_defaults() -> None:
+    signature = inspect.signature(Grid.buffer)
+    inplace = signature.parameters['inplace'].default
+
+    expected_inplace = False
+
+    assert inplace is expected_inplace
+
+
+def test_grid_buffer_large() -> None:
+    grid = Grid.from_bounding_box(
+        bounding_box=BoundingBox(
+            x_min=0,
+            y_min=0,
+            x_max=128_000,
+            y_max=128_000,
+        ),
+        tile_size=128,
+    )
+
+    grid_ = grid.buffer(buffer_size=5)
+
+    assert len(grid_) == 1010 ** 2
+
+    grid_ = grid.buffer(buffer_size=-5)
+
+    assert len(grid_) == 990 ** 2
+
+
 @pytest.mark.parametrize(('grid', 'num_chunks', 'expected'), data_test_grid_chunk)
 def test_grid_chunk(
     grid: Grid,
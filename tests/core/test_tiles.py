@@ -335,3 +335,57 @@ def test_tiles_copy(
         assert id(copied_channel) != id(channel)
 
     assert id(copied_tiles.metadata) != id(tiles.metadata)
+
+
+def test_tiles_to_composite_raster() -> None:
+    data = np.arange(4 * 4 * 3, dtype=np.uint8).reshape(4, 4, 3)
+    tiles = Tiles.from_composite_raster(
+        data=data,
+        channel_names=[ChannelName.R, ChannelName.G, ChannelName.B],
+        coordinates=(0, 0),
+        tile_size=4,
+    )
+
+    composite_data = tiles.to_composite_raster(channel_names=[ChannelName.R, ChannelName.G, ChannelName.B])
+
+    np.testing.assert_array_equal(composite_data[0], data)
+    assert np.shares_memory(composite_data, data)
+
+    composite_data = tiles.to_composite_raster(channel_names=[ChannelName.R, ChannelName.B])
+
+    np.testing.assert_array_equal(composite_data[0], data[..., [0, 2]])
+    assert np.shares_memory(composite_data, data)
+
+    composite_data = tiles.to_composite_raster(channel_names=[ChannelName.B, ChannelName.R, ChannelName.G])
+
+    np.testing.assert_array_equal(composite_data[0], data[..., [2, 0, 1]])
+    assert not np.shares_memory(composite_data, data)
+    assert composite_data.flags.writeable
+
+
+@pytest.mark.parametrize(
+    'channel_names',
+    [
+        [ChannelName.R],
+        [ChannelName.R, ChannelName.G, ChannelName.B],
+    ],
+)
+def test_tiles_to_composite_raster_read_only(
+    channel_names: list[ChannelName],
+) -> None:
+    data = np.arange(4 * 4 * 3, dtype=np.uint8).reshape(4, 4, 3)
+    tiles = Tiles.from_composite_raster(
+        data=data,
+        channel_names=[ChannelName.R, ChannelName.G, ChannelName.B],
+        coordinates=(0, 0),
+        tile_size=4,
+    )
+
+    composite_data = tiles.to_composite_raster(channel_names=channel_names)
+
+    assert not composite_data.flags.writeable
+
+    with pytest.raises(ValueError, match='read-only'):
+        composite_data += 1
+
+    np.testing.assert_array_equal(tiles[ChannelName.R].data[0], data[..., 0])
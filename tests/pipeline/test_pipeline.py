@@ -0,0 +1,558 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+import math
+import re
+from pathlib import Path
+from threading import Lock
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
+
+import httpx
+import numpy as np
+import pydantic
+import pytest
+
+# noinspection PyProtectedMember
+from aviary._utils.journal import CoordinatesJournal
+
+# noinspection PyProtectedMember
+from aviary._utils.work_queue import WorkQueue
+from aviary.core.bounding_box import BoundingBox
+from aviary.core.enums import (
+    ChannelName,
+    WMSVersion,
+)
+from aviary.core.exceptions import AviaryUserError
+from aviary.core.grid import (
+    Grid,
+    GridConfig,
+)
+from aviary.core.tiles import (
+    Tile,
+    Tiles,
+)
+from aviary.core.type_aliases import (
+    Coordinates,
+    CoordinatesSet,
+)
+from aviary.pipeline.pipeline import (
+    ShardedTilePipeline,
+    ShardedTilePipelineConfig,
+    TilePipeline,
+    TilePipelineConfig,
+)
+from aviary.tile.tile_fetcher import (
+    TileFetcherConfig,
+    WMSFetcher,
+    register_tile_fetcher,
+)
+from aviary.tile.tiles_processor import (
+    SequentialCompositeProcessor,
+    TilesProcessorConfig,
+)
+from tests._functional.tile.conftest import get_png
+
+
+def _tile_fetcher(
+    coordinates: Coordinates,
+) -> Tile:
+    return Tile(
+        channels=[],
+        coordinates=coordinates,
+        tile_size=128,
+    )
+
+
+class _TileFetcherConfig(pydantic.BaseModel):
+    tile_size: int = 128
+
+
+@register_tile_fetcher(config_class=_TileFetcherConfig)
+class _TileFetcher:
+
+    def __init__(
+        self,
+        tile_size: int = 128,
+    ) -> None:
+        self._tile_size = tile_size
+
+    @classmethod
+    def from_config(
+        cls,
+        config: _TileFetcherConfig,
+    ) -> '_TileFetcher':
+        return cls(tile_size=config.tile_size)
+
+    def __call__(
+        self,
+        coordinates: Coordinates,
+    ) -> Tile:
+        return Tile(
+            channels=[],
+            coordinates=coordinates,
+            tile_size=self._tile_size,
+        )
+
+
+class _TilesProcessor:
+
+    def __init__(
+        self,
+        exception_batch_index: int | None = None,
+    ) -> None:
+        self._exception_batch_index = exception_batch_index
+        self.coordinates = []
+        self.num_flushes = 0
+        self._lock = Lock()
+
+    def __call__(
+        self,
+        tiles: Tiles,
+    ) -> Tiles:
+        with self._lock:
+            if len(self.coordinates) == self._exception_batch_index:
+                message = 'test'
+                raise ValueError(message)
+
+            self.coordinates.append(tiles.coordinates)
+
+        return tiles
+
+    def flush(self) -> None:
+        with self._lock:
+            self.num_flushes += 1
+
+
+def _sort(
+    coordinates: CoordinatesSet,
+) -> CoordinatesSet:
+    return coordinates[np.lexsort((coordinates[:, 0], coordinates[:, 1]))]
+
+
+@pytest.fixture
+def grid() -> Grid:
+    bounding_box = BoundingBox(
+        x_min=0,
+        y_min=0,
+        x_max=1280,
+        y_max=640,
+    )
+    return Grid.from_bounding_box(
+        bounding_box=bounding_box,
+        tile_size=128,
+    )
+
+
+@pytest.mark.parametrize(
+    (
+        'staged',
+        'stage_num_workers',
+    ),
+    [
+        (False, None),
+        (True, None),
+        (True, [1, 2]),
+    ],
+)
+def test_tile_pipeline_call(
+    grid: Grid,
+    staged: bool,
+    stage_num_workers: list[int] | None,
+    tmp_path: Path,
+) -> None:
+    tiles_processors = [_TilesProcessor(), _TilesProcessor()]
+    checkpoint_path = tmp_path / 'checkpoint.bin'
+    tile_pipeline = TilePipeline(
+        grid=grid,
+        tile_fetcher=_tile_fetcher,
+        tiles_processor=SequentialCompositeProcessor(tiles_processors=tiles_processors),
+        tile_loader_batch_size=4,
+        staged=staged,
+        stage_num_workers=stage_num_workers,
+        checkpoint_path=checkpoint_path,
+        show_progress=False,
+    )
+
+    tile_pipeline()
+
+    for tiles_processor in tiles_processors:
+        coordinates = np.concatenate(tiles_processor.coordinates)
+
+        np.testing.assert_array_equal(_sort(coordinates), grid.coordinates)
+        assert tiles_processor.num_flushes == math.ceil(len(tiles_processor.coordinates) / 10)
+
+    checkpoint_journal = CoordinatesJournal(
+        path=checkpoint_path,
+        tile_size=grid.tile_size,
+    )
+
+    np.testing.assert_array_equal(_sort(checkpoint_journal.read()), grid.coordinates)
+
+
+def test_tile_pipeline_call_staged_exception(
+    grid: Grid,
+    tmp_path: Path,
+) -> None:
+    tiles_processors = [_TilesProcessor(), _TilesProcessor(exception_batch_index=2)]
+    checkpoint_path = tmp_path / 'checkpoint.bin'
+    tile_pipeline = TilePipeline(
+        grid=grid,
+        tile_fetcher=_tile_fetcher,
+        tiles_processor=SequentialCompositeProcessor(tiles_processors=tiles_processors),
+        tile_loader_batch_size=4,
+        staged=True,
+        checkpoint_path=checkpoint_path,
+        show_progress=False,
+    )
+
+    with pytest.raises(ValueError, match='test'):
+        tile_pipeline()
+
+    checkpoint_journal = CoordinatesJournal(
+        path=checkpoint_path,
+        tile_size=grid.tile_size,
+    )
+    coordinates = checkpoint_journal.read()
+    expected = np.concatenate(tiles_processors[1].coordinates)
+
+    assert len(coordinates) <= len(expected)
+    np.testing.assert_array_equal(coordinates, expected[:len(coordinates)])
+
+
+@pytest.mark.parametrize('checkpoint_interval', [1, 3, 10])
+def test_tile_pipeline_call_flush(
+    grid: Grid,
+    checkpoint_interval: int,
+    tmp_path: Path,
+) -> None:
+    checkpoint_path = tmp_path / 'checkpoint.bin'
+    checkpoint_journal = CoordinatesJournal(
+        path=checkpoint_path,
+        tile_size=grid.tile_size,
+    )
+    tiles_processor = MagicMock(side_effect=lambda tiles: tiles)
+    num_tiles = []
+    tiles_processor.flush.side_effect = lambda: num_tiles.append(len(checkpoint_journal.read()))
+    tile_pipeline = TilePipeline(
+        grid=grid,
+        tile_fetcher=_tile_fetcher,
+        tiles_processor=tiles_processor,
+        tile_loader_batch_size=4,
+        checkpoint_path=checkpoint_path,
+        checkpoint_interval=checkpoint_interval,
+        show_progress=False,
+    )
+
+    tile_pipeline()
+
+    assert num_tiles == list(range(0, len(grid), 4 * checkpoint_interval))
+    np.testing.assert_array_equal(_sort(checkpoint_journal.read()), grid.coordinates)
+
+
+def test_tile_pipeline_call_exception_pending(
+    grid: Grid,
+    tmp_path: Path,
+) -> None:
+    tiles_processor = _TilesProcessor(exception_batch_index=5)
+    checkpoint_path = tmp_path / 'checkpoint.bin'
+    tile_pipeline = TilePipeline(
+        grid=grid,
+        tile_fetcher=_tile_fetcher,
+        tiles_processor=tiles_processor,
+        tile_loader_batch_size=4,
+        checkpoint_path=checkpoint_path,
+        checkpoint_interval=3,
+        show_progress=False,
+    )
+
+    with pytest.raises(ValueError, match='test'):
+        tile_pipeline()
+
+    checkpoint_journal = CoordinatesJournal(
+        path=checkpoint_path,
+        tile_size=grid.tile_size,
+    )
+    expected = np.concatenate(tiles_processor.coordinates[:3])
+
+    np.testing.assert_array_equal(checkpoint_journal.read(), expected)
+    assert tiles_processor.num_flushes == 1
+
+
+def test_tile_pipeline_init_exceptions(
+    grid: Grid,
+) -> None:
+    message = (
+        'Invalid checkpoint_interval! '
+        'The checkpoint interval must be positive.'
+    )
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = TilePipeline(
+            grid=grid,
+            tile_fetcher=_tile_fetcher,
+            tiles_processor=_TilesProcessor(),
+            checkpoint_interval=0,
+        )
+
+
+def _create_async_client(
+    max_num_connections: int | None = None,  # ruff: ignore[ARG001]
+) -> httpx.AsyncClient:
+    def _handle(
+        request: httpx.Request,  # ruff: ignore[ARG001]
+    ) -> httpx.Response:
+        return httpx.Response(
+            status_code=200,
+            headers={'Content-Type': 'image/png'},
+            content=get_png(),
+        )
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(_handle))
+
+
+@patch('aviary.tile.tile_fetcher.create_async_client', side_effect=_create_async_client)
+def test_tile_pipeline_call_twice_asynchronous(
+    mocked_create_async_client: MagicMock,
+) -> None:
+    bounding_box = BoundingBox(
+        x_min=0,
+        y_min=0,
+        x_max=16,
+        y_max=8,
+    )
+    grid = Grid.from_bounding_box(
+        bounding_box=bounding_box,
+        tile_size=4,
+    )
+    wms_fetcher = WMSFetcher(
+        url='https://www.test.com',
+        version=WMSVersion.V1_3_0,
+        layer='test_layer',
+        epsg_code=25832,
+        response_format='image/png',
+        channel_names=[ChannelName.R, ChannelName.G, ChannelName.B],
+        tile_size=4,
+        ground_sampling_distance=1.,
+        asynchronous=True,
+    )
+    tiles_processor = _TilesProcessor()
+    tile_pipeline = TilePipeline(
+        grid=grid,
+        tile_fetcher=wms_fetcher,
+        tiles_processor=tiles_processor,
+        tile_loader_batch_size=3,
+        show_progress=False,
+    )
+
+    tile_pipeline()
+    tile_pipeline()
+
+    coordinates = np.concatenate(tiles_processor.coordinates)
+    expected = np.concatenate([grid.coordinates, grid.coordinates])
+
+    np.testing.assert_array_equal(_sort(coordinates), _sort(expected))
+    assert mocked_create_async_client.call_count == 2
+
+
+def _create_tile_pipeline_config(
+    bounding_box_coordinates: tuple[int, int, int, int],
+    path: Path,
+) -> TilePipelineConfig:
+    return TilePipelineConfig(
+        show_progress=False,
+        grid_config=GridConfig(
+            bounding_box_coordinates=bounding_box_coordinates,
+            tile_size=128,
+        ),
+        tile_fetcher_config=TileFetcherConfig(
+            package='tests',
+            name='_TileFetcher',
+            config={},
+        ),
+        tiles_processor_config=TilesProcessorConfig(
+            name='GridExporter',
+            config={
+                'path': path,
+                'mode': 'journal',
+            },
+        ),
+    )
+
+
+def test_sharded_tile_pipeline_call(
+    grid: Grid,
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / 'grid.bin'
+    work_queue_path = tmp_path / 'work_queue.db'
+    sharded_tile_pipeline = ShardedTilePipeline(
+        tile_pipeline_config=_create_tile_pipeline_config(
+            bounding_box_coordinates=(0, 0, 1280, 640),
+            path=path,
+        ),
+        work_queue_path=work_queue_path,
+        num_units=4,
+        poll_interval=.1,
+    )
+
+    sharded_tile_pipeline()
+
+    coordinates_journal = CoordinatesJournal(
+        path=path,
+        tile_size=grid.tile_size,
+    )
+    work_queue = WorkQueue(path=work_queue_path)
+
+    np.testing.assert_array_equal(_sort(coordinates_journal.read()), grid.coordinates)
+    assert work_queue.count() == {'pending': 0, 'claimed': 0, 'done': 4}
+
+    sharded_tile_pipeline()
+
+    assert len(coordinates_journal.read()) == len(grid)
+
+
+def test_sharded_tile_pipeline_call_components(
+    grid: Grid,
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / 'grid.bin'
+    sharded_tile_pipeline = ShardedTilePipeline(
+        tile_pipeline_config=_create_tile_pipeline_config(
+            bounding_box_coordinates=(0, 0, 1280, 640),
+            path=path,
+        ),
+        work_queue_path=tmp_path / 'work_queue.db',
+        num_units=4,
+        poll_interval=.1,
+    )
+    tiles_processor = MagicMock(side_effect=lambda tiles: tiles)
+
+    with (
+        patch(
+            'aviary.pipeline.pipeline._TileFetcherFactory.create',
+            return_value=_tile_fetcher,
+        ) as mocked_create_tile_fetcher,
+        patch(
+            'aviary.pipeline.pipeline._TilesProcessorFactory.create',
+            return_value=tiles_processor,
+        ) as mocked_create_tiles_processor,
+    ):
+        sharded_tile_pipeline()
+
+    coordinates = np.concatenate([
+        call.kwargs['tiles'].coordinates
+        for call in tiles_processor.call_args_list
+    ])
+
+    np.testing.assert_array_equal(_sort(coordinates), grid.coordinates)
+    assert mocked_create_tile_fetcher.call_count == 1
+    assert mocked_create_tiles_processor.call_count == 1
+    assert tiles_processor.flush.call_count == 4
+    tiles_processor.close.assert_called_once_with()
+
+
+def test_sharded_tile_pipeline_call_exceptions(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / 'grid.bin'
+    work_queue_path = tmp_path / 'work_queue.db'
+    sharded_tile_pipeline = ShardedTilePipeline(
+        tile_pipeline_config=_create_tile_pipeline_config(
+            bounding_box_coordinates=(0, 0, 1280, 640),
+            path=path,
+        ),
+        work_queue_path=work_queue_path,
+        num_units=4,
+        poll_interval=.1,
+    )
+
+    sharded_tile_pipeline()
+
+    sharded_tile_pipeline = ShardedTilePipeline(
+        tile_pipeline_config=_create_tile_pipeline_config(
+            bounding_box_coordinates=(0, 0, 640, 1280),
+            path=path,
+        ),
+        work_queue_path=work_queue_path,
+        num_units=4,
+        poll_interval=.1,
+    )
+    message = re.escape(
+        'Invalid fingerprint! '
+        'The fingerprint must match the fingerprint of the work queue, '
+        'i.e., the work queue must not be reused for a different grid or tile size.',
+    )
+
+    with pytest.raises(AviaryUserError, match=message):
+        sharded_tile_pipeline()
+
+
+@pytest.mark.parametrize(
+    (
+        'num_units',
+        'num_workers',
+    ),
+    [
+        (0, 1),
+        (1, 0),
+    ],
+)
+def test_sharded_tile_pipeline_init_exceptions(
+    num_units: int,
+    num_workers: int,
+    tmp_path: Path,
+) -> None:
+    with pytest.raises(AviaryUserError, match='must be positive'):
+        _ = ShardedTilePipeline(
+            tile_pipeline_config=_create_tile_pipeline_config(
+                bounding_box_coordinates=(0, 0, 1280, 640),
+                path=tmp_path / 'grid.bin',
+            ),
+            work_queue_path=tmp_path / 'work_queue.db',
+            num_units=num_units,
+            num_workers=num_workers,
+        )
+
+
+def test_sharded_tile_pipeline_init_exceptions_checkpoint_path(
+    tmp_path: Path,
+) -> None:
+    tile_pipeline_config = _create_tile_pipeline_config(
+        bounding_box_coordinates=(0, 0, 1280, 640),
+        path=tmp_path / 'grid.bin',
+    )
+    tile_pipeline_config.checkpoint_path = tmp_path / 'checkpoint.bin'
+    message = re.escape(
+        'Invalid tile_pipeline_config! '
+        'The tile pipeline must not contain checkpoint_path or resume, '
+        'since the work queue keeps track of the units that are done.',
+    )
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = ShardedTilePipeline(
+            tile_pipeline_config=tile_pipeline_config,
+            work_queue_path=tmp_path / 'work_queue.db',
+            num_units=4,
+        )
+
+    with pytest.raises(pydantic.ValidationError, match='must not contain checkpoint_path or resume'):
+        _ = ShardedTilePipelineConfig(
+            work_queue_path=tmp_path / 'work_queue.db',
+            num_units=4,
+            tile_pipeline_config=tile_pipeline_config,
+        )
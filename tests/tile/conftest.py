@@ -101,3 +101,37 @@ def wms_fetcher() -> WMSFetcher:
         style=style,
         buffer_size=buffer_size,
     )
+
+
+@pytest.fixture
+def wms_fetcher_async() -> WMSFetcher:
+    url = 'https://www.test.com'
+    version = WMSVersion.V1_3_0
+    layer = 'test_layer'
+    epsg_code = 25832
+    response_format = 'image/png'
+    channel_names = [
+        ChannelName.R,
+        ChannelName.G,
+        ChannelName.B,
+    ]
+    tile_size = 128
+    ground_sampling_distance = .2
+    time = None
+    style = None
+    buffer_size = 0
+    asynchronous = True
+    return WMSFetcher(
+        url=url,
+        version=version,
+        layer=layer,
+        epsg_code=epsg_code,
+        response_format=response_format,
+        channel_names=channel_names,
+        tile_size=tile_size,
+        ground_sampling_distance=ground_sampling_distance,
+        time=time,
+        style=style,
+        buffer_size=buffer_size,
+        asynchronous=asynchronous,
+    )
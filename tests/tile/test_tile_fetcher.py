@@ -14,17 +14,26 @@
 #  If not, see <https://www.gnu.org/licenses/>.
 
 import inspect
+import re
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
+# noinspection PyProtectedMember
+from aviary._utils.concurrency import run_coroutine
 from aviary.core.enums import (
     ChannelName,
     InterpolationMode,
     WMSVersion,
 )
+from aviary.core.exceptions import AviaryUserError
 from aviary.tile.tile_fetcher import (
+    CachedFetcher,
+    CachedFetcherConfig,
+    ChunkStoreFetcher,
+    ChunkStoreFetcherConfig,
     CompositeFetcher,
     TileFetcher,
     VRTFetcher,
@@ -32,6 +41,265 @@ from aviary.tile.tile_fetcher import (
     WMSFetcher,
     WMSFetcherConfig,
 )
+from tests._functional.tile.conftest import get_png
+
+
+def test_cached_fetcher_init(
+    tmp_path: Path,
+) -> None:
+    tile_fetcher = MagicMock(spec=TileFetcher)
+    path = tmp_path / 'cache'
+    cache_key = 'test'
+    max_size = None
+
+    cached_fetcher = CachedFetcher(
+        tile_fetcher=tile_fetcher,
+        path=path,
+        cache_key=cache_key,
+        max_size=max_size,
+    )
+
+    assert cached_fetcher._tile_fetcher == tile_fetcher
+    assert cached_fetcher._path == path
+    assert cached_fetcher._cache_key == cache_key
+    assert cached_fetcher._max_size == max_size
+    assert path.is_dir()
+
+
+def test_cached_fetcher_init_defaults() -> None:
+    signature = inspect.signature(CachedFetcher)
+    max_size = signature.parameters['max_size'].default
+
+    expected_max_size = None
+
+    assert max_size is expected_max_size
+
+
+def test_cached_fetcher_from_config(
+    tmp_path: Path,
+) -> None:
+    tile_fetcher_config = {
+        'name': 'StubFetcher',
+        'config': {
+            'tile_size': 128,
+        },
+    }
+    path = tmp_path / 'cache'
+    max_size = None
+    cached_fetcher_config = CachedFetcherConfig(
+        tile_fetcher_config=tile_fetcher_config,
+        path=path,
+        max_size=max_size,
+    )
+
+    cached_fetcher = CachedFetcher.from_config(cached_fetcher_config)
+
+    tile_fetcher_config['config']['tile_size'] = 64
+    cached_fetcher_config_ = CachedFetcherConfig(
+        tile_fetcher_config=tile_fetcher_config,
+        path=path,
+        max_size=max_size,
+    )
+
+    cached_fetcher_ = CachedFetcher.from_config(cached_fetcher_config_)
+
+    assert cached_fetcher._path == path
+    assert cached_fetcher._max_size == max_size
+    assert cached_fetcher._cache_key != cached_fetcher_._cache_key
+
+
+@patch('aviary.tile.tile_fetcher.cached_fetcher')
+def test_cached_fetcher_call(
+    mocked_cached_fetcher: MagicMock,
+    tmp_path: Path,
+) -> None:
+    cached_fetcher = CachedFetcher(
+        tile_fetcher=MagicMock(spec=TileFetcher),
+        path=tmp_path,
+        cache_key='test',
+    )
+    coordinates = (0, 0)
+
+    expected = 'expected'
+    mocked_cached_fetcher.return_value = expected
+
+    tile = cached_fetcher(coordinates=coordinates)
+
+    assert tile == expected
+    mocked_cached_fetcher.assert_called_once_with(
+        coordinates=coordinates,
+        tile_fetcher=cached_fetcher._tile_fetcher,
+        cache=cached_fetcher._cache,
+        cache_key=cached_fetcher._cache_key,
+    )
+
+
+def test_cached_fetcher_asynchronous_batched(
+    tmp_path: Path,
+) -> None:
+    cached_fetcher = CachedFetcher(
+        tile_fetcher=MagicMock(spec=TileFetcher),
+        path=tmp_path,
+        cache_key='test',
+    )
+
+    assert not cached_fetcher.asynchronous
+    assert not cached_fetcher.batched
+
+    tile_fetcher = MagicMock(spec=VRTFetcher)
+    cached_fetcher = CachedFetcher(
+        tile_fetcher=tile_fetcher,
+        path=tmp_path,
+        cache_key='test',
+    )
+
+    assert cached_fetcher.batched
+
+    tile_fetcher = MagicMock(spec=WMSFetcher)
+    tile_fetcher.asynchronous = True
+    cached_fetcher = CachedFetcher(
+        tile_fetcher=tile_fetcher,
+        path=tmp_path,
+        cache_key='test',
+    )
+
+    assert cached_fetcher.asynchronous
+
+
+@patch('aviary.tile.tile_fetcher.cached_fetcher_async', new_callable=AsyncMock)
+def test_cached_fetcher_fetch_async(
+    mocked_cached_fetcher_async: AsyncMock,
+    tmp_path: Path,
+) -> None:
+    tile_fetcher = MagicMock(spec=WMSFetcher)
+    tile_fetcher.asynchronous = True
+    cached_fetcher = CachedFetcher(
+        tile_fetcher=tile_fetcher,
+        path=tmp_path,
+        cache_key='test',
+    )
+    coordinates = (0, 0)
+
+    expected = 'expected'
+    mocked_cached_fetcher_async.return_value = expected
+
+    tile = run_coroutine(cached_fetcher.fetch_async(coordinates=coordinates))
+
+    assert tile == expected
+    mocked_cached_fetcher_async.assert_awaited_once_with(
+        coordinates=coordinates,
+        tile_fetcher=cached_fetcher._tile_fetcher,
+        cache=cached_fetcher._cache,
+        cache_key=cached_fetcher._cache_key,
+    )
+
+
+def test_cached_fetcher_fetch_async_exceptions(
+    tmp_path: Path,
+) -> None:
+    cached_fetcher = CachedFetcher(
+        tile_fetcher=MagicMock(spec=TileFetcher),
+        path=tmp_path,
+        cache_key='test',
+    )
+    message = re.escape(
+        'Invalid call! '
+        'The tile fetcher must fetch the tiles asynchronously to fetch a tile asynchronously.',
+    )
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = run_coroutine(cached_fetcher.fetch_async(coordinates=(0, 0)))
+
+
+@patch('aviary.tile.tile_fetcher.cached_fetcher_many')
+def test_cached_fetcher_fetch_many(
+    mocked_cached_fetcher_many: MagicMock,
+    tmp_path: Path,
+) -> None:
+    cached_fetcher = CachedFetcher(
+        tile_fetcher=MagicMock(spec=VRTFetcher),
+        path=tmp_path,
+        cache_key='test',
+    )
+    coordinates = [(0, 0), (128, 0)]
+
+    expected = ['expected', 'expected']
+    mocked_cached_fetcher_many.return_value = expected
+
+    tiles = cached_fetcher.fetch_many(coordinates=coordinates)
+
+    assert tiles == expected
+    mocked_cached_fetcher_many.assert_called_once_with(
+        coordinates=coordinates,
+        tile_fetcher=cached_fetcher._tile_fetcher,
+        cache=cached_fetcher._cache,
+        cache_key=cached_fetcher._cache_key,
+        batched=True,
+        max_num_threads=None,
+    )
+
+
+def test_chunk_store_fetcher_init(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path
+    fill_value = 1
+
+    chunk_store_fetcher = ChunkStoreFetcher(
+        path=path,
+        fill_value=fill_value,
+    )
+
+    assert chunk_store_fetcher._path == path
+    assert chunk_store_fetcher._fill_value == fill_value
+
+
+def test_chunk_store_fetcher_init_defaults() -> None:
+    signature = inspect.signature(ChunkStoreFetcher)
+    fill_value = signature.parameters['fill_value'].default
+
+    expected_fill_value = 0
+
+    assert fill_value == expected_fill_value
+
+
+def test_chunk_store_fetcher_from_config(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path
+    fill_value = 1
+    chunk_store_fetcher_config = ChunkStoreFetcherConfig(
+        path=path,
+        fill_value=fill_value,
+    )
+
+    chunk_store_fetcher = ChunkStoreFetcher.from_config(chunk_store_fetcher_config)
+
+    assert chunk_store_fetcher._path == path
+    assert chunk_store_fetcher._fill_value == fill_value
+
+
+@patch('aviary.tile.tile_fetcher.chunk_store_fetcher')
+def test_chunk_store_fetcher_call(
+    mocked_chunk_store_fetcher: MagicMock,
+    tmp_path: Path,
+) -> None:
+    chunk_store_fetcher = ChunkStoreFetcher(
+        path=tmp_path,
+    )
+    coordinates = (0, 0)
+
+    expected = 'expected'
+    mocked_chunk_store_fetcher.return_value = expected
+
+    tile = chunk_store_fetcher(coordinates=coordinates)
+
+    assert tile == expected
+    mocked_chunk_store_fetcher.assert_called_once_with(
+        coordinates=coordinates,
+        chunk_store=chunk_store_fetcher._chunk_store,
+        fill_value=chunk_store_fetcher._fill_value,
+    )
 
 
 def test_composite_fetcher_init() -> None:
@@ -99,6 +367,7 @@ def test_vrt_fetcher_init() -> None:
     ground_sampling_distance = .2
     interpolation_mode = InterpolationMode.BILINEAR
     buffer_size = 0
+    max_num_datasets = None
 
     vrt_fetcher = VRTFetcher(
         path=path,
@@ -108,6 +377,7 @@ def test_vrt_fetcher_init() -> None:
         ground_sampling_distance=ground_sampling_distance,
         interpolation_mode=interpolation_mode,
         buffer_size=buffer_size,
+        max_num_datasets=max_num_datasets,
     )
 
     assert vrt_fetcher._path == path
@@ -117,18 +387,41 @@ def test_vrt_fetcher_init() -> None:
     assert vrt_fetcher._ground_sampling_distance == ground_sampling_distance
     assert vrt_fetcher._interpolation_mode == interpolation_mode
     assert vrt_fetcher._buffer_size == buffer_size
+    assert vrt_fetcher._max_num_datasets == max_num_datasets
 
 
 def test_vrt_fetcher_init_defaults() -> None:
     signature = inspect.signature(VRTFetcher)
     interpolation_mode = signature.parameters['interpolation_mode'].default
     buffer_size = signature.parameters['buffer_size'].default
+    max_num_datasets = signature.parameters['max_num_datasets'].default
 
     expected_interpolation_mode = InterpolationMode.BILINEAR
     expected_buffer_size = 0
+    expected_max_num_datasets = None
 
     assert interpolation_mode == expected_interpolation_mode
     assert buffer_size == expected_buffer_size
+    assert max_num_datasets is expected_max_num_datasets
+
+
+@pytest.mark.parametrize('max_num_datasets', [0, -1])
+def test_vrt_fetcher_init_exceptions(
+    max_num_datasets: int,
+) -> None:
+    message = re.escape(
+        'Invalid max_num_datasets! The maximum number of datasets must be positive.',
+    )
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = VRTFetcher(
+            path=Path('test/test.vrt'),
+            epsg_code=25832,
+            channel_names=ChannelName.R,
+            tile_size=128,
+            ground_sampling_distance=.2,
+            max_num_datasets=max_num_datasets,
+        )
 
 
 def test_vrt_fetcher_from_config() -> None:
@@ -145,6 +438,7 @@ def test_vrt_fetcher_from_config() -> None:
     ground_sampling_distance = .2
     interpolation_mode = InterpolationMode.BILINEAR
     buffer_size = 0
+    max_num_datasets = None
     vrt_fetcher_config = VRTFetcherConfig(
         path=path,
         epsg_code=epsg_code,
@@ -153,6 +447,7 @@ def test_vrt_fetcher_from_config() -> None:
         ground_sampling_distance=ground_sampling_distance,
         interpolation_mode=interpolation_mode,
         buffer_size=buffer_size,
+        max_num_datasets=max_num_datasets,
     )
 
     vrt_fetcher = VRTFetcher.from_config(vrt_fetcher_config)
@@ -164,6 +459,7 @@ def test_vrt_fetcher_from_config() -> None:
     assert vrt_fetcher._ground_sampling_distance == ground_sampling_distance
     assert vrt_fetcher._interpolation_mode == interpolation_mode
     assert vrt_fetcher._buffer_size == buffer_size
+    assert vrt_fetcher._max_num_datasets == max_num_datasets
 
 
 @patch('aviary.tile.tile_fetcher.vrt_fetcher')
@@ -189,6 +485,35 @@ def test_vrt_fetcher_call(
         interpolation_mode=vrt_fetcher._interpolation_mode,
         buffer_size=vrt_fetcher._buffer_size,
         fill_value=vrt_fetcher._FILL_VALUE,
+        dataset_pool=vrt_fetcher._dataset_pool,
+    )
+
+
+@patch('aviary.tile.tile_fetcher.vrt_fetcher_many')
+def test_vrt_fetcher_fetch_many(
+    mocked_vrt_fetcher_many: MagicMock,
+    vrt_fetcher: VRTFetcher,
+) -> None:
+    coordinates = [(0, 0), (128, 0)]
+
+    expected = 'expected'
+    mocked_vrt_fetcher_many.return_value = expected
+
+    tiles = vrt_fetcher.fetch_many(coordinates=coordinates)
+
+    assert tiles == expected
+    mocked_vrt_fetcher_many.assert_called_once_with(
+        coordinates=coordinates,
+        path=vrt_fetcher._path,
+        epsg_code=vrt_fetcher._epsg_code,
+        channel_names=vrt_fetcher._channel_names,
+        tile_size=vrt_fetcher._tile_size,
+        ground_sampling_distance=vrt_fetcher._ground_sampling_distance,
+        interpolation_mode=vrt_fetcher._interpolation_mode,
+        buffer_size=vrt_fetcher._buffer_size,
+        fill_value=vrt_fetcher._FILL_VALUE,
+        dataset_pool=vrt_fetcher._dataset_pool,
+        max_num_threads=None,
     )
 
 
@@ -208,6 +533,13 @@ def test_wms_fetcher_init() -> None:
     time = None
     style = None
     buffer_size = 0
+    max_num_retries = 3
+    backoff_factor = .5
+    max_num_sessions = None
+    asynchronous = False
+    max_num_concurrent_requests = 64
+    max_num_requests_per_second = None
+    max_num_decoding_threads = None
 
     wms_fetcher = WMSFetcher(
         url=url,
@@ -221,6 +553,13 @@ def test_wms_fetcher_init() -> None:
         time=time,
         style=style,
         buffer_size=buffer_size,
+        max_num_retries=max_num_retries,
+        backoff_factor=backoff_factor,
+        max_num_sessions=max_num_sessions,
+        asynchronous=asynchronous,
+        max_num_concurrent_requests=max_num_concurrent_requests,
+        max_num_requests_per_second=max_num_requests_per_second,
+        max_num_decoding_threads=max_num_decoding_threads,
     )
 
     assert wms_fetcher._url == url
@@ -234,6 +573,13 @@ def test_wms_fetcher_init() -> None:
     assert wms_fetcher._time == time
     assert wms_fetcher._style == style
     assert wms_fetcher._buffer_size == buffer_size
+    assert wms_fetcher._max_num_retries == max_num_retries
+    assert wms_fetcher._backoff_factor == backoff_factor
+    assert wms_fetcher._max_num_sessions == max_num_sessions
+    assert wms_fetcher._asynchronous == asynchronous
+    assert wms_fetcher._max_num_concurrent_requests == max_num_concurrent_requests
+    assert wms_fetcher._max_num_requests_per_second == max_num_requests_per_second
+    assert wms_fetcher._max_num_decoding_threads == max_num_decoding_threads
 
 
 def test_wms_fetcher_init_defaults() -> None:
@@ -241,14 +587,82 @@ def test_wms_fetcher_init_defaults() -> None:
     time = signature.parameters['time'].default
     style = signature.parameters['style'].default
     buffer_size = signature.parameters['buffer_size'].default
+    max_num_retries = signature.parameters['max_num_retries'].default
+    backoff_factor = signature.parameters['backoff_factor'].default
+    max_num_sessions = signature.parameters['max_num_sessions'].default
+    asynchronous = signature.parameters['asynchronous'].default
+    max_num_concurrent_requests = signature.parameters['max_num_concurrent_requests'].default
+    max_num_requests_per_second = signature.parameters['max_num_requests_per_second'].default
+    max_num_decoding_threads = signature.parameters['max_num_decoding_threads'].default
 
     expected_time = None
     expected_style = None
     expected_buffer_size = 0
+    expected_max_num_retries = 3
+    expected_backoff_factor = .5
+    expected_max_num_sessions = None
+    expected_asynchronous = False
+    expected_max_num_concurrent_requests = 64
+    expected_max_num_requests_per_second = None
+    expected_max_num_decoding_threads = None
 
     assert time is expected_time
     assert style is expected_style
     assert buffer_size == expected_buffer_size
+    assert max_num_retries == expected_max_num_retries
+    assert backoff_factor == expected_backoff_factor
+    assert max_num_sessions is expected_max_num_sessions
+    assert asynchronous is expected_asynchronous
+    assert max_num_concurrent_requests == expected_max_num_concurrent_requests
+    assert max_num_requests_per_second is expected_max_num_requests_per_second
+    assert max_num_decoding_threads is expected_max_num_decoding_threads
+
+
+@pytest.mark.parametrize(
+    (
+        'kwargs',
+        'message',
+    ),
+    [
+        (
+            {'max_num_sessions': 0},
+            'Invalid max_num_sessions! The maximum number of sessions must be positive.',
+        ),
+        (
+            {'max_num_concurrent_requests': 0},
+            'Invalid max_num_concurrent_requests! The maximum number of concurrent requests must be positive.',
+        ),
+        (
+            {'max_num_concurrent_requests': -1},
+            'Invalid max_num_concurrent_requests! The maximum number of concurrent requests must be positive.',
+        ),
+        (
+            {'max_num_requests_per_second': 0.},
+            'Invalid max_num_requests_per_second! The maximum number of requests per second must be positive.',
+        ),
+        (
+            {'max_num_decoding_threads': 0},
+            'Invalid max_num_decoding_threads! The maximum number of decoding threads must be positive.',
+        ),
+    ],
+)
+def test_wms_fetcher_init_exceptions(
+    kwargs: dict[str, object],
+    message: str,
+) -> None:
+    with pytest.raises(AviaryUserError, match=re.escape(message)):
+        _ = WMSFetcher(
+            url='https://www.test.com',
+            version=WMSVersion.V1_3_0,
+            layer='test_layer',
+            epsg_code=25832,
+            response_format='image/png',
+            channel_names=ChannelName.R,
+            tile_size=128,
+            ground_sampling_distance=.2,
+            asynchronous=True,
+            **kwargs,
+        )
 
 
 def test_wms_fetcher_from_config() -> None:
@@ -267,6 +681,13 @@ def test_wms_fetcher_from_config() -> None:
     time = None
     style = None
     buffer_size = 0
+    max_num_retries = 3
+    backoff_factor = .5
+    max_num_sessions = None
+    asynchronous = False
+    max_num_concurrent_requests = 64
+    max_num_requests_per_second = None
+    max_num_decoding_threads = None
     wms_fetcher_config = WMSFetcherConfig(
         url=url,
         version=version,
@@ -279,6 +700,13 @@ def test_wms_fetcher_from_config() -> None:
         time=time,
         style=style,
         buffer_size=buffer_size,
+        max_num_retries=max_num_retries,
+        backoff_factor=backoff_factor,
+        max_num_sessions=max_num_sessions,
+        asynchronous=asynchronous,
+        max_num_concurrent_requests=max_num_concurrent_requests,
+        max_num_requests_per_second=max_num_requests_per_second,
+        max_num_decoding_threads=max_num_decoding_threads,
     )
 
     wms_fetcher = WMSFetcher.from_config(wms_fetcher_config)
@@ -294,6 +722,13 @@ def test_wms_fetcher_from_config() -> None:
     assert wms_fetcher._time == time
     assert wms_fetcher._style == style
     assert wms_fetcher._buffer_size == buffer_size
+    assert wms_fetcher._max_num_retries == max_num_retries
+    assert wms_fetcher._backoff_factor == backoff_factor
+    assert wms_fetcher._max_num_sessions == max_num_sessions
+    assert wms_fetcher._asynchronous == asynchronous
+    assert wms_fetcher._max_num_concurrent_requests == max_num_concurrent_requests
+    assert wms_fetcher._max_num_requests_per_second == max_num_requests_per_second
+    assert wms_fetcher._max_num_decoding_threads == max_num_decoding_threads
 
 
 @patch('aviary.tile.tile_fetcher.wms_fetcher')
@@ -323,4 +758,103 @@ def test_wms_fetcher_call(
         style=wms_fetcher._style,
         buffer_size=wms_fetcher._buffer_size,
         fill_value=wms_fetcher._FILL_VALUE,
+        session_pool=wms_fetcher._session_pool,
+    )
+
+
+@patch('aviary.tile.tile_fetcher.wms_fetcher_async', new_callable=AsyncMock)
+def test_wms_fetcher_call_asynchronous(
+    mocked_wms_fetcher_async: AsyncMock,
+    wms_fetcher_async: WMSFetcher,
+) -> None:
+    coordinates = (0, 0)
+
+    expected = 'expected'
+    mocked_wms_fetcher_async.return_value = expected
+
+    tile = wms_fetcher_async(coordinates=coordinates)
+
+    assert tile == expected
+    mocked_wms_fetcher_async.assert_awaited_once_with(
+        coordinates=coordinates,
+        url=wms_fetcher_async._url,
+        version=wms_fetcher_async._version,
+        layer=wms_fetcher_async._layer,
+        epsg_code=wms_fetcher_async._epsg_code,
+        response_format=wms_fetcher_async._response_format,
+        channel_names=wms_fetcher_async._channel_names,
+        tile_size=wms_fetcher_async._tile_size,
+        ground_sampling_distance=wms_fetcher_async._ground_sampling_distance,
+        client=wms_fetcher_async._client,
+        time=wms_fetcher_async._time,
+        style=wms_fetcher_async._style,
+        buffer_size=wms_fetcher_async._buffer_size,
+        fill_value=wms_fetcher_async._FILL_VALUE,
+        max_num_retries=wms_fetcher_async._max_num_retries,
+        backoff_factor=wms_fetcher_async._backoff_factor,
+        semaphore=wms_fetcher_async._semaphore,
+        rate_limiter=wms_fetcher_async._rate_limiter,
+        executor=wms_fetcher_async._executor,
     )
+
+    wms_fetcher_async.close()
+
+
+def _create_async_client(
+    max_num_connections: int | None = None,  # ruff: ignore[ARG001]
+) -> httpx.AsyncClient:
+    def _handle(
+        request: httpx.Request,  # ruff: ignore[ARG001]
+    ) -> httpx.Response:
+        return httpx.Response(
+            status_code=200,
+            headers={'Content-Type': 'image/png'},
+            content=get_png(),
+        )
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(_handle))
+
+
+@patch('aviary.tile.tile_fetcher.create_async_client', side_effect=_create_async_client)
+def test_wms_fetcher_close_asynchronous(
+    mocked_create_async_client: MagicMock,
+) -> None:
+    wms_fetcher = WMSFetcher(
+        url='https://www.test.com',
+        version=WMSVersion.V1_3_0,
+        layer='test_layer',
+        epsg_code=25832,
+        response_format='image/png',
+        channel_names=[ChannelName.R, ChannelName.G, ChannelName.B],
+        tile_size=4,
+        ground_sampling_distance=1.,
+        asynchronous=True,
+    )
+    _ = wms_fetcher(coordinates=(0, 0))
+    client = wms_fetcher._client
+    executor = wms_fetcher._executor
+
+    wms_fetcher.close()
+
+    assert client.is_closed
+    assert executor._shutdown
+
+    tile = wms_fetcher(coordinates=(0, 0))
+
+    assert tile.channel_names == {ChannelName.R, ChannelName.G, ChannelName.B}
+    assert mocked_create_async_client.call_count == 2
+    assert not wms_fetcher._client.is_closed
+
+    wms_fetcher.close()
+
+
+def test_wms_fetcher_fetch_async_exceptions(
+    wms_fetcher: WMSFetcher,
+) -> None:
+    message = re.escape(
+        'Invalid call! '
+        'asynchronous must be True to fetch a tile asynchronously.',
+    )
+
+    with pytest.raises(AviaryUserError, match=message):
+        _ = run_coroutine(wms_fetcher.fetch_async(coordinates=(0, 0)))
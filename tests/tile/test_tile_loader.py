@@ -0,0 +1,154 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+import random
+import time
+
+import numpy as np
+import pytest
+
+from aviary.core.bounding_box import BoundingBox
+from aviary.core.grid import Grid
+from aviary.core.tiles import Tile
+from aviary.core.type_aliases import Coordinates
+from aviary.tile.tile_loader import TileLoader
+from aviary.tile.tile_set import TileSet
+
+
+def _tile_fetcher(
+    coordinates: Coordinates,
+) -> Tile:
+    time.sleep(random.uniform(0., .01))  # ruff: ignore[S311]
+    return Tile(
+        channels=[],
+        coordinates=coordinates,
+        tile_size=128,
+    )
+
+
+@pytest.fixture
+def tile_set() -> TileSet:
+    bounding_box = BoundingBox(
+        x_min=0,
+        y_min=0,
+        x_max=1280,
+        y_max=640,
+    )
+    grid = Grid.from_bounding_box(
+        bounding_box=bounding_box,
+        tile_size=128,
+    )
+    return TileSet(
+        grid=grid,
+        tile_fetcher=_tile_fetcher,
+    )
+
+
+@pytest.mark.parametrize(
+    (
+        'num_prefetched_tiles',
+        'num_prefetching_threads',
+    ),
+    [
+        (0, 1),
+        (1, 1),
+        (4, 4),
+    ],
+)
+def test_tile_loader_iter(
+    tile_set: TileSet,
+    num_prefetched_tiles: int,
+    num_prefetching_threads: int,
+) -> None:
+    tile_loader = TileLoader(
+        tile_set=tile_set,
+        batch_size=3,
+        num_prefetched_tiles=num_prefetched_tiles,
+        num_prefetching_threads=num_prefetching_threads,
+    )
+
+    for _ in range(2):
+        coordinates = np.concatenate([tiles.coordinates for tiles in tile_loader])
+
+        np.testing.assert_array_equal(coordinates, tile_set._grid.coordinates)
+
+    assert len(tile_loader) == 17
+
+
+def test_tile_loader_iter_exception(
+    tile_set: TileSet,
+) -> None:
+    def tile_fetcher(
+        coordinates: Coordinates,
+    ) -> Tile:
+        if coordinates[0] == 640:
+            message = 'test'
+            raise ValueError(message)
+
+        return _tile_fetcher(coordinates=coordinates)
+
+    tile_set._tile_fetcher = tile_fetcher
+    tile_loader = TileLoader(
+        tile_set=tile_set,
+        num_prefetched_tiles=2,
+        num_prefetching_threads=2,
+    )
+
+    with pytest.raises(ValueError, match='test'):
+        for _ in tile_loader:
+            pass
+
+    assert tile_loader._prefetch_executor is None
+
+
+def test_tile_loader_iter_batched(
+    tile_set: TileSet,
+) -> None:
+    class TileFetcher:
+
+        def __init__(self) -> None:
+            self.num_calls = 0
+
+        def __call__(
+            self,
+            coordinates: Coordinates,
+        ) -> Tile:
+            return _tile_fetcher(coordinates=coordinates)
+
+        def fetch_many(
+            self,
+            coordinates: list[Coordinates],
+            max_num_threads: int | None = None,
+        ) -> list[Tile]:
+            self.num_calls += 1
+            self.max_num_threads = max_num_threads
+            return [
+                _tile_fetcher(coordinates=coordinates_item)
+                for coordinates_item in coordinates
+            ]
+
+    tile_fetcher = TileFetcher()
+    tile_set._tile_fetcher = tile_fetcher
+    tile_loader = TileLoader(
+        tile_set=tile_set,
+        batch_size=3,
+        max_num_threads=4,
+    )
+
+    coordinates = np.concatenate([tiles.coordinates for tiles in tile_loader])
+
+    np.testing.assert_array_equal(coordinates, tile_set._grid.coordinates)
+    assert tile_fetcher.num_calls == len(tile_loader)
+    assert tile_fetcher.max_num_threads == 4
@@ -0,0 +1,146 @@
+#  Copyright (C) 2026 Marius Maryniak
+#
+#  This file is part of aviary.
+#
+#  aviary is free software: you can redistribute it and/or modify it under the terms of the
+#  GNU General Public License as published by the Free Software Foundation,
+#  either version 3 of the License, or (at your option) any later version.
+#
+#  aviary is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+#  without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with aviary.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import rasterio as rio
+
+from aviary.core.enums import (
+    ChannelName,
+    GridExporterMode,
+    RasterExporterMode,
+)
+from aviary.core.grid import Grid
+from aviary.core.tiles import Tiles
+from aviary.tile.tile_fetcher import ChunkStoreFetcher
+from aviary.tile.tiles_exporter import (
+    ChunkStoreExporter,
+    GridExporter,
+    RasterExporter,
+)
+
+
+def _create_tiles(
+    x_min: int,
+) -> Tiles:
+    data = np.random.default_rng(x_min).integers(0, 256, size=(32, 32, 3), dtype=np.uint8)
+    return Tiles.from_composite_raster(
+        data=data,
+        channel_names=[ChannelName.R, ChannelName.G, ChannelName.B],
+        coordinates=(x_min, 0),
+        tile_size=32,
+    )
+
+
+def test_chunk_store_exporter_chunk_store_fetcher(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / 'chunk_store'
+    chunk_store_exporter = ChunkStoreExporter(
+        channel_names=[ChannelName.R, ChannelName.G, ChannelName.B],
+        path=path,
+        remove_channels=False,
+    )
+    tiles = [_create_tiles(x_min=x_min) for x_min in (0, 32)]
+
+    for tiles_ in tiles:
+        _ = chunk_store_exporter(tiles=tiles_)
+
+    chunk_store_fetcher = ChunkStoreFetcher(path=path)
+
+    for tiles_ in tiles:
+        tile = chunk_store_fetcher(coordinates=tuple(tiles_.coordinates[0]))
+
+        for channel_name in (ChannelName.R, ChannelName.G, ChannelName.B):
+            np.testing.assert_array_equal(tile[channel_name].data[0], tiles_[channel_name].data[0])
+
+    tile = chunk_store_fetcher(coordinates=(64, 0))
+
+    assert not tile[ChannelName.R].data[0].any()
+
+
+def test_grid_exporter_journal(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / 'grid.bin'
+    json_path = tmp_path / 'grid.json'
+    grid_exporter = GridExporter(
+        path=path,
+        mode=GridExporterMode.JOURNAL,
+        json_path=json_path,
+    )
+    tiles = [_create_tiles(x_min=x_min) for x_min in (0, 32, 64)]
+
+    for tiles_ in tiles:
+        _ = grid_exporter(tiles=tiles_)
+
+    assert not json_path.exists()
+
+    grid_exporter.close()
+
+    grid = Grid.from_json(json_string=json_path.read_text())
+    expected = Grid(
+        coordinates=np.concatenate([tiles_.coordinates for tiles_ in tiles]),
+        tile_size=32,
+    )
+
+    assert grid == expected
+    assert Grid.from_journal(path=path) == expected
+
+
+@pytest.mark.parametrize('write_in_background', [False, True])
+def test_raster_exporter_mosaic(
+    write_in_background: bool,
+    tmp_path: Path,
+) -> None:
+    raster_exporter = RasterExporter(
+        channel_names=[ChannelName.R, ChannelName.G, ChannelName.B],
+        epsg_code=25832,
+        path=tmp_path,
+        remove_channels=False,
+        write_in_background=write_in_background,
+        mode=RasterExporterMode.MOSAIC,
+        mosaic_size=2,
+    )
+    tiles = [_create_tiles(x_min=x_min) for x_min in (0, 32, 64)]
+
+    for tiles_ in tiles:
+        _ = raster_exporter(tiles=tiles_)
+
+    raster_exporter.close()
+
+    with rio.open(tmp_path / '0_0.tiff') as src:
+        data = src.read()
+        descriptions = src.descriptions
+
+    expected = np.concatenate(
+        [
+            tiles[0].to_composite_raster(channel_names=[ChannelName.R, ChannelName.G, ChannelName.B])[0],
+            tiles[1].to_composite_raster(channel_names=[ChannelName.R, ChannelName.G, ChannelName.B])[0],
+        ],
+        axis=1,
+    )
+
+    np.testing.assert_array_equal(data[:, -32:, :], np.transpose(expected, (2, 0, 1)))
+    assert descriptions == ('r', 'g', 'b')
+
+    with rio.open(tmp_path / '64_0.tiff') as src:
+        data = src.read()
+
+    expected = tiles[2].to_composite_raster(channel_names=[ChannelName.R, ChannelName.G, ChannelName.B])[0]
+
+    np.testing.assert_array_equal(data[:, -32:, :32], np.transpose(expected, (2, 0, 1)))